@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: async_client.py
+Descripción: Cliente HTTP asíncrono (asyncio) con pool de conexiones keep-alive.
+             Implementa HTTP/1.1 sobre asyncio streams sin dependencias externas.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import logging
+import ssl
+import time
+import urllib.parse
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from src.api.client import HTTPError, ACCEPT_ENCODING, READ_CHUNK_SIZE, get_decoder
+from src.utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Par de streams de una conexión abierta
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+# Errores que indican que una conexión reutilizada fue cerrada por el servidor
+STALE_CONNECTION_ERRORS = (
+    asyncio.IncompleteReadError,
+    ConnectionResetError,
+    BrokenPipeError
+)
+
+
+class AsyncConnectionPool:
+    """Pool de conexiones persistentes para asyncio, agrupadas por host"""
+
+    def __init__(self, max_idle: int = 10, idle_timeout: float = 60.0):
+        """
+        Args:
+            max_idle: Número máximo de conexiones inactivas conservadas por host
+            idle_timeout: Segundos que una conexión puede estar inactiva antes de descartarse
+        """
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+
+        self._idle: Dict[Tuple[str, int], Deque[Tuple[Connection, float]]] = {}
+        self._in_use = 0
+
+        # Estadísticas
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+        self._stale = 0
+        self._discarded = 0
+        self._overflow = 0
+
+    async def acquire(
+        self,
+        host: str,
+        port: int,
+        timeout: float,
+        ssl_context: Optional[ssl.SSLContext]
+    ) -> Tuple[Connection, bool]:
+        """
+        Obtiene una conexión para el host, reutilizando una inactiva si está sana
+
+        Args:
+            host: Hostname del servidor
+            port: Puerto del servidor
+            timeout: Timeout de conexión en segundos
+            ssl_context: Contexto TLS (None para HTTP plano)
+
+        Returns:
+            Tupla (conexión, reutilizada)
+        """
+        idle = self._idle.get((host, port))
+        while idle:
+            conn, released_at = idle.pop()
+            self._in_use += 1
+
+            if time.monotonic() - released_at > self.idle_timeout:
+                self._drop(conn, "_expired")
+                continue
+            if self._is_stale(conn):
+                self._drop(conn, "_stale")
+                continue
+
+            self._reused += 1
+            return conn, True
+
+        self._created += 1
+        self._in_use += 1
+        try:
+            conn = await asyncio.wait_for(
+                asyncio.open_connection(
+                    host,
+                    port,
+                    ssl=ssl_context,
+                    server_hostname=host if ssl_context else None
+                ),
+                timeout
+            )
+        except BaseException:
+            self._in_use -= 1
+            raise
+
+        logger.debug(f"Nueva conexión asíncrona a {host}:{port}")
+        return conn, False
+
+    def release(self, host: str, port: int, conn: Connection, reusable: bool = True) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            host: Hostname del servidor
+            port: Puerto del servidor
+            conn: Conexión a devolver
+            reusable: False si la conexión no debe reutilizarse
+        """
+        if not reusable:
+            self.discard(conn)
+            return
+
+        self._in_use -= 1
+        idle = self._idle.setdefault((host, port), deque())
+        if len(idle) < self.max_idle:
+            idle.append((conn, time.monotonic()))
+            return
+
+        self._overflow += 1
+        conn[1].close()
+
+    def discard(self, conn: Connection) -> None:
+        """
+        Cierra una conexión en uso sin devolverla al pool
+
+        Args:
+            conn: Conexión a descartar
+        """
+        self._drop(conn, "_discarded")
+
+    async def close_all(self) -> None:
+        """Cierra todas las conexiones inactivas"""
+        writers = [conn[1] for idle in self._idle.values() for conn, _ in idle]
+        self._idle.clear()
+
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso del pool
+
+        Returns:
+            Diccionario con contadores y tasa de reutilización
+        """
+        checkouts = self._created + self._reused
+        return {
+            'created': self._created,
+            'reused': self._reused,
+            'expired': self._expired,
+            'stale': self._stale,
+            'discarded': self._discarded,
+            'overflow': self._overflow,
+            'in_use': self._in_use,
+            'idle': sum(len(idle) for idle in self._idle.values()),
+            'reuse_rate': self._reused / checkouts if checkouts else 0.0
+        }
+
+    def _drop(self, conn: Connection, counter: str) -> None:
+        """Cierra una conexión en uso y actualiza el contador indicado"""
+        self._in_use -= 1
+        setattr(self, counter, getattr(self, counter) + 1)
+        conn[1].close()
+
+    @staticmethod
+    def _is_stale(conn: Connection) -> bool:
+        """Verifica si una conexión inactiva fue cerrada por el servidor"""
+        reader, writer = conn
+        return reader.at_eof() or writer.is_closing()
+
+
+class AsyncHTTPClient:
+    """Cliente HTTP asíncrono para hacer requests HTTPS"""
+
+    def __init__(
+        self,
+        host: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        pool: Optional[AsyncConnectionPool] = None,
+        compression: bool = True,
+        port: int = 443,
+        use_tls: bool = True
+    ):
+        """
+        Args:
+            host: Hostname del servidor (sin https://)
+            headers: Headers HTTP por defecto
+            timeout: Timeout en segundos
+            pool: Pool de conexiones persistentes (se crea uno si no se indica)
+            compression: Si se negocian respuestas comprimidas (Accept-Encoding)
+            port: Puerto del servidor
+            use_tls: Si la conexión usa TLS (HTTPS)
+        """
+        self.host = host
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.pool = pool or AsyncConnectionPool()
+        self.compression = compression
+        self.port = port
+        self.ssl_context = ssl.create_default_context() if use_tls else None
+        logger.debug(f"AsyncHTTPClient inicializado para {host}")
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Realiza un GET request
+
+        Args:
+            endpoint: Endpoint de la API (ej: "/api/search")
+            params: Parámetros de query
+
+        Returns:
+            Respuesta JSON parseada
+
+        Raises:
+            HTTPError: Si el status code no es 200
+            json.JSONDecodeError: Si la respuesta no es JSON válido
+        """
+        full_endpoint = self._build_endpoint(endpoint, params)
+        logger.debug(f"GET {self.host}{full_endpoint}")
+
+        status_code, data = await self._request("GET", full_endpoint, headers=self.headers)
+
+        logger.debug(f"Response: {status_code}, {len(data)} bytes")
+
+        if status_code != 200:
+            error_msg = data.decode('utf-8', errors='ignore')[:200]
+            raise HTTPError(status_code, error_msg)
+
+        return json_codec.loads(data)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Realiza un POST request
+
+        Args:
+            endpoint: Endpoint de la API
+            data: Datos para el body (se serializan a JSON)
+            params: Parámetros de query
+
+        Returns:
+            Respuesta JSON parseada
+
+        Raises:
+            HTTPError: Si el status code no es 200-201
+        """
+        full_endpoint = self._build_endpoint(endpoint, params)
+        body = json_codec.dumps(data or {})
+
+        headers = self.headers.copy()
+        headers['Content-Type'] = 'application/json'
+
+        logger.debug(f"POST {self.host}{full_endpoint}")
+
+        status_code, response_data = await self._request("POST", full_endpoint, body=body, headers=headers)
+
+        logger.debug(f"Response: {status_code}, {len(response_data)} bytes")
+
+        if status_code not in (200, 201):
+            error_msg = response_data.decode('utf-8', errors='ignore')[:200]
+            raise HTTPError(status_code, error_msg)
+
+        return json_codec.loads(response_data)
+
+    async def close(self) -> None:
+        """Cierra las conexiones persistentes inactivas del pool"""
+        await self.pool.close_all()
+
+    @staticmethod
+    def _build_endpoint(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Construye el endpoint con query string"""
+        query_string = urllib.parse.urlencode(params or {})
+        return f"{endpoint}?{query_string}" if query_string else endpoint
+
+    async def _request(
+        self,
+        method: str,
+        full_endpoint: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Envía una petición usando una conexión del pool
+
+        Args:
+            method: Método HTTP
+            full_endpoint: Endpoint con query string
+            body: Body de la petición (opcional)
+            headers: Headers HTTP
+
+        Returns:
+            Tupla (status code, body de la respuesta)
+        """
+        request = self._serialize_request(method, full_endpoint, body, headers or {})
+
+        while True:
+            conn, reused = await self.pool.acquire(self.host, self.port, self.timeout, self.ssl_context)
+            reader, writer = conn
+
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_code, data, reusable = await asyncio.wait_for(
+                    self._read_response(reader, method),
+                    self.timeout
+                )
+            except STALE_CONNECTION_ERRORS as e:
+                self.pool.discard(conn)
+                if reused:
+                    logger.debug(f"Conexión reutilizada cerrada por el servidor ({e}), reconectando")
+                    continue
+                raise
+            except BaseException:
+                self.pool.discard(conn)
+                raise
+
+            self.pool.release(self.host, self.port, conn, reusable=reusable)
+            return status_code, data
+
+    def _serialize_request(
+        self,
+        method: str,
+        full_endpoint: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> bytes:
+        """Serializa la línea de petición, headers y body en bytes"""
+        all_headers = {'Host': self.host, 'Connection': 'keep-alive'}
+        if self.compression:
+            all_headers['Accept-Encoding'] = ACCEPT_ENCODING
+        all_headers.update(headers)
+        if body is not None:
+            all_headers['Content-Length'] = str(len(body))
+
+        lines = [f"{method} {full_endpoint} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in all_headers.items())
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1')
+        return head + body if body else head
+
+    async def _read_response(self, reader: asyncio.StreamReader, method: str) -> Tuple[int, bytes, bool]:
+        """
+        Lee y parsea una respuesta HTTP/1.1
+
+        Returns:
+            Tupla (status code, body descomprimido, conexión reutilizable)
+        """
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise asyncio.IncompleteReadError(b"", None)
+
+            version, status_code = self._parse_status_line(status_line)
+            headers = await self._read_headers(reader)
+
+            # Respuestas informativas (100 Continue, etc.): esperar la definitiva
+            if 100 <= status_code < 200:
+                continue
+            break
+
+        connection = headers.get('connection', '').lower()
+        reusable = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        decoder = get_decoder(headers.get('content-encoding')) if self.compression else None
+        body = bytearray()
+
+        def feed(chunk: bytes) -> None:
+            body.extend(decoder.decompress(chunk) if decoder else chunk)
+
+        if method == 'HEAD' or status_code in (204, 304):
+            pass
+        elif 'chunked' in headers.get('transfer-encoding', '').lower():
+            await self._read_chunked(reader, feed)
+        elif 'content-length' in headers:
+            remaining = int(headers['content-length'])
+            while remaining > 0:
+                chunk = await reader.readexactly(min(remaining, READ_CHUNK_SIZE))
+                remaining -= len(chunk)
+                feed(chunk)
+        else:
+            # Sin longitud conocida: el body termina al cerrar la conexión
+            reusable = False
+            while True:
+                chunk = await reader.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                feed(chunk)
+
+        if decoder:
+            body.extend(decoder.flush())
+
+        return status_code, body, reusable
+
+    @staticmethod
+    def _parse_status_line(line: bytes) -> Tuple[str, int]:
+        """Parsea 'HTTP/1.1 200 OK' en (versión, status code)"""
+        parts = line.decode('latin-1').strip().split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise HTTPError(502, f"Línea de estado inválida: {line[:100]!r}")
+        try:
+            return parts[0], int(parts[1])
+        except ValueError:
+            raise HTTPError(502, f"Línea de estado inválida: {line[:100]!r}")
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+        """Lee headers hasta la línea vacía; las claves se normalizan a minúsculas"""
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            if line in (b"\r\n", b"\n"):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader, feed: Any) -> None:
+        """Lee un body con Transfer-Encoding: chunked"""
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise asyncio.IncompleteReadError(b"", None)
+            size = int(size_line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                break
+            feed(await reader.readexactly(size))
+            await reader.readexactly(2)  # CRLF tras cada bloque
+
+        # Trailers opcionales hasta la línea vacía
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: async_jsearch_client.py
+Descripción: Versión asyncio del cliente para la API JSearch de OpenWeb Ninja.
+             Mantiene las firmas de JSearchClient con métodos awaitables.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import logging
+from typing import List, Dict, Any, Optional
+from src.api.async_client import AsyncHTTPClient, AsyncConnectionPool
+from src.api.client import HTTPError
+from src.api.rate_limiter import AsyncRateLimiter
+from src.api.retry_policy import build_retry_policy
+from src.models.search_params import SearchParameters
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJSearchClient:
+    """Cliente asíncrono para interactuar con JSearch API de OpenWeb Ninja"""
+
+    def __init__(self, api_key: str, api_host: str = "api.openwebninja.com", config: Any = None):
+        """
+        Args:
+            api_key: API key de OpenWeb Ninja
+            api_host: Host de la API
+            config: Objeto Config opcional con configuración
+        """
+        self.api_key = api_key
+        self.api_host = api_host
+
+        # Crear cliente HTTP asíncrono
+        self.client = AsyncHTTPClient(
+            host=api_host,
+            headers={'x-api-key': api_key},
+            timeout=config.request_timeout if config else 30,
+            pool=AsyncConnectionPool(
+                max_idle=config.pool_max_idle if config else 10,
+                idle_timeout=config.pool_idle_timeout if config else 60.0
+            ),
+            compression=config.http_compression if config else True
+        )
+
+        # Configurar rate limiter
+        self.rate_limiter = AsyncRateLimiter(
+            delay=config.rate_limit_delay if config else 1.0,
+            max_retries=config.max_retries if config else 3,
+            retry_delay=config.retry_delay if config else 2,
+            retry_policy=build_retry_policy(config)
+        )
+
+        logger.info(f"AsyncJSearchClient inicializado para {api_host}")
+
+    async def close(self) -> None:
+        """Cierra las conexiones persistentes del cliente"""
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncJSearchClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso del cliente
+
+        Returns:
+            Diccionario con estadísticas del pool de conexiones
+        """
+        return {
+            'connection_pool': self.client.pool.stats()
+        }
+
+    async def search_jobs(self, params: SearchParameters) -> List[Dict[str, Any]]:
+        """
+        Busca trabajos usando JSearch API
+
+        Args:
+            params: Parámetros de búsqueda validados
+
+        Returns:
+            Lista de trabajos encontrados
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/search"
+        api_params = params.to_api_params()
+
+        logger.info(f"Buscando trabajos: {params.query} en {params.country}")
+
+        @self.rate_limiter.with_retry
+        async def _make_request():
+            response = await self.client.get(endpoint, api_params)
+
+            if "error" in response:
+                raise HTTPError(400, response.get("error"))
+
+            return response.get("data", [])
+
+        try:
+            jobs = await _make_request()
+            logger.info(f"Encontrados {len(jobs)} trabajos")
+            return jobs
+        except HTTPError as e:
+            if e.status_code == 429:
+                logger.error("Rate limit excedido")
+                raise HTTPError(429, "Rate limit excedido. Intenta más tarde.")
+            raise
+
+    async def get_job_details(
+        self,
+        job_id: str,
+        country: str = "us",
+        language: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Obtiene detalles de un trabajo específico
+
+        Args:
+            job_id: ID del trabajo
+            country: Código de país
+            language: Código de idioma (opcional)
+            fields: Campos específicos a incluir (opcional)
+
+        Returns:
+            Detalles del trabajo
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/job-details"
+        params = {
+            'job_id': job_id,
+            'country': country
+        }
+
+        if language:
+            params['language'] = language
+        if fields:
+            params['fields'] = fields
+
+        logger.info(f"Obteniendo detalles del trabajo: {job_id}")
+
+        @self.rate_limiter.with_retry
+        async def _make_request():
+            response = await self.client.get(endpoint, params)
+
+            if "error" in response:
+                raise HTTPError(400, response.get("error"))
+
+            data = response.get("data", [])
+            if not data:
+                raise HTTPError(404, "Trabajo no encontrado")
+
+            return data[0]
+
+        return await _make_request()
+
+    async def get_estimated_salary(
+        self,
+        job_title: str,
+        location: str,
+        location_type: str = "ANY",
+        years_of_experience: str = "ALL",
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene estimación de salarios
+
+        Args:
+            job_title: Título del trabajo
+            location: Ubicación
+            location_type: Tipo de ubicación (ANY, CITY, STATE, COUNTRY)
+            years_of_experience: Nivel de experiencia
+            fields: Campos específicos (opcional)
+
+        Returns:
+            Lista con información salarial
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/estimated-salary"
+        params = {
+            'job_title': job_title,
+            'location': location,
+            'location_type': location_type,
+            'years_of_experience': years_of_experience
+        }
+
+        if fields:
+            params['fields'] = fields
+
+        logger.info(f"Obteniendo estimación salarial: {job_title} en {location}")
+
+        @self.rate_limiter.with_retry
+        async def _make_request():
+            response = await self.client.get(endpoint, params)
+
+            if "error" in response:
+                raise HTTPError(400, response.get("error"))
+
+            return response.get("data", [])
+
+        return await _make_request()
+
+    async def get_company_salary(
+        self,
+        company: str,
+        job_title: str,
+        location: Optional[str] = None,
+        location_type: str = "ANY",
+        years_of_experience: str = "ALL"
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtiene salarios de una empresa específica
+
+        Args:
+            company: Nombre de la empresa
+            job_title: Título del trabajo
+            location: Ubicación (opcional)
+            location_type: Tipo de ubicación
+            years_of_experience: Nivel de experiencia
+
+        Returns:
+            Lista con información salarial de la empresa
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/company-job-salary"
+        params = {
+            'company': company,
+            'job_title': job_title,
+            'location_type': location_type,
+            'years_of_experience': years_of_experience
+        }
+
+        if location:
+            params['location'] = location
+
+        logger.info(f"Obteniendo salarios de {company} para {job_title}")
+
+        @self.rate_limiter.with_retry
+        async def _make_request():
+            response = await self.client.get(endpoint, params)
+
+            if "error" in response:
+                raise HTTPError(400, response.get("error"))
+
+            return response.get("data", [])
+
+        return await _make_request()
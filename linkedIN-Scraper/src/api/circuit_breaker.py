@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: circuit_breaker.py
+Descripción: Circuit breaker por endpoint (cerrado / abierto / semiabierto) para
+             fallar rápido mientras la API está degradada, en lugar de bloquear
+             cada petición con reintentos y backoff.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple, TypeVar
+from src.api.client import HTTPError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Estados del circuito
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(HTTPError):
+    """El circuito del endpoint está abierto: la petición no se envía"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            503,
+            f"API no disponible temporalmente para {endpoint}; reintenta en {retry_after:.0f}s"
+        )
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Indica si un error refleja un problema de la API y no de la petición
+
+    Los errores 5xx, 429 y de red cuentan como fallos; el resto de 4xx
+    (parámetros inválidos, trabajo no encontrado...) no.
+
+    Args:
+        error: Excepción lanzada por la petición
+
+    Returns:
+        True si el error debe contar para abrir el circuito
+    """
+    if isinstance(error, HTTPError):
+        return error.status_code >= 500 or error.status_code == 429
+    return isinstance(error, (OSError, TimeoutError))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker con ventana deslizante de las últimas llamadas
+
+    El circuito se abre cuando, con al menos `min_calls` llamadas en la
+    ventana, la fracción de fallos alcanza `failure_rate_threshold` o la de
+    llamadas lentas alcanza `slow_call_rate_threshold`. Tras `open_duration`
+    segundos pasa a semiabierto y deja pasar `half_open_max_calls` llamadas
+    de prueba: si todas van bien se cierra, si alguna falla se vuelve a abrir.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 10.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Args:
+            name: Nombre del circuito (endpoint)
+            failure_rate_threshold: Fracción de fallos que abre el circuito
+            slow_call_duration: Segundos a partir de los que una llamada es lenta
+            slow_call_rate_threshold: Fracción de llamadas lentas que abre el circuito
+            window_size: Número de llamadas recientes consideradas
+            min_calls: Llamadas mínimas en la ventana antes de evaluar
+            open_duration: Segundos que el circuito permanece abierto
+            half_open_max_calls: Llamadas de prueba en estado semiabierto
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)  # (fallo, lenta)
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._generation = 0  # cambia con cada transición de estado
+        self._lock = threading.Lock()
+
+        # Estadísticas
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Estado actual (pasa a semiabierto si ya venció el tiempo abierto)"""
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self._generation += 1
+
+    def _refresh_state(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._set_state(HALF_OPEN)
+            self._half_open_calls = 0
+            self._half_open_successes = 0
+            logger.info(f"Circuito {self.name}: semiabierto, probando la API")
+
+    def _open(self) -> None:
+        self._set_state(OPEN)
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        logger.warning(f"Circuito {self.name}: abierto durante {self.open_duration:.0f}s")
+
+    def _before_call(self) -> int:
+        """
+        Reserva permiso para una llamada o lanza CircuitOpenError
+
+        Returns:
+            Generación del estado en que se admitió la llamada (para _after_call)
+        """
+        with self._lock:
+            self._refresh_state()
+
+            if self._state == OPEN:
+                self._rejected += 1
+                retry_after = self.open_duration - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(self.name, max(retry_after, 0.0))
+
+            if self._state == HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_calls += 1
+
+            return self._generation
+
+    def _after_call(self, generation: int, failed: bool, duration: float) -> None:
+        """
+        Registra el resultado de una llamada y actualiza el estado
+
+        Solo cuentan las llamadas admitidas en el estado actual: una llamada
+        lenta admitida con el circuito cerrado que termina ya en semiabierto
+        no es una prueba, y no debe volver a abrirlo ni cerrarlo.
+        """
+        slow = duration >= self.slow_call_duration
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            if self._state == HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                    return
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._set_state(CLOSED)
+                    self._window.clear()
+                    logger.info(f"Circuito {self.name}: cerrado, la API responde de nuevo")
+                return
+
+            self._window.append((failed, slow))
+            calls = len(self._window)
+            if calls < self.min_calls:
+                return
+
+            failure_rate = sum(1 for f, _ in self._window if f) / calls
+            slow_rate = sum(1 for _, s in self._window if s) / calls
+            if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_call_rate_threshold:
+                self._open()
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        Ejecuta `func` si el circuito lo permite
+
+        Args:
+            func: Llamada a proteger
+
+        Returns:
+            Resultado de `func`
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto
+        """
+        generation = self._before_call()
+
+        start = time.monotonic()
+        try:
+            result = func()
+        except BaseException as e:
+            self._after_call(generation, is_upstream_failure(e), time.monotonic() - start)
+            raise
+
+        self._after_call(generation, False, time.monotonic() - start)
+        return result
+
+    def reset(self) -> None:
+        """Vuelve al estado cerrado descartando el historial"""
+        with self._lock:
+            self._set_state(CLOSED)
+            self._window.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna el estado del circuito
+
+        Returns:
+            Diccionario con estado, tasas de la ventana y contadores
+        """
+        with self._lock:
+            self._refresh_state()
+            calls = len(self._window)
+            return {
+                'state': self._state,
+                'calls': calls,
+                'failure_rate': sum(1 for f, _ in self._window if f) / calls if calls else 0.0,
+                'slow_call_rate': sum(1 for _, s in self._window if s) / calls if calls else 0.0,
+                'rejected': self._rejected,
+                'times_opened': self._times_opened,
+                'retry_after': (
+                    max(self.open_duration - (time.monotonic() - self._opened_at), 0.0)
+                    if self._state == OPEN else None
+                )
+            }
+
+
+class CircuitBreakerRegistry:
+    """Un CircuitBreaker por endpoint, creado bajo demanda"""
+
+    def __init__(self, **breaker_options: Any):
+        """
+        Args:
+            **breaker_options: Parámetros para cada CircuitBreaker
+        """
+        self.breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """
+        Obtiene (o crea) el circuito de un endpoint
+
+        Args:
+            endpoint: Endpoint sin query string
+
+        Returns:
+            CircuitBreaker del endpoint
+        """
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, **self.breaker_options)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def call(self, endpoint: str, func: Callable[[], T]) -> T:
+        """
+        Ejecuta `func` protegida por el circuito del endpoint
+
+        Args:
+            endpoint: Endpoint sin query string
+            func: Llamada a proteger
+
+        Returns:
+            Resultado de `func`
+
+        Raises:
+            CircuitOpenError: Si el circuito del endpoint está abierto
+        """
+        return self.get(endpoint).call(func)
+
+    def is_healthy(self) -> bool:
+        """True si ningún circuito está abierto"""
+        return all(state['state'] != OPEN for state in self.snapshot().values())
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna el estado de todos los circuitos
+
+        Returns:
+            {endpoint: estado}
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
@@ -3,7 +3,8 @@
 """
 Nombre del archivo: client.py
 Descripción: Cliente HTTP genérico para realizar peticiones HTTPS a APIs externas.
-             Proporciona métodos GET y POST con manejo de errores y parsing JSON.
+             Proporciona métodos GET y POST con manejo de errores, parsing JSON
+             y descompresión incremental de respuestas gzip/deflate/brotli.
 
 Autor: Hex686f6c61
 Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
@@ -11,13 +12,38 @@ Versión: 3.0.0
 Fecha: 2025-12-08
 """
 import http.client
-import json
 import urllib.parse
 import logging
-from typing import Dict, Any, Optional
+import time
+import zlib
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple
+from src.api.connection_pool import ConnectionPool
+from src.api.http_cache import ConditionalCache
+from src.api.json_stream import JSONArrayStreamParser
+from src.api.metrics import LatencyMetrics, RequestTiming, timed_connect
+from src.utils import json_codec
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
+# Tamaño de bloque para leer y descomprimir respuestas comprimidas
+READ_CHUNK_SIZE = 64 * 1024
+
+# Codificaciones anunciadas en Accept-Encoding (brotli solo si está instalado)
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli else "gzip, deflate"
+
+# Errores que indican que una conexión reutilizada fue cerrada por el servidor
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError
+)
+
 
 class HTTPError(Exception):
     """Excepción para errores HTTP"""
@@ -28,6 +54,177 @@ class HTTPError(Exception):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class _DeflateDecoder:
+    """Descompresor 'deflate' que acepta tanto formato zlib como deflate crudo"""
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj()
+        self._first_chunk = True
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._first_chunk:
+            self._first_chunk = False
+            try:
+                return self._decompressor.decompress(chunk)
+            except zlib.error:
+                # Algunos servidores envían deflate sin cabecera zlib
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(chunk)
+
+    def flush(self) -> bytes:
+        return self._decompressor.flush()
+
+
+class _BrotliDecoder:
+    """Adaptador de brotli.Decompressor a la interfaz decompress/flush"""
+
+    def __init__(self):
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decompressor.process(chunk)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def get_decoder(content_encoding: Any) -> Optional[Any]:
+    """
+    Crea un descompresor incremental para el Content-Encoding indicado
+
+    Args:
+        content_encoding: Valor del header Content-Encoding
+
+    Returns:
+        Objeto con métodos decompress/flush, o None si no hay que descomprimir
+    """
+    if not isinstance(content_encoding, str):
+        return None
+
+    encoding = content_encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        return _DeflateDecoder()
+    if encoding == "br" and brotli:
+        return _BrotliDecoder()
+    return None
+
+
+def iter_body(response: Any) -> Iterator[bytes]:
+    """
+    Itera el body de una respuesta por bloques, descomprimiéndolos si hace falta
+
+    Args:
+        response: Respuesta HTTP (http.client.HTTPResponse)
+
+    Yields:
+        Bloques del body ya descomprimidos
+    """
+    decoder = get_decoder(response.getheader('Content-Encoding'))
+    while True:
+        chunk = response.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = decoder.decompress(chunk) if decoder else chunk
+        if data:
+            yield data
+
+    if decoder:
+        tail = decoder.flush()
+        if tail:
+            yield tail
+
+
+def read_body(response: Any) -> bytes:
+    """
+    Lee el body de una respuesta, descomprimiéndolo por bloques si viene comprimido
+
+    Los bloques comprimidos se descartan a medida que se descomprimen, de modo
+    que nunca se mantiene en memoria el payload comprimido completo.
+
+    Args:
+        response: Respuesta HTTP (http.client.HTTPResponse)
+
+    Returns:
+        Body descomprimido
+    """
+    if get_decoder(response.getheader('Content-Encoding')) is None:
+        return response.read()
+
+    body = bytearray()
+    for chunk in iter_body(response):
+        body += chunk
+    return body
+
+
+class StreamedResponse:
+    """
+    Respuesta JSON cuyo array `key` se parsea de forma incremental
+
+    La conexión vuelve al pool cuando el documento se consume completo; si el
+    consumidor abandona la iteración antes, la conexión se descarta. La
+    latencia de transferencia solo se registra para documentos completos.
+    """
+
+    def __init__(
+        self,
+        client: "HTTPClient",
+        conn: http.client.HTTPSConnection,
+        response: Any,
+        key: str,
+        endpoint: Optional[str] = None,
+        timing: Optional[RequestTiming] = None
+    ):
+        self._client = client
+        self._conn = conn
+        self._response = response
+        self._parser = JSONArrayStreamParser(key)
+        self._finished = False
+        self._endpoint = endpoint
+        self._timing = timing
+
+    @property
+    def extras(self) -> Dict[str, Any]:
+        """Valores de primer nivel distintos del array (status, error, ...)"""
+        return self._parser.extras
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._finished:
+            return
+
+        completed = False
+        transfer = 0.0
+        try:
+            chunks = iter_body(self._response)
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                transfer += time.perf_counter() - start
+                if chunk is None:
+                    break
+                yield from self._parser.feed(chunk)
+            self._parser.close()
+            completed = True
+        finally:
+            self._finished = True
+            if completed:
+                self._client.pool.release(
+                    self._client.host, self._conn, reusable=not self._response.will_close
+                )
+                if self._timing is not None:
+                    self._timing.add('transfer', transfer)
+                    self._client._record(self._endpoint, self._timing)
+            else:
+                self._client.pool.discard(self._conn)
+
+    def close(self) -> None:
+        """Abandona la respuesta sin consumirla, descartando la conexión"""
+        if not self._finished:
+            self._finished = True
+            self._client.pool.discard(self._conn)
+
+
 class HTTPClient:
     """Cliente HTTP genérico para hacer requests HTTPS"""
 
@@ -35,23 +232,43 @@ class HTTPClient:
         self,
         host: str,
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        pool: Optional[ConnectionPool] = None,
+        compression: bool = True,
+        cache: Optional[ConditionalCache] = None,
+        metrics: Optional[LatencyMetrics] = None,
+        on_response: Optional[Callable[[int, Dict[str, str]], None]] = None
     ):
         """
         Args:
             host: Hostname del servidor (sin https://)
             headers: Headers HTTP por defecto
             timeout: Timeout en segundos
+            pool: Pool de conexiones persistentes (se crea uno si no se indica)
+            compression: Si se negocian respuestas comprimidas (Accept-Encoding)
+            cache: Caché de respuestas con ETag/Last-Modified para GET condicionales
+            metrics: Histogramas de latencia por fase (se crean si no se indican)
+            on_response: Callback (status, headers en minúsculas) para cada respuesta recibida
         """
         self.host = host
         self.headers = headers or {}
         self.timeout = timeout
+        self.pool = pool or ConnectionPool()
+        self.compression = compression
+        self.cache = cache
+        self.metrics = metrics or LatencyMetrics()
+        self.on_response = on_response
         logger.debug(f"HTTPClient inicializado para {host}")
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Realiza un GET request
 
+        Con caché configurada, si hay una respuesta previa con validadores se
+        envía If-None-Match/If-Modified-Since; un 304 devuelve el resultado ya
+        parseado sin descargar ni parsear de nuevo. El resultado cacheado se
+        comparte entre llamadas y no debe modificarse.
+
         Args:
             endpoint: Endpoint de la API (ej: "/api/search")
             params: Parámetros de query
@@ -63,39 +280,45 @@ class HTTPClient:
             HTTPError: Si el status code no es 200
             json.JSONDecodeError: Si la respuesta no es JSON válido
         """
-        params = params or {}
-
-        # Construir URL con parámetros
-        query_string = urllib.parse.urlencode(params)
-        full_endpoint = f"{endpoint}?{query_string}" if query_string else endpoint
+        full_endpoint = self._build_endpoint(endpoint, params)
 
         logger.debug(f"GET {self.host}{full_endpoint}")
 
-        # Crear conexión HTTPS
-        conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
-
-        try:
-            # Realizar request
-            conn.request("GET", full_endpoint, headers=self.headers)
-
-            # Obtener respuesta
-            response = conn.getresponse()
-            status_code = response.status
-            data = response.read()
-
-            logger.debug(f"Response: {status_code}, {len(data)} bytes")
-
-            # Verificar status code
-            if status_code != 200:
-                error_msg = data.decode('utf-8', errors='ignore')[:200]
-                raise HTTPError(status_code, error_msg)
-
-            # Parsear JSON
-            result = json.loads(data.decode('utf-8'))
-            return result
-
-        finally:
-            conn.close()
+        headers = self.headers
+        cached = self.cache.get(full_endpoint) if self.cache else None
+        if cached:
+            headers = {**self.headers, **cached.conditional_headers()}
+
+        timing = RequestTiming()
+        conn, response = self._send("GET", full_endpoint, headers=headers, timing=timing)
+        data = self._read_and_release(conn, response, timing)
+        status_code = response.status
+        self._record(endpoint, timing)
+
+        logger.debug(f"Response: {status_code}, {len(data)} bytes")
+
+        # Respuesta sin cambios: reutilizar el resultado parseado
+        if status_code == 304 and cached:
+            logger.debug(f"304 Not Modified: usando respuesta cacheada de {full_endpoint}")
+            self.cache.mark_revalidated()
+            return cached.result
+
+        # Verificar status code
+        if status_code != 200:
+            error_msg = data.decode('utf-8', errors='ignore')[:200]
+            raise HTTPError(status_code, error_msg)
+
+        # Parsear JSON
+        result = json_codec.loads(data)
+
+        if self.cache:
+            self.cache.store(
+                full_endpoint,
+                response.getheader('ETag'),
+                response.getheader('Last-Modified'),
+                result
+            )
+        return result
 
     def post(
         self,
@@ -117,15 +340,11 @@ class HTTPClient:
         Raises:
             HTTPError: Si el status code no es 200-201
         """
-        params = params or {}
         data = data or {}
-
-        # Construir URL con parámetros
-        query_string = urllib.parse.urlencode(params)
-        full_endpoint = f"{endpoint}?{query_string}" if query_string else endpoint
+        full_endpoint = self._build_endpoint(endpoint, params)
 
         # Preparar body
-        body = json.dumps(data).encode('utf-8')
+        body = json_codec.dumps(data)
 
         # Headers para JSON
         headers = self.headers.copy()
@@ -134,28 +353,196 @@ class HTTPClient:
 
         logger.debug(f"POST {self.host}{full_endpoint}")
 
-        # Crear conexión HTTPS
-        conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        timing = RequestTiming()
+        status_code, response_data = self._request(
+            "POST", full_endpoint, body=body, headers=headers, timing=timing
+        )
+        self._record(endpoint, timing)
 
-        try:
-            # Realizar request
-            conn.request("POST", full_endpoint, body=body, headers=headers)
+        logger.debug(f"Response: {status_code}, {len(response_data)} bytes")
 
-            # Obtener respuesta
-            response = conn.getresponse()
-            status_code = response.status
-            response_data = response.read()
+        # Verificar status code
+        if status_code not in (200, 201):
+            error_msg = response_data.decode('utf-8', errors='ignore')[:200]
+            raise HTTPError(status_code, error_msg)
 
-            logger.debug(f"Response: {status_code}, {len(response_data)} bytes")
+        # Parsear JSON
+        result = json_codec.loads(response_data)
+        return result
 
-            # Verificar status code
-            if status_code not in (200, 201):
-                error_msg = response_data.decode('utf-8', errors='ignore')[:200]
-                raise HTTPError(status_code, error_msg)
+    def cached_result(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Resultado cacheado de un GET, sin revalidarlo con el servidor
 
-            # Parsear JSON
-            result = json.loads(response_data.decode('utf-8'))
-            return result
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query
 
-        finally:
-            conn.close()
+        Returns:
+            Respuesta parseada previamente o None si no hay entrada
+        """
+        if not self.cache:
+            return None
+        cached = self.cache.get(self._build_endpoint(endpoint, params))
+        if cached is None:
+            return None
+        self.cache.mark_served_stale()
+        logger.debug(f"Sirviendo {endpoint} desde caché sin revalidar")
+        return cached.result
+
+    def stream_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: str = "data"
+    ) -> StreamedResponse:
+        """
+        Realiza un GET cuyo array `key` se parsea de forma incremental
+
+        El status se verifica antes de devolver; los elementos se leen y
+        decodifican a medida que se itera la respuesta, sin cargar el body
+        completo en memoria.
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query
+            key: Clave del array de primer nivel a emitir
+
+        Returns:
+            Respuesta iterable elemento a elemento
+
+        Raises:
+            HTTPError: Si el status code no es 200
+        """
+        full_endpoint = self._build_endpoint(endpoint, params)
+
+        logger.debug(f"GET (stream) {self.host}{full_endpoint}")
+
+        timing = RequestTiming()
+        conn, response = self._send("GET", full_endpoint, headers=self.headers, timing=timing)
+
+        if response.status != 200:
+            data = self._read_and_release(conn, response, timing)
+            self._record(endpoint, timing)
+            error_msg = data.decode('utf-8', errors='ignore')[:200]
+            raise HTTPError(response.status, error_msg)
+
+        return StreamedResponse(self, conn, response, key, endpoint=endpoint, timing=timing)
+
+    def close(self) -> None:
+        """Cierra las conexiones persistentes inactivas del pool"""
+        self.pool.close_all()
+
+    @staticmethod
+    def _build_endpoint(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        """Construye el endpoint con query string"""
+        query_string = urllib.parse.urlencode(params or {})
+        return f"{endpoint}?{query_string}" if query_string else endpoint
+
+    def _record(self, endpoint: str, timing: RequestTiming) -> None:
+        """Cierra la medición de una petición y la agrega al endpoint"""
+        timing.finish()
+        self.metrics.record(endpoint, timing)
+
+    def _request(
+        self,
+        method: str,
+        full_endpoint: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timing: Optional[RequestTiming] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Envía una petición y lee la respuesta completa
+
+        Args:
+            method: Método HTTP
+            full_endpoint: Endpoint con query string
+            body: Body de la petición (opcional)
+            headers: Headers HTTP
+            timing: Medición de latencia a completar (opcional)
+
+        Returns:
+            Tupla (status code, body de la respuesta)
+        """
+        conn, response = self._send(method, full_endpoint, body=body, headers=headers, timing=timing)
+        data = self._read_and_release(conn, response, timing)
+        return response.status, data
+
+    def _send(
+        self,
+        method: str,
+        full_endpoint: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timing: Optional[RequestTiming] = None
+    ) -> Tuple[http.client.HTTPSConnection, Any]:
+        """
+        Envía una petición usando una conexión del pool y espera los headers
+
+        Si una conexión reutilizada resulta estar cerrada por el servidor,
+        se descarta y se reintenta una vez con una conexión nueva. Con
+        `timing`, las conexiones nuevas se abren explícitamente para medir
+        DNS/TCP/TLS, y el tiempo hasta los headers se registra como 'ttfb'.
+
+        Returns:
+            Tupla (conexión en uso, respuesta con el body aún sin leer)
+        """
+        headers = dict(headers or {})
+        if self.compression:
+            headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
+
+        while True:
+            conn, reused = self.pool.acquire(self.host, self.timeout)
+
+            try:
+                if timing is not None:
+                    timing.reused_connection = reused
+                    if not reused and getattr(conn, 'sock', None) is None:
+                        timed_connect(conn, timing)
+
+                start = time.perf_counter()
+                conn.request(method, full_endpoint, body=body, headers=headers)
+                response = conn.getresponse()
+                if timing is not None:
+                    timing.add('ttfb', time.perf_counter() - start)
+                self._notify(response)
+                return conn, response
+            except STALE_CONNECTION_ERRORS as e:
+                self.pool.discard(conn)
+                if reused:
+                    logger.debug(f"Conexión reutilizada cerrada por el servidor ({e}), reconectando")
+                    continue
+                raise
+            except BaseException:
+                self.pool.discard(conn)
+                raise
+
+    def _notify(self, response: Any) -> None:
+        """Pasa status y headers de la respuesta al callback on_response"""
+        if self.on_response is None:
+            return
+        try:
+            headers = {name.lower(): value for name, value in response.getheaders()}
+        except (AttributeError, TypeError):
+            headers = {}
+        self.on_response(response.status, headers)
+
+    def _read_and_release(
+        self,
+        conn: http.client.HTTPSConnection,
+        response: Any,
+        timing: Optional[RequestTiming] = None
+    ) -> bytes:
+        """Lee el body completo y devuelve la conexión al pool"""
+        start = time.perf_counter()
+        try:
+            data = read_body(response)
+        except BaseException:
+            self.pool.discard(conn)
+            raise
+
+        if timing is not None:
+            timing.add('transfer', time.perf_counter() - start)
+        self.pool.release(self.host, conn, reusable=not response.will_close)
+        return data
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: connection_pool.py
+Descripción: Pool thread-safe de conexiones HTTPS persistentes (keep-alive) por host.
+             Reutiliza conexiones para evitar handshakes TCP + TLS en cada petición.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import http.client
+import logging
+import select
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """
+    Pool thread-safe de conexiones HTTPS persistentes por host
+
+    Solo limita las conexiones inactivas que se conservan: nunca hace esperar
+    a una petición, así que con mucha concurrencia se abren las conexiones
+    necesarias y al liberarse se cierran las que no caben en `max_idle`.
+    """
+
+    def __init__(self, max_idle: int = 10, idle_timeout: float = 60.0):
+        """
+        Args:
+            max_idle: Número máximo de conexiones inactivas conservadas por host
+            idle_timeout: Segundos que una conexión puede estar inactiva antes de descartarse
+        """
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        # host -> cola de (conexión, instante en que quedó libre)
+        self._idle: Dict[str, Deque[Tuple[http.client.HTTPSConnection, float]]] = {}
+        self._in_use = 0
+
+        # Estadísticas
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+        self._stale = 0
+        self._discarded = 0
+        self._overflow = 0
+
+    def acquire(self, host: str, timeout: float) -> Tuple[http.client.HTTPSConnection, bool]:
+        """
+        Obtiene una conexión para el host, reutilizando una inactiva si está sana
+
+        Args:
+            host: Hostname del servidor
+            timeout: Timeout de la conexión en segundos
+
+        Returns:
+            Tupla (conexión, reutilizada)
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(host)
+                if not idle:
+                    self._created += 1
+                    self._in_use += 1
+                    break
+                conn, released_at = idle.pop()  # LIFO: la más reciente suele estar viva
+                self._in_use += 1
+
+            # El chequeo de salud se hace fuera del lock
+            if time.monotonic() - released_at > self.idle_timeout:
+                self._drop(conn, "_expired")
+                continue
+            if self._is_stale(conn):
+                self._drop(conn, "_stale")
+                continue
+
+            with self._lock:
+                self._reused += 1
+            logger.debug(f"Reutilizando conexión a {host}")
+            return conn, True
+
+        logger.debug(f"Abriendo nueva conexión a {host}")
+        return http.client.HTTPSConnection(host, timeout=timeout), False
+
+    def release(self, host: str, conn: http.client.HTTPSConnection, reusable: bool = True) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            host: Hostname del servidor
+            conn: Conexión a devolver
+            reusable: False si la conexión no debe reutilizarse (ej: 'Connection: close')
+        """
+        if not reusable:
+            self.discard(conn)
+            return
+
+        with self._lock:
+            self._in_use -= 1
+            idle = self._idle.setdefault(host, deque())
+            if len(idle) < self.max_idle:
+                idle.append((conn, time.monotonic()))
+                return
+            self._overflow += 1
+
+        conn.close()
+
+    def discard(self, conn: http.client.HTTPSConnection) -> None:
+        """
+        Cierra una conexión en uso sin devolverla al pool
+
+        Args:
+            conn: Conexión a descartar
+        """
+        self._drop(conn, "_discarded")
+
+    def close_all(self) -> None:
+        """Cierra todas las conexiones inactivas"""
+        with self._lock:
+            connections = [conn for idle in self._idle.values() for conn, _ in idle]
+            self._idle.clear()
+
+        for conn in connections:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso del pool
+
+        Returns:
+            Diccionario con contadores y tasa de reutilización
+        """
+        with self._lock:
+            checkouts = self._created + self._reused
+            return {
+                'created': self._created,
+                'reused': self._reused,
+                'expired': self._expired,
+                'stale': self._stale,
+                'discarded': self._discarded,
+                'overflow': self._overflow,
+                'in_use': self._in_use,
+                'idle': sum(len(idle) for idle in self._idle.values()),
+                'reuse_rate': self._reused / checkouts if checkouts else 0.0
+            }
+
+    def _drop(self, conn: http.client.HTTPSConnection, counter: str) -> None:
+        """Cierra una conexión en uso y actualiza el contador indicado"""
+        with self._lock:
+            self._in_use -= 1
+            setattr(self, counter, getattr(self, counter) + 1)
+        conn.close()
+
+    @staticmethod
+    def _is_stale(conn: http.client.HTTPSConnection) -> bool:
+        """
+        Verifica si una conexión inactiva ya no es utilizable
+
+        Un socket inactivo legible indica que el servidor lo cerró (EOF)
+        o envió datos inesperados; en ambos casos no se puede reutilizar.
+        """
+        sock = conn.sock
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError, TypeError):
+            return True
+        return bool(readable)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: hedging.py
+Descripción: Peticiones "hedged" para recortar la latencia de cola: si una petición
+             tarda más que un percentil de la latencia reciente se lanza un
+             duplicado y se usa la primera respuesta que llegue.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import contextvars
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, TypeVar
+from src.api.metrics import LatencyMetrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RequestHedger:
+    """
+    Ejecuta peticiones idempotentes con un duplicado opcional
+
+    El umbral de cada endpoint es el percentil `percentile` de su latencia
+    total reciente (histogramas de LatencyMetrics). Sin suficientes muestras
+    no se hace hedging. Cada duplicado pasa antes por `before_hedge` (el rate
+    limiter) y el número de duplicados nunca supera `max_ratio` del total de
+    peticiones.
+    """
+
+    def __init__(
+        self,
+        metrics: LatencyMetrics,
+        percentile: float = 95.0,
+        max_ratio: float = 0.1,
+        min_samples: int = 20,
+        before_hedge: Optional[Callable[[], None]] = None,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            metrics: Métricas de latencia del HTTPClient
+            percentile: Percentil de latencia a partir del cual se duplica la petición
+            max_ratio: Fracción máxima de peticiones que pueden duplicarse
+            min_samples: Muestras mínimas del endpoint para calcular el umbral
+            before_hedge: Función a llamar antes de lanzar un duplicado (ej: RateLimiter.wait)
+            max_workers: Threads para ejecutar peticiones y duplicados
+        """
+        self.metrics = metrics
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.before_hedge = before_hedge
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+
+        # Estadísticas
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._budget_exhausted = 0
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """
+        Tiempo de espera antes de duplicar una petición al endpoint
+
+        Args:
+            endpoint: Endpoint sin query string
+
+        Returns:
+            Segundos de espera o None si no hay datos suficientes
+        """
+        histogram = self.metrics.get_histogram(endpoint, 'total')
+        if histogram is None or histogram.count < self.min_samples:
+            return None
+        return histogram.percentile(self.percentile) / 1000
+
+    def _reserve_hedge(self) -> bool:
+        """Reserva un duplicado si no se supera la fracción máxima"""
+        with self._lock:
+            if self._hedged + 1 > self.max_ratio * self._requests:
+                self._budget_exhausted += 1
+                return False
+            self._hedged += 1
+            return True
+
+    def run(self, endpoint: str, func: Callable[[], T]) -> T:
+        """
+        Ejecuta `func`, duplicándola si tarda más que el umbral del endpoint
+
+        `func` debe ser idempotente: la petición perdedora no se cancela,
+        termina en segundo plano y su resultado se descarta.
+
+        Args:
+            endpoint: Endpoint sin query string
+            func: Petición a ejecutar
+
+        Returns:
+            Resultado de la primera ejecución que termine con éxito
+
+        Raises:
+            Exception: El error de la petición si todas las ejecuciones fallan
+        """
+        with self._lock:
+            self._requests += 1
+
+        delay = self.hedge_delay(endpoint)
+        if delay is None:
+            return func()
+
+        # Cada ejecución hereda el usage_scope (llamador y prioridad) de quien llama
+        primary = self._executor.submit(contextvars.copy_context().run, func)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._reserve_hedge():
+            return primary.result()
+
+        if self.before_hedge:
+            self.before_hedge()
+
+        logger.debug(f"Petición a {endpoint} supera {delay * 1000:.0f}ms, lanzando duplicado")
+        hedge = self._executor.submit(contextvars.copy_context().run, func)
+        return self._first_success(primary, hedge)
+
+    def _first_success(self, primary: Future, hedge: Future) -> Any:
+        """Retorna el primer resultado correcto; si ambas fallan, el error de la original"""
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result()
+
+        return primary.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de hedging
+
+        Returns:
+            Diccionario con contadores
+        """
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'hedged': self._hedged,
+                'hedge_wins': self._hedge_wins,
+                'budget_exhausted': self._budget_exhausted,
+                'hedge_ratio': self._hedged / self._requests if self._requests else 0.0
+            }
+
+    def shutdown(self) -> None:
+        """Libera los threads del executor"""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: http_cache.py
+Descripción: Caché de respuestas con validadores HTTP (ETag / Last-Modified).
+             Permite peticiones condicionales: un 304 reutiliza el resultado ya parseado.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class CacheEntry:
+    """Respuesta parseada junto con sus validadores"""
+
+    __slots__ = ('etag', 'last_modified', 'result')
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], result: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.result = result
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Headers para revalidar la entrada
+
+        Returns:
+            Diccionario con If-None-Match y/o If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """Caché LRU thread-safe de respuestas revalidables"""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Args:
+            max_entries: Número máximo de respuestas almacenadas
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Estadísticas
+        self._revalidated = 0
+        self._served_stale = 0
+        self._stored = 0
+        self._evicted = 0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Obtiene la entrada para una URL
+
+        Args:
+            key: Endpoint con query string
+
+        Returns:
+            Entrada almacenada o None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: str, etag: Optional[str], last_modified: Optional[str], result: Any) -> None:
+        """
+        Guarda una respuesta si trae algún validador
+
+        Args:
+            key: Endpoint con query string
+            etag: Valor del header ETag
+            last_modified: Valor del header Last-Modified
+            result: Respuesta ya parseada
+        """
+        if not etag and not last_modified:
+            # Sin validadores no hay forma de revalidar: no merece la pena guardarla
+            self.invalidate(key)
+            return
+
+        with self._lock:
+            self._entries[key] = CacheEntry(etag, last_modified, result)
+            self._entries.move_to_end(key)
+            self._stored += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+
+    def mark_revalidated(self) -> None:
+        """Registra que una entrada se sirvió tras un 304 Not Modified"""
+        with self._lock:
+            self._revalidated += 1
+
+    def mark_served_stale(self) -> None:
+        """Registra que una entrada se sirvió sin revalidar (ahorro de cuota)"""
+        with self._lock:
+            self._served_stale += 1
+
+    def invalidate(self, key: str) -> None:
+        """
+        Elimina la entrada de una URL
+
+        Args:
+            key: Endpoint con query string
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso de la caché
+
+        Returns:
+            Diccionario con contadores
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'stored': self._stored,
+                'revalidated': self._revalidated,
+                'served_stale': self._served_stale,
+                'evicted': self._evicted
+            }
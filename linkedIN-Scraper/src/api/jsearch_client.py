@@ -10,43 +10,391 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import contextvars
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
+from src.api.circuit_breaker import CircuitBreakerRegistry
 from src.api.client import HTTPClient, HTTPError
+from src.api.hedging import RequestHedger
+from src.api.http_cache import ConditionalCache
+from src.api.key_pool import ApiKeyPool, PooledKey
+from src.api.metrics import LatencyMetrics
 from src.api.rate_limiter import RateLimiter
+from src.api.result_cache import NegativeCache, ResultCache
+from src.api.retry_policy import build_retry_policy
+from src.api.salary_cache import DAY, SalaryCache
+from src.api.scheduler import RequestScheduler
+from src.api.shared_rate_limit import create_bucket_store
+from src.api.transport import create_pool
+from src.api.usage_budget import Admission, CreditBudget, UsageLedger, OK
 from src.models.search_params import SearchParameters
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# IDs que admite una petición a job-details (separados por comas)
+MAX_DETAILS_BATCH = 20
+
 
 class JSearchClient:
     """Cliente para interactuar con JSearch API de OpenWeb Ninja"""
 
-    def __init__(self, api_key: str, api_host: str = "api.openwebninja.com", config: Any = None):
+    def __init__(
+        self,
+        api_key: str,
+        api_host: str = "api.openwebninja.com",
+        config: Any = None,
+        caller: Optional[str] = None
+    ):
         """
         Args:
             api_key: API key de OpenWeb Ninja
             api_host: Host de la API
             config: Objeto Config opcional con configuración
+            caller: Nombre con el que se registra el consumo (por defecto config.usage_caller)
         """
         self.api_key = api_key
         self.api_host = api_host
 
-        # Crear cliente HTTP
-        self.client = HTTPClient(
-            host=api_host,
+        # Caché de respuestas revalidables (ETag / Last-Modified)
+        cache_size = config.conditional_cache_size if config else 128
+        cache = ConditionalCache(max_entries=cache_size) if cache_size else None
+
+        # Transporte: red (live), red + grabación (record) o cassette sin red (replay)
+        self.transport_mode = config.transport_mode if config else "live"
+        pool = create_pool(
+            mode=self.transport_mode,
+            cassette_path=config.cassette_path if config else "cassettes/jsearch.jsonl.gz",
+            max_idle=config.pool_max_idle if config else 10,
+            idle_timeout=config.pool_idle_timeout if config else 60.0,
+            latency_scale=config.replay_latency_scale if config else 0.0
+        )
+
+        # Con EXTRA_API_KEYS las peticiones se reparten entre varias keys
+        extra_keys = [key for key in config.additional_api_keys() if key != api_key] if config else []
+
+        # Configurar rate limiter (en replay no hay cuota que proteger).
+        # Con un backend compartido todos los procesos con la misma key usan un único bucket
+        replaying = self.transport_mode == "replay"
+        store = None
+        if config and not replaying:
+            store = create_bucket_store(
+                config.rate_limit_backend,
+                path=config.rate_limit_store_path,
+                redis_url=config.redis_url
+            )
+        self.key_pool = None
+        if not extra_keys:
+            self.client = self._build_http_client(api_key, config, pool, cache)
+            self.rate_limiter = self._build_rate_limiter(
+                api_key, config, store, self._build_scheduler(config), retry_policy=build_retry_policy(config)
+            )
+            # 429, Retry-After y headers de cuota ajustan el rate limiter
+            self.client.on_response = self.rate_limiter.observe_response
+        else:
+            # Cada key con su cliente, su rate limiter y su planificador (una espera
+            # en una key no retiene el turno de las demás); pool, caché y métricas compartidos
+            metrics = LatencyMetrics()
+            keys = []
+            for key in [api_key] + extra_keys:
+                key_client = self._build_http_client(key, config, pool, cache, metrics)
+                key_limiter = self._build_rate_limiter(key, config, store, self._build_scheduler(config))
+                key_client.on_response = key_limiter.observe_response
+                keys.append(PooledKey(key, key_client, key_limiter))
+            self.key_pool = ApiKeyPool(
+                keys,
+                failure_threshold=config.key_failure_threshold,
+                cooldown=config.key_cooldown_seconds
+            )
+            self.client = keys[0].client
+            # La espera la hace el limitador de cada key; este solo reintenta
+            self.rate_limiter = RateLimiter(
+                delay=0.0,
+                max_retries=config.max_retries,
+                retry_delay=config.retry_delay,
+                retry_policy=build_retry_policy(config)
+            )
+            logger.info(f"Pool de {len(keys)} API keys")
+
+        # Hedging opcional: duplicar peticiones lentas para recortar la latencia de cola
+        self.hedger = None
+        if config and config.hedge_requests:
+            self.hedger = RequestHedger(
+                self.client.metrics,
+                percentile=config.hedge_percentile,
+                max_ratio=config.hedge_max_ratio,
+                before_hedge=self.rate_limiter.wait
+            )
+
+        # Búsquedas de varias páginas como peticiones de una página en paralelo
+        self.page_executor = None
+        if config and config.page_fanout:
+            self.page_executor = ThreadPoolExecutor(
+                max_workers=config.page_fanout_workers,
+                thread_name_prefix="pages"
+            )
+
+        # Resultados de búsqueda en memoria: repetir una búsqueda no llega a la API
+        self.result_cache = None
+        result_cache_bytes = config.result_cache_bytes if config else 16 * 1024 * 1024
+        if result_cache_bytes:
+            self.result_cache = ResultCache(
+                max_bytes=result_cache_bytes,
+                ttls={
+                    'today': config.result_cache_ttl_today,
+                    '3days': config.result_cache_ttl_week,
+                    'week': config.result_cache_ttl_week,
+                    'month': config.result_cache_ttl_month,
+                    'all': config.result_cache_ttl_month
+                } if config else None
+            )
+
+        # Trabajos no encontrados y búsquedas vacías: no se repiten durante un rato
+        self.negative_cache = None
+        negative_ttl = config.negative_cache_ttl if config else 300.0
+        if negative_ttl:
+            self.negative_cache = NegativeCache(ttl=negative_ttl)
+
+        # Salarios en disco, compartidos entre procesos (en replay no hay cuota que ahorrar)
+        self.salary_cache = None
+        if config and config.salary_cache_enabled and not replaying:
+            self.salary_cache = SalaryCache(config.salary_cache_path, ttl=config.salary_cache_ttl_days * DAY)
+
+        # Detalles de varios trabajos: IDs por petición y peticiones en paralelo
+        self.details_batch_size = config.details_batch_size if config else MAX_DETAILS_BATCH
+        self.details_batch_workers = config.details_batch_workers if config else 4
+
+        # Circuit breaker por endpoint: fallar rápido mientras la API está degradada
+        self.circuit_breakers = None
+        enabled = config.circuit_breaker_enabled if config else True
+        if enabled:
+            self.circuit_breakers = CircuitBreakerRegistry(
+                failure_rate_threshold=config.circuit_failure_rate if config else 0.5,
+                slow_call_duration=config.circuit_slow_call_seconds if config else 10.0,
+                open_duration=config.circuit_open_seconds if config else 30.0
+            )
+
+        # Registro de consumo y control de admisión frente a la cuota mensual
+        self.budget = None
+        if config and config.usage_tracking and not replaying:
+            self.budget = CreditBudget(
+                UsageLedger(config.usage_db_path),
+                monthly_limit=config.monthly_request_budget,
+                soft_limit=config.budget_soft_limit,
+                default_caller=caller or config.usage_caller,
+                default_priority=config.usage_priority
+            )
+
+        logger.info(f"JSearchClient inicializado para {api_host}")
+
+    def _build_http_client(
+        self,
+        api_key: str,
+        config: Any,
+        pool: Any,
+        cache: Optional[ConditionalCache],
+        metrics: Optional[LatencyMetrics] = None
+    ) -> HTTPClient:
+        """Crea el cliente HTTP que envía `api_key`"""
+        return HTTPClient(
+            host=self.api_host,
             headers={'x-api-key': api_key},
-            timeout=config.request_timeout if config else 30
+            timeout=config.request_timeout if config else 30,
+            pool=pool,
+            compression=config.http_compression if config else True,
+            cache=cache,
+            metrics=metrics
+        )
+
+    @staticmethod
+    def _build_scheduler(config: Any) -> Optional[RequestScheduler]:
+        """Crea un planificador por prioridad si está activado"""
+        if not (config and config.scheduler_enabled):
+            return None
+        return RequestScheduler(
+            max_wait=config.scheduler_max_wait,
+            default_priority=config.usage_priority
         )
 
-        # Configurar rate limiter
-        self.rate_limiter = RateLimiter(
-            delay=config.rate_limit_delay if config else 1.0,
+    def _build_rate_limiter(
+        self,
+        api_key: str,
+        config: Any,
+        store: Any,
+        scheduler: Optional[RequestScheduler],
+        retry_policy: Any = None
+    ) -> RateLimiter:
+        """Crea el rate limiter de `api_key` (bucket compartido propio si hay store)"""
+        return RateLimiter(
+            delay=0.0 if self.transport_mode == "replay" else (config.rate_limit_delay if config else 1.0),
             max_retries=config.max_retries if config else 3,
-            retry_delay=config.retry_delay if config else 2
+            retry_delay=config.retry_delay if config else 2,
+            burst=config.rate_limit_burst if config else 1,
+            adaptive=config.adaptive_rate_limit if config else False,
+            min_delay=config.rate_limit_min_delay if config else None,
+            store=store,
+            store_key=f"jsearch:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}",
+            retry_policy=retry_policy,
+            scheduler=scheduler
         )
 
-        logger.info(f"JSearchClient inicializado para {api_host}")
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso del cliente
+
+        Returns:
+            Diccionario con estadísticas del pool de conexiones, la caché
+            y la latencia por endpoint y fase
+        """
+        return {
+            'connection_pool': self.client.pool.stats(),
+            'conditional_cache': self.client.cache.stats() if self.client.cache else None,
+            'result_cache': self.result_cache.stats() if self.result_cache else None,
+            'negative_cache': self.negative_cache.stats() if self.negative_cache else None,
+            'salary_cache': self.salary_cache.stats() if self.salary_cache else None,
+            'latency': self.client.metrics.snapshot(),
+            'hedging': self.hedger.stats() if self.hedger else None,
+            'circuit_breakers': self.get_circuit_state(),
+            'rate_limiter': self.rate_limiter.stats(),
+            'retries': self.rate_limiter.retry_policy.stats(),
+            'scheduler': self.rate_limiter.scheduler.stats() if self.rate_limiter.scheduler else None,
+            'api_keys': self.key_pool.stats() if self.key_pool else None
+        }
+
+    def get_usage_report(self) -> Optional[Dict[str, Any]]:
+        """
+        Retorna el consumo del mes frente a la cuota
+
+        Returns:
+            Informe de CreditBudget.report() o None si el registro está desactivado
+            o no se pudo leer
+        """
+        return self.budget.report() if self.budget else None
+
+    def get_circuit_state(self) -> Dict[str, Any]:
+        """
+        Retorna el estado de los circuit breakers
+
+        Returns:
+            {endpoint: estado} o diccionario vacío si están desactivados
+        """
+        return self.circuit_breakers.snapshot() if self.circuit_breakers else {}
+
+    def _guarded(self, endpoint: str, func: Callable[[], T]) -> T:
+        """Ejecuta una petición protegida por el circuit breaker del endpoint"""
+        if self.circuit_breakers is None:
+            return func()
+        return self.circuit_breakers.call(endpoint, func)
+
+    def _with_key(self, func: Callable[[HTTPClient], T]) -> T:
+        """Ejecuta una petición con el cliente de la key que toque"""
+        if self.key_pool is None:
+            return func(self.client)
+        return self.key_pool.call(lambda key: func(key.client))
+
+    def _admit(self, endpoint: str, pages: int = 1) -> Admission:
+        """
+        Pasa la petición por el control de presupuesto
+
+        Args:
+            endpoint: Endpoint de la API
+            pages: Páginas pedidas
+
+        Returns:
+            Condiciones con las que se admite
+
+        Raises:
+            BudgetExceededError: Si el presupuesto no admite la petición
+        """
+        if self.budget is None:
+            return Admission(pages, False, OK)
+        return self.budget.admit(endpoint, pages)
+
+    def _charged(self, endpoint: str, func: Callable[[], T], credits: int = 1) -> T:
+        """Ejecuta una petición y la anota en el registro de consumo si llegó a la API"""
+        if self.budget is None:
+            return func()
+        try:
+            result = func()
+        except HTTPError as e:
+            # Los 4xx (salvo 429) consumen cuota; 429 y 5xx no
+            if e.status_code < 500 and e.status_code != 429:
+                self.budget.record(endpoint, credits)
+            raise
+        self.budget.record(endpoint, credits)
+        return result
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        credits: int = 1,
+        prefer_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        GET a la API, con circuit breaker y hedging si están activados
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query
+            credits: Créditos que consume la petición
+            prefer_cache: Servir una respuesta cacheada sin revalidar si existe
+
+        Returns:
+            Respuesta JSON parseada
+        """
+        if prefer_cache:
+            cached = self.client.cached_result(endpoint, params)
+            if cached is not None:
+                return cached
+
+        def _send():
+            return self._charged(endpoint, lambda: self._with_key(lambda client: client.get(endpoint, params)), credits)
+
+        def _request():
+            if self.hedger is None:
+                return _send()
+            return self.hedger.run(endpoint, _send)
+
+        return self._guarded(endpoint, _request)
+
+    def _cached_search(self, endpoint: str, params: SearchParameters) -> Optional[List[Dict[str, Any]]]:
+        """Resultado vigente de la caché para `params` (None si no hay)"""
+        key = ResultCache.make_key(endpoint, params.to_api_params())
+        if self.negative_cache is not None and self.negative_cache.contains(key):
+            return []
+        if self.result_cache is None:
+            return None
+        return self.result_cache.get(key)
+
+    def _cache_search(self, endpoint: str, params: SearchParameters, jobs: List[Dict[str, Any]]) -> None:
+        """Guarda el resultado completo de una búsqueda (las vacías, en la caché negativa)"""
+        key = ResultCache.make_key(endpoint, params.to_api_params())
+        if not jobs:
+            if self.negative_cache is not None:
+                self.negative_cache.add(key)
+            return
+        if self.result_cache is not None:
+            self.result_cache.put(key, jobs, self.result_cache.ttl_for(params.date_posted))
+
+    def _known_missing(self, job_id: str, country: str) -> bool:
+        """Indica si el trabajo no se encontró hace poco"""
+        if self.negative_cache is None:
+            return False
+        return self.negative_cache.contains(self._details_key(job_id, country))
+
+    def _remember_missing(self, job_id: str, country: str) -> None:
+        """Anota un trabajo no encontrado en la caché negativa"""
+        if self.negative_cache is not None:
+            self.negative_cache.add(self._details_key(job_id, country))
+
+    @staticmethod
+    def _details_key(job_id: str, country: str) -> str:
+        """Clave de un trabajo (idioma y campos no cambian que exista o no)"""
+        return ResultCache.make_key("/jsearch/job-details", {'job_id': job_id, 'country': country.lower()})
 
     def search_jobs(self, params: SearchParameters) -> List[Dict[str, Any]]:
         """
@@ -62,14 +410,112 @@ class JSearchClient:
             HTTPError: Si hay error en la petición
         """
         endpoint = "/jsearch/search"
-        api_params = params.to_api_params()
+        cached = self._cached_search(endpoint, params)
+        if cached is not None:
+            logger.info(f"Búsqueda servida desde caché: {params.query} en {params.country}")
+            return cached
+
+        admission = self._admit(endpoint, params.num_pages)
+        if admission.pages < params.num_pages:
+            params = params.model_copy(update={'num_pages': admission.pages})
 
         logger.info(f"Buscando trabajos: {params.query} en {params.country}")
 
+        try:
+            if self.page_executor is not None and params.num_pages > 1:
+                jobs = self._search_pages(params, admission.prefer_cache)
+            else:
+                jobs = self._search_request(params, admission.prefer_cache)
+                self._cache_search(endpoint, params, jobs)
+            logger.info(f"Encontrados {len(jobs)} trabajos")
+            return jobs
+        except HTTPError as e:
+            if e.status_code == 429:
+                logger.error("Rate limit excedido")
+                raise HTTPError(429, "Rate limit excedido. Intenta más tarde.")
+            raise
+
+    def iter_search_pages(
+        self,
+        params: SearchParameters,
+        limit: Optional[int] = None,
+        max_pages: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Recorre los resultados página a página, pidiendo cada página al necesitarla
+
+        Se empieza en params.page y cada página es una petición de una sola
+        página (params.num_pages se ignora). La siguiente página no se pide
+        hasta que el llamador termina con la anterior, así que dejar de
+        iterar no cuesta peticiones. Se para con una página vacía o sin
+        trabajos nuevos, al llegar a `limit` trabajos o tras `max_pages` páginas.
+
+        Args:
+            params: Parámetros de búsqueda validados
+            limit: Trabajos a partir de los que no se piden más páginas
+            max_pages: Páginas máximas a pedir
+
+        Yields:
+            Trabajos de cada página (dicts crudos de la API, sin repetidos)
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/search"
+        seen = set()
+        total = 0
+        page = params.page
+
+        logger.info(f"Buscando trabajos por páginas: {params.query} en {params.country}")
+
+        if limit is not None and limit <= 0:
+            return
+
+        while max_pages is None or page - params.page < max_pages:
+            page_params = params.model_copy(update={'page': page, 'num_pages': 1})
+            jobs = self._cached_search(endpoint, page_params)
+            if jobs is None:
+                admission = self._admit(endpoint, 1)
+                try:
+                    jobs = self._search_request(page_params, admission.prefer_cache)
+                except HTTPError as e:
+                    if e.status_code == 429:
+                        logger.error("Rate limit excedido")
+                        raise HTTPError(429, "Rate limit excedido. Intenta más tarde.")
+                    raise
+                self._cache_search(endpoint, page_params, jobs)
+
+            new_jobs = []
+            for job in jobs:
+                job_id = job.get('job_id')
+                if job_id is not None:
+                    if job_id in seen:
+                        continue
+                    seen.add(job_id)
+                new_jobs.append(job)
+
+            if not new_jobs:
+                logger.info(f"Página {page} sin trabajos nuevos: fin de los resultados")
+                return
+
+            if limit is not None:
+                new_jobs = new_jobs[:limit - total]
+            total += len(new_jobs)
+            yield new_jobs
+
+            if limit is not None and total >= limit:
+                return
+            page += 1
+
+    def _search_request(self, params: SearchParameters, prefer_cache: bool = False) -> List[Dict[str, Any]]:
+        """Una petición de búsqueda (todas las páginas de `params`) con reintentos"""
+        endpoint = "/jsearch/search"
+        api_params = params.to_api_params()
+
         # Usar rate limiter con reintentos
         @self.rate_limiter.with_retry
         def _make_request():
-            response = self.client.get(endpoint, api_params)
+            response = self._get(endpoint, api_params, credits=params.num_pages, prefer_cache=prefer_cache)
 
             # Verificar si hay error en la respuesta
             if "error" in response:
@@ -77,16 +523,115 @@ class JSearchClient:
 
             return response.get("data", [])
 
+        return _make_request()
+
+    def _search_pages(self, params: SearchParameters, prefer_cache: bool = False) -> List[Dict[str, Any]]:
+        """
+        Busca cada página de `params` con una petición propia, en paralelo
+
+        Las páginas salen a medida que el rate limiter lo permite. Los
+        resultados se unen en orden de página sin repetir job_id; si alguna
+        página falla se devuelven las demás.
+
+        Args:
+            params: Parámetros de búsqueda con num_pages > 1
+            prefer_cache: Servir desde caché sin revalidar si es posible
+
+        Returns:
+            Trabajos de las páginas que respondieron
+
+        Raises:
+            Exception: El error de la primera página si fallan todas
+        """
+        pages = [
+            params.model_copy(update={'page': params.page + offset, 'num_pages': 1})
+            for offset in range(params.num_pages)
+        ]
+        # Cada página hereda el usage_scope (llamador y prioridad) de la búsqueda
+        futures = [
+            self.page_executor.submit(contextvars.copy_context().run, self._search_request, page, prefer_cache)
+            for page in pages
+        ]
+
+        results: List[List[Dict[str, Any]]] = []
+        errors: List[Exception] = []
+        for page, future in zip(pages, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Página {page.page} de '{params.query}' falló: {e}")
+                errors.append(e)
+
+        if not results:
+            raise errors[0]
+        if errors:
+            logger.warning(f"Resultados parciales: {len(errors)} de {len(pages)} páginas fallaron")
+
+        jobs: List[Dict[str, Any]] = []
+        seen = set()
+        for page_jobs in results:
+            for job in page_jobs:
+                job_id = job.get('job_id')
+                if job_id is not None:
+                    if job_id in seen:
+                        continue
+                    seen.add(job_id)
+                jobs.append(job)
+
+        # Un resultado parcial no se cachea: la próxima búsqueda vuelve a pedir todas las páginas
+        if not errors:
+            self._cache_search("/jsearch/search", params, jobs)
+        return jobs
+
+    def iter_search_jobs(self, params: SearchParameters) -> Iterator[Dict[str, Any]]:
+        """
+        Busca trabajos emitiendo cada resultado a medida que llega
+
+        A diferencia de search_jobs, la respuesta se parsea de forma incremental:
+        solo el trabajo en curso se mantiene en memoria. Los reintentos cubren
+        la petición y el status; una vez empezada la lectura ya no se reintenta.
+
+        Args:
+            params: Parámetros de búsqueda validados
+
+        Yields:
+            Cada trabajo encontrado (dict crudo de la API)
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        endpoint = "/jsearch/search"
+        admission = self._admit(endpoint, params.num_pages)
+        if admission.pages < params.num_pages:
+            params = params.model_copy(update={'num_pages': admission.pages})
+        api_params = params.to_api_params()
+
+        logger.info(f"Buscando trabajos (streaming): {params.query} en {params.country}")
+
+        @self.rate_limiter.with_retry
+        def _open_stream():
+            return self._guarded(endpoint, lambda: self._charged(
+                endpoint, lambda: self._with_key(lambda client: client.stream_get(endpoint, api_params)), params.num_pages
+            ))
+
         try:
-            jobs = _make_request()
-            logger.info(f"Encontrados {len(jobs)} trabajos")
-            return jobs
+            stream = _open_stream()
         except HTTPError as e:
             if e.status_code == 429:
                 logger.error("Rate limit excedido")
                 raise HTTPError(429, "Rate limit excedido. Intenta más tarde.")
             raise
 
+        count = 0
+        for job in stream:
+            count += 1
+            yield job
+
+        if "error" in stream.extras:
+            raise HTTPError(400, stream.extras.get("error"))
+
+        logger.info(f"Encontrados {count} trabajos")
+
     def get_job_details(
         self,
         job_id: str,
@@ -120,11 +665,16 @@ class JSearchClient:
         if fields:
             params['fields'] = fields
 
+        if self._known_missing(job_id, country):
+            logger.info(f"Trabajo {job_id} no encontrado hace poco: no se vuelve a pedir")
+            raise HTTPError(404, "Trabajo no encontrado")
+
         logger.info(f"Obteniendo detalles del trabajo: {job_id}")
+        admission = self._admit(endpoint)
 
         @self.rate_limiter.with_retry
         def _make_request():
-            response = self.client.get(endpoint, params)
+            response = self._get(endpoint, params, prefer_cache=admission.prefer_cache)
 
             if "error" in response:
                 raise HTTPError(400, response.get("error"))
@@ -135,6 +685,115 @@ class JSearchClient:
 
             return data[0]  # Retornar primer resultado
 
+        try:
+            return _make_request()
+        except HTTPError as e:
+            if e.status_code == 404:
+                self._remember_missing(job_id, country)
+            raise
+
+    def get_job_details_batch(
+        self,
+        job_ids: Iterable[str],
+        country: str = "us",
+        language: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Obtiene los detalles de varios trabajos
+
+        Los IDs se agrupan de `details_batch_size` en `details_batch_size` en
+        una sola petición (job-details acepta IDs separados por comas) y los
+        grupos se piden en paralelo, hasta `details_batch_workers` a la vez.
+        Un error afecta solo a los IDs de su grupo.
+
+        Args:
+            job_ids: IDs de los trabajos (los repetidos se piden una vez)
+            country: Código de país
+            language: Código de idioma (opcional)
+            fields: Campos específicos a incluir (opcional)
+
+        Returns:
+            {job_id: detalles del trabajo, o la excepción si no se pudieron obtener}
+        """
+        ids = list(dict.fromkeys(job_ids))
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        pending = []
+        for job_id in ids:
+            if self._known_missing(job_id, country):
+                results[job_id] = HTTPError(404, "Trabajo no encontrado")
+            else:
+                pending.append(job_id)
+
+        size = max(1, min(self.details_batch_size, MAX_DETAILS_BATCH))
+        chunks = [pending[start:start + size] for start in range(0, len(pending), size)]
+        if not chunks:
+            return {job_id: results[job_id] for job_id in ids}
+
+        logger.info(f"Obteniendo detalles de {len(pending)} trabajos en {len(chunks)} peticiones")
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.details_batch_workers, len(chunks)),
+            thread_name_prefix="details"
+        ) as executor:
+            # Cada grupo hereda el usage_scope (llamador y prioridad) del lote
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._job_details_chunk, chunk, country, language, fields)
+                for chunk in chunks
+            ]
+            for chunk, future in zip(chunks, futures):
+                try:
+                    found = future.result()
+                except Exception as e:
+                    logger.warning(f"Error obteniendo detalles de {len(chunk)} trabajos: {e}")
+                    for job_id in chunk:
+                        results[job_id] = e
+                    continue
+                for job_id in chunk:
+                    details = found.get(job_id)
+                    if details is None:
+                        self._remember_missing(job_id, country)
+                        details = HTTPError(404, "Trabajo no encontrado")
+                    results[job_id] = details
+
+        failed = sum(1 for value in results.values() if isinstance(value, Exception))
+        if failed:
+            logger.warning(f"No se obtuvieron los detalles de {failed} de {len(ids)} trabajos")
+        return {job_id: results[job_id] for job_id in ids}
+
+    def _job_details_chunk(
+        self,
+        job_ids: List[str],
+        country: str,
+        language: Optional[str],
+        fields: Optional[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Una petición a job-details para varios IDs; retorna {job_id: detalles}"""
+        endpoint = "/jsearch/job-details"
+        params = {
+            'job_id': ",".join(job_ids),
+            'country': country
+        }
+
+        if language:
+            params['language'] = language
+        if fields:
+            # Sin job_id no se sabe a qué ID corresponde cada resultado
+            if 'job_id' not in fields.split(','):
+                fields = f"job_id,{fields}"
+            params['fields'] = fields
+
+        admission = self._admit(endpoint)
+
+        @self.rate_limiter.with_retry
+        def _make_request():
+            response = self._get(endpoint, params, prefer_cache=admission.prefer_cache)
+
+            if "error" in response:
+                raise HTTPError(400, response.get("error"))
+
+            return {job.get('job_id'): job for job in response.get("data", [])}
+
         return _make_request()
 
     def get_estimated_salary(
@@ -173,17 +832,7 @@ class JSearchClient:
             params['fields'] = fields
 
         logger.info(f"Obteniendo estimación salarial: {job_title} en {location}")
-
-        @self.rate_limiter.with_retry
-        def _make_request():
-            response = self.client.get(endpoint, params)
-
-            if "error" in response:
-                raise HTTPError(400, response.get("error"))
-
-            return response.get("data", [])
-
-        return _make_request()
+        return self._salary_request(endpoint, params)
 
     def get_company_salary(
         self,
@@ -221,14 +870,42 @@ class JSearchClient:
             params['location'] = location
 
         logger.info(f"Obteniendo salarios de {company} para {job_title}")
+        return self._salary_request(endpoint, params)
+
+    def _salary_request(self, endpoint: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Consulta de salarios con reintentos, servida desde la caché de salarios si es posible
+
+        Args:
+            endpoint: Endpoint de salarios
+            params: Parámetros de la consulta
+
+        Returns:
+            Lista con información salarial
+
+        Raises:
+            HTTPError: Si hay error en la petición
+        """
+        cache_key = None
+        if self.salary_cache is not None:
+            cache_key = self.salary_cache.make_key(endpoint, params)
+            cached = self.salary_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Salarios servidos desde caché")
+                return cached
+
+        admission = self._admit(endpoint)
 
         @self.rate_limiter.with_retry
         def _make_request():
-            response = self.client.get(endpoint, params)
+            response = self._get(endpoint, params, prefer_cache=admission.prefer_cache)
 
             if "error" in response:
                 raise HTTPError(400, response.get("error"))
 
             return response.get("data", [])
 
-        return _make_request()
+        result = _make_request()
+        if cache_key is not None and result:
+            self.salary_cache.put(cache_key, result)
+        return result
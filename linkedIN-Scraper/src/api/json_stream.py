@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: json_stream.py
+Descripción: Parser JSON incremental para respuestas con forma {"data": [...], ...}.
+             Entrega los elementos del array uno a uno a medida que llegan los bytes.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from src.utils import json_codec
+
+# Caracteres estructurales fuera de strings
+_STRUCTURAL = re.compile(rb'[{}\[\]",:]')
+# Caracteres relevantes dentro de strings
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b' \t\r\n'
+
+
+class JSONArrayStreamParser:
+    """
+    Parser incremental del array `key` de un objeto JSON de primer nivel
+
+    Solo se mantiene en memoria el elemento que se está leyendo: cada elemento
+    completo se decodifica con json_codec.loads y se entrega, y sus bytes se
+    descartan. El resto de valores de primer nivel (status, error, ...) se
+    guardan en `extras`.
+    """
+
+    def __init__(self, key: str = "data"):
+        """
+        Args:
+            key: Clave del array de primer nivel cuyos elementos se emiten
+        """
+        self.key = key
+        self.extras: Dict[str, Any] = {}
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+
+        self._current_key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._capture_start: Optional[int] = None
+        self._capture_depth = 0
+        self._awaiting: Optional[str] = None  # "value" | "element"
+        self._in_array = False
+
+    @property
+    def done(self) -> bool:
+        """True si el objeto de primer nivel ya se cerró"""
+        return self._started and self._depth == 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Procesa un bloque de bytes
+
+        Args:
+            chunk: Siguiente bloque del documento
+
+        Returns:
+            Elementos del array completados en este bloque
+
+        Raises:
+            ValueError: Si el documento no es un objeto JSON
+        """
+        self._buf += chunk
+        items: List[Any] = []
+        self._scan(items)
+        self._compact()
+        return items
+
+    def close(self) -> None:
+        """
+        Verifica que el documento terminó correctamente
+
+        Raises:
+            ValueError: Si el documento está incompleto
+        """
+        if not self.done or self._in_string:
+            raise ValueError("Documento JSON incompleto")
+
+    def _scan(self, items: List[Any]) -> None:
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buf, pos)
+                if not match:
+                    pos = end
+                    break
+                i = match.start()
+                if buf[i] == 0x5C:  # '\\': saltar el carácter escapado
+                    if i + 1 >= end:
+                        pos = i  # esperar al siguiente bloque
+                        break
+                    pos = i + 2
+                    continue
+                self._in_string = False
+                pos = i + 1
+                if self._key_start is not None:
+                    self._current_key = json_codec.loads(bytes(buf[self._key_start:pos]))
+                    self._key_start = None
+                continue
+
+            if self._awaiting:
+                while pos < end and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == end:
+                    break
+                if not self._start_value(buf[pos], pos):
+                    pos += 1
+                    continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if not match:
+                pos = end
+                break
+            i = match.start()
+            char = buf[i]
+            pos = i + 1
+
+            if char == 0x22:  # '"'
+                self._in_string = True
+                if self._depth == 1 and self._capture_start is None:
+                    self._key_start = i
+            elif char in b'{[':
+                if not self._started:
+                    if char != 0x7B:
+                        raise ValueError("Se esperaba un objeto JSON en el primer nivel")
+                    self._started = True
+                self._depth += 1
+            elif char in b'}]':
+                self._end_capture(i, items)
+                if self._in_array and self._depth == 2:
+                    self._in_array = False
+                self._depth -= 1
+            elif char == 0x2C:  # ','
+                self._end_capture(i, items)
+                if self._in_array and self._depth == 2:
+                    self._awaiting = "element"
+            elif char == 0x3A and self._depth == 1:  # ':'
+                self._awaiting = "value"
+
+        self._pos = pos
+
+    def _start_value(self, char: int, pos: int) -> bool:
+        """
+        Inicia la captura del valor que empieza en `pos`
+
+        Returns:
+            False si el carácter ya fue consumido aquí (apertura o cierre del array)
+        """
+        awaiting = self._awaiting
+        self._awaiting = None
+
+        if awaiting == "element" and char == 0x5D:  # ']' de array vacío
+            self._in_array = False
+            self._depth -= 1
+            return False
+
+        if awaiting == "value" and char == 0x5B and self._current_key == self.key:
+            self._in_array = True
+            self._awaiting = "element"
+            self._depth += 1
+            return False
+
+        self._capture_start = pos
+        self._capture_depth = self._depth
+        return True
+
+    def _end_capture(self, end: int, items: List[Any]) -> None:
+        """Finaliza la captura si el delimitador pertenece al valor capturado"""
+        if self._capture_start is None or self._depth != self._capture_depth:
+            return
+
+        value = json_codec.loads(bytes(self._buf[self._capture_start:end]))
+        self._capture_start = None
+
+        if self._in_array:
+            items.append(value)
+        elif self._current_key is not None:
+            self.extras[self._current_key] = value
+
+    def _compact(self) -> None:
+        """Descarta los bytes ya procesados que no forman parte de una captura"""
+        keep_from = self._pos
+        for start in (self._capture_start, self._key_start):
+            if start is not None:
+                keep_from = min(keep_from, start)
+        if keep_from == 0:
+            return
+
+        del self._buf[:keep_from]
+        self._pos -= keep_from
+        if self._capture_start is not None:
+            self._capture_start -= keep_from
+        if self._key_start is not None:
+            self._key_start -= keep_from
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """
+    Itera los elementos del array `key` a partir de bloques de bytes
+
+    Args:
+        chunks: Bloques consecutivos del documento JSON
+        key: Clave del array de primer nivel
+
+    Yields:
+        Cada elemento decodificado del array
+    """
+    parser = JSONArrayStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
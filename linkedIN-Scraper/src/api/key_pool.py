@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: key_pool.py
+Descripción: Pool de API keys para repartir las peticiones entre varias keys.
+             Cada key tiene su propio cliente HTTP, rate limiter y contadores;
+             las keys rechazadas, limitadas o con errores seguidos salen de la
+             rotación durante un tiempo.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+from src.api.client import HTTPClient, HTTPError
+from src.api.rate_limiter import RateLimiter
+from src.api.retry_policy import is_retryable
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Errores propios de la key: otra key puede atender la petición al momento
+INVALID_KEY_STATUS_CODES = (401, 403)
+THROTTLED_STATUS_CODE = 429
+
+# Estados de una key
+ACTIVE = "active"
+COOLING = "cooling"
+DISABLED = "disabled"
+
+
+def mask_key(api_key: str) -> str:
+    """
+    Versión de la key apta para logs y estadísticas
+
+    Args:
+        api_key: API key
+
+    Returns:
+        Últimos 4 caracteres precedidos de asteriscos
+    """
+    return f"****{api_key[-4:]}" if len(api_key) > 8 else "****"
+
+
+class PooledKey:
+    """Una API key del pool con su cliente, su rate limiter y su salud"""
+
+    def __init__(self, api_key: str, client: HTTPClient, rate_limiter: RateLimiter):
+        """
+        Args:
+            api_key: API key
+            client: Cliente HTTP que envía la key en sus headers
+            rate_limiter: Rate limiter propio de la key
+        """
+        self.api_key = api_key
+        self.key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self.label = mask_key(api_key)
+        self.client = client
+        self.rate_limiter = rate_limiter
+
+        self.requests = 0
+        self.waiting = 0   # Peticiones que ya eligieron la key y esperan su rate limiter
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.throttled = 0
+        self.cooldown_until = 0.0
+        self.disabled = False
+        self.last_error: Optional[str] = None
+
+    def next_available(self) -> float:
+        """Segundos hasta que la key puede enviar, contando las peticiones que ya la esperan"""
+        return self.rate_limiter.next_available() + self.waiting * self.rate_limiter.delay
+
+    def state(self, now: float) -> str:
+        """Estado de la key: ACTIVE, COOLING o DISABLED"""
+        if self.disabled:
+            return DISABLED
+        if self.cooldown_until > now:
+            return COOLING
+        return ACTIVE
+
+
+class ApiKeyPool:
+    """
+    Reparte las peticiones entre varias API keys
+
+    Cada petición va a la key activa que antes puede enviar según su rate
+    limiter y las peticiones que ya la esperan (a igualdad, la menos usada),
+    así que el throughput crece con el número de keys. Salud de las keys:
+
+    - 401/403: la key se retira del pool.
+    - 429: la key descansa `cooldown` segundos (cuota o límite agotado).
+    - `failure_threshold` errores transitorios seguidos: descansa `cooldown` segundos.
+
+    Ante errores propios de la key (401, 403, 429) la petición se repite al
+    momento con otra key si queda alguna sin probar.
+    """
+
+    def __init__(self, keys: List[PooledKey], failure_threshold: int = 3, cooldown: float = 60.0):
+        """
+        Args:
+            keys: Keys del pool (al menos una)
+            failure_threshold: Errores transitorios seguidos que sacan a una key de la rotación
+            cooldown: Segundos que una key limitada o con errores queda fuera
+
+        Raises:
+            ValueError: Si no hay keys
+        """
+        if not keys:
+            raise ValueError("El pool necesita al menos una API key")
+        self.keys = keys
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failovers = 0
+        self._lock = threading.Lock()
+
+    def _select(self, exclude: Set[str]) -> Optional[PooledKey]:
+        """Key a usar para la siguiente petición (None si no queda ninguna utilizable)"""
+        now = time.time()
+        candidates = [key for key in self.keys if key.key_id not in exclude and not key.disabled]
+        if not candidates:
+            return None
+
+        active = [key for key in candidates if key.state(now) == ACTIVE]
+        if active:
+            return min(active, key=lambda key: (key.next_available(), key.requests))
+
+        # Todas descansando: mejor la que antes vuelve que no enviar nada
+        key = min(candidates, key=lambda key: key.cooldown_until)
+        logger.warning(f"Todas las API keys están en pausa, usando {key.label}")
+        return key
+
+    def acquire(self, exclude: Optional[Set[str]] = None) -> PooledKey:
+        """
+        Elige una key y espera su rate limiter
+
+        Args:
+            exclude: key_id de las keys que no deben usarse
+
+        Returns:
+            Key lista para enviar la petición
+
+        Raises:
+            HTTPError: Si todas las keys han sido rechazadas por la API
+        """
+        with self._lock:
+            key = self._select(exclude or set())
+            if key is None:
+                raise HTTPError(401, "Ninguna API key del pool es válida")
+            key.requests += 1
+            key.waiting += 1
+
+        try:
+            key.rate_limiter.wait()
+        finally:
+            with self._lock:
+                key.waiting -= 1
+        return key
+
+    def call(self, func: Callable[[PooledKey], T]) -> T:
+        """
+        Ejecuta una petición con una key del pool
+
+        Args:
+            func: Función que recibe la key y hace la petición con su cliente
+
+        Returns:
+            Resultado de `func`
+
+        Raises:
+            Exception: El error de la petición si no queda otra key que probar
+        """
+        tried: Set[str] = set()
+        while True:
+            key = self.acquire(tried)
+            try:
+                result = func(key)
+            except Exception as e:
+                tried.add(key.key_id)
+                if self._record_failure(key, e) and self._has_untried(tried):
+                    with self._lock:
+                        self._failovers += 1
+                    logger.warning(f"API key {key.label} no disponible ({e}), probando con otra")
+                    continue
+                raise
+            self._record_success(key)
+            return result
+
+    def _has_untried(self, tried: Set[str]) -> bool:
+        with self._lock:
+            return any(key.key_id not in tried and not key.disabled for key in self.keys)
+
+    def _record_success(self, key: PooledKey) -> None:
+        with self._lock:
+            key.consecutive_failures = 0
+
+    def _record_failure(self, key: PooledKey, error: Exception) -> bool:
+        """
+        Actualiza la salud de la key tras un error
+
+        Returns:
+            True si el error es propio de la key y otra puede repetir la petición
+        """
+        status = error.status_code if isinstance(error, HTTPError) else None
+        with self._lock:
+            key.last_error = str(error)
+
+            if status in INVALID_KEY_STATUS_CODES:
+                key.failures += 1
+                key.disabled = True
+                logger.error(f"API key {key.label} rechazada ({status}): se retira del pool")
+                return True
+
+            if status == THROTTLED_STATUS_CODE:
+                key.failures += 1
+                key.throttled += 1
+                key.cooldown_until = time.time() + self.cooldown
+                logger.warning(f"API key {key.label} limitada (429): en pausa {self.cooldown:.0f}s")
+                return True
+
+            if not is_retryable(error):
+                # 400, 404...: la petición es la que falla, no la key
+                key.consecutive_failures = 0
+                return False
+
+            key.failures += 1
+            key.consecutive_failures += 1
+            if key.consecutive_failures >= self.failure_threshold:
+                key.consecutive_failures = 0
+                key.cooldown_until = time.time() + self.cooldown
+                logger.warning(
+                    f"API key {key.label}: {self.failure_threshold} errores seguidos, en pausa {self.cooldown:.0f}s"
+                )
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna el estado del pool
+
+        Returns:
+            Diccionario con el número de keys activas, los cambios de key y
+            el estado, contadores y cuota conocida de cada key
+        """
+        now = time.time()
+        keys = []
+        with self._lock:
+            for key in self.keys:
+                limiter = key.rate_limiter.stats()
+                keys.append({
+                    'key': key.label,
+                    'state': key.state(now),
+                    'requests': key.requests,
+                    'failures': key.failures,
+                    'throttled': key.throttled,
+                    'cooldown_for': max(0.0, key.cooldown_until - now) if not key.disabled else None,
+                    'rate': limiter['rate'],
+                    'quota_remaining': limiter['quota_remaining'],
+                    'scheduler': key.rate_limiter.scheduler.stats() if key.rate_limiter.scheduler else None,
+                    'last_error': key.last_error
+                })
+            failovers = self._failovers
+
+        return {
+            'total': len(keys),
+            'active': sum(1 for key in keys if key['state'] == ACTIVE),
+            'failovers': failovers,
+            'keys': keys
+        }
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: metrics.py
+Descripción: Medición de latencia por fases (DNS, conexión, TLS, TTFB, transferencia)
+             y agregación por endpoint en histogramas thread-safe.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import bisect
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Fases medidas en cada petición, en orden
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'transfer', 'total')
+
+# Límites superiores de los buckets del histograma (milisegundos)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class RequestTiming:
+    """Duración de cada fase de una petición (segundos)"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.reused_connection = False
+        self._start = time.perf_counter()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Acumula tiempo en una fase
+
+        Args:
+            phase: Nombre de la fase
+            seconds: Duración en segundos
+        """
+        self.phases[phase] = self.phases.get(phase, 0.0) + max(seconds, 0.0)
+
+    def finish(self) -> None:
+        """Fija la duración total desde la creación"""
+        self.phases['total'] = time.perf_counter() - self._start
+
+
+class LatencyHistogram:
+    """Histograma de latencias con buckets fijos"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """
+        Args:
+            buckets_ms: Límites superiores de los buckets en milisegundos
+        """
+        self.buckets_ms = buckets_ms
+        self.counts: List[int] = [0] * (len(buckets_ms) + 1)  # último bucket: +inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        """
+        Registra una observación
+
+        Args:
+            seconds: Duración en segundos
+        """
+        value_ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        Estima un percentil como el límite superior de su bucket
+
+        Args:
+            p: Percentil entre 0 y 100
+
+        Returns:
+            Latencia estimada en milisegundos o None si no hay datos
+        """
+        if not self.count:
+            return None
+
+        target = max(1, int(round(self.count * p / 100.0 + 0.4999)))
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                upper = self.buckets_ms[i] if i < len(self.buckets_ms) else self.max_ms
+                return min(upper, self.max_ms)
+        return self.max_ms  # pragma: no cover
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Resume el histograma
+
+        Returns:
+            Diccionario con conteos, media, extremos y percentiles (ms)
+        """
+        return {
+            'count': self.count,
+            'mean_ms': self.sum_ms / self.count if self.count else None,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'buckets': {
+                **{f"le_{bound}": count for bound, count in zip(self.buckets_ms, self.counts)},
+                'le_inf': self.counts[-1]
+            }
+        }
+
+
+class LatencyMetrics:
+    """Histogramas de latencia por endpoint y fase, seguros entre threads"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS):
+        """
+        Args:
+            buckets_ms: Límites de los buckets de cada histograma
+        """
+        self.buckets_ms = buckets_ms
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._connections: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, timing: RequestTiming) -> None:
+        """
+        Agrega las fases de una petición al endpoint
+
+        Las fases de conexión (dns, connect, tls) solo se registran cuando
+        se abrió una conexión nueva.
+
+        Args:
+            endpoint: Endpoint sin query string (ej: "/jsearch/search")
+            timing: Tiempos de la petición
+        """
+        with self._lock:
+            histograms = self._histograms.setdefault(endpoint, {})
+            for phase, seconds in timing.phases.items():
+                if phase not in histograms:
+                    histograms[phase] = LatencyHistogram(self.buckets_ms)
+                histograms[phase].observe(seconds)
+
+            connections = self._connections.setdefault(endpoint, {'new': 0, 'reused': 0})
+            connections['reused' if timing.reused_connection else 'new'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna el resumen de todos los endpoints
+
+        Returns:
+            {endpoint: {'phases': {fase: resumen}, 'connections': {...}}}
+        """
+        with self._lock:
+            return {
+                endpoint: {
+                    'phases': {
+                        phase: histograms[phase].to_dict()
+                        for phase in PHASES if phase in histograms
+                    },
+                    'connections': dict(self._connections.get(endpoint, {}))
+                }
+                for endpoint, histograms in self._histograms.items()
+            }
+
+    def get_histogram(self, endpoint: str, phase: str) -> Optional[LatencyHistogram]:
+        """
+        Obtiene el histograma de una fase de un endpoint
+
+        Args:
+            endpoint: Endpoint sin query string
+            phase: Nombre de la fase
+
+        Returns:
+            Histograma o None si no hay datos
+        """
+        with self._lock:
+            return self._histograms.get(endpoint, {}).get(phase)
+
+    def reset(self) -> None:
+        """Descarta todas las mediciones"""
+        with self._lock:
+            self._histograms.clear()
+            self._connections.clear()
+
+
+def timed_connect(conn: Any, timing: RequestTiming) -> None:
+    """
+    Abre la conexión de un HTTPSConnection midiendo DNS, TCP y TLS por separado
+
+    http.client no expone las fases de connect(); se sustituye la función de
+    creación del socket de la instancia por una que resuelve y conecta
+    midiendo cada paso. El resto de connect() (handshake TLS) se atribuye a 'tls'.
+
+    Args:
+        conn: Conexión sin abrir
+        timing: Tiempos de la petición en curso
+    """
+    def create_connection(address, timeout=None, source_address=None, *args, **kwargs):
+        host, port = address
+
+        start = time.perf_counter()
+        addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        timing.add('dns', time.perf_counter() - start)
+
+        start = time.perf_counter()
+        last_error: Optional[OSError] = None
+        for family, socktype, proto, _, sockaddr in addresses:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                if timeout is not None:
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                timing.add('connect', time.perf_counter() - start)
+                return sock
+            except OSError as e:
+                last_error = e
+                sock.close()
+        raise last_error or OSError(f"No se pudo resolver {host}")
+
+    conn._create_connection = create_connection
+
+    start = time.perf_counter()
+    conn.connect()
+    elapsed = time.perf_counter() - start
+    timing.add('tls', elapsed - timing.phases.get('dns', 0.0) - timing.phases.get('connect', 0.0))
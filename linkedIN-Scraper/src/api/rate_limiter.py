@@ -10,50 +10,385 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
+import threading
 import time
 import logging
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+from src.api.retry_policy import RetryBudget, RetryPolicy
+from src.api.shared_rate_limit import SharedStoreError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Headers de cuota habituales (estándar, X-RateLimit-* y variantes de RapidAPI)
+QUOTA_REMAINING_HEADERS = ('ratelimit-remaining', 'x-ratelimit-remaining', 'x-ratelimit-requests-remaining')
+QUOTA_RESET_HEADERS = ('ratelimit-reset', 'x-ratelimit-reset', 'x-ratelimit-requests-reset')
+QUOTA_LIMIT_HEADERS = ('ratelimit-limit', 'x-ratelimit-limit', 'x-ratelimit-requests-limit')
+
+# Solo se reparte la cuota de ventanas cortas (por segundo o minuto); repartir
+# una cuota mensual llevaría el delay al máximo
+QUOTA_PACING_WINDOW = 60.0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Interpreta un header Retry-After
+
+    Args:
+        value: Segundos de espera o fecha HTTP
+        now: Timestamp actual (time.time() si no se indica)
+
+    Returns:
+        Segundos a esperar o None si el valor no es válido
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+def _first_number(headers: Dict[str, str], names: Tuple[str, ...]) -> Optional[float]:
+    """Primer header numérico presente de la lista"""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(',')[0].strip())
+        except ValueError:
+            continue
+    return None
+
 
 class RateLimiter:
-    """Implementa rate limiting para requests a la API"""
+    """
+    Rate limiting tipo token bucket, seguro entre threads
 
-    def __init__(self, delay: float = 1.0, max_retries: int = 3, retry_delay: int = 2):
+    El bucket se rellena a razón de 1/delay tokens por segundo hasta `burst`
+    tokens: ráfagas cortas de hasta `burst` peticiones salen sin esperar y a
+    largo plazo se respeta la tasa. Cada llamada reserva su token bajo el lock
+    y duerme fuera de él, de modo que los threads concurrentes quedan
+    espaciados en lugar de competir por el mismo hueco.
+
+    Con un `store` compartido (SQLite o Redis) el bucket vive fuera del
+    proceso y todos los limitadores con la misma `store_key` consumen el
+    mismo presupuesto; si el almacén falla se usa el bucket local.
+    """
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        burst: int = 1,
+        adaptive: bool = False,
+        min_delay: Optional[float] = None,
+        max_delay: float = 30.0,
+        decrease_factor: float = 2.0,
+        increase_step: float = 0.1,
+        success_threshold: int = 10,
+        store: Any = None,
+        store_key: str = "default",
+        retry_policy: Optional[RetryPolicy] = None,
+        scheduler: Any = None
+    ):
         """
         Args:
-            delay: Tiempo mínimo entre requests (segundos)
+            delay: Tiempo mínimo medio entre requests (segundos); 0 desactiva el límite
             max_retries: Número máximo de reintentos
             retry_delay: Delay base entre reintentos (segundos)
+            burst: Requests que pueden salir seguidos sin esperar
+            adaptive: Ajustar la tasa según los 429 y los headers de cuota (AIMD)
+            min_delay: Delay mínimo al que puede acelerar el modo adaptativo (por defecto `delay`)
+            max_delay: Delay máximo al que puede frenar el modo adaptativo
+            decrease_factor: Factor por el que se divide la tasa tras un 429
+            increase_step: Requests/segundo que se suman tras `success_threshold` éxitos
+            success_threshold: Respuestas correctas seguidas antes de acelerar
+            store: Almacén compartido entre procesos (ver shared_rate_limit)
+            store_key: Bucket del almacén (uno por API key)
+            retry_policy: Política de reintentos (por defecto, full jitter con
+                          presupuesto del 10% a partir de max_retries y retry_delay)
+            scheduler: RequestScheduler que ordena las esperas por prioridad (opcional)
         """
         self.delay = delay
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.burst = max(1, burst)
         self.last_request_time = 0.0
         self.request_count = 0
 
+        self.adaptive = adaptive
+        self.min_delay = delay if min_delay is None else min_delay
+        self.max_delay = max_delay
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.success_threshold = success_threshold
+        self.store = store
+        self.store_key = store_key
+        self.retry_policy = retry_policy or RetryPolicy(max_retries, retry_delay, budget=RetryBudget())
+        self.scheduler = scheduler
+
+        self._tokens = float(self.burst)
+        self._updated_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._successes = 0
+        self._throttled = 0
+        self._shared_delay = 0.0
+        self._quota: Dict[str, Optional[float]] = {'limit': None, 'remaining': None, 'reset': None}
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tasa sostenida en requests por segundo (inf si no hay límite)"""
+        return 1.0 / self.delay if self.delay > 0 else float('inf')
+
+    def _refill(self, now: float) -> None:
+        """Añade los tokens acumulados desde la última actualización"""
+        if self._updated_at is not None and self.delay > 0:
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(float(self.burst), self._tokens + elapsed / self.delay)
+        self._updated_at = now
+
     def wait(self) -> None:
-        """Espera el tiempo necesario para respetar rate limiting"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        """
+        Espera el tiempo necesario para respetar rate limiting
+
+        Con scheduler, las peticiones en espera obtienen su token por orden de
+        prioridad en lugar de por orden de llegada.
+        """
+        if self.scheduler is None:
+            self._acquire()
+        else:
+            self.scheduler.run(self._acquire)
+
+    def _acquire(self) -> None:
+        """Reserva un token y duerme hasta poder usarlo"""
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            self.request_count += 1
+            request_number = self.request_count
+
+            sleep_time = 0.0
+            if self.delay > 0:
+                # El token puede quedar "en deuda": el siguiente thread esperará más
+                self._tokens -= 1
+                if self._tokens < 0:
+                    sleep_time = -self._tokens * self.delay
 
-        if time_since_last_request < self.delay:
-            sleep_time = self.delay - time_since_last_request
+            # Espera impuesta por el servidor (Retry-After o cuota agotada)
+            blocked_for = self._blocked_until - now
+            sleep_time = max(sleep_time, blocked_for)
+
+        if self.store is not None:
+            # El bucket compartido manda; el local queda como respaldo
+            try:
+                shared_wait, shared_delay = self.store.reserve(self.store_key, self.delay, self.burst)
+                sleep_time = max(blocked_for, shared_wait)
+                with self._lock:
+                    self._shared_delay = shared_delay
+            except SharedStoreError as e:
+                logger.warning(f"Rate limiter compartido no disponible, usando el local: {e}")
+
+        if sleep_time > 0:
             logger.debug(f"Rate limiting: esperando {sleep_time:.2f}s")
             time.sleep(sleep_time)
 
         self.last_request_time = time.time()
-        self.request_count += 1
-        logger.debug(f"Request #{self.request_count}")
+        logger.debug(f"Request #{request_number}")
+
+    def available_tokens(self) -> float:
+        """
+        Tokens disponibles ahora mismo
+
+        Returns:
+            Número de requests que pueden salir sin esperar (negativo si hay cola)
+        """
+        with self._lock:
+            self._refill(time.time())
+            return self._tokens
+
+    def next_available(self) -> float:
+        """
+        Segundos hasta que una petición pueda salir sin esperar
+
+        Returns:
+            0 si hay un token libre y no hay bloqueo del servidor
+        """
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            wait = (1 - self._tokens) * self.delay if self.delay > 0 and self._tokens < 1 else 0.0
+            return max(0.0, wait, self._blocked_until - now)
+
+    def observe_response(self, status: int, headers: Dict[str, str]) -> None:
+        """
+        Ajusta el limitador según una respuesta de la API
+
+        Siempre se respeta Retry-After. En modo adaptativo, además, un 429
+        divide la tasa por `decrease_factor`, cada `success_threshold`
+        respuestas correctas seguidas suman `increase_step` requests/segundo,
+        y los headers de cuota (X-RateLimit-Remaining/Reset) reparten las
+        peticiones restantes hasta el reset. Con almacén compartido el nuevo
+        delay y la cuota se publican para que frenen todos los procesos.
+
+        Args:
+            status: Status code de la respuesta
+            headers: Headers de la respuesta con nombres en minúsculas
+        """
+        with self._lock:
+            now = time.time()
+            previous_block = self._blocked_until
+
+            retry_after = parse_retry_after(headers.get('retry-after'), now)
+            if retry_after is not None and (status == 429 or status >= 500):
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                logger.warning(f"El servidor pide esperar {retry_after:.1f}s (Retry-After)")
+
+            previous_delay = self.delay
+            quota_seen = self._adapt(status, headers, now) if self.adaptive else False
+            publish = quota_seen or self.delay != previous_delay
+            delay = self.delay
+            remaining = self._quota['remaining']
+            reset_in = max(0.0, self._quota['reset'] - now) if self._quota['reset'] else None
+
+            blocked_for = self._blocked_until - now if self._blocked_until > previous_block else 0.0
+
+        if self.store is None:
+            return
+
+        # El resto de procesos también deben respetar la espera y el nuevo ritmo
+        if blocked_for > 0:
+            try:
+                self.store.block(self.store_key, blocked_for)
+            except SharedStoreError as e:
+                logger.warning(f"No se pudo propagar la espera al rate limiter compartido: {e}")
+        if publish:
+            try:
+                self.store.publish(self.store_key, delay, remaining, reset_in)
+            except SharedStoreError as e:
+                logger.warning(f"No se pudo publicar el ritmo en el rate limiter compartido: {e}")
+            else:
+                with self._lock:
+                    self._shared_delay = delay
+
+    def _effective_delay(self) -> float:
+        """Delay más estricto entre el propio y el publicado por otros procesos"""
+        return max(self.delay, self._shared_delay)
+
+    def _adapt(self, status: int, headers: Dict[str, str], now: float) -> bool:
+        """
+        Ajuste AIMD de la tasa según el status y los headers de cuota
+
+        Los ajustes parten del delay efectivo: un proceso que no ha visto el
+        429 de otro no debe publicar un ritmo más rápido que el compartido.
+
+        Returns:
+            True si la respuesta traía headers de cuota
+        """
+        quota_seen = self._observe_quota(headers, now)
+
+        if status == 429:
+            self._throttled += 1
+            self._successes = 0
+            self._set_delay(max(self._effective_delay(), 0.001) * self.decrease_factor)
+            logger.warning(f"429 recibido: reduciendo tasa a {self.rate:.2f} req/s")
+        elif 200 <= status < 300:
+            self._successes += 1
+            if self._successes >= self.success_threshold:
+                self._successes = 0
+                delay = self._effective_delay()
+                rate = 1.0 / delay if delay > 0 else float('inf')
+                self._set_delay(1.0 / (rate + self.increase_step))
+        return quota_seen
+
+    def _observe_quota(self, headers: Dict[str, str], now: float) -> bool:
+        """Registra la cuota anunciada y frena si no alcanza hasta el reset"""
+        remaining = _first_number(headers, QUOTA_REMAINING_HEADERS)
+        reset = _first_number(headers, QUOTA_RESET_HEADERS)
+        limit = _first_number(headers, QUOTA_LIMIT_HEADERS)
+        if limit is not None:
+            self._quota['limit'] = limit
+        if remaining is None:
+            return False
+
+        self._quota['remaining'] = remaining
+        if reset is None:
+            return True
+
+        # Algunas APIs envían un timestamp absoluto, otras segundos hasta el reset
+        reset_in = reset - now if reset > 1e9 else reset
+        reset_in = max(0.0, reset_in)
+        self._quota['reset'] = now + reset_in
+
+        # Ventanas largas (cuotas mensuales) no se esperan aquí: se deja llegar el 429
+        if remaining <= 0 and reset_in <= self.max_delay:
+            self._blocked_until = max(self._blocked_until, now + reset_in)
+            logger.warning(f"Cuota agotada: esperando {reset_in:.0f}s hasta el reset")
+        elif remaining > 0 and 0 < reset_in <= max(self.max_delay, QUOTA_PACING_WINDOW):
+            # Repartir lo que queda hasta el reset
+            self._set_delay(max(self._effective_delay(), reset_in / remaining))
+        return True
+
+    def _set_delay(self, delay: float) -> None:
+        """Cambia el delay respetando los límites del modo adaptativo"""
+        delay = min(self.max_delay, max(self.min_delay, delay))
+        if delay != self.delay:
+            logger.debug(f"Rate limiter: delay {self.delay:.3f}s -> {delay:.3f}s")
+        self.delay = delay
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna el estado del limitador
+
+        Returns:
+            Diccionario con tasa actual, cuota conocida y contadores
+        """
+        shared = None
+        if self.store is not None:
+            try:
+                shared = self.store.state(self.store_key)
+            except SharedStoreError as e:
+                shared = {'error': str(e)}
+
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            return {
+                'backend': self.store.name if self.store is not None else 'local',
+                'shared': shared,
+                'delay': self.delay,
+                'rate': self.rate,
+                'burst': self.burst,
+                'adaptive': self.adaptive,
+                'available_tokens': self._tokens,
+                'requests': self.request_count,
+                'throttled': self._throttled,
+                'blocked_for': max(0.0, self._blocked_until - now),
+                'quota_limit': self._quota['limit'],
+                'quota_remaining': self._quota['remaining'],
+                'quota_reset_in': max(0.0, self._quota['reset'] - now) if self._quota['reset'] else None
+            }
 
     def with_retry(self, func: Callable[..., T]) -> Callable[..., T]:
         """
         Decorator para agregar lógica de reintentos a una función
 
+        Solo se reintentan errores transitorios (ver retry_policy), esperando
+        el rate limiting antes de cada intento.
+
         Args:
             func: Función a decorar
 
@@ -62,67 +397,97 @@ class RateLimiter:
         """
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception = None
+            return self.retry_policy.call(lambda: func(*args, **kwargs), before_attempt=self.wait)
+
+        return wrapper
+
+
+class AsyncRateLimiter:
+    """Rate limiting para corrutinas, seguro ante peticiones concurrentes"""
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Args:
+            delay: Tiempo mínimo entre requests (segundos)
+            max_retries: Número máximo de reintentos
+            retry_delay: Delay base entre reintentos (segundos)
+            retry_policy: Política de reintentos (por defecto, como en RateLimiter)
+        """
+        self.delay = delay
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_policy = retry_policy or RetryPolicy(max_retries, retry_delay, budget=RetryBudget())
+        self.last_request_time = 0.0
+        self.request_count = 0
+        self._lock = asyncio.Lock()
 
-            for attempt in range(self.max_retries):
-                try:
-                    # Rate limiting antes de cada intento
-                    self.wait()
+    async def wait(self) -> None:
+        """
+        Espera el turno de la siguiente petición
 
-                    # Ejecutar función
-                    result = func(*args, **kwargs)
-                    return result
+        Cada llamada reserva su hueco bajo el lock y duerme fuera de él, de modo
+        que N corrutinas concurrentes salen espaciadas `delay` segundos sin
+        bloquear el event loop.
+        """
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.last_request_time + self.delay)
+            self.last_request_time = slot
+            self.request_count += 1
+            request_number = self.request_count
 
-                except Exception as e:
-                    last_exception = e
-                    logger.warning(f"Intento {attempt + 1}/{self.max_retries} falló: {e}")
+        sleep_time = slot - now
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: esperando {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
+        logger.debug(f"Request #{request_number}")
 
-                    # Si no es el último intento, esperar con backoff exponencial
-                    if attempt < self.max_retries - 1:
-                        sleep_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                        logger.info(f"Reintentando en {sleep_time}s...")
-                        time.sleep(sleep_time)
-                    else:
-                        logger.error(f"Máximo de reintentos alcanzado")
+    def with_retry(self, func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        """
+        Decorator para agregar lógica de reintentos a una corrutina
+
+        Args:
+            func: Corrutina a decorar
 
-            # Si llegamos aquí, todos los intentos fallaron
-            raise last_exception or Exception("Máximo de reintentos alcanzado")
+        Returns:
+            Corrutina decorada con reintentos
+        """
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await self.retry_policy.call_async(lambda: func(*args, **kwargs), before_attempt=self.wait)
 
         return wrapper
 
 
 def retry_on_http_error(max_retries: int = 3, retry_delay: int = 2):
     """
-    Decorator para reintentar en caso de errores HTTP específicos
+    Decorator para reintentar errores HTTP transitorios
+
+    Usa la misma clasificación y backoff que RateLimiter.with_retry, sin
+    rate limiting ni presupuesto de reintentos.
 
     Args:
-        max_retries: Número máximo de reintentos
+        max_retries: Número máximo de intentos
         retry_delay: Delay base entre reintentos
 
     Returns:
         Decorator
     """
+    policy = RetryPolicy(max(max_retries, 1), retry_delay)
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    error_str = str(e).lower()
-
-                    # Errores que justifican reintentos
-                    retryable_errors = ['429', 'timeout', 'connection', 'temporary']
-                    is_retryable = any(err in error_str for err in retryable_errors)
-
-                    if not is_retryable or attempt == max_retries - 1:
-                        raise
-
-                    sleep_time = retry_delay * (attempt + 1)
-                    logger.warning(f"Error retryable: {e}. Reintentando en {sleep_time}s...")
-                    time.sleep(sleep_time)
-
-            raise Exception("Máximo de reintentos alcanzado")
+            if max_retries < 1:
+                # Sin intentos el decorador falla al llamar, como siempre ha hecho
+                raise Exception("Máximo de reintentos alcanzado")
+            return policy.call(lambda: func(*args, **kwargs))
 
         return wrapper
     return decorator
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: result_cache.py
+Descripción: Caché en memoria de resultados de búsqueda con TTL y límite en bytes,
+             y de resultados negativos (trabajos no encontrados, búsquedas vacías).
+             Una consulta repetida dentro del TTL se responde sin petición a la API.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+from src.utils import json_codec
+
+# TTL (segundos) según date_posted: las ofertas de hoy cambian antes que las del mes
+DEFAULT_TTLS = {
+    'today': 300.0,
+    '3days': 1800.0,
+    'week': 1800.0,
+    'month': 7200.0,
+    'all': 7200.0
+}
+
+
+class ResultEntry:
+    """Resultado serializado con su caducidad"""
+
+    __slots__ = ('data', 'expires_at')
+
+    def __init__(self, data: bytes, expires_at: float):
+        self.data = data
+        self.expires_at = expires_at
+
+
+class ResultCache:
+    """
+    Caché LRU thread-safe de resultados, limitada por bytes
+
+    Los resultados se guardan serializados a JSON: el tamaño de cada entrada
+    es exacto y cada acierto devuelve una copia nueva, así que el llamador
+    puede modificar lo que recibe sin tocar la caché.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, ttls: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            max_bytes: Bytes máximos de resultados almacenados
+            ttls: TTL en segundos por valor de date_posted (por defecto DEFAULT_TTLS)
+        """
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._entries: "OrderedDict[str, ResultEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Estadísticas
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+        self._stored = 0
+        self._oversized = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Clave canónica de una petición
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de query (p. ej. SearchParameters.to_api_params())
+
+        Returns:
+            Endpoint con los parámetros ordenados
+        """
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def ttl_for(self, date_posted: str) -> float:
+        """
+        TTL de un resultado según su filtro de fecha
+
+        Args:
+            date_posted: Valor de date_posted de la búsqueda
+
+        Returns:
+            Segundos que el resultado se considera válido
+        """
+        return self.ttls.get(date_posted, self.ttls['all'])
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Obtiene un resultado vigente
+
+        Args:
+            key: Clave de make_key()
+
+        Returns:
+            Copia del resultado o None si no está o ha caducado
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            data = entry.data
+
+        return json_codec.loads(data)
+
+    def put(self, key: str, result: Any, ttl: float) -> None:
+        """
+        Guarda un resultado, expulsando los menos usados si no cabe
+
+        Args:
+            key: Clave de make_key()
+            result: Resultado serializable a JSON
+            ttl: Segundos de validez
+        """
+        data = json_codec.dumps(result)
+
+        with self._lock:
+            self._remove(key)
+            if len(data) > self.max_bytes:
+                # Ocuparía toda la caché: mejor conservar el resto
+                self._oversized += 1
+                return
+
+            self._entries[key] = ResultEntry(data, time.monotonic() + ttl)
+            self._bytes += len(data)
+            self._stored += 1
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.data)
+                self._evicted += 1
+
+    def _remove(self, key: str) -> None:
+        """Elimina una entrada (con el lock tomado)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.data)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Elimina un resultado
+
+        Args:
+            key: Clave de make_key()
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Elimina todos los resultados"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso de la caché
+
+        Returns:
+            Diccionario con contadores y ocupación
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'expired': self._expired,
+                'evicted': self._evicted,
+                'stored': self._stored,
+                'oversized': self._oversized
+            }
+
+
+class NegativeCache:
+    """
+    Caché LRU thread-safe de resultados negativos
+
+    Recuerda durante `ttl` segundos las claves que no devolvieron nada
+    (trabajo no encontrado, búsqueda sin resultados) para no volver a
+    pedirlas. El TTL es corto: una búsqueda vacía puede tener resultados
+    al rato.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000):
+        """
+        Args:
+            ttl: Segundos que se recuerda un resultado negativo
+            max_entries: Número máximo de claves recordadas
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Estadísticas
+        self._hits = 0
+        self._stored = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def contains(self, key: str) -> bool:
+        """
+        Indica si la clave dio un resultado negativo hace menos de `ttl`
+
+        Args:
+            key: Clave de ResultCache.make_key()
+
+        Returns:
+            True si se puede responder sin petición
+        """
+        with self._lock:
+            expires_at = self._expires.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._expires[key]
+                self._expired += 1
+                return False
+            self._expires.move_to_end(key)
+            self._hits += 1
+            return True
+
+    def add(self, key: str) -> None:
+        """
+        Recuerda un resultado negativo
+
+        Args:
+            key: Clave de ResultCache.make_key()
+        """
+        with self._lock:
+            self._expires[key] = time.monotonic() + self.ttl
+            self._expires.move_to_end(key)
+            self._stored += 1
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+                self._evicted += 1
+
+    def discard(self, key: str) -> None:
+        """
+        Olvida un resultado negativo
+
+        Args:
+            key: Clave de ResultCache.make_key()
+        """
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def clear(self) -> None:
+        """Olvida todos los resultados negativos"""
+        with self._lock:
+            self._expires.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de uso de la caché
+
+        Returns:
+            Diccionario con contadores
+        """
+        with self._lock:
+            return {
+                'entries': len(self._expires),
+                'ttl': self.ttl,
+                'hits': self._hits,
+                'stored': self._stored,
+                'expired': self._expired,
+                'evicted': self._evicted
+            }
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: retry_policy.py
+Descripción: Política de reintentos única para clientes síncronos y asíncronos:
+             clasifica los errores por status code y tipo de excepción, espera
+             con backoff exponencial "full jitter" y limita los reintentos con
+             un presupuesto global para no multiplicar la carga durante caídas.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import http.client
+import logging
+import random
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, FrozenSet, Optional, TypeVar
+from src.api.circuit_breaker import CircuitOpenError
+from src.api.client import HTTPError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Status codes transitorios: timeout, too early, rate limit y errores del servidor/proxy
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Errores de red que suelen resolverse al repetir la petición. No se incluye
+# OSError entero: certificados inválidos, permisos o ficheros inexistentes
+# fallarían igual en el siguiente intento.
+RETRYABLE_EXCEPTIONS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    asyncio.TimeoutError,
+    asyncio.IncompleteReadError,
+    http.client.HTTPException
+)
+
+
+def is_retryable(error: BaseException, statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES) -> bool:
+    """
+    Indica si merece la pena repetir una petición que falló con `error`
+
+    Los HTTPError se clasifican por status code (400, 401, 404... fallarían
+    igual al repetirse); los errores de red y timeouts se reintentan; el
+    resto (errores de parseo, de programación...) no.
+
+    Args:
+        error: Excepción lanzada por la petición
+        statuses: Status codes que se consideran transitorios
+
+    Returns:
+        True si el error es transitorio
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, HTTPError):
+        return error.status_code in statuses
+    return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+
+class RetryBudget:
+    """
+    Presupuesto de reintentos en una ventana deslizante
+
+    Se permiten `min_retries` reintentos por ventana más `ratio` reintentos
+    por cada petición original. Con la API caída todos los intentos fallan y
+    el presupuesto se agota enseguida: la carga extra queda acotada a
+    ~`ratio` en lugar de multiplicarse por el número de reintentos.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 5, window: float = 60.0):
+        """
+        Args:
+            ratio: Reintentos permitidos por petición original
+            min_retries: Reintentos permitidos por ventana aunque haya pocas peticiones
+            window: Duración de la ventana (segundos)
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Registra una petición original"""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """
+        Reserva un reintento si queda presupuesto
+
+        Returns:
+            True si el reintento está permitido
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna el uso del presupuesto
+
+        Returns:
+            Diccionario con peticiones y reintentos en la ventana
+        """
+        with self._lock:
+            self._prune(time.monotonic())
+            return {
+                'requests': len(self._requests),
+                'retries': len(self._retries),
+                'allowed': self.min_retries + self.ratio * len(self._requests)
+            }
+
+
+class RetryPolicy:
+    """Decide si reintentar, cuánto esperar y lleva la cuenta de los reintentos"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        retryable_statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    ):
+        """
+        Args:
+            max_attempts: Intentos totales por petición (incluido el primero)
+            base_delay: Backoff base (segundos); se dobla en cada intento
+            max_delay: Backoff máximo (segundos)
+            budget: Presupuesto global de reintentos (None = sin límite)
+            retryable_statuses: Status codes que se consideran transitorios
+
+        Raises:
+            ValueError: Si max_attempts es menor que 1
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts debe ser al menos 1 (recibido {max_attempts})")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retryable_statuses = retryable_statuses
+
+        self._retries = 0
+        self._non_retryable = 0
+        self._budget_exhausted = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Espera antes del siguiente intento ("full jitter")
+
+        Un valor aleatorio entre 0 y base_delay * 2^attempt (acotado a
+        max_delay), para que los clientes que fallaron a la vez no vuelvan
+        a la vez.
+
+        Args:
+            attempt: Intento que acaba de fallar (0 = el primero)
+
+        Returns:
+            Segundos a esperar
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """
+        Decide si reintentar tras un fallo
+
+        Args:
+            error: Excepción del intento
+            attempt: Intento que falló (0 = el primero)
+
+        Returns:
+            True si hay que reintentar (consume presupuesto)
+        """
+        if not is_retryable(error, self.retryable_statuses):
+            with self._lock:
+                self._non_retryable += 1
+            logger.debug(f"Error no reintentable: {error}")
+            return False
+
+        if attempt + 1 >= self.max_attempts:
+            logger.error("Máximo de reintentos alcanzado")
+            return False
+
+        if self.budget is not None and not self.budget.try_acquire():
+            with self._lock:
+                self._budget_exhausted += 1
+            logger.warning(f"Presupuesto de reintentos agotado, no se reintenta: {error}")
+            return False
+
+        with self._lock:
+            self._retries += 1
+        return True
+
+    def _start(self) -> None:
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def call(self, func: Callable[[], T], before_attempt: Optional[Callable[[], None]] = None) -> T:
+        """
+        Ejecuta `func` aplicando la política
+
+        Args:
+            func: Petición a ejecutar
+            before_attempt: Función a llamar antes de cada intento (ej: RateLimiter.wait)
+
+        Returns:
+            Resultado de `func`
+
+        Raises:
+            Exception: El error del último intento
+        """
+        self._start()
+        attempt = 0
+        while True:
+            if before_attempt:
+                before_attempt()
+            try:
+                return func()
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+                sleep_time = self.backoff(attempt)
+                logger.warning(f"Intento {attempt + 1}/{self.max_attempts} falló: {e}. Reintentando en {sleep_time:.1f}s...")
+                time.sleep(sleep_time)
+                attempt += 1
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[T]],
+        before_attempt: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> T:
+        """
+        Versión asíncrona de call()
+
+        Args:
+            func: Corrutina (sin argumentos) a ejecutar
+            before_attempt: Corrutina a esperar antes de cada intento
+
+        Returns:
+            Resultado de `func`
+
+        Raises:
+            Exception: El error del último intento
+        """
+        self._start()
+        attempt = 0
+        while True:
+            if before_attempt:
+                await before_attempt()
+            try:
+                return await func()
+            except Exception as e:
+                if not self.should_retry(e, attempt):
+                    raise
+                sleep_time = self.backoff(attempt)
+                logger.warning(f"Intento {attempt + 1}/{self.max_attempts} falló: {e}. Reintentando en {sleep_time:.1f}s...")
+                await asyncio.sleep(sleep_time)
+                attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de reintentos
+
+        Returns:
+            Diccionario con contadores y uso del presupuesto
+        """
+        with self._lock:
+            return {
+                'retries': self._retries,
+                'non_retryable': self._non_retryable,
+                'budget_exhausted': self._budget_exhausted,
+                'budget': self.budget.stats() if self.budget else None
+            }
+
+
+def build_retry_policy(config: Any = None) -> RetryPolicy:
+    """
+    Crea la política de reintentos a partir de la configuración
+
+    Args:
+        config: Objeto Config opcional
+
+    Returns:
+        RetryPolicy con presupuesto global
+    """
+    if config is None:
+        return RetryPolicy(budget=RetryBudget())
+    return RetryPolicy(
+        max_attempts=config.max_retries,
+        base_delay=config.retry_delay,
+        max_delay=config.retry_max_delay,
+        budget=RetryBudget(ratio=config.retry_budget_ratio)
+    )
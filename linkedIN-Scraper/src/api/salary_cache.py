@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: salary_cache.py
+Descripción: Caché persistente en SQLite de las consultas de salarios.
+             Los salarios cambian en semanas, así que una consulta repetida se
+             sirve desde disco incluso tras reiniciar o desde otro proceso.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from src.api.sqlite_file import SQLiteFile
+from src.utils import json_codec
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400.0
+
+
+def normalize_value(value: Any) -> str:
+    """
+    Forma canónica de un parámetro: sin mayúsculas ni espacios sobrantes
+
+    Args:
+        value: Valor del parámetro
+
+    Returns:
+        Texto normalizado ("Madrid,  Spain " -> "madrid, spain")
+    """
+    return " ".join(str(value).split()).casefold()
+
+
+class SalaryCache(SQLiteFile):
+    """
+    Resultados de salarios guardados en SQLite con TTL
+
+    Cada fila guarda la respuesta serializada y su caducidad. Varios procesos
+    (CLI y web) pueden compartir el mismo fichero: las escrituras son atómicas
+    y las lecturas no bloquean gracias al modo WAL. Si el fichero no se puede
+    usar (bloqueado, corrupto, sin permisos) la caché se comporta como vacía.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS salary_cache ("
+        "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, data BLOB NOT NULL, "
+        "stored_at REAL NOT NULL, expires_at REAL NOT NULL)",
+    )
+
+    def __init__(self, path: Union[str, Path], ttl: float = 14 * DAY, timeout: float = 10.0):
+        """
+        Args:
+            path: Fichero de la base de datos (se crea si no existe)
+            ttl: Segundos de validez de un resultado
+            timeout: Segundos máximos esperando el lock de otro proceso
+        """
+        super().__init__(path, timeout)
+        self.ttl = ttl
+
+        # Estadísticas de este proceso
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._stored = 0
+        self._errors = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        Clave canónica de una consulta
+
+        Mayúsculas, espacios y orden de los parámetros no cambian la clave,
+        así que "Data Engineer" en "Madrid" y "data engineer" en " madrid"
+        comparten resultado.
+
+        Args:
+            endpoint: Endpoint de la API
+            params: Parámetros de la consulta (título, ubicación, tipo, experiencia, empresa...)
+
+        Returns:
+            Clave de la consulta
+        """
+        parts = sorted((name, normalize_value(value)) for name, value in params.items() if value is not None)
+        return endpoint + "?" + "&".join(f"{name}={value}" for name, value in parts)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Obtiene un resultado vigente
+
+        Args:
+            key: Clave de make_key()
+
+        Returns:
+            Resultado guardado o None si no está, ha caducado o no se pudo leer
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT data, expires_at FROM salary_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+                if row[1] <= now:
+                    self._connection().execute(
+                        "DELETE FROM salary_cache WHERE key = ? AND expires_at <= ?", (key, now)
+                    )
+                    self._expired += 1
+                    self._misses += 1
+                    return None
+            result = json_codec.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"No se pudo leer la caché de salarios: {e}")
+            with self._lock:
+                self._misses += 1
+                self._errors += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return result
+
+    def put(self, key: str, result: Any, ttl: Optional[float] = None) -> None:
+        """
+        Guarda un resultado (si la caché no está disponible no se guarda)
+
+        Args:
+            key: Clave de make_key()
+            result: Resultado serializable a JSON
+            ttl: Segundos de validez (por defecto el TTL de la caché)
+        """
+        now = time.time()
+        data = json_codec.dumps(result)
+        endpoint = key.split("?", 1)[0]
+        try:
+            with self._lock:
+                self._connection().execute(
+                    "INSERT OR REPLACE INTO salary_cache (key, endpoint, data, stored_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, endpoint, data, now, now + (self.ttl if ttl is None else ttl))
+                )
+                self._stored += 1
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo guardar en la caché de salarios: {e}")
+            with self._lock:
+                self._errors += 1
+
+    def purge_expired(self) -> int:
+        """
+        Borra los resultados caducados
+
+        Returns:
+            Número de filas borradas (0 si la caché no está disponible)
+        """
+        try:
+            with self._lock:
+                cursor = self._connection().execute(
+                    "DELETE FROM salary_cache WHERE expires_at <= ?", (time.time(),)
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo limpiar la caché de salarios: {e}")
+            return 0
+        if cursor.rowcount:
+            logger.info(f"Caché de salarios: {cursor.rowcount} resultados caducados borrados")
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Borra todos los resultados"""
+        try:
+            with self._lock:
+                self._connection().execute("DELETE FROM salary_cache")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo vaciar la caché de salarios: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas de la caché
+
+        Returns:
+            Diccionario con las entradas guardadas en disco (None si no se
+            pueden leer) y los aciertos, fallos y escrituras de este proceso
+        """
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM salary_cache"
+                ).fetchone()
+            entries, size = int(row[0]), int(row[1])
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudieron leer las estadísticas de la caché de salarios: {e}")
+            entries = size = None
+
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'entries': entries,
+                'bytes': size,
+                'ttl_days': self.ttl / DAY,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'expired': self._expired,
+                'stored': self._stored,
+                'errors': self._errors
+            }
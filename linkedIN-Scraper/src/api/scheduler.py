@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: scheduler.py
+Descripción: Planificador de peticiones por prioridad delante del rate limiter:
+             las búsquedas interactivas no esperan detrás de un lote grande.
+             Reparto ponderado entre clases (interactive, enrichment, batch) con
+             envejecimiento para que ninguna clase se quede sin turno.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+from src.api.usage_budget import BATCH, ENRICHMENT, INTERACTIVE, PRIORITIES, scoped_priority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Turnos relativos de cada clase cuando todas tienen peticiones en cola
+DEFAULT_WEIGHTS: Dict[str, int] = {INTERACTIVE: 8, ENRICHMENT: 3, BATCH: 1}
+
+
+class _Ticket:
+    """Petición en cola"""
+
+    __slots__ = ('priority', 'seq', 'enqueued_at')
+
+    def __init__(self, priority: str, seq: int, enqueued_at: float):
+        self.priority = priority
+        self.seq = seq
+        self.enqueued_at = enqueued_at
+
+
+class RequestScheduler:
+    """
+    Ordena el acceso al rate limiter por prioridad
+
+    Cada petición pide turno con `run(gate)`: el turno se concede a una
+    petición cada vez y, mientras dura `gate` (la espera del rate limiter),
+    el resto queda en cola. Cuando varias clases tienen peticiones en cola se
+    reparten los turnos según `weights` (stride scheduling: cada clase avanza
+    su "pase" 1/peso por turno y sale la de pase menor). Una petición que
+    lleva más de `max_wait` segundos en cola pasa delante (envejecimiento).
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, int]] = None,
+        max_wait: float = 30.0,
+        default_priority: str = INTERACTIVE
+    ):
+        """
+        Args:
+            weights: Peso de cada clase de prioridad
+            max_wait: Segundos en cola a partir de los que una petición tiene preferencia
+            default_priority: Clase si no hay usage_scope activo
+
+        Raises:
+            ValueError: Si alguna prioridad o peso no es válido
+        """
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        unknown = set(self.weights) - set(PRIORITIES)
+        if unknown or any(weight <= 0 for weight in self.weights.values()):
+            raise ValueError(f"Pesos de prioridad inválidos: {self.weights}")
+        if default_priority not in self.weights:
+            raise ValueError(f"Prioridad desconocida: {default_priority}")
+
+        self.max_wait = max_wait
+        self.default_priority = default_priority
+
+        self._queues: Dict[str, Deque[_Ticket]] = {name: deque() for name in self.weights}
+        self._pass: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+        self._busy = False
+        self._granted: Optional[_Ticket] = None
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+        # Estadísticas por clase
+        self._dispatched = {name: 0 for name in self.weights}
+        self._aged = {name: 0 for name in self.weights}
+        self._total_wait = {name: 0.0 for name in self.weights}
+        self._max_wait_seen = {name: 0.0 for name in self.weights}
+
+    def _resolve(self, priority: Optional[str]) -> str:
+        priority = priority or scoped_priority() or self.default_priority
+        if priority not in self.weights:
+            logger.warning(f"Prioridad desconocida '{priority}', usando {self.default_priority}")
+            return self.default_priority
+        return priority
+
+    def _select(self, now: float) -> Optional[_Ticket]:
+        """Siguiente petición a la que dar turno (sin sacarla de la cola)"""
+        heads = [queue[0] for queue in self._queues.values() if queue]
+        if not heads:
+            return None
+
+        # Envejecimiento: la petición más antigua que supere max_wait va primero
+        aged = [ticket for ticket in heads if now - ticket.enqueued_at >= self.max_wait]
+        if aged:
+            return min(aged, key=lambda ticket: ticket.seq)
+
+        return min(heads, key=lambda ticket: (self._pass[ticket.priority], -self.weights[ticket.priority], ticket.seq))
+
+    def _grant_next(self) -> None:
+        """Si el turno está libre, se lo da a la siguiente petición en cola"""
+        if self._busy:
+            return
+        now = time.monotonic()
+        ticket = self._select(now)
+        if ticket is None:
+            return
+
+        self._queues[ticket.priority].popleft()
+        waited = now - ticket.enqueued_at
+        if waited >= self.max_wait:
+            self._aged[ticket.priority] += 1
+
+        self._virtual_time = self._pass[ticket.priority]
+        self._pass[ticket.priority] += 1.0 / self.weights[ticket.priority]
+
+        self._dispatched[ticket.priority] += 1
+        self._total_wait[ticket.priority] += waited
+        self._max_wait_seen[ticket.priority] = max(self._max_wait_seen[ticket.priority], waited)
+        self._busy = True
+        self._granted = ticket
+        self._cond.notify_all()
+
+    def run(self, gate: Callable[[], T], priority: Optional[str] = None) -> T:
+        """
+        Espera turno según la prioridad y ejecuta `gate`
+
+        Args:
+            gate: Función que ocupa el turno (ej: RateLimiter._acquire)
+            priority: Clase de la petición (por defecto la del usage_scope activo)
+
+        Returns:
+            Resultado de `gate`
+        """
+        priority = self._resolve(priority)
+
+        with self._cond:
+            now = time.monotonic()
+            queue = self._queues[priority]
+            if not queue:
+                # Una clase que estaba inactiva no acumula turnos atrasados
+                self._pass[priority] = max(self._pass[priority], self._virtual_time)
+            ticket = _Ticket(priority, next(self._seq), now)
+            queue.append(ticket)
+
+            self._grant_next()
+            while self._granted is not ticket:
+                self._cond.wait()
+            self._granted = None
+
+        try:
+            return gate()
+        finally:
+            with self._cond:
+                self._busy = False
+                self._grant_next()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna estadísticas por clase de prioridad
+
+        Returns:
+            {clase: {queued, dispatched, aged, avg_wait, max_wait}}
+        """
+        with self._cond:
+            return {
+                name: {
+                    'weight': self.weights[name],
+                    'queued': len(self._queues[name]),
+                    'dispatched': self._dispatched[name],
+                    'aged': self._aged[name],
+                    'avg_wait': self._total_wait[name] / self._dispatched[name] if self._dispatched[name] else 0.0,
+                    'max_wait': self._max_wait_seen[name]
+                }
+                for name in self.weights
+            }
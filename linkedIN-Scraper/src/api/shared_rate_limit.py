@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: shared_rate_limit.py
+Descripción: Almacenes compartidos para el token bucket del RateLimiter, de modo
+             que varios procesos (workers de Flask, CLI por cron...) que usan la
+             misma API key consuman un único presupuesto de peticiones y frenen
+             juntos (delay adaptativo, cuota anunciada, Retry-After).
+             SQLite coordina procesos de un mismo host; Redis, varios hosts.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from src.api.sqlite_file import SQLiteFile
+
+try:
+    import redis  # type: ignore
+except ImportError:  # pragma: no cover - dependencia opcional
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("local", "sqlite", "redis")
+
+# Columnas añadidas a la tabla buckets después de su primera versión
+_SHARED_COLUMNS = (
+    ("delay", "REAL NOT NULL DEFAULT 0"),
+    ("quota_remaining", "REAL"),
+    ("quota_reset", "REAL")
+)
+
+
+class SharedStoreError(Exception):
+    """El almacén compartido no está disponible"""
+
+
+def take_token(
+    tokens: float,
+    updated: float,
+    blocked_until: float,
+    delay: float,
+    burst: int,
+    now: float
+) -> Tuple[float, float]:
+    """
+    Reserva un token del bucket
+
+    Args:
+        tokens: Tokens guardados
+        updated: Momento de la última actualización
+        blocked_until: Momento hasta el que el servidor pidió esperar
+        delay: Segundos entre requests (0 = sin límite)
+        burst: Capacidad del bucket
+        now: Momento actual
+
+    Returns:
+        Tupla (tokens restantes, segundos a esperar)
+    """
+    wait = 0.0
+    if delay > 0:
+        tokens = min(float(burst), tokens + max(0.0, now - updated) / delay) - 1
+        if tokens < 0:
+            wait = -tokens * delay
+    return tokens, max(wait, blocked_until - now)
+
+
+class SQLiteBucketStore(SQLiteFile):
+    """
+    Token buckets en un fichero SQLite compartido por los procesos del host
+
+    Cada reserva es una transacción `BEGIN IMMEDIATE`, que SQLite serializa
+    con un lock del fichero, así que dos procesos nunca toman el mismo token.
+    Junto a los tokens se guarda el último delay publicado y la cuota vista:
+    cada reserva usa el intervalo más estricto entre el suyo y el publicado.
+    """
+
+    name = "sqlite"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS buckets ("
+        "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, "
+        "blocked_until REAL NOT NULL DEFAULT 0, delay REAL NOT NULL DEFAULT 0, "
+        "quota_remaining REAL, quota_reset REAL)",
+    )
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Añade las columnas que no tienen los ficheros de antes de compartir el delay y la cuota"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(buckets)")}
+        for column, ddl in _SHARED_COLUMNS:
+            if column not in columns:
+                conn.execute(f"ALTER TABLE buckets ADD COLUMN {column} {ddl}")
+
+    def _load(self, conn: sqlite3.Connection, key: str, burst: int, now: float) -> Tuple[float, float, float, float]:
+        row = conn.execute(
+            "SELECT tokens, updated, blocked_until, delay FROM buckets WHERE key = ?", (key,)
+        ).fetchone()
+        return row if row else (float(burst), now, 0.0, 0.0)
+
+    def _save(self, conn: sqlite3.Connection, key: str, tokens: float, updated: float, blocked_until: float) -> None:
+        conn.execute(
+            "INSERT INTO buckets (key, tokens, updated, blocked_until) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated, "
+            "blocked_until = excluded.blocked_until",
+            (key, tokens, updated, blocked_until)
+        )
+
+    def reserve(self, key: str, delay: float, burst: int) -> Tuple[float, float]:
+        """
+        Reserva un token del bucket compartido
+
+        Args:
+            key: Bucket (uno por API key)
+            delay: Segundos entre requests de este proceso
+            burst: Capacidad del bucket
+
+        Returns:
+            Tupla (segundos que debe esperar el llamador, delay publicado por
+            los procesos que comparten el bucket; 0 si ninguno lo ha hecho)
+
+        Raises:
+            SharedStoreError: Si la base de datos no está disponible
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    now = time.time()
+                    tokens, updated, blocked_until, shared_delay = self._load(conn, key, burst, now)
+                    tokens, wait = take_token(tokens, updated, blocked_until, max(delay, shared_delay), burst, now)
+                    self._save(conn, key, tokens, now, blocked_until)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                raise SharedStoreError(f"SQLite no disponible ({self.path}): {e}") from e
+        return wait, shared_delay
+
+    def block(self, key: str, seconds: float) -> None:
+        """
+        Bloquea el bucket para todos los procesos (Retry-After, cuota agotada)
+
+        Args:
+            key: Bucket
+            seconds: Segundos de bloqueo desde ahora
+
+        Raises:
+            SharedStoreError: Si la base de datos no está disponible
+        """
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    now = time.time()
+                    tokens, updated, blocked_until, _ = self._load(conn, key, 1, now)
+                    self._save(conn, key, tokens, updated, max(blocked_until, now + seconds))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                raise SharedStoreError(f"SQLite no disponible ({self.path}): {e}") from e
+
+    def publish(
+        self,
+        key: str,
+        delay: float,
+        remaining: Optional[float] = None,
+        reset_in: Optional[float] = None
+    ) -> None:
+        """
+        Publica el delay adaptativo y la cuota vista para el resto de procesos
+
+        Args:
+            key: Bucket
+            delay: Segundos entre requests que deben respetar todos
+            remaining: Peticiones restantes anunciadas por la API (si se conocen)
+            reset_in: Segundos hasta el reset de la cuota (si se conocen)
+
+        Raises:
+            SharedStoreError: Si la base de datos no está disponible
+        """
+        with self._lock:
+            try:
+                now = time.time()
+                reset = now + reset_in if reset_in is not None else None
+                # Un bucket nuevo arranca vacío en el pasado: la reserva lo rellena hasta `burst`
+                self._connection().execute(
+                    "INSERT INTO buckets (key, tokens, updated, delay, quota_remaining, quota_reset) "
+                    "VALUES (?, 0, 0, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET delay = excluded.delay, "
+                    "quota_remaining = COALESCE(excluded.quota_remaining, quota_remaining), "
+                    "quota_reset = COALESCE(excluded.quota_reset, quota_reset)",
+                    (key, delay, remaining, reset)
+                )
+            except sqlite3.Error as e:
+                raise SharedStoreError(f"SQLite no disponible ({self.path}): {e}") from e
+
+    def state(self, key: str) -> Dict[str, Any]:
+        """
+        Estado del bucket compartido
+
+        Args:
+            key: Bucket
+
+        Returns:
+            Diccionario con tokens guardados, segundos de bloqueo restantes,
+            delay publicado y última cuota vista
+        """
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT tokens, blocked_until, delay, quota_remaining, quota_reset FROM buckets WHERE key = ?",
+                    (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                raise SharedStoreError(f"SQLite no disponible ({self.path}): {e}") from e
+        if row is None:
+            return {'tokens': None, 'blocked_for': 0.0, 'delay': 0.0, 'quota_remaining': None, 'quota_reset_in': None}
+        now = time.time()
+        return {
+            'tokens': row[0],
+            'blocked_for': max(0.0, row[1] - now),
+            'delay': row[2],
+            'quota_remaining': row[3],
+            'quota_reset_in': max(0.0, row[4] - now) if row[4] is not None else None
+        }
+
+
+# Reserva atómica en Redis; usa el reloj del servidor para que todos los hosts coincidan.
+# Los números se devuelven como texto porque Redis trunca los floats de Lua a enteros.
+_RESERVE_SCRIPT = """
+local burst = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'blocked_until', 'delay')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+local blocked_until = tonumber(state[3]) or 0
+local shared_delay = tonumber(state[4]) or 0
+local delay = math.max(tonumber(ARGV[1]), shared_delay)
+local wait = 0
+if delay > 0 then
+  tokens = math.min(burst, tokens + math.max(0, now - updated) / delay) - 1
+  if tokens < 0 then wait = -tokens * delay end
+end
+wait = math.max(wait, blocked_until - now)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now), 'blocked_until', tostring(blocked_until))
+redis.call('EXPIRE', KEYS[1], ttl)
+return {tostring(wait), tostring(shared_delay)}
+"""
+
+_BLOCK_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local blocked_until = tonumber(redis.call('HGET', KEYS[1], 'blocked_until')) or 0
+redis.call('HSET', KEYS[1], 'blocked_until', tostring(math.max(blocked_until, now + tonumber(ARGV[1]))))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+# Publica delay y cuota; un bucket nuevo arranca vacío en el pasado para que
+# la siguiente reserva lo rellene hasta `burst`
+_PUBLISH_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  redis.call('HSET', KEYS[1], 'tokens', '0', 'updated', '0')
+end
+redis.call('HSET', KEYS[1], 'delay', ARGV[1])
+if ARGV[2] ~= '' then redis.call('HSET', KEYS[1], 'quota_remaining', ARGV[2]) end
+if ARGV[3] ~= '' then redis.call('HSET', KEYS[1], 'quota_reset', tostring(now + tonumber(ARGV[3]))) end
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return 1
+"""
+
+
+class RedisBucketStore:
+    """Token buckets en Redis, compartidos por todos los procesos y hosts"""
+
+    name = "redis"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "ratelimit:", client: Any = None, ttl: int = 86400):
+        """
+        Args:
+            url: URL de Redis
+            prefix: Prefijo de las claves
+            client: Cliente redis ya creado (opcional)
+            ttl: Segundos que se conserva un bucket sin uso
+
+        Raises:
+            ImportError: Si el paquete redis no está instalado y no se pasa cliente
+        """
+        if client is None:
+            if redis is None:
+                raise ImportError("El backend 'redis' requiere el paquete redis (pip install redis)")
+            client = redis.Redis.from_url(url, socket_timeout=5)
+        self.url = url
+        self.prefix = prefix
+        self.ttl = ttl
+        self.client = client
+        self._reserve = client.register_script(_RESERVE_SCRIPT)
+        self._block = client.register_script(_BLOCK_SCRIPT)
+        self._publish = client.register_script(_PUBLISH_SCRIPT)
+
+    def _run(self, script: Any, key: str, args: list) -> Any:
+        try:
+            return script(keys=[self.prefix + key], args=args)
+        except Exception as e:
+            raise SharedStoreError(f"Redis no disponible ({self.url}): {e}") from e
+
+    def reserve(self, key: str, delay: float, burst: int) -> Tuple[float, float]:
+        """
+        Reserva un token del bucket compartido
+
+        Args:
+            key: Bucket (uno por API key)
+            delay: Segundos entre requests de este proceso
+            burst: Capacidad del bucket
+
+        Returns:
+            Tupla (segundos que debe esperar el llamador, delay publicado por
+            los procesos que comparten el bucket; 0 si ninguno lo ha hecho)
+
+        Raises:
+            SharedStoreError: Si Redis no está disponible
+        """
+        wait, shared_delay = self._run(self._reserve, key, [delay, burst, self.ttl])
+        return float(wait), float(shared_delay)
+
+    def block(self, key: str, seconds: float) -> None:
+        """
+        Bloquea el bucket para todos los procesos (Retry-After, cuota agotada)
+
+        Args:
+            key: Bucket
+            seconds: Segundos de bloqueo desde ahora
+
+        Raises:
+            SharedStoreError: Si Redis no está disponible
+        """
+        self._run(self._block, key, [seconds, self.ttl])
+
+    def publish(
+        self,
+        key: str,
+        delay: float,
+        remaining: Optional[float] = None,
+        reset_in: Optional[float] = None
+    ) -> None:
+        """
+        Publica el delay adaptativo y la cuota vista para el resto de procesos
+
+        Args:
+            key: Bucket
+            delay: Segundos entre requests que deben respetar todos
+            remaining: Peticiones restantes anunciadas por la API (si se conocen)
+            reset_in: Segundos hasta el reset de la cuota (si se conocen)
+
+        Raises:
+            SharedStoreError: Si Redis no está disponible
+        """
+        self._run(self._publish, key, [
+            delay,
+            '' if remaining is None else remaining,
+            '' if reset_in is None else reset_in,
+            self.ttl
+        ])
+
+    def state(self, key: str) -> Dict[str, Any]:
+        """
+        Estado del bucket compartido
+
+        Args:
+            key: Bucket
+
+        Returns:
+            Diccionario con tokens guardados, segundos de bloqueo restantes,
+            delay publicado y última cuota vista
+        """
+        try:
+            tokens, blocked_until, delay, remaining, reset = self.client.hmget(
+                self.prefix + key, 'tokens', 'blocked_until', 'delay', 'quota_remaining', 'quota_reset'
+            )
+        except Exception as e:
+            raise SharedStoreError(f"Redis no disponible ({self.url}): {e}") from e
+        now = time.time()
+        return {
+            'tokens': float(tokens) if tokens is not None else None,
+            'blocked_for': max(0.0, float(blocked_until) - now) if blocked_until is not None else 0.0,
+            'delay': float(delay) if delay is not None else 0.0,
+            'quota_remaining': float(remaining) if remaining is not None else None,
+            'quota_reset_in': max(0.0, float(reset) - now) if reset is not None else None
+        }
+
+    def close(self) -> None:
+        """Cierra las conexiones"""
+        self.client.close()
+
+
+def create_bucket_store(
+    backend: str,
+    path: Union[str, Path] = "cache/rate_limit.sqlite3",
+    redis_url: str = "redis://localhost:6379/0"
+) -> Optional[Union[SQLiteBucketStore, RedisBucketStore]]:
+    """
+    Crea el almacén del rate limiter
+
+    Args:
+        backend: "local" (solo este proceso), "sqlite" o "redis"
+        path: Fichero SQLite para el backend "sqlite"
+        redis_url: URL para el backend "redis"
+
+    Returns:
+        Almacén compartido, o None para el backend "local"
+
+    Raises:
+        ValueError: Si el backend no es válido
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de rate limiting inválido: {backend} (usa {', '.join(BACKENDS)})")
+    if backend == "sqlite":
+        return SQLiteBucketStore(path)
+    if backend == "redis":
+        return RedisBucketStore(redis_url)
+    return None
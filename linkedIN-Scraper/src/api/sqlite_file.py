@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: sqlite_file.py
+Descripción: Base común de los almacenes en SQLite compartidos entre procesos
+             (registro de consumo, caché de salarios, rate limiter compartido):
+             una conexión por proceso, en modo WAL y con el esquema creado.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+class SQLiteFile:
+    """
+    Fichero SQLite que pueden compartir varios procesos
+
+    Las subclases declaran su esquema en `schema` y usan `_connection()`
+    con `_lock` tomado. Las conexiones no sobreviven a un fork, así que
+    cada proceso abre la suya; el modo WAL permite leer mientras otro
+    proceso escribe y sin transacción implícita cada sentencia es atómica.
+    """
+
+    # Sentencias CREATE ... IF NOT EXISTS que se ejecutan al abrir
+    schema: Tuple[str, ...] = ()
+
+    def __init__(self, path: Union[str, Path], timeout: float = 10.0):
+        """
+        Args:
+            path: Fichero de la base de datos (se crea si no existe)
+            timeout: Segundos máximos esperando el lock de otro proceso
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexión del proceso actual (se reabre tras un fork)"""
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.timeout,
+                isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                conn.execute(statement)
+            self._migrate(conn)
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Adapta ficheros creados con un esquema anterior (por defecto nada)"""
+
+    def close(self) -> None:
+        """Cierra la conexión"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
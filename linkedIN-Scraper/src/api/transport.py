@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: transport.py
+Descripción: Transportes alternativos para HTTPClient: grabación de respuestas
+             reales en un cassette comprimido y reproducción determinista
+             sin red, con latencia simulada opcional.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from src.api.connection_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Modos de transporte admitidos
+TRANSPORT_MODES = ("live", "record", "replay")
+
+# Headers de respuesta que no se guardan en el cassette
+_SKIPPED_HEADERS = {'set-cookie', 'connection', 'keep-alive', 'transfer-encoding', 'date'}
+
+
+class CassetteMissError(LookupError):
+    """
+    No hay respuesta grabada para la petición en modo replay
+
+    No es un HTTPError: un hueco del cassette no dice nada de la API, así que
+    no debe confundirse con un 404 (ni acabar en la caché negativa).
+    """
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+        super().__init__(f"Sin respuesta grabada para {method} {url}")
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """
+    Clave de una petición en el cassette
+
+    Los parámetros de query se ordenan para que el orden de inserción no
+    afecte; el body se identifica por su hash.
+
+    Args:
+        method: Método HTTP
+        url: Endpoint con query string
+        body: Body de la petición (opcional)
+
+    Returns:
+        Clave estable de la petición
+    """
+    parsed = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+    key = f"{method.upper()} {parsed.path}?{query}" if query else f"{method.upper()} {parsed.path}"
+    if body:
+        key += f" #{hashlib.sha256(body).hexdigest()[:16]}"
+    return key
+
+
+class Cassette:
+    """
+    Respuestas HTTP grabadas en un fichero JSON lines comprimido con gzip
+
+    Cada interacción se añade como un miembro gzip independiente, de modo
+    que grabar no reescribe el fichero y un corte a mitad no pierde lo
+    anterior. Las respuestas de una misma petición se reproducen en el orden
+    en que se grabaron; al agotarse se repite la última.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Ruta del cassette (ej: "cassettes/jsearch.jsonl.gz")
+        """
+        self.path = Path(path)
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """
+        Carga un cassette existente
+
+        Args:
+            path: Ruta del cassette
+
+        Returns:
+            Cassette con las interacciones grabadas
+
+        Raises:
+            FileNotFoundError: Si el cassette no existe
+        """
+        cassette = cls(path)
+        with gzip.open(cassette.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    cassette._interactions.setdefault(interaction['key'], []).append(interaction)
+
+        logger.info(f"Cassette cargado: {len(cassette)} interacciones desde {cassette.path}")
+        return cassette
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(items) for items in self._interactions.values())
+
+    def record(
+        self,
+        key: str,
+        status: int,
+        headers: List[Tuple[str, str]],
+        body: bytes,
+        latency: float
+    ) -> None:
+        """
+        Añade una interacción al cassette y al fichero
+
+        Args:
+            key: Clave de la petición (ver request_key)
+            status: Status code de la respuesta
+            headers: Headers de la respuesta
+            body: Body tal como llegó por la red (sin descomprimir)
+            latency: Segundos hasta recibir los headers
+        """
+        interaction = {
+            'key': key,
+            'status': status,
+            'headers': [[name, value] for name, value in headers if name.lower() not in _SKIPPED_HEADERS],
+            'body': base64.b64encode(body).decode('ascii'),
+            'latency': round(latency, 6)
+        }
+
+        with self._lock:
+            self._interactions.setdefault(key, []).append(interaction)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(interaction) + "\n")
+
+        logger.debug(f"Grabada respuesta {status} para {key}")
+
+    def next_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Siguiente respuesta grabada para una petición
+
+        Args:
+            key: Clave de la petición
+
+        Returns:
+            Interacción grabada o None si no existe
+        """
+        with self._lock:
+            items = self._interactions.get(key)
+            if not items:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return items[min(cursor, len(items) - 1)]
+
+    def rewind(self) -> None:
+        """Vuelve a reproducir desde la primera respuesta de cada petición"""
+        with self._lock:
+            self._cursors.clear()
+
+
+class ReplayResponse:
+    """Respuesta grabada con la interfaz de http.client.HTTPResponse que usa HTTPClient"""
+
+    def __init__(self, interaction: Dict[str, Any]):
+        self.status = interaction['status']
+        self.will_close = False
+        self._headers = [(name, value) for name, value in interaction['headers']]
+        self._body = io.BytesIO(base64.b64decode(interaction['body']))
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        for header, value in self._headers:
+            if header.lower() == name.lower():
+                return value
+        return default
+
+    def getheaders(self) -> List[Tuple[str, str]]:
+        return list(self._headers)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._body.read(amt)
+
+
+class ReplayConnection:
+    """Conexión sin red que responde desde un cassette"""
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0):
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self.sock = self  # siempre "conectada": no se mide DNS/TCP/TLS
+        self._pending: Optional[Tuple[str, str, Optional[bytes]]] = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._pending = (method, url, body)
+
+    def getresponse(self) -> ReplayResponse:
+        """
+        Returns:
+            Respuesta grabada para la última petición
+
+        Raises:
+            CassetteMissError: Si la petición no está en el cassette
+        """
+        method, url, body = self._pending
+        self._pending = None
+
+        interaction = self.cassette.next_response(request_key(method, url, body))
+        if interaction is None:
+            raise CassetteMissError(method, url)
+
+        if self.latency_scale > 0:
+            time.sleep(interaction.get('latency', 0.0) * self.latency_scale)
+        return ReplayResponse(interaction)
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayPool:
+    """Sustituto de ConnectionPool que reproduce respuestas de un cassette"""
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0):
+        """
+        Args:
+            cassette: Cassette con las respuestas grabadas
+            latency_scale: Factor sobre la latencia grabada (0 = sin espera)
+        """
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._requests = 0
+
+    def acquire(self, host: str, timeout: Optional[float] = None) -> Tuple[ReplayConnection, bool]:
+        with self._lock:
+            self._requests += 1
+        return ReplayConnection(self.cassette, self.latency_scale), True
+
+    def release(self, host: str, conn: ReplayConnection, reusable: bool = True) -> None:
+        pass
+
+    def discard(self, conn: ReplayConnection) -> None:
+        pass
+
+    def close_all(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Contadores compatibles con ConnectionPool.stats()
+        """
+        with self._lock:
+            return {
+                'mode': 'replay',
+                'created': 0,
+                'reused': self._requests,
+                'expired': 0,
+                'stale': 0,
+                'discarded': 0,
+                'overflow': 0,
+                'in_use': 0,
+                'idle': 0,
+                'reuse_rate': 1.0 if self._requests else 0.0,
+                'interactions': len(self.cassette)
+            }
+
+
+class RecordingResponse:
+    """Envuelve una respuesta real y graba el body a medida que se lee"""
+
+    def __init__(self, response: Any, cassette: Cassette, key: str, latency: float):
+        self._response = response
+        self._cassette = cassette
+        self._key = key
+        self._latency = latency
+        self._body = bytearray()
+        self._recorded = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        data = self._response.read(amt)
+        self._body += data
+        if amt is None or not data:
+            self._save()
+        return data
+
+    def _save(self) -> None:
+        if self._recorded:
+            return
+        self._recorded = True
+        self._cassette.record(
+            self._key,
+            self._response.status,
+            self._response.getheaders(),
+            bytes(self._body),
+            self._latency
+        )
+
+
+class RecordingConnection:
+    """Envuelve una HTTPSConnection real y graba sus respuestas"""
+
+    _OWN_ATTRIBUTES = ('_conn', '_cassette', '_key', '_started')
+
+    def __init__(self, conn: Any, cassette: Cassette):
+        self._conn = conn
+        self._cassette = cassette
+        self._key: Optional[str] = None
+        self._started = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # El resto de atributos (ej: _create_connection de timed_connect) van a la conexión real
+        if name in self._OWN_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self._key = request_key(method, url, body)
+        self._started = time.perf_counter()
+        self._conn.request(method, url, body=body, headers=headers or {})
+
+    def getresponse(self) -> RecordingResponse:
+        response = self._conn.getresponse()
+        latency = time.perf_counter() - self._started
+        return RecordingResponse(response, self._cassette, self._key, latency)
+
+
+class RecordingPool(ConnectionPool):
+    """ConnectionPool que graba en un cassette cada respuesta recibida"""
+
+    def __init__(self, cassette: Cassette, max_idle: int = 10, idle_timeout: float = 60.0):
+        """
+        Args:
+            cassette: Cassette donde se añaden las respuestas
+            max_idle: Conexiones inactivas máximas por host
+            idle_timeout: Segundos antes de descartar una conexión inactiva
+        """
+        super().__init__(max_idle=max_idle, idle_timeout=idle_timeout)
+        self.cassette = cassette
+
+    def acquire(self, host: str, timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        conn, reused = super().acquire(host, timeout)
+        if not isinstance(conn, RecordingConnection):
+            conn = RecordingConnection(conn, self.cassette)
+        return conn, reused
+
+
+def create_pool(
+    mode: str = "live",
+    cassette_path: Union[str, Path] = "cassettes/jsearch.jsonl.gz",
+    max_idle: int = 10,
+    idle_timeout: float = 60.0,
+    latency_scale: float = 0.0
+) -> Any:
+    """
+    Crea el pool de conexiones correspondiente al modo de transporte
+
+    Args:
+        mode: "live" (red), "record" (red + grabación) o "replay" (solo cassette)
+        cassette_path: Ruta del cassette
+        max_idle: Conexiones inactivas máximas por host
+        idle_timeout: Segundos antes de descartar una conexión inactiva
+        latency_scale: Factor de latencia simulada en modo replay
+
+    Returns:
+        Pool compatible con HTTPClient
+
+    Raises:
+        ValueError: Si el modo no es válido
+        FileNotFoundError: Si el cassette no existe en modo replay
+    """
+    if mode == "live":
+        return ConnectionPool(max_idle=max_idle, idle_timeout=idle_timeout)
+    if mode == "record":
+        logger.info(f"Grabando respuestas en {cassette_path}")
+        return RecordingPool(Cassette(cassette_path), max_idle=max_idle, idle_timeout=idle_timeout)
+    if mode == "replay":
+        return ReplayPool(Cassette.load(cassette_path), latency_scale=latency_scale)
+    raise ValueError(f"Modo de transporte no válido: {mode} (usa {', '.join(TRANSPORT_MODES)})")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: usage_budget.py
+Descripción: Registro persistente del consumo de la API (por mes, endpoint y
+             llamador) y control de admisión frente a la cuota mensual del plan:
+             con el presupuesto bajo presión se rechaza primero el trabajo por
+             lotes y el interactivo pasa a usar caché y menos páginas.
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import calendar
+import logging
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+from src.api.client import HTTPError
+from src.api.sqlite_file import SQLiteFile
+
+logger = logging.getLogger(__name__)
+
+# Prioridades de trabajo: usuario esperando, enriquecimiento de resultados y lotes de fondo
+INTERACTIVE = "interactive"
+ENRICHMENT = "enrichment"
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, ENRICHMENT, BATCH)
+
+# Estados del presupuesto
+OK = "ok"
+SOFT_LIMIT = "soft_limit"
+EXHAUSTED = "exhausted"
+
+_scope: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar("usage_scope", default=(None, None))
+
+
+@contextmanager
+def usage_scope(caller: Optional[str] = None, priority: Optional[str] = None) -> Iterator[None]:
+    """
+    Atribuye las peticiones hechas dentro del bloque a un llamador y prioridad
+
+    Ejemplo:
+        with usage_scope("cron-nightly", BATCH):
+            job_service.search_jobs(params)
+
+    Args:
+        caller: Nombre del llamador (None = el del cliente)
+        priority: INTERACTIVE, ENRICHMENT o BATCH (None = la del cliente)
+    """
+    token = _scope.set((caller, priority))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def scoped_priority() -> Optional[str]:
+    """Prioridad fijada por el usage_scope activo (None si no hay)"""
+    return _scope.get()[1]
+
+
+class BudgetExceededError(HTTPError):
+    """La petición no se admite porque el presupuesto mensual no lo permite"""
+
+    def __init__(self, message: str, used: int, limit: int, priority: str):
+        self.used = used
+        self.limit = limit
+        self.priority = priority
+        super().__init__(402, message)
+
+
+class Admission(NamedTuple):
+    """Condiciones con las que se admite una petición"""
+
+    pages: int           # Páginas permitidas (búsquedas)
+    prefer_cache: bool   # Servir desde caché sin revalidar si es posible
+    state: str           # OK, SOFT_LIMIT o EXHAUSTED
+
+
+def month_key(now: datetime) -> str:
+    """Mes de facturación (UTC) en formato YYYY-MM"""
+    return now.strftime("%Y-%m")
+
+
+def month_progress(now: datetime) -> float:
+    """Fracción transcurrida del mes de `now` (0-1)"""
+    days = calendar.monthrange(now.year, now.month)[1]
+    start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return min(1.0, (now - start).total_seconds() / (days * 86400))
+
+
+class UsageLedger(SQLiteFile):
+    """
+    Consumo de la API guardado en SQLite
+
+    Una fila por (mes, endpoint, llamador) con peticiones y créditos. Las
+    actualizaciones son atómicas, así que varios procesos pueden compartir
+    el mismo fichero.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS usage ("
+        "month TEXT NOT NULL, endpoint TEXT NOT NULL, caller TEXT NOT NULL, "
+        "requests INTEGER NOT NULL, credits INTEGER NOT NULL, "
+        "PRIMARY KEY (month, endpoint, caller))",
+    )
+
+    def record(self, endpoint: str, caller: str, credits: int = 1, now: Optional[datetime] = None) -> None:
+        """
+        Suma una petición al registro
+
+        Args:
+            endpoint: Endpoint sin query string
+            caller: Llamador que hizo la petición
+            credits: Créditos consumidos
+            now: Momento de la petición (UTC, ahora si no se indica)
+        """
+        month = month_key(now or datetime.now(timezone.utc))
+        with self._lock:
+            self._connection().execute(
+                "INSERT INTO usage (month, endpoint, caller, requests, credits) VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT (month, endpoint, caller) DO UPDATE SET "
+                "requests = requests + 1, credits = credits + excluded.credits",
+                (month, endpoint, caller, credits)
+            )
+
+    def month_credits(self, month: str) -> int:
+        """
+        Créditos consumidos en un mes
+
+        Args:
+            month: Mes en formato YYYY-MM
+
+        Returns:
+            Total de créditos
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COALESCE(SUM(credits), 0) FROM usage WHERE month = ?", (month,)
+            ).fetchone()
+        return int(row[0])
+
+    def usage(self, month: str) -> Dict[str, Any]:
+        """
+        Desglose del consumo de un mes
+
+        Args:
+            month: Mes en formato YYYY-MM
+
+        Returns:
+            Diccionario con totales y desglose por endpoint y por llamador
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT endpoint, caller, requests, credits FROM usage WHERE month = ?", (month,)
+            ).fetchall()
+
+        by_endpoint: Dict[str, Dict[str, int]] = {}
+        by_caller: Dict[str, Dict[str, int]] = {}
+        for endpoint, caller, requests, credits in rows:
+            for group, name in ((by_endpoint, endpoint), (by_caller, caller)):
+                totals = group.setdefault(name, {'requests': 0, 'credits': 0})
+                totals['requests'] += requests
+                totals['credits'] += credits
+
+        return {
+            'requests': sum(row[2] for row in rows),
+            'credits': sum(row[3] for row in rows),
+            'by_endpoint': by_endpoint,
+            'by_caller': by_caller
+        }
+
+
+class CreditBudget:
+    """
+    Control de admisión frente a la cuota mensual
+
+    - Por debajo del límite blando: todo se admite.
+    - Desde el límite blando: el trabajo no interactivo se rechaza y el INTERACTIVE se
+      admite con una sola página y sirviendo desde caché cuando se pueda.
+    - Agotada la cuota: se rechaza todo.
+
+    Con `monthly_limit=0` solo se registra el consumo. Si el registro falla
+    se deja pasar la petición: la contabilidad no debe tumbar el servicio.
+    """
+
+    def __init__(
+        self,
+        ledger: UsageLedger,
+        monthly_limit: int = 0,
+        soft_limit: float = 0.8,
+        default_caller: str = "cli",
+        default_priority: str = INTERACTIVE
+    ):
+        """
+        Args:
+            ledger: Registro de consumo
+            monthly_limit: Créditos del plan al mes (0 = sin límite)
+            soft_limit: Fracción de la cuota a partir de la que hay presión
+            default_caller: Llamador si no hay usage_scope activo
+            default_priority: Prioridad si no hay usage_scope activo
+        """
+        self.ledger = ledger
+        self.monthly_limit = monthly_limit
+        self.soft_limit = soft_limit
+        self.default_caller = default_caller
+        self.default_priority = default_priority
+
+    def current_caller(self) -> str:
+        """Llamador de la petición en curso"""
+        return _scope.get()[0] or self.default_caller
+
+    def current_priority(self) -> str:
+        """Prioridad de la petición en curso"""
+        return _scope.get()[1] or self.default_priority
+
+    def _used(self) -> Optional[int]:
+        try:
+            return self.ledger.month_credits(month_key(datetime.now(timezone.utc)))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo leer el consumo de la API: {e}")
+            return None
+
+    def admit(self, endpoint: str, pages: int = 1) -> Admission:
+        """
+        Decide si una petición puede enviarse y con qué condiciones
+
+        Args:
+            endpoint: Endpoint sin query string
+            pages: Páginas pedidas (cada página consume un crédito)
+
+        Returns:
+            Admission con las páginas permitidas y si preferir caché
+
+        Raises:
+            BudgetExceededError: Si la cuota está agotada, o hay presión y el trabajo es por lotes
+        """
+        if not self.monthly_limit:
+            return Admission(pages, False, OK)
+
+        used = self._used()
+        if used is None:
+            return Admission(pages, False, OK)
+
+        priority = self.current_priority()
+        remaining = self.monthly_limit - used
+
+        if remaining <= 0:
+            raise BudgetExceededError(
+                f"Cuota mensual agotada ({used}/{self.monthly_limit} peticiones)",
+                used, self.monthly_limit, priority
+            )
+
+        if used >= self.soft_limit * self.monthly_limit:
+            if priority != INTERACTIVE:
+                raise BudgetExceededError(
+                    f"Presupuesto bajo presión ({used}/{self.monthly_limit}): "
+                    f"trabajo {priority} rechazado para reservar la cuota al uso interactivo",
+                    used, self.monthly_limit, priority
+                )
+            if pages > 1:
+                logger.warning(f"Presupuesto bajo presión: {endpoint} limitado a 1 página")
+            return Admission(1, True, SOFT_LIMIT)
+
+        return Admission(min(pages, remaining), False, OK)
+
+    def record(self, endpoint: str, credits: int = 1) -> None:
+        """
+        Registra una petición enviada
+
+        Args:
+            endpoint: Endpoint sin query string
+            credits: Créditos consumidos
+        """
+        try:
+            self.ledger.record(endpoint, self.current_caller(), credits)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo registrar el consumo de la API: {e}")
+
+    def report(self, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Informe de consumo del mes en curso
+
+        Args:
+            now: Momento de referencia (UTC, ahora si no se indica)
+
+        Returns:
+            Diccionario con consumo, límite, proyección a fin de mes, estado y
+            desglose por endpoint y llamador, o None si el registro no se pudo leer
+        """
+        now = now or datetime.now(timezone.utc)
+        try:
+            usage = self.ledger.usage(month_key(now))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"No se pudo leer el consumo de la API: {e}")
+            return None
+        used = usage['credits']
+        progress = month_progress(now)
+        projected = int(round(used / progress)) if progress > 0 else used
+        limit = self.monthly_limit
+
+        if limit and used >= limit:
+            state = EXHAUSTED
+        elif limit and used >= self.soft_limit * limit:
+            state = SOFT_LIMIT
+        else:
+            state = OK
+
+        return {
+            'month': month_key(now),
+            'limit': limit or None,
+            'soft_limit': int(self.soft_limit * limit) if limit else None,
+            'used': used,
+            'requests': usage['requests'],
+            'remaining': max(0, limit - used) if limit else None,
+            'used_ratio': used / limit if limit else None,
+            'projected': projected,
+            'projected_over': projected > limit if limit else False,
+            'month_progress': progress,
+            'state': state,
+            'by_endpoint': usage['by_endpoint'],
+            'by_caller': usage['by_caller']
+        }
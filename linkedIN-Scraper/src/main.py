@@ -15,13 +15,14 @@ import sys
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.api.jsearch_client import JSearchClient
+from src.services.batch_search import BatchSearchRunner
 from src.services.job_service import JobService
 from src.services.salary_service import SalaryService
 from src.services.export_service import ExportService
 from src.ui.console import Console
 from src.ui.menu import MenuSystem
 from src.ui.prompts import Prompts
-from src.ui.formatters import JobFormatter, SalaryFormatter
+from src.ui.formatters import JobFormatter, SalaryFormatter, StatsFormatter
 from config.predefined_searches import PREDEFINED_SEARCHES, SEARCH_TITLES
 
 
@@ -100,6 +101,38 @@ def handle_predefined_search(choice, job_service, export_service, console):
         console.print_error(f"Search error: {e}")
 
 
+def handle_batch_search(batch_runner, export_service, console):
+    """
+    Runs every predefined search concurrently and saves the merged results
+
+    Args:
+        batch_runner: Batch search runner
+        export_service: Export service
+        console: Rich Console
+    """
+    try:
+        searches = list(PREDEFINED_SEARCHES.values())
+        console.print_info(f"Running {len(searches)} predefined searches")
+
+        with console.console.status("[bold green]Running searches...", spinner="dots"):
+            result = batch_runner.run(searches)
+
+        console.console.print("\n")
+        console.console.print(StatsFormatter.format_batch_report(result))
+
+        if result.jobs:
+            csv_path = export_service.export_jobs_to_csv(result.jobs, "predefined batch")
+            console.print_success(f"Saved {len(result.jobs)} unique jobs to: {csv_path.name}")
+        else:
+            console.print_warning("No jobs found")
+
+        if result.failed:
+            console.print_warning(f"{len(result.failed)} searches failed")
+
+    except Exception as e:
+        console.print_error(f"Batch search error: {e}")
+
+
 def handle_job_details(job_service, export_service, prompts, console):
     """
     Handles job details retrieval
@@ -216,6 +249,47 @@ def handle_company_salary(salary_service, export_service, prompts, console):
         console.print_error(f"Error querying salaries: {e}")
 
 
+def handle_api_stats(api_client, console):
+    """
+    Displays API client statistics
+
+    Args:
+        api_client: JSearch API client
+        console: Rich Console
+    """
+    stats = api_client.get_stats()
+
+    if not stats.get('latency'):
+        console.print_info("No requests made yet in this session")
+        return
+
+    console.console.print("\n")
+    console.console.print(StatsFormatter.format_latency_table(stats['latency']))
+    console.console.print(StatsFormatter.format_pool_summary(stats))
+
+
+def handle_usage_report(api_client, console):
+    """
+    Displays API usage for the current month against the budget
+
+    Args:
+        api_client: JSearch API client
+        console: Rich Console
+    """
+    report = api_client.get_usage_report()
+
+    if report is None:
+        if api_client.budget is None:
+            console.print_info("Usage tracking is disabled (USAGE_TRACKING=false)")
+        else:
+            console.print_error("Could not read the usage ledger (see USAGE_DB_PATH)")
+        return
+
+    console.console.print("\n")
+    console.console.print(StatsFormatter.format_usage_report(report))
+    console.console.print(StatsFormatter.format_budget_summary(report))
+
+
 def main():
     """Main application function"""
     console = Console()
@@ -245,9 +319,10 @@ def main():
     # Initialize services
     try:
         api_client = JSearchClient(config.api_key, config.api_host, config)
-        job_service = JobService(api_client)
+        job_service = JobService(api_client, stream=config.stream_responses)
         salary_service = SalaryService(api_client)
         export_service = ExportService(config.output_dir)
+        batch_runner = BatchSearchRunner(job_service, max_workers=config.batch_search_workers)
 
         console.print_success("Services initialized successfully")
         console.print_info(f"Connected to: {config.api_host}")
@@ -291,6 +366,18 @@ def main():
                 # Query company salaries
                 handle_company_salary(salary_service, export_service, prompts, console)
 
+            elif choice == "14":
+                # API statistics
+                handle_api_stats(api_client, console)
+
+            elif choice == "15":
+                # API usage and budget
+                handle_usage_report(api_client, console)
+
+            elif choice == "16":
+                # Run all predefined searches concurrently
+                handle_batch_search(batch_runner, export_service, console)
+
             # Pause before showing menu again
             menu.wait_for_enter()
 
@@ -13,6 +13,33 @@ Fecha: 2025-12-08
 from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator
 
+# Campos de la API que usan los listados (JobFormatter.format_job_table y los filtros)
+LISTING_FIELDS = ",".join((
+    "job_id", "job_title", "employer_name",
+    "job_city", "job_state", "job_country", "job_is_remote", "job_employment_type",
+    "job_min_salary", "job_max_salary", "job_salary_currency", "job_salary_period"
+))
+
+
+def normalize_fields(fields: str) -> str:
+    """
+    Normaliza una proyección de campos de la API
+
+    Quita espacios y repetidos, y añade job_id si falta (es obligatorio en Job).
+
+    Args:
+        fields: Campos separados por coma
+
+    Returns:
+        Campos separados por coma, empezando por job_id
+    """
+    names = ["job_id"]
+    for name in fields.split(","):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return ",".join(names)
+
 
 class Job(BaseModel):
     """Modelo que representa un trabajo de LinkedIn"""
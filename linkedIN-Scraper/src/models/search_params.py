@@ -12,6 +12,7 @@ Fecha: 2025-12-08
 """
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
+from src.models.job import normalize_fields
 
 
 class SearchParameters(BaseModel):
@@ -28,6 +29,7 @@ class SearchParameters(BaseModel):
     radius: Optional[int] = Field(None, ge=0, description="Radio de búsqueda en km")
     exclude_job_publishers: Optional[str] = Field(None, description="Publishers a excluir")
     language: Optional[str] = Field(None, description="Código de idioma")
+    fields: Optional[str] = Field(None, description="Campos a devolver separados por coma (ej: LISTING_FIELDS)")
 
     @field_validator('query')
     @classmethod
@@ -56,6 +58,14 @@ class SearchParameters(BaseModel):
             raise ValueError(f"date_posted debe ser uno de: {', '.join(valid_periods)}")
         return v
 
+    @field_validator('fields')
+    @classmethod
+    def validate_fields(cls, v: Optional[str]) -> Optional[str]:
+        """Normaliza la proyección de campos (siempre incluye job_id)"""
+        if v is None or not v.strip():
+            return None
+        return normalize_fields(v)
+
     def to_api_params(self) -> dict:
         """Convierte a parámetros para la API"""
         params = {
@@ -79,5 +89,7 @@ class SearchParameters(BaseModel):
             params['radius'] = str(self.radius)
         if self.exclude_job_publishers:
             params['exclude_job_publishers'] = self.exclude_job_publishers
+        if self.fields:
+            params['fields'] = self.fields
 
         return params
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File name: async_job_service.py
+Description: Asyncio version of the job search service.
+             Same methods as JobService, with awaitable API calls.
+
+Author: Hex686f6c61
+Repository: https://github.com/Hex686f6c61/linkedIN-Scraper
+Version: 3.0.0
+Date: 2025-12-08
+"""
+import logging
+from typing import List
+from src.api.async_jsearch_client import AsyncJSearchClient
+from src.models.job import Job
+from src.models.search_params import SearchParameters
+from src.services.job_service import JobResultsMixin
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobService(JobResultsMixin):
+    """
+    Async service for job search and management
+
+    Shares parsing, filters and sorting with JobService through
+    JobResultsMixin; only the API calls are async.
+    """
+
+    def __init__(self, api_client: AsyncJSearchClient):
+        """
+        Args:
+            api_client: Async JSearch API Client
+        """
+        self.api_client = api_client
+        logger.debug("AsyncJobService initialized")
+
+    async def search_jobs(self, params: SearchParameters) -> List[Job]:
+        """
+        Searches for jobs and returns validated Job objects
+
+        Args:
+            params: Search parameters
+
+        Returns:
+            List of Job objects
+
+        Raises:
+            Exception: If search error occurs
+        """
+        logger.info(f"Searching for jobs: '{params.query}' in {params.country}")
+
+        try:
+            raw_results = await self.api_client.search_jobs(params)
+            return self._parse_jobs(raw_results)
+
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            raise
+
+    async def get_job_details(self, job_id: str, country: str = "us") -> Job:
+        """
+        Gets complete job details
+
+        Args:
+            job_id: Job ID
+            country: Country code
+
+        Returns:
+            Job object with complete details
+
+        Raises:
+            Exception: If error getting details
+        """
+        logger.info(f"Getting job details: {job_id}")
+
+        try:
+            raw_data = await self.api_client.get_job_details(job_id, country)
+            return self._parse_job_details(raw_data)
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting details: {e}")
+            raise
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File name: async_salary_service.py
+Description: Asyncio version of the salary query service.
+             Location comparisons run their lookups concurrently.
+
+Author: Hex686f6c61
+Repository: https://github.com/Hex686f6c61/linkedIN-Scraper
+Version: 3.0.0
+Date: 2025-12-08
+"""
+import asyncio
+import logging
+from typing import List, Optional
+from src.api.async_jsearch_client import AsyncJSearchClient
+from src.models.salary import SalaryInfo
+from src.services.salary_service import SalaryService
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSalaryService(SalaryService):
+    """Async service for salary queries"""
+
+    def __init__(self, api_client: AsyncJSearchClient):
+        """
+        Args:
+            api_client: Async JSearch API Client
+        """
+        self.api_client = api_client
+        logger.debug("AsyncSalaryService initialized")
+
+    async def get_estimated_salary(  # type: ignore[override]
+        self,
+        job_title: str,
+        location: str,
+        years_of_experience: str = "ALL"
+    ) -> List[SalaryInfo]:
+        """
+        Gets salary estimates
+
+        Args:
+            job_title: Job title
+            location: Location
+            years_of_experience: Experience level
+
+        Returns:
+            List of SalaryInfo
+
+        Raises:
+            Exception: If query error occurs
+        """
+        logger.info(f"Querying salaries: {job_title} in {location} ({years_of_experience})")
+
+        try:
+            raw_results = await self.api_client.get_estimated_salary(
+                job_title=job_title,
+                location=location,
+                years_of_experience=years_of_experience
+            )
+
+            salaries = self._parse_salaries(raw_results)
+            logger.info(f"Obtained {len(salaries)} salary records")
+            return salaries
+
+        except Exception as e:
+            logger.error(f"Error querying salaries: {e}")
+            raise
+
+    async def get_company_salary(  # type: ignore[override]
+        self,
+        company: str,
+        job_title: str,
+        location: Optional[str] = None,
+        years_of_experience: str = "ALL"
+    ) -> List[SalaryInfo]:
+        """
+        Gets salaries for a specific company
+
+        Args:
+            company: Company name
+            job_title: Job title
+            location: Location (optional)
+            years_of_experience: Experience level
+
+        Returns:
+            List of SalaryInfo
+
+        Raises:
+            Exception: If query error occurs
+        """
+        logger.info(f"Querying salaries of {company} for {job_title}")
+
+        try:
+            raw_results = await self.api_client.get_company_salary(
+                company=company,
+                job_title=job_title,
+                location=location,
+                years_of_experience=years_of_experience
+            )
+
+            salaries = self._parse_salaries(raw_results, label="company salary")
+            logger.info(f"Obtained {len(salaries)} salary records from {company}")
+            return salaries
+
+        except Exception as e:
+            logger.error(f"Error querying company salaries: {e}")
+            raise
+
+    async def compare_locations(  # type: ignore[override]
+        self,
+        job_title: str,
+        locations: List[str],
+        years_of_experience: str = "ALL"
+    ) -> dict:
+        """
+        Compares salaries across different locations
+
+        All locations are queried concurrently; the rate limiter still
+        spaces the actual requests.
+
+        Args:
+            job_title: Job title
+            locations: List of locations
+            years_of_experience: Experience level
+
+        Returns:
+            Dictionary with comparison by location
+        """
+        logger.info(f"Comparing salaries for {job_title} in {len(locations)} locations")
+
+        results = await asyncio.gather(
+            *(self.get_estimated_salary(job_title, location, years_of_experience) for location in locations),
+            return_exceptions=True
+        )
+
+        comparison = {}
+        for location, salaries in zip(locations, results):
+            if isinstance(salaries, Exception):
+                logger.warning(f"Error comparing {location}: {salaries}")
+                continue
+            if salaries:
+                comparison[location] = self._summarize_location(salaries)
+
+        return comparison
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File name: batch_search.py
+Description: Runs many job searches concurrently through one shared API client
+             (rate limiter, key pool and budget), deduplicating jobs across
+             queries and reporting per-query timing and results.
+
+Author: Hex686f6c61
+Repository: https://github.com/Hex686f6c61/linkedIN-Scraper
+Version: 3.0.0
+Date: 2025-12-08
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional
+from src.api.usage_budget import BATCH, usage_scope
+from src.models.job import Job
+from src.models.search_params import SearchParameters
+from src.services.job_service import JobService
+
+logger = logging.getLogger(__name__)
+
+
+class SearchOutcome(NamedTuple):
+    """Result of one query of a batch"""
+
+    params: SearchParameters
+    jobs: List[Job]                 # Jobs returned by this query
+    new_jobs: int                   # Jobs not already returned by an earlier query of the batch
+    duration: float                 # Seconds spent on the query, waits included
+    error: Optional[Exception]      # Error if the query failed
+
+
+class BatchSearchResult(NamedTuple):
+    """Merged result of a batch of searches"""
+
+    jobs: List[Job]                 # Unique jobs, in query order
+    outcomes: List[SearchOutcome]   # One per query, in input order
+    duration: float                 # Wall-clock seconds for the whole batch
+
+    @property
+    def failed(self) -> List[SearchOutcome]:
+        """Queries that raised an error"""
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
+
+
+class BatchSearchRunner:
+    """
+    Runs many searches on a bounded worker pool
+
+    Every query goes through the same JobService, so they all share the
+    client's rate limiter, key pool and usage budget: the pool only keeps
+    enough requests waiting to use the rate budget fully. Queries run
+    under usage_scope(caller, priority), so by default they are charged to
+    "batch" and queue behind interactive requests.
+    """
+
+    def __init__(
+        self,
+        job_service: JobService,
+        max_workers: int = 4,
+        caller: str = "batch",
+        priority: str = BATCH
+    ):
+        """
+        Args:
+            job_service: Job service whose API client is shared by all queries
+            max_workers: Queries in flight at once
+            caller: Name the usage is recorded under
+            priority: Priority class of the queries (see usage_budget)
+        """
+        self.job_service = job_service
+        self.max_workers = max(1, max_workers)
+        self.caller = caller
+        self.priority = priority
+
+    def _run_one(self, params: SearchParameters):
+        """Runs one query, returning (jobs, duration, error)"""
+        start = time.perf_counter()
+        with usage_scope(self.caller, self.priority):
+            try:
+                jobs = self.job_service.search_jobs(params)
+            except Exception as e:
+                logger.warning(f"Batch query '{params.query}' ({params.country}) failed: {e}")
+                return [], time.perf_counter() - start, e
+        return jobs, time.perf_counter() - start, None
+
+    def run(self, searches: Iterable[SearchParameters]) -> BatchSearchResult:
+        """
+        Runs all searches and merges their results
+
+        A failed query is reported in its outcome and does not stop the rest.
+
+        Args:
+            searches: Search parameters, one per query
+
+        Returns:
+            Unique jobs across all queries plus per-query outcomes
+        """
+        searches = list(searches)
+        start = time.perf_counter()
+        if not searches:
+            return BatchSearchResult([], [], 0.0)
+
+        logger.info(f"Running {len(searches)} searches with {self.max_workers} workers")
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(searches)),
+            thread_name_prefix="batch-search"
+        ) as executor:
+            results = list(executor.map(self._run_one, searches))
+
+        # Deduplicate in input order so the outcome of a query does not depend on timing
+        merged: List[Job] = []
+        seen = set()
+        outcomes = []
+        for params, (jobs, duration, error) in zip(searches, results):
+            new_jobs = 0
+            for job in jobs:
+                if job.job_id in seen:
+                    continue
+                seen.add(job.job_id)
+                merged.append(job)
+                new_jobs += 1
+            outcomes.append(SearchOutcome(params, jobs, new_jobs, duration, error))
+
+        result = BatchSearchResult(merged, outcomes, time.perf_counter() - start)
+        logger.info(
+            f"Batch finished in {result.duration:.1f}s: {len(merged)} unique jobs, "
+            f"{len(result.failed)} of {len(searches)} queries failed"
+        )
+        return result
@@ -11,12 +11,12 @@ Version: 3.0.0
 Date: 2025-12-08
 """
 import csv
-import json
 import logging
 from pathlib import Path
 from typing import List, Union
 from src.models.job import Job
 from src.models.salary import SalaryInfo
+from src.utils import json_codec
 from src.utils.file_utils import generate_filename, ensure_dir_exists
 
 logger = logging.getLogger(__name__)
@@ -114,8 +114,8 @@ class ExportService:
             # Convert jobs to dicts
             jobs_data = [job.model_dump() for job in jobs]
 
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                json.dump(jobs_data, jsonfile, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as jsonfile:
+                jsonfile.write(json_codec.dumps(jobs_data, indent=True))
 
             logger.info(f"JSON created successfully: {filepath}")
             return filepath
@@ -147,8 +147,8 @@ class ExportService:
             # Convert salaries to dicts
             salaries_data = [salary.model_dump() for salary in salaries]
 
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                json.dump(salaries_data, jsonfile, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as jsonfile:
+                jsonfile.write(json_codec.dumps(salaries_data, indent=True))
 
             logger.info(f"JSON salarial creado exitosamente: {filepath}")
             return filepath
@@ -11,92 +11,91 @@ Version: 3.0.0
 Date: 2025-12-08
 """
 import logging
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from pydantic import ValidationError
 from src.api.jsearch_client import JSearchClient
-from src.models.job import Job
+from src.models.job import Job, normalize_fields
 from src.models.search_params import SearchParameters
 
 logger = logging.getLogger(__name__)
 
 
-class JobService:
-    """Service for job search and management"""
+class JobResultsMixin:
+    """
+    Parsing, filtering and sorting of job results
+
+    Shared by JobService and AsyncJobService; holds no state and makes no
+    API calls, so it works with either client.
+    """
 
-    def __init__(self, api_client: JSearchClient):
+    @staticmethod
+    def _project(job_data: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
         """
+        Keeps only the projected fields of a raw job
+
+        The API may ignore `fields` (or the response may come from a cache
+        filled by a full request), so heavy fields such as job_description
+        are dropped here before validation.
+
         Args:
-            api_client: JSearch API Client
+            job_data: Raw job dict from the API
+            fields: Projected fields (comma separated), None keeps everything
+
+        Returns:
+            Job dict with only the projected fields
         """
-        self.api_client = api_client
-        logger.debug("JobService initialized")
+        if not fields or not isinstance(job_data, dict):
+            return job_data
+        keep = set(fields.split(","))
+        return {name: value for name, value in job_data.items() if name in keep}
 
-    def search_jobs(self, params: SearchParameters) -> List[Job]:
+    def _parse_jobs(self, raw_results: Iterable[Dict[str, Any]], fields: Optional[str] = None) -> List[Job]:
         """
-        Searches for jobs and returns validated Job objects
+        Validates raw API results into Job objects, skipping invalid entries
 
         Args:
-            params: Search parameters
+            raw_results: Raw job dicts from the API (list or stream)
+            fields: Projected fields (comma separated); other fields are not validated
 
         Returns:
             List of Job objects
-
-        Raises:
-            Exception: If search error occurs
         """
-        logger.info(f"Searching for jobs: '{params.query}' in {params.country}")
-
-        try:
-            # Call the API
-            raw_results = self.api_client.search_jobs(params)
-
-            # Parse results to Job objects
-            jobs = []
-            for i, job_data in enumerate(raw_results):
-                try:
-                    job = Job.model_validate(job_data)
-                    jobs.append(job)
-                except ValidationError as e:
-                    logger.warning(f"Error parsing job #{i+1}: {e}")
-                    # Continue with rest of jobs
-                    continue
-
-            logger.info(f"Parsed {len(jobs)} jobs from {len(raw_results)} results")
-            return jobs
+        jobs = []
+        total = 0
+        for i, job_data in enumerate(raw_results):
+            total += 1
+            try:
+                job = Job.model_validate(self._project(job_data, fields))
+                jobs.append(job)
+            except ValidationError as e:
+                logger.warning(f"Error parsing job #{i+1}: {e}")
+                # Continue with rest of jobs
+                continue
 
-        except Exception as e:
-            logger.error(f"Search error: {e}")
-            raise
+        logger.info(f"Parsed {len(jobs)} jobs from {total} results")
+        return jobs
 
-    def get_job_details(self, job_id: str, country: str = "us") -> Job:
+    def _parse_job_details(self, raw_data: Dict[str, Any]) -> Job:
         """
-        Gets complete job details
+        Validates raw job details into a Job object
 
         Args:
-            job_id: Job ID
-            country: Country code
+            raw_data: Raw job dict from the API
 
         Returns:
-            Job object with complete details
+            Job object
 
         Raises:
-            Exception: If error getting details
+            ValueError: If the data is not a valid job
         """
-        logger.info(f"Getting job details: {job_id}")
-
         try:
-            raw_data = self.api_client.get_job_details(job_id, country)
             job = Job.model_validate(raw_data)
-
-            logger.info(f"Details obtained: {job.title}")
-            return job
-
         except ValidationError as e:
             logger.error(f"Error parsing job details: {e}")
             raise ValueError(f"Invalid job data: {e}")
-        except Exception as e:
-            logger.error(f"Error getting details: {e}")
-            raise
+
+        logger.info(f"Details obtained: {job.title}")
+        return job
 
     def filter_remote_jobs(self, jobs: List[Job]) -> List[Job]:
         """
@@ -157,3 +156,131 @@ class JobService:
         sorted_jobs = sorted(jobs, key=get_salary_key, reverse=descending)
         logger.debug(f"Jobs sorted by salary")
         return sorted_jobs
+
+
+class JobService(JobResultsMixin):
+    """Service for job search and management"""
+
+    def __init__(self, api_client: JSearchClient, stream: bool = False):
+        """
+        Args:
+            api_client: JSearch API Client
+            stream: Parse search responses incrementally, one job at a time
+        """
+        self.api_client = api_client
+        self.stream = stream
+        logger.debug("JobService initialized")
+
+    def search_jobs(self, params: SearchParameters) -> List[Job]:
+        """
+        Searches for jobs and returns validated Job objects
+
+        Args:
+            params: Search parameters
+
+        Returns:
+            List of Job objects
+
+        Raises:
+            Exception: If search error occurs
+        """
+        logger.info(f"Searching for jobs: '{params.query}' in {params.country}")
+
+        try:
+            # Call the API (streamed results are validated as they arrive)
+            if self.stream:
+                raw_results = self.api_client.iter_search_jobs(params)
+            else:
+                raw_results = self.api_client.search_jobs(params)
+            return self._parse_jobs(raw_results, params.fields)
+
+        except Exception as e:
+            logger.error(f"Search error: {e}")
+            raise
+
+    def iter_jobs(self, params: SearchParameters, limit: Optional[int] = None) -> Iterator[Job]:
+        """
+        Yields validated jobs page by page, fetching each page only when needed
+
+        Args:
+            params: Search parameters (num_pages is ignored)
+            limit: Maximum number of jobs to yield
+
+        Yields:
+            Job objects, in result order
+        """
+        logger.info(f"Iterating jobs: '{params.query}' in {params.country}")
+
+        if limit is not None and limit <= 0:
+            return
+
+        count = 0
+        for page in self.api_client.iter_search_pages(params):
+            for job in self._parse_jobs(page, params.fields):
+                yield job
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def get_job_details(self, job_id: str, country: str = "us", fields: Optional[str] = None) -> Job:
+        """
+        Gets complete job details
+
+        Args:
+            job_id: Job ID
+            country: Country code
+            fields: Only request and validate these API fields (comma separated)
+
+        Returns:
+            Job object with complete details
+
+        Raises:
+            Exception: If error getting details
+        """
+        logger.info(f"Getting job details: {job_id}")
+        fields = normalize_fields(fields) if fields else None
+
+        try:
+            raw_data = self.api_client.get_job_details(job_id, country, fields=fields)
+            return self._parse_job_details(self._project(raw_data, fields))
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting details: {e}")
+            raise
+
+    def get_job_details_batch(
+        self,
+        job_ids: Iterable[str],
+        country: str = "us",
+        fields: Optional[str] = None
+    ) -> Dict[str, Union[Job, Exception]]:
+        """
+        Gets complete details for several jobs with as few requests as possible
+
+        Args:
+            job_ids: Job IDs
+            country: Country code
+            fields: Only request and validate these API fields (comma separated)
+
+        Returns:
+            {job_id: Job, or the exception raised for that ID}
+        """
+        fields = normalize_fields(fields) if fields else None
+        raw_results = self.api_client.get_job_details_batch(job_ids, country, fields=fields)
+
+        results: Dict[str, Union[Job, Exception]] = {}
+        for job_id, raw_data in raw_results.items():
+            if isinstance(raw_data, Exception):
+                results[job_id] = raw_data
+                continue
+            try:
+                results[job_id] = Job.model_validate(self._project(raw_data, fields))
+            except ValidationError as e:
+                logger.warning(f"Error parsing job details {job_id}: {e}")
+                results[job_id] = ValueError(f"Invalid job data: {e}")
+
+        found = sum(1 for result in results.values() if isinstance(result, Job))
+        logger.info(f"Details obtained for {found} of {len(results)} jobs")
+        return results
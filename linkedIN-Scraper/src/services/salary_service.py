@@ -11,7 +11,7 @@ Version: 3.0.0
 Date: 2025-12-08
 """
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import ValidationError
 from src.api.jsearch_client import JSearchClient
 from src.models.salary import SalaryInfo
@@ -59,17 +59,7 @@ class SalaryService:
                 years_of_experience=years_of_experience
             )
 
-            # Parse results
-            salaries = []
-            for i, salary_data in enumerate(raw_results):
-                try:
-                    salary = SalaryInfo.model_validate(salary_data)
-                    if salary.has_salary_data():  # Only include if has data
-                        salaries.append(salary)
-                except ValidationError as e:
-                    logger.warning(f"Error parsing salary #{i+1}: {e}")
-                    continue
-
+            salaries = self._parse_salaries(raw_results)
             logger.info(f"Obtained {len(salaries)} salary records")
             return salaries
 
@@ -109,17 +99,7 @@ class SalaryService:
                 years_of_experience=years_of_experience
             )
 
-            # Parse results
-            salaries = []
-            for i, salary_data in enumerate(raw_results):
-                try:
-                    salary = SalaryInfo.model_validate(salary_data)
-                    if salary.has_salary_data():
-                        salaries.append(salary)
-                except ValidationError as e:
-                    logger.warning(f"Error parsing company salary #{i+1}: {e}")
-                    continue
-
+            salaries = self._parse_salaries(raw_results, label="company salary")
             logger.info(f"Obtained {len(salaries)} salary records from {company}")
             return salaries
 
@@ -151,16 +131,53 @@ class SalaryService:
             try:
                 salaries = self.get_estimated_salary(job_title, location, years_of_experience)
                 if salaries:
-                    # Calculate average of medians
-                    medians = [s.median_salary for s in salaries if s.median_salary]
-                    avg_median = sum(medians) / len(medians) if medians else None
-                    comparison[location] = {
-                        'count': len(salaries),
-                        'average_median': avg_median,
-                        'salaries': salaries
-                    }
+                    comparison[location] = self._summarize_location(salaries)
             except Exception as e:
                 logger.warning(f"Error comparing {location}: {e}")
                 continue
 
         return comparison
+
+    def _parse_salaries(self, raw_results: List[Dict[str, Any]], label: str = "salary") -> List[SalaryInfo]:
+        """
+        Validates raw API results into SalaryInfo objects
+
+        Only records that actually contain salary data are kept.
+
+        Args:
+            raw_results: Raw salary dicts from the API
+            label: Record label used in warnings
+
+        Returns:
+            List of SalaryInfo
+        """
+        salaries = []
+        for i, salary_data in enumerate(raw_results):
+            try:
+                salary = SalaryInfo.model_validate(salary_data)
+                if salary.has_salary_data():  # Only include if has data
+                    salaries.append(salary)
+            except ValidationError as e:
+                logger.warning(f"Error parsing {label} #{i+1}: {e}")
+                continue
+        return salaries
+
+    @staticmethod
+    def _summarize_location(salaries: List[SalaryInfo]) -> Dict[str, Any]:
+        """
+        Builds the comparison entry for one location
+
+        Args:
+            salaries: Salary records of the location
+
+        Returns:
+            Dictionary with count, average of medians and records
+        """
+        # Calculate average of medians
+        medians = [s.median_salary for s in salaries if s.median_salary]
+        avg_median = sum(medians) / len(medians) if medians else None
+        return {
+            'count': len(salaries),
+            'average_median': avg_median,
+            'salaries': salaries
+        }
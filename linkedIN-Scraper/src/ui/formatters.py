@@ -10,7 +10,7 @@ Repository: https://github.com/Hex686f6c61/linkedIN-Scraper
 Version: 3.0.0
 Date: 2025-12-08
 """
-from typing import List
+from typing import Any, Dict, List
 from rich.table import Table
 from rich.panel import Panel
 from src.models.job import Job
@@ -192,3 +192,193 @@ class SalaryFormatter:
 
         lines.append("=" * 80 + "\n")
         return "\n".join(lines)
+
+
+class StatsFormatter:
+    """Formatter for API client statistics"""
+
+    @staticmethod
+    def _format_ms(value) -> str:
+        """Formats a millisecond value, or N/A if missing"""
+        return f"{value:.1f}" if value is not None else "N/A"
+
+    @staticmethod
+    def format_latency_table(latency: Dict[str, Any]) -> Table:
+        """
+        Creates Rich table with the latency breakdown per endpoint and phase
+
+        Args:
+            latency: Snapshot from LatencyMetrics.snapshot()
+
+        Returns:
+            Formatted Rich table
+        """
+        table = Table(title="[bold]Request Latency (ms)[/bold]", show_lines=True)
+
+        # Columns
+        table.add_column("Endpoint", style="cyan", width=28)
+        table.add_column("Phase", style="magenta", width=10)
+        table.add_column("Count", justify="right", width=7)
+        table.add_column("Mean", style="green", justify="right", width=9)
+        table.add_column("p50", justify="right", width=9)
+        table.add_column("p90", style="yellow", justify="right", width=9)
+        table.add_column("p99", style="red", justify="right", width=9)
+        table.add_column("Max", justify="right", width=9)
+
+        for endpoint, data in sorted(latency.items()):
+            first = True
+            for phase, summary in data.get('phases', {}).items():
+                table.add_row(
+                    endpoint if first else "",
+                    phase,
+                    str(summary['count']),
+                    StatsFormatter._format_ms(summary['mean_ms']),
+                    StatsFormatter._format_ms(summary['p50_ms']),
+                    StatsFormatter._format_ms(summary['p90_ms']),
+                    StatsFormatter._format_ms(summary['p99_ms']),
+                    StatsFormatter._format_ms(summary['max_ms'])
+                )
+                first = False
+
+        return table
+
+    @staticmethod
+    def format_pool_summary(stats: Dict[str, Any]) -> str:
+        """
+        Formats connection pool and cache counters in simple text
+
+        Args:
+            stats: Dictionary from JSearchClient.get_stats()
+
+        Returns:
+            Summary text
+        """
+        pool = stats.get('connection_pool') or {}
+        lines = [
+            f"Connections: {pool.get('created', 0)} created, {pool.get('reused', 0)} reused "
+            f"({pool.get('reuse_rate', 0.0):.0%} reuse rate)"
+        ]
+
+        cache = stats.get('conditional_cache')
+        if cache:
+            lines.append(
+                f"Conditional cache: {cache['entries']} entries, "
+                f"{cache['revalidated']} served after 304"
+            )
+
+        hedging = stats.get('hedging')
+        if hedging:
+            lines.append(
+                f"Hedged requests: {hedging['hedged']} of {hedging['requests']} "
+                f"({hedging['hedge_wins']} won by the duplicate)"
+            )
+
+        retries = stats.get('retries')
+        if retries:
+            lines.append(
+                f"Retries: {retries['retries']} sent, {retries['non_retryable']} errors not retried, "
+                f"{retries['budget_exhausted']} skipped by the retry budget"
+            )
+
+        api_keys = stats.get('api_keys')
+        if api_keys:
+            lines.append(
+                f"API keys: {api_keys['active']} of {api_keys['total']} active, "
+                f"{api_keys['failovers']} requests moved to another key"
+            )
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_usage_report(report: Dict[str, Any]) -> Table:
+        """
+        Creates Rich table with API usage for the current month
+
+        Args:
+            report: Report from JSearchClient.get_usage_report()
+
+        Returns:
+            Formatted Rich table
+        """
+        limit = report.get('limit')
+        budget = f"{report['used']} / {limit}" if limit else f"{report['used']} (no limit)"
+        table = Table(
+            title=f"[bold]API Usage {report['month']}[/bold] - {budget} credits",
+            show_lines=True
+        )
+
+        table.add_column("Group", style="magenta", width=10)
+        table.add_column("Name", style="cyan", width=28)
+        table.add_column("Requests", justify="right", width=10)
+        table.add_column("Credits", style="green", justify="right", width=10)
+
+        for group, key in (("Endpoint", 'by_endpoint'), ("Caller", 'by_caller')):
+            first = True
+            for name, totals in sorted(report.get(key, {}).items()):
+                table.add_row(group if first else "", name, str(totals['requests']), str(totals['credits']))
+                first = False
+
+        return table
+
+    @staticmethod
+    def format_budget_summary(report: Dict[str, Any]) -> str:
+        """
+        Formats budget state and month-end projection in simple text
+
+        Args:
+            report: Report from JSearchClient.get_usage_report()
+
+        Returns:
+            Summary text
+        """
+        lines = [
+            f"Projected month-end usage: {report['projected']} credits "
+            f"({report['month_progress']:.0%} of the month elapsed)"
+        ]
+
+        if report.get('limit'):
+            lines.append(f"Remaining: {report['remaining']} credits ({report['used_ratio']:.0%} used)")
+            if report['state'] == 'exhausted':
+                lines.append("[red]Monthly budget exhausted: requests are rejected[/red]")
+            elif report['state'] == 'soft_limit':
+                lines.append("[yellow]Soft limit reached: batch work is rejected, searches use cache and one page[/yellow]")
+            elif report['projected_over']:
+                lines.append("[yellow]At the current pace the monthly budget will run out before the month ends[/yellow]")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_batch_report(result: Any) -> Table:
+        """
+        Creates Rich table with per-query results of a batch of searches
+
+        Args:
+            result: BatchSearchResult from BatchSearchRunner.run()
+
+        Returns:
+            Formatted Rich table
+        """
+        table = Table(
+            title=f"[bold]Batch: {len(result.jobs)} unique jobs[/bold] in {result.duration:.1f}s",
+            show_lines=True
+        )
+
+        table.add_column("Query", style="cyan", width=35)
+        table.add_column("Country", width=7)
+        table.add_column("Jobs", justify="right", width=6)
+        table.add_column("New", style="green", justify="right", width=6)
+        table.add_column("Time", justify="right", width=8)
+        table.add_column("Status", width=20)
+
+        for outcome in result.outcomes:
+            status = f"[red]{outcome.error}[/red]" if outcome.error else "OK"
+            table.add_row(
+                outcome.params.query,
+                outcome.params.country,
+                str(len(outcome.jobs)),
+                str(outcome.new_jobs),
+                f"{outcome.duration:.1f}s",
+                status
+            )
+
+        return table
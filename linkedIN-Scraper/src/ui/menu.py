@@ -51,6 +51,9 @@ class MenuSystem:
   [11] Get job details (by ID)
   [12] Query estimated salaries by position
   [13] Query company specific salaries
+  [14] API statistics (latency, connections)
+  [15] API usage and monthly budget
+  [16] Run all predefined searches (batch)
 
 [bold red][0] Exit[/bold red]
         """
@@ -61,7 +64,7 @@ class MenuSystem:
         # Get user option
         choice = Prompt.ask(
             "\n[bold]Select an option[/bold]",
-            choices=[str(i) for i in range(14)],
+            choices=[str(i) for i in range(17)],
             default="0"
         )
 
@@ -11,7 +11,7 @@ Version: 3.0.0
 Date: 2025-12-08
 """
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -22,12 +22,71 @@ class Config(BaseSettings):
     # API Settings
     api_key: str = Field(..., description="OpenWeb Ninja API Key")
     api_host: str = Field(default="api.openwebninja.com", description="API Host")
+    extra_api_keys: str = Field(default="", description="Additional API keys, comma separated; requests are spread across API_KEY and these")
+    key_failure_threshold: int = Field(default=3, ge=1, le=20, description="Consecutive transient errors after which a key is rested")
+    key_cooldown_seconds: float = Field(default=60.0, ge=1.0, le=3600.0, description="Time a throttled or failing key stays out of rotation (seconds)")
 
     # Request Settings
     max_retries: int = Field(default=3, ge=1, le=10, description="Maximum number of retries")
-    retry_delay: int = Field(default=2, ge=1, le=10, description="Delay between retries (seconds)")
+    retry_delay: int = Field(default=2, ge=1, le=10, description="Base delay between retries (seconds), doubled per attempt with full jitter")
+    retry_max_delay: float = Field(default=30.0, ge=1.0, le=300.0, description="Upper bound for the retry backoff (seconds)")
+    retry_budget_ratio: float = Field(default=0.1, ge=0.0, le=1.0, description="Retries allowed per original request over the last minute")
     request_timeout: int = Field(default=30, ge=10, le=120, description="Request timeout (seconds)")
     rate_limit_delay: float = Field(default=1.0, ge=0.1, le=5.0, description="Delay between requests (seconds)")
+    rate_limit_burst: int = Field(default=3, ge=1, le=20, description="Requests allowed back-to-back before the delay applies")
+    adaptive_rate_limit: bool = Field(default=True, description="Slow down on 429/quota headers and speed up again on sustained success")
+    rate_limit_min_delay: float = Field(default=0.2, ge=0.05, le=5.0, description="Fastest pace the adaptive limiter may reach (seconds between requests)")
+    rate_limit_backend: str = Field(default="local", pattern="^(local|sqlite|redis)$", description="local: per process, sqlite: shared by processes on this host, redis: shared by every host")
+    rate_limit_store_path: Path = Field(default=Path("cache/rate_limit.sqlite3"), description="SQLite file for the shared rate limiter")
+    redis_url: str = Field(default="redis://localhost:6379/0", description="Redis URL for the shared rate limiter")
+
+    # Connection Pool Settings
+    pool_max_idle: int = Field(default=10, ge=1, le=100, description="Idle keep-alive connections kept per host (not a cap on open connections)")
+    pool_idle_timeout: float = Field(default=60.0, ge=1.0, le=600.0, description="Idle time before a pooled connection is dropped (seconds)")
+    http_compression: bool = Field(default=True, description="Request gzip/deflate/brotli compressed responses")
+    conditional_cache_size: int = Field(default=128, ge=0, le=10000, description="Responses kept for ETag/Last-Modified revalidation (0 disables)")
+    result_cache_bytes: int = Field(default=16 * 1024 * 1024, ge=0, description="Bytes of search results kept in memory for repeated queries (0 disables)")
+    result_cache_ttl_today: float = Field(default=300.0, ge=1.0, le=86400.0, description="Lifetime of cached results for date_posted=today (seconds)")
+    result_cache_ttl_week: float = Field(default=1800.0, ge=1.0, le=86400.0, description="Lifetime of cached results for date_posted=3days/week (seconds)")
+    result_cache_ttl_month: float = Field(default=7200.0, ge=1.0, le=86400.0, description="Lifetime of cached results for date_posted=month/all (seconds)")
+    negative_cache_ttl: float = Field(default=300.0, ge=0.0, le=86400.0, description="How long missing job IDs and empty searches are remembered (seconds, 0 disables)")
+    stream_responses: bool = Field(default=False, description="Parse search results incrementally to keep memory flat")
+    page_fanout: bool = Field(default=False, description="Split multi-page searches into concurrent single-page requests")
+    page_fanout_workers: int = Field(default=4, ge=1, le=10, description="Single-page requests of one search in flight at once")
+    details_batch_size: int = Field(default=20, ge=1, le=20, description="Job IDs packed into one job-details request (1 = one request per ID)")
+    details_batch_workers: int = Field(default=4, ge=1, le=10, description="Job-details requests of one batch in flight at once")
+    batch_search_workers: int = Field(default=4, ge=1, le=20, description="Searches of a batch run in flight at once")
+    hedge_requests: bool = Field(default=False, description="Send a duplicate request when one is slower than recent latency")
+    hedge_percentile: float = Field(default=95.0, ge=50.0, le=99.9, description="Latency percentile that triggers a hedged request")
+    hedge_max_ratio: float = Field(default=0.1, ge=0.0, le=0.5, description="Maximum fraction of requests that may be hedged")
+
+    # Circuit Breaker Settings
+    circuit_breaker_enabled: bool = Field(default=True, description="Fail fast per endpoint while the API is unhealthy")
+    circuit_failure_rate: float = Field(default=0.5, gt=0.0, le=1.0, description="Failure rate over recent calls that opens the circuit")
+    circuit_slow_call_seconds: float = Field(default=10.0, ge=0.1, le=120.0, description="Calls slower than this count towards the slow-call rate (seconds)")
+    circuit_open_seconds: float = Field(default=30.0, ge=1.0, le=600.0, description="Time the circuit stays open before probing again (seconds)")
+
+    # Salary Cache Settings
+    salary_cache_enabled: bool = Field(default=True, description="Keep salary lookups on disk so repeated ones skip the API")
+    salary_cache_path: Path = Field(default=Path("cache/salary.sqlite3"), description="SQLite file holding cached salary results")
+    salary_cache_ttl_days: float = Field(default=14.0, gt=0.0, le=365.0, description="Lifetime of cached salary results (days)")
+
+    # Usage Budget Settings
+    usage_tracking: bool = Field(default=True, description="Record API usage per month, endpoint and caller")
+    usage_db_path: Path = Field(default=Path("cache/usage.sqlite3"), description="SQLite file holding the usage ledger")
+    monthly_request_budget: int = Field(default=0, ge=0, description="Requests included in the monthly plan (0 = track only, no limits)")
+    budget_soft_limit: float = Field(default=0.8, gt=0.0, le=1.0, description="Fraction of the budget after which batch work is rejected and interactive work degrades")
+    usage_caller: str = Field(default="cli", min_length=1, max_length=50, description="Name this process reports its usage under")
+    usage_priority: str = Field(default="interactive", pattern="^(interactive|enrichment|batch)$", description="Priority class of this process: interactive work degrades under budget pressure, the rest is rejected first and scheduled last")
+
+    # Scheduler Settings
+    scheduler_enabled: bool = Field(default=True, description="Hand out rate limit slots by priority class instead of arrival order")
+    scheduler_max_wait: float = Field(default=30.0, ge=1.0, le=600.0, description="Queue time after which a request goes first regardless of its class (seconds)")
+
+    # Transport Settings (record/replay)
+    transport_mode: str = Field(default="live", pattern="^(live|record|replay)$", description="live: network only, record: network + save responses to cassette, replay: serve responses from cassette offline")
+    cassette_path: Path = Field(default=Path("cassettes/jsearch.jsonl.gz"), description="Gzip-compressed cassette file for record/replay")
+    replay_latency_scale: float = Field(default=0.0, ge=0.0, le=10.0, description="Multiplier applied to recorded latency when replaying (0 = no delay)")
 
     # Paths
     output_dir: Path = Field(default=Path("output"), description="Output directory")
@@ -46,7 +105,8 @@ class Config(BaseSettings):
 
     def validate_and_setup(self) -> None:
         """Validates configuration and creates necessary directories"""
-        if not self.api_key or self.api_key == "YOUR_API_KEY_HERE":
+        # Replay mode never touches the network, so no real key is needed
+        if self.transport_mode != "replay" and (not self.api_key or self.api_key == "YOUR_API_KEY_HERE"):
             raise ValueError(
                 "API_KEY not configured. "
                 "Please configure your API key in the .env file"
@@ -56,6 +116,15 @@ class Config(BaseSettings):
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
+    def additional_api_keys(self) -> List[str]:
+        """Keys from EXTRA_API_KEYS, without blanks or repeats of API_KEY"""
+        keys: List[str] = []
+        for key in self.extra_api_keys.split(","):
+            key = key.strip()
+            if key and key != self.api_key and key not in keys:
+                keys.append(key)
+        return keys
+
     @classmethod
     def load(cls) -> "Config":
         """Loads and validates configuration"""
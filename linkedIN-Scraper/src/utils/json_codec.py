@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File name: json_codec.py
+Description: JSON encoding/decoding backed by orjson or msgspec when installed,
+             falling back to the standard library json module otherwise.
+
+Author: Hex686f6c61
+Repository: https://github.com/Hex686f6c61/linkedIN-Scraper
+Version: 3.0.0
+Date: 2025-12-08
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+DefaultHook = Optional[Callable[[Any], Any]]
+
+# Backends in order of preference
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """
+    JSON codec with a uniform interface over the available backends
+
+    Output is always UTF-8 bytes without ASCII escaping. Decoding errors are
+    raised as json.JSONDecodeError regardless of the backend.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Args:
+            backend: "orjson", "msgspec" or "json" (fastest installed if not given)
+
+        Raises:
+            ValueError: If the requested backend is unknown or not installed
+        """
+        available = {"orjson": orjson is not None, "msgspec": msgspec is not None, "json": True}
+        if backend is None:
+            backend = next(name for name in BACKENDS if available[name])
+        if backend not in available:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if not available[backend]:
+            raise ValueError(f"JSON backend not installed: {backend}")
+        self.backend = backend
+
+    def loads(self, data: JSONInput) -> Any:
+        """
+        Decodes a JSON document
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Decoded Python object
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+        """
+        if self.backend == "orjson":
+            return orjson.loads(data)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+
+        if self.backend == "msgspec":
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError as e:
+                document = data if isinstance(data, str) else bytes(data).decode('utf-8', errors='replace')
+                raise json.JSONDecodeError(str(e), document, 0) from e
+
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        indent: bool = False,
+        sort_keys: bool = False,
+        default: DefaultHook = None
+    ) -> bytes:
+        """
+        Encodes an object to JSON
+
+        Args:
+            obj: Object to encode
+            indent: Pretty-print with 2-space indentation
+            sort_keys: Sort object keys
+            default: Hook converting unsupported objects to serializable ones
+
+        Returns:
+            UTF-8 encoded JSON
+
+        Raises:
+            TypeError: If an object cannot be serialized
+        """
+        if self.backend == "orjson":
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=default, option=option)
+
+        if self.backend == "msgspec":
+            data = msgspec.json.encode(obj, enc_hook=default, order="sorted" if sort_keys else None)
+            return msgspec.json.format(data, indent=2) if indent else data
+
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=None if indent else (',', ':'),
+            sort_keys=sort_keys,
+            default=default
+        ).encode('utf-8')
+
+    def dumps_str(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Encodes an object to a JSON string
+
+        Args:
+            obj: Object to encode
+            **kwargs: Same options as dumps()
+
+        Returns:
+            JSON string
+        """
+        return self.dumps(obj, **kwargs).decode('utf-8')
+
+
+# Shared codec using the fastest installed backend
+codec = JSONCodec()
+
+loads = codec.loads
+dumps = codec.dumps
+dumps_str = codec.dumps_str
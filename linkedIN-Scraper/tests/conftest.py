@@ -12,9 +12,45 @@ Fecha: 2025-12-08
 """
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
+from src.api.jsearch_client import JSearchClient
 from src.models.job import Job
 from src.models.salary import SalaryInfo
 from src.models.search_params import SearchParameters
+from src.utils.config import Config
+
+
+@pytest.fixture(autouse=True)
+def isolated_usage_ledger(tmp_path, monkeypatch):
+    """Registro de consumo de la API en un directorio temporal para cada test"""
+    monkeypatch.setenv("USAGE_DB_PATH", str(tmp_path / "usage.sqlite3"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_salary_cache(tmp_path, monkeypatch):
+    """Caché de salarios en un directorio temporal para cada test"""
+    monkeypatch.setenv("SALARY_CACHE_PATH", str(tmp_path / "salary.sqlite3"))
+
+
+@pytest.fixture
+def make_jsearch_client():
+    """
+    Fábrica de JSearchClient con una Config real y la API simulada
+
+    Por defecto sin registro de consumo ni planificador y sin espera entre
+    peticiones; `client.client.get` es un Mock que responde {"data": data}.
+    Cualquier campo de Config se puede cambiar por argumento.
+    """
+    def factory(data=None, api_key="test_key", caller=None, **overrides):
+        options = dict(usage_tracking=False, scheduler_enabled=False)
+        options.update(overrides)
+        config = Config(api_key=api_key, **options)
+        client = JSearchClient(api_key=api_key, config=config, caller=caller)
+        client.rate_limiter.delay = 0.0
+        client.client.get = Mock(return_value={"data": [] if data is None else data})
+        return client
+
+    return factory
 
 
 @pytest.fixture
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_async_client.py
+Descripción: Tests para AsyncHTTPClient y AsyncConnectionPool contra un servidor local
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import gzip
+import json
+import pytest
+from src.api.async_client import AsyncHTTPClient, AsyncConnectionPool
+from src.api.client import HTTPError
+
+
+class LocalServer:
+    """Servidor HTTP/1.1 mínimo que responde según el path"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.connections = 0
+        self.requests = []
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = b""
+                if "content-length" in headers:
+                    body = await reader.readexactly(int(headers["content-length"]))
+
+                method, path, _ = request_line.decode().split(" ", 2)
+                self.requests.append((method, path, headers, body))
+
+                response = self.routes[path.split("?")[0]]
+                writer.write(response)
+                await writer.drain()
+                if b"Connection: close" in response:
+                    break
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def http_response(body, status="200 OK", headers=None):
+    """Construye una respuesta HTTP con Content-Length"""
+    lines = [f"HTTP/1.1 {status}", f"Content-Length: {len(body)}"]
+    lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+def chunked_response(chunks):
+    """Construye una respuesta con Transfer-Encoding: chunked"""
+    head = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+    body = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in chunks)
+    return head + body + b"0\r\n\r\n"
+
+
+def make_client(server, **kwargs):
+    return AsyncHTTPClient(host="127.0.0.1", port=server.port, use_tls=False, **kwargs)
+
+
+class TestAsyncHTTPClient:
+    """Tests para AsyncHTTPClient"""
+
+    def test_client_initialization(self):
+        """Test inicialización del cliente"""
+        client = AsyncHTTPClient(host="api.example.com", headers={"x-api-key": "k"}, timeout=60)
+
+        assert client.host == "api.example.com"
+        assert client.headers == {"x-api-key": "k"}
+        assert client.timeout == 60
+        assert client.port == 443
+        assert client.ssl_context is not None
+
+    def test_get_success_and_keep_alive(self):
+        """Test GET exitoso reutilizando la conexión"""
+        async def scenario():
+            routes = {"/search": http_response(b'{"data": [1, 2]}')}
+            async with LocalServer(routes) as server:
+                client = make_client(server, headers={"x-api-key": "k"})
+                first = await client.get("/search", {"query": "python dev"})
+                second = await client.get("/search")
+                await client.close()
+                return first, second, server, client.pool.stats()
+
+        first, second, server, stats = asyncio.run(scenario())
+
+        assert first == {"data": [1, 2]}
+        assert second == first
+        assert server.connections == 1
+        assert stats['reused'] == 1
+        method, path, headers, _ = server.requests[0]
+        assert method == "GET"
+        assert path == "/search?query=python+dev"
+        assert headers["x-api-key"] == "k"
+        assert headers["host"] == "127.0.0.1"
+        assert "gzip" in headers["accept-encoding"]
+
+    def test_get_gzip_chunked(self):
+        """Test respuesta chunked y comprimida con gzip"""
+        payload = {"data": [{"job_id": str(i)} for i in range(200)]}
+        compressed = gzip.compress(json.dumps(payload).encode())
+        head = b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n\r\n"
+        pieces = [compressed[i:i + 100] for i in range(0, len(compressed), 100)]
+        body = b"".join(f"{len(c):x}\r\n".encode() + c + b"\r\n" for c in pieces) + b"0\r\n\r\n"
+
+        async def scenario():
+            async with LocalServer({"/search": head + body}) as server:
+                client = make_client(server)
+                result = await client.get("/search")
+                await client.close()
+                return result
+
+        assert asyncio.run(scenario()) == payload
+
+    def test_chunked_response(self):
+        """Test respuesta chunked sin comprimir"""
+        async def scenario():
+            async with LocalServer({"/c": chunked_response([b'{"a"', b': 1}'])}) as server:
+                client = make_client(server)
+                result = await client.get("/c")
+                await client.close()
+                return result
+
+        assert asyncio.run(scenario()) == {"a": 1}
+
+    def test_get_http_error(self):
+        """Test GET con status de error"""
+        async def scenario():
+            routes = {"/missing": http_response(b"Not Found", status="404 Not Found")}
+            async with LocalServer(routes) as server:
+                client = make_client(server)
+                try:
+                    await client.get("/missing")
+                finally:
+                    await client.close()
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(scenario())
+
+        assert exc_info.value.status_code == 404
+        assert "Not Found" in exc_info.value.message
+
+    def test_connection_close_not_reused(self):
+        """Test 'Connection: close' descarta la conexión"""
+        async def scenario():
+            routes = {"/x": http_response(b'{}', headers={"Connection": "close"})}
+            async with LocalServer(routes) as server:
+                client = make_client(server)
+                await client.get("/x")
+                await client.get("/x")
+                await client.close()
+                return server.connections
+
+        assert asyncio.run(scenario()) == 2
+
+    def test_post_sends_json_body(self):
+        """Test POST serializa el body como JSON"""
+        async def scenario():
+            routes = {"/create": http_response(b'{"id": "1"}', status="201 Created")}
+            async with LocalServer(routes) as server:
+                client = make_client(server)
+                result = await client.post("/create", {"name": "test"}, {"v": "1"})
+                await client.close()
+                return result, server.requests[0]
+
+        result, (method, path, headers, body) = asyncio.run(scenario())
+
+        assert result == {"id": "1"}
+        assert method == "POST"
+        assert path == "/create?v=1"
+        assert headers["content-type"] == "application/json"
+        assert json.loads(body) == {"name": "test"}
+
+    def test_invalid_status_line(self):
+        """Test línea de estado inválida"""
+        async def scenario():
+            async with LocalServer({"/bad": b"garbage\r\n\r\n"}) as server:
+                client = make_client(server)
+                try:
+                    await client.get("/bad")
+                finally:
+                    await client.close()
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(scenario())
+
+        assert exc_info.value.status_code == 502
+
+
+class TestAsyncConnectionPool:
+    """Tests para AsyncConnectionPool"""
+
+    def test_stats_empty_pool(self):
+        """Test estadísticas de un pool sin uso"""
+        stats = AsyncConnectionPool().stats()
+
+        assert stats['created'] == 0
+        assert stats['reuse_rate'] == 0.0
+
+    def test_max_idle_limits_idle(self):
+        """Test el pool no conserva más conexiones que max_idle"""
+        async def scenario():
+            async with LocalServer({"/x": http_response(b'{}')}) as server:
+                pool = AsyncConnectionPool(max_idle=1)
+                first, _ = await pool.acquire("127.0.0.1", server.port, 5, None)
+                second, _ = await pool.acquire("127.0.0.1", server.port, 5, None)
+                pool.release("127.0.0.1", server.port, first)
+                pool.release("127.0.0.1", server.port, second)
+                stats = pool.stats()
+                await pool.close_all()
+                return stats
+
+        stats = asyncio.run(scenario())
+
+        assert stats['idle'] == 1
+        assert stats['overflow'] == 1
+        assert stats['in_use'] == 0
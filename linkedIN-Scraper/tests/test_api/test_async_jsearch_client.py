@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_async_jsearch_client.py
+Descripción: Tests para AsyncJSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.api.async_jsearch_client import AsyncJSearchClient
+from src.api.client import HTTPError
+from src.models.search_params import SearchParameters
+
+
+def make_client(response):
+    """Crea un AsyncJSearchClient con el cliente HTTP simulado"""
+    client = AsyncJSearchClient(api_key="test_key")
+    client.client = Mock()
+    client.client.get = AsyncMock(return_value=response)
+    client.client.close = AsyncMock()
+    client.rate_limiter.delay = 0.0
+    return client
+
+
+class TestAsyncJSearchClient:
+    """Tests para AsyncJSearchClient"""
+
+    def test_initialization_with_config(self):
+        """Test inicialización con config"""
+        mock_config = Mock()
+        mock_config.request_timeout = 60
+        mock_config.rate_limit_delay = 2.0
+        mock_config.max_retries = 5
+        mock_config.retry_delay = 3
+        mock_config.pool_max_idle = 4
+        mock_config.pool_idle_timeout = 10.0
+        mock_config.http_compression = False
+
+        client = AsyncJSearchClient(api_key="test_key", config=mock_config)
+
+        assert client.client.timeout == 60
+        assert client.client.pool.max_idle == 4
+        assert client.client.compression is False
+        assert client.rate_limiter.delay == 2.0
+        assert client.rate_limiter.max_retries == 5
+
+    def test_search_jobs_success(self):
+        """Test búsqueda exitosa"""
+        client = make_client({"data": [{"job_id": "1"}]})
+        params = SearchParameters(query="python", country="us")
+
+        jobs = asyncio.run(client.search_jobs(params))
+
+        assert jobs == [{"job_id": "1"}]
+        endpoint, api_params = client.client.get.call_args[0]
+        assert endpoint == "/jsearch/search"
+        assert api_params["query"] == "python"
+
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_search_jobs_rate_limit(self, mock_sleep):
+        """Test error 429 se traduce a mensaje de rate limit"""
+        client = make_client({})
+        client.client.get.side_effect = HTTPError(429, "Too Many Requests")
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(client.search_jobs(SearchParameters(query="python")))
+
+        assert exc_info.value.status_code == 429
+        assert "Rate limit" in str(exc_info.value)
+
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_search_jobs_error_in_response(self, mock_sleep):
+        """Test error en el cuerpo de la respuesta"""
+        client = make_client({"error": "Invalid API key"})
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(client.search_jobs(SearchParameters(query="python")))
+
+        assert exc_info.value.status_code == 400
+
+    def test_get_job_details(self):
+        """Test detalles con parámetros opcionales"""
+        client = make_client({"data": [{"job_id": "123"}]})
+
+        job = asyncio.run(client.get_job_details("123", "es", language="en", fields="job_id"))
+
+        assert job == {"job_id": "123"}
+        params = client.client.get.call_args[0][1]
+        assert params == {"job_id": "123", "country": "es", "language": "en", "fields": "job_id"}
+
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_get_job_details_not_found(self, mock_sleep):
+        """Test trabajo no encontrado"""
+        client = make_client({"data": []})
+
+        with pytest.raises(HTTPError) as exc_info:
+            asyncio.run(client.get_job_details("missing"))
+
+        assert exc_info.value.status_code == 404
+
+    def test_get_estimated_salary(self):
+        """Test estimación salarial"""
+        client = make_client({"data": [{"median_salary": 50000}]})
+
+        result = asyncio.run(client.get_estimated_salary("Developer", "Madrid", fields="median_salary"))
+
+        assert result == [{"median_salary": 50000}]
+        params = client.client.get.call_args[0][1]
+        assert params["fields"] == "median_salary"
+        assert params["location_type"] == "ANY"
+
+    def test_get_company_salary(self):
+        """Test salarios de empresa con y sin ubicación"""
+        client = make_client({"data": []})
+
+        asyncio.run(client.get_company_salary("Google", "Engineer"))
+        assert "location" not in client.client.get.call_args[0][1]
+
+        asyncio.run(client.get_company_salary("Google", "Engineer", location="NYC"))
+        assert client.client.get.call_args[0][1]["location"] == "NYC"
+
+    def test_context_manager_closes(self):
+        """Test el context manager cierra las conexiones"""
+        client = make_client({})
+
+        async def scenario():
+            async with client:
+                pass
+
+        asyncio.run(scenario())
+        client.client.close.assert_awaited_once()
+
+    def test_get_stats(self):
+        """Test estadísticas del pool"""
+        client = AsyncJSearchClient(api_key="test_key")
+
+        assert client.get_stats()['connection_pool']['created'] == 0
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_circuit_breaker.py
+Descripción: Tests para CircuitBreaker, CircuitBreakerRegistry y su uso en JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import pytest
+from unittest.mock import Mock, patch
+from src.api.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry,
+    CircuitOpenError, is_upstream_failure
+)
+from src.api.client import HTTPError
+from src.api.jsearch_client import JSearchClient
+from src.utils.config import Config
+
+
+def _fail(status=500):
+    raise HTTPError(status, "error")
+
+
+class TestIsUpstreamFailure:
+    """Tests para is_upstream_failure"""
+
+    def test_classification(self):
+        """Test qué errores cuentan como fallo de la API"""
+        assert is_upstream_failure(HTTPError(500))
+        assert is_upstream_failure(HTTPError(503))
+        assert is_upstream_failure(HTTPError(429))
+        assert is_upstream_failure(ConnectionResetError())
+        assert is_upstream_failure(TimeoutError())
+        assert not is_upstream_failure(HTTPError(400))
+        assert not is_upstream_failure(HTTPError(404))
+        assert not is_upstream_failure(ValueError())
+
+
+class TestCircuitBreaker:
+    """Tests para CircuitBreaker"""
+
+    def _breaker(self, **kwargs):
+        options = dict(window_size=4, min_calls=4, open_duration=30.0)
+        options.update(kwargs)
+        return CircuitBreaker("/test", **options)
+
+    def test_success_keeps_closed(self):
+        """Test llamadas correctas mantienen el circuito cerrado"""
+        breaker = self._breaker()
+
+        for _ in range(10):
+            assert breaker.call(lambda: "ok") == "ok"
+
+        assert breaker.state == CLOSED
+
+    def test_opens_on_failure_rate(self):
+        """Test el circuito se abre al alcanzar la tasa de fallos"""
+        breaker = self._breaker(failure_rate_threshold=0.5)
+
+        breaker.call(lambda: "ok")
+        breaker.call(lambda: "ok")
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+
+        assert breaker.state == OPEN
+
+    def test_waits_for_min_calls(self):
+        """Test no se evalúa con menos llamadas que min_calls"""
+        breaker = self._breaker()
+
+        for _ in range(3):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+
+        assert breaker.state == CLOSED
+
+    def test_client_errors_do_not_open(self):
+        """Test los 4xx no abren el circuito"""
+        breaker = self._breaker()
+
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(lambda: _fail(404))
+
+        assert breaker.state == CLOSED
+
+    def test_open_fails_fast(self):
+        """Test con el circuito abierto no se ejecuta la llamada"""
+        breaker = self._breaker()
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+        func = Mock()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(func)
+
+        func.assert_not_called()
+        assert exc_info.value.status_code == 503
+        assert 0 < exc_info.value.retry_after <= 30
+        assert breaker.snapshot()['rejected'] == 1
+
+    def test_opens_on_slow_calls(self):
+        """Test el circuito se abre si las llamadas son lentas"""
+        breaker = self._breaker(slow_call_duration=5.0, slow_call_rate_threshold=0.5)
+
+        clock = iter(range(0, 1000, 10))
+        with patch('src.api.circuit_breaker.time.monotonic', side_effect=lambda: next(clock)):
+            for _ in range(4):
+                breaker.call(lambda: "slow")
+
+            snapshot = breaker.snapshot()
+
+        assert snapshot['slow_call_rate'] == 1.0
+        assert snapshot['state'] == OPEN
+
+    @patch('src.api.circuit_breaker.time.monotonic')
+    def test_half_open_then_closed(self, mock_time):
+        """Test tras el tiempo abierto una prueba correcta cierra el circuito"""
+        mock_time.return_value = 100.0
+        breaker = self._breaker()
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+
+        mock_time.return_value = 131.0
+        assert breaker.state == HALF_OPEN
+
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()['calls'] == 0
+
+    @patch('src.api.circuit_breaker.time.monotonic')
+    def test_half_open_failure_reopens(self, mock_time):
+        """Test una prueba fallida vuelve a abrir el circuito"""
+        mock_time.return_value = 100.0
+        breaker = self._breaker()
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+
+        mock_time.return_value = 131.0
+        with pytest.raises(HTTPError):
+            breaker.call(_fail)
+
+        assert breaker.state == OPEN
+        assert breaker.snapshot()['times_opened'] == 2
+
+    @patch('src.api.circuit_breaker.time.monotonic')
+    def test_half_open_limits_trial_calls(self, mock_time):
+        """Test en semiabierto solo pasan las llamadas de prueba permitidas"""
+        mock_time.return_value = 100.0
+        breaker = self._breaker()
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+        mock_time.return_value = 131.0
+
+        def trial():
+            # Mientras la prueba está en curso, otra llamada es rechazada
+            with pytest.raises(CircuitOpenError):
+                breaker.call(lambda: "other")
+            return "ok"
+
+        assert breaker.call(trial) == "ok"
+
+    @pytest.mark.parametrize("outcome", ["ok", "fail"])
+    @patch('src.api.circuit_breaker.time.monotonic')
+    def test_straggler_is_not_a_probe(self, mock_time, outcome):
+        """Test una llamada admitida en cerrado que termina en semiabierto no cuenta como prueba"""
+        mock_time.return_value = 100.0
+        breaker = self._breaker()
+
+        def straggler():
+            # Mientras tanto otras llamadas abren el circuito y vence el tiempo abierto
+            for _ in range(4):
+                with pytest.raises(HTTPError):
+                    breaker.call(_fail)
+            mock_time.return_value = 131.0
+            assert breaker.state == HALF_OPEN
+            if outcome == "fail":
+                _fail()
+            return "ok"
+
+        if outcome == "fail":
+            with pytest.raises(HTTPError):
+                breaker.call(straggler)
+        else:
+            breaker.call(straggler)
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.snapshot()['times_opened'] == 1
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CLOSED
+
+    def test_reset(self):
+        """Test reset vuelve a cerrado"""
+        breaker = self._breaker()
+        for _ in range(4):
+            with pytest.raises(HTTPError):
+                breaker.call(_fail)
+
+        breaker.reset()
+
+        assert breaker.state == CLOSED
+
+
+class TestCircuitBreakerRegistry:
+    """Tests para CircuitBreakerRegistry"""
+
+    def test_breaker_per_endpoint(self):
+        """Test cada endpoint tiene su propio circuito"""
+        registry = CircuitBreakerRegistry(window_size=2, min_calls=2)
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                registry.call("/a", _fail)
+
+        assert registry.call("/b", lambda: "ok") == "ok"
+        snapshot = registry.snapshot()
+        assert snapshot["/a"]['state'] == OPEN
+        assert snapshot["/b"]['state'] == CLOSED
+        assert registry.get("/a") is registry.get("/a")
+        assert not registry.is_healthy()
+
+    def test_empty_registry_is_healthy(self):
+        """Test sin circuitos el registro está sano"""
+        assert CircuitBreakerRegistry().is_healthy()
+
+
+class TestJSearchClientCircuitBreaker:
+    """Tests para el circuit breaker en JSearchClient"""
+
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_open_circuit_fails_fast_without_retries(self, mock_http_client, sample_search_params):
+        """Test con la API caída se deja de llamar y no se reintenta"""
+        mock_http_client.return_value.get.side_effect = HTTPError(503, "down")
+        client = JSearchClient(api_key="test_key")
+        client.rate_limiter.delay = 0
+        client.rate_limiter.retry_delay = 0
+
+        with patch('src.api.rate_limiter.time.sleep'):
+            for _ in range(4):
+                with pytest.raises(HTTPError):
+                    client.search_jobs(sample_search_params)
+
+            calls_before = mock_http_client.return_value.get.call_count
+            with pytest.raises(CircuitOpenError):
+                client.search_jobs(sample_search_params)
+
+        assert mock_http_client.return_value.get.call_count == calls_before
+        assert client.get_circuit_state()['/jsearch/search']['state'] == OPEN
+
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_circuit_breaker_can_be_disabled(self, mock_http_client):
+        """Test sin circuit breaker no hay estado que mostrar"""
+        config = Config(api_key="test_key", circuit_breaker_enabled=False)
+
+        client = JSearchClient(api_key="test_key", config=config)
+
+        assert client.circuit_breakers is None
+        assert client.get_circuit_state() == {}
@@ -10,9 +10,12 @@ Versión: 3.0.0
 Fecha: 2025-12-08
 """
 import pytest
+import gzip
+import io
 import json
+import zlib
 from unittest.mock import Mock, patch, MagicMock
-from src.api.client import HTTPClient, HTTPError
+from src.api.client import HTTPClient, HTTPError, READ_CHUNK_SIZE, read_body
 
 
 class TestHTTPClient:
@@ -269,3 +272,201 @@ class TestHTTPError:
         assert error.status_code == 500
         assert error.message == ""
         assert "500" in str(error)
+
+
+class FakeResponse:
+    """Respuesta HTTP mínima que entrega el body por bloques"""
+
+    def __init__(self, body, status=200, headers=None):
+        self.status = status
+        self.will_close = True
+        self._stream = io.BytesIO(body)
+        self._headers = headers or {}
+        self.read_sizes = []
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def getheaders(self):
+        return list(self._headers.items())
+
+    def read(self, amt=None):
+        self.read_sizes.append(amt)
+        return self._stream.read(amt)
+
+
+class TestCompression:
+    """Tests para negociación y descompresión de respuestas"""
+
+    payload = {"data": [{"job_id": str(i), "job_title": "Developer"} for i in range(500)]}
+
+    def _get(self, mock_conn_class, body, headers, **client_kwargs):
+        mock_conn = Mock()
+        response = FakeResponse(body, headers=headers)
+        mock_conn.getresponse.return_value = response
+        mock_conn_class.return_value = mock_conn
+
+        client = HTTPClient(host="api.example.com", **client_kwargs)
+        return client.get("/search"), mock_conn, response
+
+    @patch('http.client.HTTPSConnection')
+    def test_sends_accept_encoding(self, mock_conn_class):
+        """Test se anuncia Accept-Encoding en las peticiones"""
+        _, mock_conn, _ = self._get(mock_conn_class, b'{}', {})
+
+        headers = mock_conn.request.call_args[1]["headers"]
+        assert "gzip" in headers["Accept-Encoding"]
+        assert "deflate" in headers["Accept-Encoding"]
+
+    @patch('http.client.HTTPSConnection')
+    def test_compression_disabled(self, mock_conn_class):
+        """Test sin compresión no se envía Accept-Encoding"""
+        _, mock_conn, _ = self._get(mock_conn_class, b'{}', {}, compression=False)
+
+        headers = mock_conn.request.call_args[1]["headers"]
+        assert "Accept-Encoding" not in headers
+
+    @patch('http.client.HTTPSConnection')
+    def test_gzip_response_decompressed_incrementally(self, mock_conn_class):
+        """Test respuesta gzip se descomprime por bloques"""
+        body = gzip.compress(json.dumps(self.payload).encode('utf-8'))
+        result, _, response = self._get(mock_conn_class, body, {"Content-Encoding": "gzip"})
+
+        assert result == self.payload
+        assert all(size == READ_CHUNK_SIZE for size in response.read_sizes)
+
+    @patch('http.client.HTTPSConnection')
+    def test_deflate_zlib_response(self, mock_conn_class):
+        """Test respuesta deflate con cabecera zlib"""
+        body = zlib.compress(json.dumps(self.payload).encode('utf-8'))
+        result, _, _ = self._get(mock_conn_class, body, {"Content-Encoding": "deflate"})
+
+        assert result == self.payload
+
+    @patch('http.client.HTTPSConnection')
+    def test_deflate_raw_response(self, mock_conn_class):
+        """Test respuesta deflate cruda (sin cabecera zlib)"""
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = compressor.compress(json.dumps(self.payload).encode('utf-8')) + compressor.flush()
+        result, _, _ = self._get(mock_conn_class, body, {"Content-Encoding": "deflate"})
+
+        assert result == self.payload
+
+    @patch('http.client.HTTPSConnection')
+    def test_identity_response_read_at_once(self, mock_conn_class):
+        """Test respuesta sin comprimir se lee de una vez"""
+        result, _, response = self._get(mock_conn_class, b'{"ok": true}', {})
+
+        assert result == {"ok": True}
+        assert response.read_sizes == [None]
+
+    @patch('http.client.HTTPSConnection')
+    def test_gzip_error_response(self, mock_conn_class):
+        """Test el mensaje de error también se descomprime"""
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = FakeResponse(
+            gzip.compress(b'Service Unavailable'),
+            status=503,
+            headers={"Content-Encoding": "gzip"}
+        )
+        mock_conn_class.return_value = mock_conn
+
+        client = HTTPClient(host="api.example.com")
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.get("/search")
+
+        assert exc_info.value.status_code == 503
+        assert "Service Unavailable" in exc_info.value.message
+
+    def test_read_body_unknown_encoding(self):
+        """Test codificación desconocida se devuelve sin tocar"""
+        response = FakeResponse(b'raw-bytes', headers={"Content-Encoding": "compress"})
+
+        assert read_body(response) == b'raw-bytes'
+
+
+class TestStreamGet:
+    """Tests para HTTPClient.stream_get"""
+
+    def _client(self, mock_conn_class, body, status=200, headers=None):
+        mock_conn = Mock()
+        response = FakeResponse(body, status=status, headers=headers)
+        response.will_close = False
+        mock_conn.getresponse.return_value = response
+        mock_conn_class.return_value = mock_conn
+        return HTTPClient(host="api.example.com"), mock_conn
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_yields_items_and_releases(self, mock_conn_class):
+        """Test stream_get emite los elementos y devuelve la conexión al pool"""
+        body = gzip.compress(b'{"status": "OK", "data": [{"id": 1}, {"id": 2}]}')
+        client, mock_conn = self._client(mock_conn_class, body, headers={"Content-Encoding": "gzip"})
+
+        stream = client.stream_get("/search", {"query": "python"})
+        items = list(stream)
+
+        assert items == [{"id": 1}, {"id": 2}]
+        assert stream.extras == {"status": "OK"}
+        assert client.pool.stats()['idle'] == 1
+        mock_conn.close.assert_not_called()
+        assert "/search?query=python" in mock_conn.request.call_args[0][1]
+
+    @patch('http.client.HTTPSConnection')
+    def test_on_response_receives_status_and_headers(self, mock_conn_class):
+        """Test on_response recibe el status y los headers en minúsculas"""
+        client, _ = self._client(
+            mock_conn_class, b'{"data": []}', status=200,
+            headers={"X-RateLimit-Remaining": "7"}
+        )
+        seen = []
+        client.on_response = lambda status, headers: seen.append((status, headers))
+
+        list(client.stream_get("/search", {"query": "python"}))
+
+        assert seen == [(200, {"x-ratelimit-remaining": "7"})]
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_abandoned_discards_connection(self, mock_conn_class):
+        """Test abandonar la iteración descarta la conexión"""
+        client, mock_conn = self._client(mock_conn_class, b'{"data": [{"id": 1}, {"id": 2}]}')
+
+        stream = client.stream_get("/search")
+        iterator = iter(stream)
+        next(iterator)
+        iterator.close()
+
+        mock_conn.close.assert_called_once()
+        assert client.pool.stats()['idle'] == 0
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_close_without_iterating(self, mock_conn_class):
+        """Test close sin iterar descarta la conexión"""
+        client, mock_conn = self._client(mock_conn_class, b'{"data": []}')
+
+        stream = client.stream_get("/search")
+        stream.close()
+
+        assert list(stream) == []
+        mock_conn.close.assert_called_once()
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_http_error(self, mock_conn_class):
+        """Test stream_get con status de error"""
+        client, _ = self._client(mock_conn_class, b'Too Many Requests', status=429)
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.stream_get("/search")
+
+        assert exc_info.value.status_code == 429
+        assert client.pool.stats()['in_use'] == 0
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_truncated_body(self, mock_conn_class):
+        """Test body truncado descarta la conexión"""
+        client, mock_conn = self._client(mock_conn_class, b'{"data": [{"id": 1}')
+
+        with pytest.raises(ValueError):
+            list(client.stream_get("/search"))
+
+        mock_conn.close.assert_called_once()
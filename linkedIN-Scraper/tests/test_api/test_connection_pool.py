@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_connection_pool.py
+Descripción: Tests para ConnectionPool
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import http.client
+import socket
+import pytest
+from unittest.mock import Mock, patch
+from src.api.connection_pool import ConnectionPool
+from src.api.client import HTTPClient
+
+
+@pytest.fixture
+def socket_pair():
+    """Par de sockets conectados para simular conexiones vivas"""
+    left, right = socket.socketpair()
+    yield left, right
+    left.close()
+    right.close()
+
+
+def make_connection(sock=None):
+    """Crea un mock de conexión HTTPS con el socket indicado"""
+    conn = Mock()
+    conn.sock = sock
+    return conn
+
+
+class TestConnectionPool:
+    """Tests para ConnectionPool"""
+
+    @patch('http.client.HTTPSConnection')
+    def test_acquire_creates_new_connection(self, mock_conn_class):
+        """Test acquire crea conexión cuando no hay inactivas"""
+        pool = ConnectionPool()
+        conn, reused = pool.acquire("api.example.com", 30)
+
+        assert reused is False
+        assert conn is mock_conn_class.return_value
+        mock_conn_class.assert_called_once_with("api.example.com", timeout=30)
+        assert pool.stats()['created'] == 1
+        assert pool.stats()['in_use'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_release_and_reuse(self, mock_conn_class, socket_pair):
+        """Test una conexión liberada y sana se reutiliza"""
+        mock_conn_class.return_value = make_connection(socket_pair[0])
+
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn)
+
+        conn2, reused = pool.acquire("api.example.com", 30)
+
+        assert conn2 is conn
+        assert reused is True
+        assert mock_conn_class.call_count == 1
+        stats = pool.stats()
+        assert stats['reused'] == 1
+        assert stats['reuse_rate'] == 0.5
+
+    @patch('http.client.HTTPSConnection')
+    def test_stale_connection_is_replaced(self, mock_conn_class, socket_pair):
+        """Test conexión cerrada por el servidor se descarta en el checkout"""
+        left, right = socket_pair
+        stale = make_connection(left)
+        fresh = make_connection()
+        mock_conn_class.side_effect = [stale, fresh]
+
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn)
+
+        right.close()  # El servidor cierra: el socket queda legible (EOF)
+
+        conn2, reused = pool.acquire("api.example.com", 30)
+
+        assert conn2 is fresh
+        assert reused is False
+        stale.close.assert_called_once()
+        assert pool.stats()['stale'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_connection_without_socket_is_stale(self, mock_conn_class):
+        """Test conexión sin socket no se reutiliza"""
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("api.example.com", 30)
+        conn.sock = None
+        pool.release("api.example.com", conn)
+
+        _, reused = pool.acquire("api.example.com", 30)
+
+        assert reused is False
+        assert pool.stats()['stale'] == 1
+
+    @patch('src.api.connection_pool.time.monotonic')
+    @patch('http.client.HTTPSConnection')
+    def test_idle_timeout_expires_connection(self, mock_conn_class, mock_monotonic, socket_pair):
+        """Test conexión inactiva más allá del timeout se descarta"""
+        mock_conn_class.return_value = make_connection(socket_pair[0])
+        mock_monotonic.side_effect = [100.0, 200.0]
+
+        pool = ConnectionPool(idle_timeout=60.0)
+        conn, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn)
+
+        _, reused = pool.acquire("api.example.com", 30)
+
+        assert reused is False
+        assert pool.stats()['expired'] == 1
+        conn.close.assert_called_once()
+
+    @patch('http.client.HTTPSConnection')
+    def test_release_not_reusable_closes(self, mock_conn_class):
+        """Test release con reusable=False cierra la conexión"""
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn, reusable=False)
+
+        conn.close.assert_called_once()
+        stats = pool.stats()
+        assert stats['idle'] == 0
+        assert stats['in_use'] == 0
+        assert stats['discarded'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_max_idle_limits_idle_connections(self, mock_conn_class):
+        """Test el pool no conserva más conexiones que max_idle"""
+        mock_conn_class.side_effect = lambda *a, **kw: Mock()
+
+        pool = ConnectionPool(max_idle=1)
+        conn1, _ = pool.acquire("api.example.com", 30)
+        conn2, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn1)
+        pool.release("api.example.com", conn2)
+
+        conn1.close.assert_not_called()
+        conn2.close.assert_called_once()
+        stats = pool.stats()
+        assert stats['idle'] == 1
+        assert stats['overflow'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_pools_are_per_host(self, mock_conn_class, socket_pair):
+        """Test las conexiones se agrupan por host"""
+        mock_conn_class.return_value = make_connection(socket_pair[0])
+
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("a.example.com", 30)
+        pool.release("a.example.com", conn)
+
+        _, reused = pool.acquire("b.example.com", 30)
+        assert reused is False
+
+    @patch('http.client.HTTPSConnection')
+    def test_close_all(self, mock_conn_class):
+        """Test close_all cierra las conexiones inactivas"""
+        pool = ConnectionPool()
+        conn, _ = pool.acquire("api.example.com", 30)
+        pool.release("api.example.com", conn)
+
+        pool.close_all()
+
+        conn.close.assert_called_once()
+        assert pool.stats()['idle'] == 0
+
+    def test_stats_empty_pool(self):
+        """Test estadísticas de un pool sin uso"""
+        stats = ConnectionPool().stats()
+
+        assert stats['created'] == 0
+        assert stats['reuse_rate'] == 0.0
+
+
+class TestHTTPClientKeepAlive:
+    """Tests de reutilización de conexiones en HTTPClient"""
+
+    def _response(self, body=b'{"ok": true}', will_close=False):
+        response = Mock()
+        response.status = 200
+        response.will_close = will_close
+        response.read.return_value = body
+        return response
+
+    @patch('http.client.HTTPSConnection')
+    def test_requests_reuse_connection(self, mock_conn_class, socket_pair):
+        """Test peticiones consecutivas reutilizan la misma conexión"""
+        conn = make_connection(socket_pair[0])
+        conn.getresponse.return_value = self._response()
+        mock_conn_class.return_value = conn
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/a")
+        client.get("/b")
+
+        assert mock_conn_class.call_count == 1
+        assert conn.request.call_count == 2
+        conn.close.assert_not_called()
+        assert client.pool.stats()['reused'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_connection_close_header_not_reused(self, mock_conn_class):
+        """Test respuestas con 'Connection: close' no devuelven la conexión al pool"""
+        conn = make_connection()
+        conn.getresponse.return_value = self._response(will_close=True)
+        mock_conn_class.return_value = conn
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/a")
+
+        conn.close.assert_called_once()
+        assert client.pool.stats()['idle'] == 0
+
+    @patch('http.client.HTTPSConnection')
+    def test_reconnects_on_stale_reused_connection(self, mock_conn_class, socket_pair):
+        """Test reconexión automática si el servidor cerró la conexión reutilizada"""
+        stale = make_connection(socket_pair[0])
+        stale.getresponse.side_effect = [
+            self._response(),
+            http.client.RemoteDisconnected("closed")
+        ]
+        fresh = make_connection()
+        fresh.getresponse.return_value = self._response(b'{"fresh": true}')
+        mock_conn_class.side_effect = [stale, fresh]
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/a")
+        result = client.get("/b")
+
+        assert result == {"fresh": True}
+        stale.close.assert_called_once()
+
+    @patch('http.client.HTTPSConnection')
+    def test_fresh_connection_error_not_retried(self, mock_conn_class):
+        """Test error en conexión nueva se propaga sin reintentar"""
+        conn = make_connection()
+        conn.getresponse.side_effect = ConnectionResetError("reset")
+        mock_conn_class.return_value = conn
+
+        client = HTTPClient(host="api.example.com")
+
+        with pytest.raises(ConnectionResetError):
+            client.get("/a")
+
+        assert mock_conn_class.call_count == 1
+        assert client.pool.stats()['in_use'] == 0
+
+    @patch('http.client.HTTPSConnection')
+    def test_close(self, mock_conn_class, socket_pair):
+        """Test close cierra las conexiones del pool"""
+        conn = make_connection(socket_pair[0])
+        conn.getresponse.return_value = self._response()
+        mock_conn_class.return_value = conn
+
+        client = HTTPClient(host="api.example.com")
+        client.get("/a")
+        client.close()
+
+        conn.close.assert_called_once()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_hedging.py
+Descripción: Tests para RequestHedger y el hedging de JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from src.api.hedging import RequestHedger
+from src.api.jsearch_client import JSearchClient
+from src.api.metrics import LatencyMetrics, RequestTiming
+from src.api.usage_budget import BATCH, scoped_priority, usage_scope
+from src.utils.config import Config
+
+
+def _metrics_with_samples(endpoint="/jsearch/search", seconds=0.004, count=20):
+    """Métricas con `count` muestras de latencia total"""
+    metrics = LatencyMetrics()
+    for _ in range(count):
+        timing = RequestTiming()
+        timing.phases['total'] = seconds
+        metrics.record(endpoint, timing)
+    return metrics
+
+
+class TestRequestHedger:
+    """Tests para RequestHedger"""
+
+    def test_no_hedge_without_samples(self):
+        """Test sin muestras suficientes se ejecuta una sola vez"""
+        hedger = RequestHedger(LatencyMetrics())
+        func = Mock(return_value="ok")
+
+        assert hedger.run("/jsearch/search", func) == "ok"
+        func.assert_called_once()
+        assert hedger.stats()['hedged'] == 0
+
+    def test_hedge_delay_from_percentile(self):
+        """Test umbral a partir del percentil del histograma"""
+        hedger = RequestHedger(_metrics_with_samples(seconds=0.004), percentile=95)
+
+        assert hedger.hedge_delay("/jsearch/search") == pytest.approx(0.004)
+        assert hedger.hedge_delay("/otro") is None
+
+    def test_fast_request_not_hedged(self):
+        """Test petición rápida no se duplica"""
+        hedger = RequestHedger(_metrics_with_samples(seconds=1.0), max_ratio=1.0)
+        func = Mock(return_value="ok")
+
+        assert hedger.run("/jsearch/search", func) == "ok"
+        func.assert_called_once()
+
+    def test_slow_request_hedged_and_hedge_wins(self):
+        """Test petición lenta se duplica y gana el duplicado"""
+        before_hedge = Mock()
+        hedger = RequestHedger(_metrics_with_samples(), max_ratio=1.0, before_hedge=before_hedge)
+        release_primary = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                release_primary.wait(5)
+                return "primary"
+            return "hedge"
+
+        try:
+            assert hedger.run("/jsearch/search", func) == "hedge"
+        finally:
+            release_primary.set()
+
+        before_hedge.assert_called_once()
+        stats = hedger.stats()
+        assert stats['hedged'] == 1
+        assert stats['hedge_wins'] == 1
+
+    def test_hedge_failure_falls_back_to_primary(self):
+        """Test si el duplicado falla se espera a la original"""
+        hedger = RequestHedger(_metrics_with_samples(), max_ratio=1.0)
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.05)
+                return "primary"
+            raise ConnectionError("fallo")
+
+        assert hedger.run("/jsearch/search", func) == "primary"
+        assert hedger.stats()['hedge_wins'] == 0
+
+    def test_both_fail_raises_primary_error(self):
+        """Test si ambas fallan se propaga el error de la original"""
+        hedger = RequestHedger(_metrics_with_samples(), max_ratio=1.0)
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.05)
+                raise TimeoutError("original")
+            raise ConnectionError("duplicado")
+
+        with pytest.raises(TimeoutError):
+            hedger.run("/jsearch/search", func)
+
+    def test_hedges_capped_by_ratio(self):
+        """Test el número de duplicados no supera la fracción máxima"""
+        hedger = RequestHedger(_metrics_with_samples(), max_ratio=0.0)
+        func = Mock(side_effect=lambda: threading.Event().wait(0.02) or "ok")
+
+        assert hedger.run("/jsearch/search", func) == "ok"
+
+        func.assert_called_once()
+        stats = hedger.stats()
+        assert stats['hedged'] == 0
+        assert stats['budget_exhausted'] == 1
+
+
+class TestJSearchClientHedging:
+    """Tests para el hedging en JSearchClient"""
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_hedging_disabled_by_default(self, mock_http_client, mock_rate_limiter):
+        """Test sin config no hay hedging"""
+        client = JSearchClient(api_key="test_key")
+
+        assert client.hedger is None
+        assert client.get_stats()['hedging'] is None
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_hedging_enabled_from_config(self, mock_http_client, mock_rate_limiter):
+        """Test hedging activado desde config usa el rate limiter para los duplicados"""
+        mock_http_client.return_value.metrics = LatencyMetrics()
+        mock_http_client.return_value.get.return_value = {"data": [{"job_id": "1"}]}
+        mock_rate_limiter.return_value.with_retry = lambda f: f
+
+        config = Config(api_key="test_key", hedge_requests=True, hedge_percentile=90.0, hedge_max_ratio=0.05)
+
+        client = JSearchClient(api_key="test_key", config=config)
+        salaries = client.get_estimated_salary("Developer", "Madrid")
+
+        assert salaries == [{"job_id": "1"}]
+        assert client.hedger.percentile == 90.0
+        assert client.hedger.before_hedge is mock_rate_limiter.return_value.wait
+        assert client.get_stats()['hedging']['requests'] == 1
+
+    def test_hedged_requests_keep_usage_scope(self, make_jsearch_client):
+        """Test con hedging el consumo se anota al llamador del usage_scope"""
+        client = make_jsearch_client(
+            usage_tracking=True, hedge_requests=True, hedge_max_ratio=0.5, salary_cache_enabled=False
+        )
+        client.hedger.metrics = _metrics_with_samples("/jsearch/estimated-salary")
+        priorities = []
+        client.client.get = Mock(side_effect=lambda endpoint, params: (
+            priorities.append(scoped_priority()) or {"data": [{"median_salary": 1}]}
+        ))
+
+        with usage_scope("cron", BATCH):
+            client.get_estimated_salary("Developer", "Madrid")
+
+        assert priorities == [BATCH]
+        assert client.get_usage_report()['by_caller'] == {'cron': {'requests': 1, 'credits': 1}}
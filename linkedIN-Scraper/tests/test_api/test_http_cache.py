@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_http_cache.py
+Descripción: Tests para ConditionalCache y GET condicionales en HTTPClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPClient, HTTPError
+from src.api.http_cache import ConditionalCache, CacheEntry
+
+
+class FakeResponse:
+    """Respuesta HTTP mínima con headers"""
+
+    def __init__(self, body=b'', status=200, headers=None):
+        self.status = status
+        self.will_close = False
+        self._body = body
+        self._headers = headers or {}
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def read(self, amt=None):
+        body, self._body = self._body, b''
+        return body
+
+
+class TestConditionalCache:
+    """Tests para ConditionalCache"""
+
+    def test_store_and_get(self):
+        """Test guardar y recuperar una entrada"""
+        cache = ConditionalCache()
+        cache.store("/a", '"v1"', None, {"data": [1]})
+
+        entry = cache.get("/a")
+        assert entry.result == {"data": [1]}
+        assert entry.conditional_headers() == {'If-None-Match': '"v1"'}
+
+    def test_store_without_validators_is_skipped(self):
+        """Test respuestas sin validadores no se guardan y borran la anterior"""
+        cache = ConditionalCache()
+        cache.store("/a", '"v1"', None, {"data": [1]})
+        cache.store("/a", None, None, {"data": [2]})
+
+        assert cache.get("/a") is None
+
+    def test_lru_eviction(self):
+        """Test se expulsa la entrada menos usada"""
+        cache = ConditionalCache(max_entries=2)
+        cache.store("/a", '"a"', None, 1)
+        cache.store("/b", '"b"', None, 2)
+        cache.get("/a")
+        cache.store("/c", '"c"', None, 3)
+
+        assert cache.get("/b") is None
+        assert cache.get("/a") is not None
+        assert cache.stats()['evicted'] == 1
+
+    def test_last_modified_headers(self):
+        """Test validador Last-Modified"""
+        entry = CacheEntry(None, "Mon, 08 Dec 2025 10:00:00 GMT", {})
+
+        assert entry.conditional_headers() == {'If-Modified-Since': "Mon, 08 Dec 2025 10:00:00 GMT"}
+
+    def test_clear_and_stats(self):
+        """Test limpiar la caché"""
+        cache = ConditionalCache()
+        cache.store("/a", '"a"', None, 1)
+        cache.mark_revalidated()
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats == {'entries': 0, 'stored': 1, 'revalidated': 1, 'served_stale': 0, 'evicted': 0}
+
+
+class TestConditionalGet:
+    """Tests de GET condicional en HTTPClient"""
+
+    def _client(self, mock_conn_class, responses):
+        mock_conn = Mock()
+        mock_conn.sock = None
+        mock_conn.getresponse.side_effect = responses
+        mock_conn_class.return_value = mock_conn
+        return HTTPClient(host="api.example.com", cache=ConditionalCache()), mock_conn
+
+    @patch('http.client.HTTPSConnection')
+    def test_304_returns_cached_result(self, mock_conn_class):
+        """Test un 304 devuelve el resultado parseado previamente"""
+        client, mock_conn = self._client(mock_conn_class, [
+            FakeResponse(b'{"data": [1]}', headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 08 Dec 2025 10:00:00 GMT'}),
+            FakeResponse(status=304)
+        ])
+
+        first = client.get("/search", {"query": "python"})
+        second = client.get("/search", {"query": "python"})
+
+        assert second is first
+        headers = mock_conn.request.call_args_list[1][1]["headers"]
+        assert headers['If-None-Match'] == '"v1"'
+        assert headers['If-Modified-Since'] == 'Mon, 08 Dec 2025 10:00:00 GMT'
+        assert client.cache.stats()['revalidated'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_cached_result_without_revalidation(self, mock_conn_class):
+        """Test cached_result devuelve la entrada sin enviar petición"""
+        client, mock_conn = self._client(mock_conn_class, [
+            FakeResponse(b'{"data": [1]}', headers={'ETag': '"v1"'})
+        ])
+
+        first = client.get("/search", {"query": "python"})
+
+        assert client.cached_result("/search", {"query": "python"}) is first
+        assert client.cached_result("/search", {"query": "java"}) is None
+        assert mock_conn.request.call_count == 1
+        assert client.cache.stats()['served_stale'] == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_changed_response_replaces_entry(self, mock_conn_class):
+        """Test un 200 con nuevo ETag reemplaza la entrada"""
+        client, _ = self._client(mock_conn_class, [
+            FakeResponse(b'{"v": 1}', headers={'ETag': '"v1"'}),
+            FakeResponse(b'{"v": 2}', headers={'ETag': '"v2"'})
+        ])
+
+        client.get("/search")
+        result = client.get("/search")
+
+        assert result == {"v": 2}
+        assert client.cache.get("/search").etag == '"v2"'
+
+    @patch('http.client.HTTPSConnection')
+    def test_first_request_has_no_conditional_headers(self, mock_conn_class):
+        """Test sin entrada previa no se envían validadores"""
+        client, mock_conn = self._client(mock_conn_class, [FakeResponse(b'{}')])
+
+        client.get("/search")
+
+        headers = mock_conn.request.call_args[1]["headers"]
+        assert 'If-None-Match' not in headers
+        assert 'If-Modified-Since' not in headers
+
+    @patch('http.client.HTTPSConnection')
+    def test_304_without_entry_is_error(self, mock_conn_class):
+        """Test un 304 inesperado sin entrada es un error"""
+        client, _ = self._client(mock_conn_class, [FakeResponse(status=304)])
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.get("/search")
+
+        assert exc_info.value.status_code == 304
+
+    @patch('http.client.HTTPSConnection')
+    def test_params_are_part_of_key(self, mock_conn_class):
+        """Test distintas queries no comparten entrada"""
+        client, mock_conn = self._client(mock_conn_class, [
+            FakeResponse(b'{"q": "a"}', headers={'ETag': '"a"'}),
+            FakeResponse(b'{"q": "b"}', headers={'ETag': '"b"'})
+        ])
+
+        client.get("/search", {"query": "a"})
+        client.get("/search", {"query": "b"})
+
+        headers = mock_conn.request.call_args[1]["headers"]
+        assert 'If-None-Match' not in headers
@@ -13,7 +13,9 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.api.jsearch_client import JSearchClient
 from src.api.client import HTTPError
+from src.api.usage_budget import CreditBudget, UsageLedger, usage_scope
 from src.models.search_params import SearchParameters
+from src.utils.config import Config
 
 
 class TestJSearchClient:
@@ -35,6 +37,20 @@ class TestJSearchClient:
         mock_config.rate_limit_delay = 2.0
         mock_config.max_retries = 5
         mock_config.retry_delay = 3
+        mock_config.retry_max_delay = 20.0
+        mock_config.retry_budget_ratio = 0.2
+        mock_config.transport_mode = "live"
+        mock_config.rate_limit_burst = 4
+        mock_config.adaptive_rate_limit = True
+        mock_config.rate_limit_min_delay = 0.5
+        mock_config.rate_limit_backend = "local"
+        mock_config.usage_tracking = False
+        mock_config.scheduler_enabled = False
+        mock_config.additional_api_keys.return_value = []
+        mock_config.page_fanout = False
+        mock_config.result_cache_bytes = 0
+        mock_config.salary_cache_enabled = False
+        mock_config.negative_cache_ttl = 0
 
         client = JSearchClient(api_key="test_key", config=mock_config)
 
@@ -42,6 +58,13 @@ class TestJSearchClient:
         assert client.rate_limiter.delay == 2.0
         assert client.rate_limiter.max_retries == 5
         assert client.rate_limiter.retry_delay == 3
+        assert client.rate_limiter.burst == 4
+        assert client.rate_limiter.adaptive is True
+        assert client.rate_limiter.min_delay == 0.5
+        assert client.client.on_response == client.rate_limiter.observe_response
+        assert client.rate_limiter.store is None
+        assert client.rate_limiter.retry_policy.max_attempts == 5
+        assert client.rate_limiter.retry_policy.budget.ratio == 0.2
 
     def test_jsearch_client_default_config(self):
         """Test inicialización sin config"""
@@ -404,3 +427,292 @@ def test_get_job_details_empty_data(mock_http_client, mock_rate_limiter):
         client.get_job_details("not_found_id")
     assert exc_info.value.status_code == 404
     assert "no encontrado" in str(exc_info.value.message).lower()
+
+
+class TestIterSearchJobs:
+    """Tests para JSearchClient.iter_search_jobs"""
+
+    def _client(self, mock_http_client, mock_rate_limiter, items, extras=None):
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(items)
+        stream.extras = extras or {}
+        mock_client_instance = Mock()
+        mock_client_instance.stream_get.return_value = stream
+        mock_http_client.return_value = mock_client_instance
+
+        mock_limiter_instance = Mock()
+        mock_limiter_instance.with_retry = lambda f: f
+        mock_rate_limiter.return_value = mock_limiter_instance
+
+        return JSearchClient(api_key="test_key"), mock_client_instance
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_iter_search_jobs_yields_items(self, mock_http_client, mock_rate_limiter):
+        """Test iter_search_jobs emite cada trabajo"""
+        client, http = self._client(mock_http_client, mock_rate_limiter, [{"job_id": "1"}, {"job_id": "2"}])
+        params = SearchParameters(query="python", country="us")
+
+        jobs = list(client.iter_search_jobs(params))
+
+        assert [job["job_id"] for job in jobs] == ["1", "2"]
+        http.stream_get.assert_called_once_with("/jsearch/search", params.to_api_params())
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_iter_search_jobs_error_in_body(self, mock_http_client, mock_rate_limiter):
+        """Test error en el cuerpo de la respuesta"""
+        client, _ = self._client(mock_http_client, mock_rate_limiter, [], extras={"error": "Invalid API key"})
+
+        with pytest.raises(HTTPError) as exc_info:
+            list(client.iter_search_jobs(SearchParameters(query="python")))
+
+        assert exc_info.value.status_code == 400
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_iter_search_jobs_rate_limit(self, mock_http_client, mock_rate_limiter):
+        """Test error 429 al abrir el stream"""
+        client, http = self._client(mock_http_client, mock_rate_limiter, [])
+        http.stream_get.side_effect = HTTPError(429, "Too Many Requests")
+
+        with pytest.raises(HTTPError) as exc_info:
+            list(client.iter_search_jobs(SearchParameters(query="python")))
+
+        assert exc_info.value.status_code == 429
+        assert "Rate limit" in str(exc_info.value)
+
+    @patch('src.api.jsearch_client.RateLimiter')
+    @patch('src.api.jsearch_client.HTTPClient')
+    def test_iter_search_jobs_other_error(self, mock_http_client, mock_rate_limiter):
+        """Test otros errores se propagan sin cambios"""
+        client, http = self._client(mock_http_client, mock_rate_limiter, [])
+        http.stream_get.side_effect = HTTPError(500, "Server Error")
+
+        with pytest.raises(HTTPError) as exc_info:
+            list(client.iter_search_jobs(SearchParameters(query="python")))
+
+        assert exc_info.value.status_code == 500
+
+
+class TestPageFanout:
+    """Tests para la búsqueda de varias páginas en paralelo"""
+
+    def _client(self, pages):
+        """Cliente con fan-out cuya API responde según la página pedida"""
+        config = Config(
+            api_key="test_key", page_fanout=True, usage_tracking=False,
+            scheduler_enabled=False, circuit_breaker_enabled=False, rate_limit_delay=0.1
+        )
+        client = JSearchClient(api_key="test_key", config=config)
+        client.rate_limiter.delay = 0.0
+        client.rate_limiter.retry_policy.max_attempts = 1
+        sent = []
+
+        def fake_get(endpoint, params):
+            sent.append(dict(params))
+            page = pages[int(params['page'])]
+            if isinstance(page, Exception):
+                raise page
+            return {"data": [{"job_id": job_id} for job_id in page]}
+
+        client.client.get = fake_get
+        return client, sent
+
+    def test_pages_requested_separately_and_merged_in_order(self):
+        """Test N páginas se piden una a una y se unen en orden sin duplicados"""
+        client, sent = self._client({3: ["a", "b"], 4: ["b", "c"], 5: ["d"]})
+
+        jobs = client.search_jobs(SearchParameters(query="python", page=3, num_pages=3))
+
+        assert [job["job_id"] for job in jobs] == ["a", "b", "c", "d"]
+        assert sorted(int(params['page']) for params in sent) == [3, 4, 5]
+        assert all(params['num_pages'] == "1" for params in sent)
+
+    def test_partial_results_when_a_page_fails(self):
+        """Test si falla una página se devuelven las demás"""
+        client, _ = self._client({1: ["a"], 2: HTTPError(500, "Server Error"), 3: ["c"]})
+
+        jobs = client.search_jobs(SearchParameters(query="python", num_pages=3))
+
+        assert [job["job_id"] for job in jobs] == ["a", "c"]
+
+    def test_all_pages_fail(self):
+        """Test si fallan todas las páginas se propaga el error"""
+        client, _ = self._client({1: HTTPError(429, "Too Many Requests"), 2: HTTPError(429, "Too Many Requests")})
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.search_jobs(SearchParameters(query="python", num_pages=2))
+
+        assert exc_info.value.status_code == 429
+        assert "Rate limit" in str(exc_info.value)
+
+    def test_single_page_uses_one_request(self):
+        """Test una sola página no usa el fan-out"""
+        client, sent = self._client({1: ["a"]})
+
+        client.search_jobs(SearchParameters(query="python"))
+
+        assert len(sent) == 1
+
+    def test_pages_keep_usage_scope(self, tmp_path):
+        """Test las páginas se atribuyen al llamador de la búsqueda"""
+        client, _ = self._client({1: ["a"], 2: ["b"]})
+        client.budget = CreditBudget(UsageLedger(tmp_path / "usage.sqlite3"))
+
+        with usage_scope("cron"):
+            client.search_jobs(SearchParameters(query="python", num_pages=2))
+
+        assert client.get_usage_report()['by_caller'] == {'cron': {'requests': 2, 'credits': 2}}
+
+
+class TestJobDetailsBatch:
+    """Tests para get_job_details_batch"""
+
+    def _client(self, respond, batch_size=20):
+        """Cliente cuya API de detalles responde con `respond(ids)`"""
+        config = Config(
+            api_key="test_key", usage_tracking=False, scheduler_enabled=False,
+            circuit_breaker_enabled=False, details_batch_size=batch_size
+        )
+        client = JSearchClient(api_key="test_key", config=config)
+        client.rate_limiter.delay = 0.0
+        client.rate_limiter.retry_policy.max_attempts = 1
+        sent = []
+
+        def fake_get(endpoint, params):
+            ids = params['job_id'].split(",")
+            sent.append(ids)
+            return respond(ids)
+
+        client.client.get = fake_get
+        return client, sent
+
+    def test_ids_packed_into_one_request(self):
+        """Test los IDs se piden juntos y el resultado va por ID"""
+        client, sent = self._client(lambda ids: {"data": [{"job_id": job_id} for job_id in reversed(ids)]})
+
+        results = client.get_job_details_batch(["a", "b", "a", "c"])
+
+        assert sent == [["a", "b", "c"]]
+        assert list(results) == ["a", "b", "c"]
+        assert results["b"] == {"job_id": "b"}
+
+    def test_chunks_and_missing_ids(self):
+        """Test grupos de batch_size y 404 para los IDs sin resultado"""
+        client, sent = self._client(
+            lambda ids: {"data": [{"job_id": job_id} for job_id in ids if job_id != "c"]},
+            batch_size=2
+        )
+
+        results = client.get_job_details_batch(["a", "b", "c", "d", "e"])
+
+        assert sorted(sent) == [["a", "b"], ["c", "d"], ["e"]]
+        assert isinstance(results["c"], HTTPError)
+        assert results["c"].status_code == 404
+        assert results["e"] == {"job_id": "e"}
+
+    def test_failed_request_only_affects_its_ids(self):
+        """Test un error en un grupo se asigna solo a sus IDs"""
+        def respond(ids):
+            if "b" in ids:
+                raise HTTPError(500, "Server Error")
+            return {"data": [{"job_id": job_id} for job_id in ids]}
+
+        client, _ = self._client(respond, batch_size=1)
+
+        results = client.get_job_details_batch(["a", "b", "c"])
+
+        assert results["a"] == {"job_id": "a"}
+        assert results["b"].status_code == 500
+        assert results["c"] == {"job_id": "c"}
+
+    def test_fields_always_include_job_id(self):
+        """Test job_id se añade a fields para poder asociar los resultados"""
+        client, _ = self._client(lambda ids: {"data": []})
+        client.client.get = Mock(return_value={"data": [{"job_id": "a", "job_title": "Dev"}]})
+
+        results = client.get_job_details_batch(["a"], fields="job_title")
+
+        assert client.client.get.call_args[0][1]['fields'] == "job_id,job_title"
+        assert results["a"]["job_title"] == "Dev"
+
+    def test_empty_batch(self):
+        """Test sin IDs no hay peticiones"""
+        client, sent = self._client(lambda ids: {"data": []})
+
+        assert client.get_job_details_batch([]) == {}
+        assert sent == []
+
+
+class TestIterSearchPages:
+    """Tests para iter_search_pages"""
+
+    def _client(self, pages):
+        """Cliente cuya API responde con `pages[n]` a la página n (vacía si no existe)"""
+        config = Config(api_key="test_key", usage_tracking=False, scheduler_enabled=False)
+        client = JSearchClient(api_key="test_key", config=config)
+        client.rate_limiter.delay = 0.0
+        sent = []
+
+        def fake_get(endpoint, params):
+            sent.append(int(params['page']))
+            return {"data": [{"job_id": job_id} for job_id in pages.get(int(params['page']), [])]}
+
+        client.client.get = fake_get
+        return client, sent
+
+    def test_stops_at_empty_page(self):
+        """Test se piden páginas hasta una vacía"""
+        client, sent = self._client({1: ["a", "b"], 2: ["c"]})
+
+        pages = list(client.iter_search_pages(SearchParameters(query="python", num_pages=5)))
+
+        assert pages == [[{"job_id": "a"}, {"job_id": "b"}], [{"job_id": "c"}]]
+        assert sent == [1, 2, 3]
+
+    def test_pages_fetched_lazily(self):
+        """Test la siguiente página no se pide hasta que se necesita"""
+        client, sent = self._client({1: ["a"], 2: ["b"]})
+
+        pages = client.iter_search_pages(SearchParameters(query="python"))
+        next(pages)
+
+        assert sent == [1]
+
+    def test_limit_stops_fetching(self):
+        """Test al llegar al límite no se piden más páginas"""
+        client, sent = self._client({3: ["a", "b"], 4: ["c", "d"], 5: ["e"]})
+
+        pages = list(client.iter_search_pages(SearchParameters(query="python", page=3), limit=3))
+
+        assert [job["job_id"] for page in pages for job in page] == ["a", "b", "c"]
+        assert sent == [3, 4]
+
+    def test_repeated_page_ends_iteration(self):
+        """Test una página sin trabajos nuevos termina la búsqueda"""
+        client, sent = self._client({1: ["a", "b"], 2: ["b", "a"]})
+
+        pages = list(client.iter_search_pages(SearchParameters(query="python")))
+
+        assert len(pages) == 1
+        assert sent == [1, 2]
+
+    def test_max_pages(self):
+        """Test max_pages limita las peticiones"""
+        client, sent = self._client({1: ["a"], 2: ["b"], 3: ["c"]})
+
+        list(client.iter_search_pages(SearchParameters(query="python"), max_pages=2))
+
+        assert sent == [1, 2]
+
+    def test_rate_limit_error(self):
+        """Test error 429 en una página"""
+        client, _ = self._client({})
+        client.rate_limiter.retry_policy.max_attempts = 1
+        client.client.get = Mock(side_effect=HTTPError(429, "Too Many Requests"))
+
+        with pytest.raises(HTTPError) as exc_info:
+            list(client.iter_search_pages(SearchParameters(query="python")))
+
+        assert "Rate limit" in str(exc_info.value)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_json_stream.py
+Descripción: Tests para el parser JSON incremental
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import json
+import pytest
+from src.api.json_stream import JSONArrayStreamParser, iter_array_items
+
+
+DOCUMENT = {
+    "status": "OK",
+    "request_id": "r-1",
+    "parameters": {"query": "python", "pages": [1, 2]},
+    "data": [
+        {"job_id": "1", "job_title": "Dev \"Senior\" \\ {remoto}", "tags": ["a", "b"]},
+        {"job_id": "2", "job_title": "Ingeniería [ES]", "job_min_salary": 40000.5, "x": None},
+        {"job_id": "3", "nested": {"deep": [{"k": "v,}]"}]}, "remote": True}
+    ],
+    "count": 3
+}
+
+
+def chunked(data, size):
+    """Divide bytes en bloques de tamaño fijo"""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONArrayStreamParser:
+    """Tests para JSONArrayStreamParser"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+    def test_items_and_extras_any_chunking(self, chunk_size):
+        """Test el resultado no depende de cómo se corten los bloques"""
+        raw = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode('utf-8')
+        parser = JSONArrayStreamParser("data")
+
+        items = []
+        for chunk in chunked(raw, chunk_size):
+            items.extend(parser.feed(chunk))
+        parser.close()
+
+        assert items == DOCUMENT["data"]
+        assert parser.extras == {
+            "status": "OK",
+            "request_id": "r-1",
+            "parameters": {"query": "python", "pages": [1, 2]},
+            "count": 3
+        }
+        assert parser.done
+
+    def test_items_emitted_incrementally(self):
+        """Test cada elemento se emite en cuanto se completa"""
+        parser = JSONArrayStreamParser()
+
+        assert parser.feed(b'{"data": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b': 2}]}') == [{"id": 2}]
+
+    def test_buffer_does_not_grow(self):
+        """Test el buffer solo retiene el elemento en curso"""
+        parser = JSONArrayStreamParser()
+        parser.feed(b'{"data": [')
+        for i in range(1000):
+            parser.feed(json.dumps({"job_id": str(i), "d": "x" * 100}).encode() + b',')
+
+        assert len(parser._buf) < 200
+
+    def test_empty_array(self):
+        """Test array vacío"""
+        assert list(iter_array_items([b'{"data": [ ], "status": "OK"}'])) == []
+
+    def test_scalar_elements(self):
+        """Test elementos escalares"""
+        assert list(iter_array_items([b'{"data": [1, "a", null, true, 2.5]}'])) == [1, "a", None, True, 2.5]
+
+    def test_other_key_ignored(self):
+        """Test arrays con otra clave se guardan como extras"""
+        parser = JSONArrayStreamParser("data")
+        items = parser.feed(b'{"other": [{"a": 1}], "error": {"message": "bad"}}')
+        parser.close()
+
+        assert items == []
+        assert parser.extras["other"] == [{"a": 1}]
+        assert parser.extras["error"] == {"message": "bad"}
+
+    def test_escaped_key(self):
+        """Test claves con escapes"""
+        parser = JSONArrayStreamParser("da\"ta")
+        items = parser.feed(b'{"da\\"ta": [1]}')
+
+        assert items == [1]
+
+    def test_incomplete_document(self):
+        """Test documento truncado"""
+        with pytest.raises(ValueError):
+            list(iter_array_items([b'{"data": [{"id": 1}, {"id"']))
+
+    def test_not_an_object(self):
+        """Test documento que no es un objeto"""
+        with pytest.raises(ValueError):
+            JSONArrayStreamParser().feed(b'[1, 2]')
+
+    def test_invalid_element(self):
+        """Test elemento JSON inválido"""
+        with pytest.raises(json.JSONDecodeError):
+            JSONArrayStreamParser().feed(b'{"data": [{"id": nope}]}')
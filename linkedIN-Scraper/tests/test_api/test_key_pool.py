@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_key_pool.py
+Descripción: Tests para ApiKeyPool y el reparto de peticiones entre API keys
+             en JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPError
+from src.api.key_pool import ACTIVE, COOLING, DISABLED, ApiKeyPool, PooledKey, mask_key
+from src.api.rate_limiter import RateLimiter
+
+EXTRA_KEYS = "key-bbbb-0002,key-cccc-0003"
+
+
+def _key(name, delay=0.0):
+    return PooledKey(name, Mock(), RateLimiter(delay=delay))
+
+
+class TestApiKeyPool:
+    """Tests para ApiKeyPool"""
+
+    def test_requests_spread_across_keys(self):
+        """Test las peticiones se reparten por igual entre keys libres"""
+        keys = [_key("key-aaaa-1"), _key("key-bbbb-2"), _key("key-cccc-3")]
+        pool = ApiKeyPool(keys)
+
+        used = [pool.call(lambda key: key.label) for _ in range(6)]
+
+        assert sorted(used) == sorted([key.label for key in keys] * 2)
+
+    @patch('time.sleep')
+    def test_prefers_key_with_free_token(self, mock_sleep):
+        """Test se elige la key que puede enviar sin esperar"""
+        busy, free = _key("key-busy-001", delay=10.0), _key("key-free-002", delay=10.0)
+        busy.rate_limiter.wait()
+        pool = ApiKeyPool([busy, free])
+        busy.requests = 0
+
+        assert pool.acquire() is free
+        mock_sleep.assert_not_called()
+
+    def test_invalid_key_removed_and_request_retried(self):
+        """Test un 401 retira la key y repite la petición con otra"""
+        bad, good = _key("key-bad-0001"), _key("key-good-002")
+        pool = ApiKeyPool([bad, good])
+
+        def request(key):
+            if key is bad:
+                raise HTTPError(401, "Invalid API key")
+            return "ok"
+
+        assert pool.call(request) == "ok"
+        assert bad.disabled is True
+        assert pool.call(request) == "ok"
+        assert pool.stats()['failovers'] == 1
+
+    def test_throttled_key_rests(self):
+        """Test un 429 deja la key en pausa y se usa otra"""
+        throttled, other = _key("key-429-0001"), _key("key-ok-00002")
+        pool = ApiKeyPool([throttled, other], cooldown=60.0)
+        calls = []
+
+        def request(key):
+            calls.append(key)
+            if key is throttled:
+                raise HTTPError(429, "Too many requests")
+            return "ok"
+
+        assert pool.call(request) == "ok"
+        assert pool.call(request) == "ok"
+
+        assert calls.count(throttled) == 1
+        assert pool.stats()['keys'][0]['state'] == COOLING
+
+    def test_consecutive_errors_rest_key(self):
+        """Test errores transitorios seguidos sacan la key de la rotación"""
+        key = _key("key-flaky-01")
+        pool = ApiKeyPool([key], failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                pool.call(Mock(side_effect=HTTPError(503, "Unavailable")))
+
+        assert pool.stats()['keys'][0]['state'] == COOLING
+        assert pool.stats()['active'] == 0
+
+    def test_transient_error_not_retried_on_other_key(self):
+        """Test un 5xx se devuelve al llamador (lo reintenta la política de reintentos)"""
+        first, second = _key("key-first-01"), _key("key-second-2")
+        pool = ApiKeyPool([first, second])
+
+        with pytest.raises(HTTPError) as exc_info:
+            pool.call(Mock(side_effect=HTTPError(502, "Bad gateway")))
+
+        assert exc_info.value.status_code == 502
+
+    def test_request_error_does_not_hurt_key(self):
+        """Test un 404 no cuenta contra la salud de la key"""
+        key = _key("key-only-001")
+        pool = ApiKeyPool([key], failure_threshold=1)
+
+        with pytest.raises(HTTPError):
+            pool.call(Mock(side_effect=HTTPError(404, "Not found")))
+
+        assert key.state(0) == ACTIVE
+
+    def test_all_keys_invalid(self):
+        """Test sin keys válidas se lanza 401"""
+        pool = ApiKeyPool([_key("key-bad-0001"), _key("key-bad-0002")])
+
+        with pytest.raises(HTTPError) as exc_info:
+            pool.call(Mock(side_effect=HTTPError(403, "Forbidden")))
+
+        assert exc_info.value.status_code == 403
+        with pytest.raises(HTTPError) as exc_info:
+            pool.acquire()
+        assert exc_info.value.status_code == 401
+
+    def test_all_keys_cooling_uses_first_to_return(self):
+        """Test con todas las keys en pausa se usa la que antes vuelve"""
+        early, late = _key("key-early-01"), _key("key-late-002")
+        early.cooldown_until, late.cooldown_until = 9e12, 9e12 + 60
+        pool = ApiKeyPool([late, early])
+
+        assert pool.acquire() is early
+
+    def test_empty_pool(self):
+        """Test un pool sin keys no es válido"""
+        with pytest.raises(ValueError):
+            ApiKeyPool([])
+
+    def test_stats(self):
+        """Test estadísticas por key sin exponer la key"""
+        key = _key("secret-key-1234")
+        key.disabled = True
+        stats = ApiKeyPool([key]).stats()
+
+        assert stats['total'] == 1
+        assert stats['active'] == 0
+        assert stats['keys'][0]['key'] == "****1234"
+        assert stats['keys'][0]['state'] == DISABLED
+        assert "secret" not in str(stats)
+
+    def test_mask_key(self):
+        """Test enmascarado de keys"""
+        assert mask_key("abcdefghijkl") == "****ijkl"
+        assert mask_key("short") == "****"
+
+
+class TestJSearchClientKeyPool:
+    """Tests para JSearchClient con varias API keys"""
+
+    def test_single_key_has_no_pool(self, make_jsearch_client):
+        """Test con una sola key no hay pool"""
+        client = make_jsearch_client()
+
+        assert client.key_pool is None
+        assert client.get_stats()['api_keys'] is None
+
+    def test_pool_built_from_config(self, make_jsearch_client):
+        """Test cada key tiene su cliente y su rate limiter"""
+        client = make_jsearch_client(api_key="key-aaaa-0001", extra_api_keys=EXTRA_KEYS)
+        keys = client.key_pool.keys
+
+        assert len(keys) == 3
+        assert [key.client.headers['x-api-key'] for key in keys] == ["key-aaaa-0001", "key-bbbb-0002", "key-cccc-0003"]
+        assert len({id(key.rate_limiter) for key in keys}) == 3
+        assert keys[1].client.on_response == keys[1].rate_limiter.observe_response
+        # Pool de conexiones, caché y métricas compartidos
+        assert keys[0].client.pool is keys[2].client.pool
+        assert keys[0].client.metrics is keys[2].client.metrics
+        assert client.rate_limiter.delay == 0.0
+
+    def test_requests_use_every_key(self, make_jsearch_client):
+        """Test las búsquedas se reparten entre las keys sin cambios para el llamador"""
+        client = make_jsearch_client(api_key="key-aaaa-0001", extra_api_keys=EXTRA_KEYS, circuit_breaker_enabled=False)
+        sent_with = []
+        for key in client.key_pool.keys:
+            key.client.get = Mock(side_effect=lambda endpoint, params, key=key: (
+                sent_with.append(key.label) or {"data": [{"estimated_salary": 1}]}
+            ))
+            key.rate_limiter.delay = 0.0
+
+        for city in ("Madrid", "Barcelona", "Valencia"):
+            client.get_estimated_salary("Developer", city)
+
+        assert sorted(sent_with) == sorted(key.label for key in client.key_pool.keys)
+        assert client.get_stats()['api_keys']['total'] == 3
+
+    def test_each_key_has_own_scheduler(self, make_jsearch_client):
+        """Test la espera de una key no retiene el turno de las demás"""
+        client = make_jsearch_client(api_key="key-aaaa-0001", extra_api_keys=EXTRA_KEYS, scheduler_enabled=True)
+        schedulers = [key.rate_limiter.scheduler for key in client.key_pool.keys]
+
+        assert all(scheduler is not None for scheduler in schedulers)
+        assert len({id(scheduler) for scheduler in schedulers}) == 3
+        assert client.get_stats()['api_keys']['keys'][0]['scheduler'] is not None
+
+    def test_throughput_scales_with_keys(self, make_jsearch_client):
+        """Test con 4 keys a 2 req/s cada una se alcanzan cerca de 8 req/s"""
+        client = make_jsearch_client(
+            api_key="key-aaaa-0001", extra_api_keys="key-bbbb-0002,key-cccc-0003,key-dddd-0004",
+            scheduler_enabled=True, circuit_breaker_enabled=False,
+            rate_limit_delay=0.5, rate_limit_burst=1
+        )
+        for key in client.key_pool.keys:
+            key.client.get = Mock(return_value={"data": [{"median_salary": 1}]})
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda city: client.get_estimated_salary("Developer", city), range(12)))
+        elapsed = time.monotonic() - start
+
+        # 4 peticiones al momento y 4 más cada 0,5 s: ~1 s (con un turno compartido, más de 2 s)
+        assert elapsed < 1.8
+        assert all(key.requests == 3 for key in client.key_pool.keys)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_metrics.py
+Descripción: Tests para la medición de latencia por fases y su registro en HTTPClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import http.client
+import socket
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPClient, HTTPError
+from src.api.metrics import LatencyHistogram, LatencyMetrics, RequestTiming, timed_connect
+
+
+class TestLatencyHistogram:
+    """Tests para LatencyHistogram"""
+
+    def test_empty_histogram(self):
+        """Test histograma sin observaciones"""
+        histogram = LatencyHistogram()
+
+        summary = histogram.to_dict()
+
+        assert summary['count'] == 0
+        assert summary['mean_ms'] is None
+        assert histogram.percentile(50) is None
+
+    def test_observe_updates_counters(self):
+        """Test observaciones actualizan conteo, media y extremos"""
+        histogram = LatencyHistogram()
+
+        histogram.observe(0.010)
+        histogram.observe(0.030)
+
+        summary = histogram.to_dict()
+        assert summary['count'] == 2
+        assert summary['mean_ms'] == pytest.approx(20.0)
+        assert summary['min_ms'] == pytest.approx(10.0)
+        assert summary['max_ms'] == pytest.approx(30.0)
+        assert summary['buckets']['le_10'] == 1
+        assert summary['buckets']['le_50'] == 1
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Test percentiles se estiman con el límite del bucket"""
+        histogram = LatencyHistogram(buckets_ms=(10, 100, 1000))
+        for _ in range(9):
+            histogram.observe(0.005)
+        histogram.observe(0.500)
+
+        assert histogram.percentile(50) == 10
+        assert histogram.percentile(99) == pytest.approx(500.0)  # acotado por el máximo
+
+    def test_values_above_last_bucket(self):
+        """Test valores fuera de rango van al bucket +inf"""
+        histogram = LatencyHistogram(buckets_ms=(10,))
+
+        histogram.observe(2.0)
+
+        assert histogram.to_dict()['buckets']['le_inf'] == 1
+        assert histogram.percentile(50) == pytest.approx(2000.0)
+
+
+class TestLatencyMetrics:
+    """Tests para LatencyMetrics"""
+
+    def test_record_and_snapshot(self):
+        """Test agregación por endpoint y fase"""
+        metrics = LatencyMetrics()
+        timing = RequestTiming()
+        timing.add('ttfb', 0.02)
+        timing.add('transfer', 0.01)
+        timing.finish()
+
+        metrics.record('/jsearch/search', timing)
+
+        snapshot = metrics.snapshot()
+        phases = snapshot['/jsearch/search']['phases']
+        assert list(phases) == ['ttfb', 'transfer', 'total']
+        assert phases['ttfb']['count'] == 1
+        assert snapshot['/jsearch/search']['connections'] == {'new': 1, 'reused': 0}
+
+    def test_reused_connections_counted(self):
+        """Test conteo de conexiones reutilizadas"""
+        metrics = LatencyMetrics()
+        timing = RequestTiming()
+        timing.reused_connection = True
+
+        metrics.record('/a', timing)
+
+        assert metrics.snapshot()['/a']['connections']['reused'] == 1
+
+    def test_get_histogram_and_reset(self):
+        """Test consulta de un histograma y reinicio"""
+        metrics = LatencyMetrics()
+        timing = RequestTiming()
+        timing.add('ttfb', 0.001)
+        metrics.record('/a', timing)
+
+        assert metrics.get_histogram('/a', 'ttfb').count == 1
+        assert metrics.get_histogram('/a', 'dns') is None
+
+        metrics.reset()
+
+        assert metrics.snapshot() == {}
+
+    def test_record_is_thread_safe(self):
+        """Test registros concurrentes no pierden observaciones"""
+        metrics = LatencyMetrics()
+
+        def worker():
+            for _ in range(200):
+                timing = RequestTiming()
+                timing.add('ttfb', 0.001)
+                metrics.record('/a', timing)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.get_histogram('/a', 'ttfb').count == 800
+
+
+class TestTimedConnect:
+    """Tests para timed_connect"""
+
+    def test_measures_dns_and_connect(self):
+        """Test mide DNS y TCP al abrir una conexión real"""
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            timing = RequestTiming()
+
+            timed_connect(conn, timing)
+
+            assert conn.sock is not None
+            assert {'dns', 'connect', 'tls'} <= set(timing.phases)
+            conn.close()
+        finally:
+            server.close()
+
+    def test_connection_refused_propagates(self):
+        """Test error de conexión se propaga"""
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        port = server.getsockname()[1]
+        server.close()
+
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+
+        with pytest.raises(OSError):
+            timed_connect(conn, RequestTiming())
+
+
+class TestHTTPClientLatency:
+    """Tests para el registro de latencia en HTTPClient"""
+
+    def _mock_connection(self, mock_https, body=b'{"data": []}', status=200):
+        mock_response = Mock()
+        mock_response.status = status
+        mock_response.read.return_value = body
+        mock_response.getheader.return_value = None
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_https.return_value = mock_conn
+        return mock_conn
+
+    @patch('http.client.HTTPSConnection')
+    def test_get_records_phases_per_endpoint(self, mock_https):
+        """Test GET registra TTFB, transferencia y total sin query string"""
+        self._mock_connection(mock_https)
+        client = HTTPClient('api.test.com')
+
+        client.get('/jsearch/search', {'query': 'python'})
+        client.get('/jsearch/search', {'query': 'java'})
+
+        snapshot = client.metrics.snapshot()
+        assert list(snapshot) == ['/jsearch/search']
+        phases = snapshot['/jsearch/search']['phases']
+        assert phases['ttfb']['count'] == 2
+        assert phases['transfer']['count'] == 2
+        assert phases['total']['count'] == 2
+
+    @patch('http.client.HTTPSConnection')
+    def test_error_responses_recorded(self, mock_https):
+        """Test respuestas con error también se miden"""
+        self._mock_connection(mock_https, body=b'error', status=500)
+        client = HTTPClient('api.test.com')
+
+        with pytest.raises(HTTPError):
+            client.get('/test')
+
+        assert client.metrics.get_histogram('/test', 'total').count == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_post_records_phases(self, mock_https):
+        """Test POST registra latencia"""
+        self._mock_connection(mock_https, body=b'{}')
+        client = HTTPClient('api.test.com')
+
+        client.post('/create', {'a': 1})
+
+        assert client.metrics.get_histogram('/create', 'ttfb').count == 1
+
+    @patch('http.client.HTTPSConnection')
+    def test_stream_recorded_after_consumption(self, mock_https):
+        """Test streaming registra la latencia al consumir el documento"""
+        mock_conn = self._mock_connection(mock_https)
+        mock_conn.getresponse.return_value.read.side_effect = [b'{"data": [1, 2]}', b'']
+        client = HTTPClient('api.test.com')
+
+        stream = client.stream_get('/jsearch/search')
+        assert client.metrics.snapshot() == {}
+
+        assert list(stream) == [1, 2]
+        assert client.metrics.get_histogram('/jsearch/search', 'transfer').count == 1
+
+    @patch('src.api.client.timed_connect')
+    @patch('http.client.HTTPSConnection')
+    def test_new_unconnected_connection_is_timed(self, mock_https, mock_timed_connect):
+        """Test conexiones nuevas sin socket se abren midiendo DNS/TCP/TLS"""
+        mock_conn = self._mock_connection(mock_https)
+        mock_conn.sock = None
+        client = HTTPClient('api.test.com')
+
+        client.get('/test')
+
+        mock_timed_connect.assert_called_once()
+        assert mock_timed_connect.call_args[0][0] is mock_conn
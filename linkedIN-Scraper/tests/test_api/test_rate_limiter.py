@@ -9,10 +9,14 @@ Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
 Versión: 3.0.0
 Fecha: 2025-12-08
 """
+import asyncio
+import threading
 import pytest
 import time
-from unittest.mock import Mock, patch
-from src.api.rate_limiter import RateLimiter, retry_on_http_error
+from unittest.mock import AsyncMock, Mock, patch
+from src.api.circuit_breaker import CircuitOpenError
+from src.api.client import HTTPError
+from src.api.rate_limiter import AsyncRateLimiter, RateLimiter, parse_retry_after, retry_on_http_error
 
 
 class TestRateLimiter:
@@ -107,7 +111,7 @@ class TestRateLimiter:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 3:
-                raise Exception("Temporary error")
+                raise ConnectionError("Temporary error")
             return "success"
 
         result = test_func()
@@ -122,17 +126,31 @@ class TestRateLimiter:
 
         @limiter.with_retry
         def test_func():
-            raise ValueError("Permanent error")
+            raise HTTPError(503, "Service Unavailable")
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(HTTPError) as exc_info:
             test_func()
 
-        assert "Permanent error" in str(exc_info.value)
+        assert "Service Unavailable" in str(exc_info.value)
         assert limiter.request_count == 3  # Intentó 3 veces
 
     @patch('time.sleep')
-    def test_with_retry_exponential_backoff(self, mock_sleep):
-        """Test with_retry usa exponential backoff"""
+    def test_with_retry_non_retryable_error_fails_fast(self, mock_sleep):
+        """Test with_retry no reintenta errores deterministas (404, parseo...)"""
+        limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=1)
+
+        for error in (HTTPError(404, "Trabajo no encontrado"), ValueError("Permanent error")):
+            func = Mock(side_effect=error)
+            with pytest.raises(type(error)):
+                limiter.with_retry(func)()
+            func.assert_called_once()
+
+        assert all(call[0][0] < 0.1 for call in mock_sleep.call_args_list)
+
+    @patch('src.api.retry_policy.random.uniform', side_effect=lambda low, high: high)
+    @patch('time.sleep')
+    def test_with_retry_exponential_backoff(self, mock_sleep, mock_uniform):
+        """Test with_retry usa exponential backoff (tope del jitter)"""
         limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=2)
         attempt_count = [0]
 
@@ -140,10 +158,10 @@ class TestRateLimiter:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 4:
-                raise Exception("Error")
+                raise HTTPError(500, "Error")
             return "success"
 
-        with pytest.raises(Exception):
+        with pytest.raises(HTTPError):
             test_func()
 
         # Verificar backoff: 2, 4, no sleep en último intento
@@ -177,6 +195,277 @@ class TestRateLimiter:
         result = test_func("x", "y", c="z")
         assert result == "x-y-z"
 
+    @patch('time.sleep')
+    def test_with_retry_does_not_retry_open_circuit(self, mock_sleep):
+        """Test with_retry no reintenta si el circuito está abierto"""
+        limiter = RateLimiter(delay=0.01, max_retries=3, retry_delay=2)
+        func = Mock(side_effect=CircuitOpenError("/jsearch/search", 30))
+
+        with pytest.raises(CircuitOpenError):
+            limiter.with_retry(func)()
+
+        func.assert_called_once()
+        assert all(call[0][0] < 0.1 for call in mock_sleep.call_args_list)
+
+
+class TestTokenBucket:
+    """Tests para el token bucket de RateLimiter"""
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_burst_goes_out_immediately(self, mock_time, mock_sleep):
+        """Test una ráfaga de hasta `burst` requests no espera"""
+        mock_time.return_value = 100.0
+        limiter = RateLimiter(delay=1.0, burst=3)
+
+        for _ in range(3):
+            limiter.wait()
+
+        mock_sleep.assert_not_called()
+        assert limiter.available_tokens() == 0
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_requests_beyond_burst_are_queued(self, mock_time, mock_sleep):
+        """Test los requests tras la ráfaga esperan en cola a la tasa sostenida"""
+        mock_time.return_value = 100.0
+        limiter = RateLimiter(delay=1.0, burst=2)
+
+        for _ in range(4):
+            limiter.wait()
+
+        sleeps = [call[0][0] for call in mock_sleep.call_args_list]
+        assert sleeps == [pytest.approx(1.0), pytest.approx(2.0)]
+
+    @patch('time.sleep')
+    @patch('time.time')
+    def test_tokens_refill_up_to_burst(self, mock_time, mock_sleep):
+        """Test los tokens se recuperan con el tiempo sin superar burst"""
+        mock_time.return_value = 100.0
+        limiter = RateLimiter(delay=0.5, burst=2)
+        limiter.wait()
+        limiter.wait()
+
+        mock_time.return_value = 100.5
+        assert limiter.available_tokens() == pytest.approx(1.0)
+
+        mock_time.return_value = 200.0
+        assert limiter.available_tokens() == pytest.approx(2.0)
+
+    @patch('time.sleep')
+    def test_zero_delay_disables_limit(self, mock_sleep):
+        """Test delay 0 no limita"""
+        limiter = RateLimiter(delay=0.0)
+
+        for _ in range(10):
+            limiter.wait()
+
+        mock_sleep.assert_not_called()
+        assert limiter.request_count == 10
+        assert limiter.rate == float('inf')
+
+    def test_concurrent_threads_are_spaced(self):
+        """Test threads concurrentes respetan la tasa sin perder conteos"""
+        limiter = RateLimiter(delay=0.02, burst=1)
+        times = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.wait()
+            with lock:
+                times.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.request_count == 6
+        # 6 requests con burst 1 necesitan al menos 5 intervalos
+        assert max(times) - start >= 5 * 0.02 * 0.9
+
+
+class TestAdaptiveRateLimiter:
+    """Tests para el modo adaptativo (AIMD) y los headers de cuota"""
+
+    def test_parse_retry_after(self):
+        """Test Retry-After en segundos y como fecha HTTP"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480.0) == pytest.approx(10.0)
+        assert parse_retry_after("pronto") is None
+        assert parse_retry_after(None) is None
+
+    def test_429_decreases_rate(self):
+        """Test un 429 divide la tasa"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_delay=30.0)
+
+        limiter.observe_response(429, {})
+
+        assert limiter.delay == pytest.approx(2.0)
+        assert limiter.stats()['throttled'] == 1
+
+    def test_decrease_capped_by_max_delay(self):
+        """Test la tasa no baja de 1/max_delay"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_delay=3.0)
+
+        for _ in range(5):
+            limiter.observe_response(429, {})
+
+        assert limiter.delay == 3.0
+
+    def test_sustained_success_increases_rate(self):
+        """Test tras varios éxitos la tasa sube de forma aditiva"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, min_delay=0.5, increase_step=0.5, success_threshold=3)
+
+        for _ in range(3):
+            limiter.observe_response(200, {})
+
+        assert limiter.rate == pytest.approx(1.5)
+
+        for _ in range(9):
+            limiter.observe_response(200, {})
+
+        assert limiter.delay == 0.5  # acotado por min_delay
+
+    @patch('time.sleep')
+    def test_retry_after_blocks_next_wait(self, mock_sleep):
+        """Test Retry-After retrasa la siguiente petición"""
+        limiter = RateLimiter(delay=0.01)
+
+        limiter.observe_response(429, {'retry-after': '3'})
+        limiter.wait()
+
+        assert mock_sleep.call_args[0][0] == pytest.approx(3.0, abs=0.1)
+
+    def test_non_adaptive_keeps_delay(self):
+        """Test sin modo adaptativo el delay no cambia"""
+        limiter = RateLimiter(delay=1.0)
+
+        limiter.observe_response(429, {'retry-after': '2'})
+
+        assert limiter.delay == 1.0
+        assert limiter.stats()['blocked_for'] > 1.0
+
+    def test_quota_headers_pace_requests(self):
+        """Test la cuota restante se reparte hasta el reset"""
+        limiter = RateLimiter(delay=0.5, adaptive=True, max_delay=30.0)
+
+        limiter.observe_response(200, {
+            'x-ratelimit-limit': '100',
+            'x-ratelimit-remaining': '10',
+            'x-ratelimit-reset': '20'
+        })
+
+        stats = limiter.stats()
+        assert limiter.delay == pytest.approx(2.0)
+        assert stats['quota_limit'] == 100
+        assert stats['quota_remaining'] == 10
+        assert stats['quota_reset_in'] == pytest.approx(20.0, abs=0.5)
+
+    @patch('src.api.rate_limiter.time.time')
+    def test_exhausted_quota_blocks_until_reset(self, mock_time):
+        """Test con la cuota agotada se espera al reset (timestamp absoluto)"""
+        mock_time.return_value = 1_700_000_000.0
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_delay=30.0)
+
+        limiter.observe_response(200, {
+            'x-ratelimit-requests-remaining': '0',
+            'x-ratelimit-requests-reset': '1700000015'
+        })
+
+        assert limiter.stats()['blocked_for'] == pytest.approx(15.0)
+
+    def test_monthly_quota_not_paced(self):
+        """Test una cuota mensual de RapidAPI no frena las peticiones"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_delay=30.0)
+
+        limiter.observe_response(200, {
+            'x-ratelimit-requests-limit': '10000',
+            'x-ratelimit-requests-remaining': '5000',
+            'x-ratelimit-requests-reset': '1500000'
+        })
+
+        assert limiter.delay == 1.0
+        assert limiter.stats()['quota_remaining'] == 5000
+
+    def test_long_quota_window_not_blocked(self):
+        """Test una cuota que se reinicia en días no bloquea el proceso"""
+        limiter = RateLimiter(delay=1.0, adaptive=True, max_delay=30.0)
+
+        limiter.observe_response(200, {'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '86400'})
+
+        assert limiter.stats()['blocked_for'] == 0.0
+
+
+class TestAsyncRateLimiter:
+    """Tests para AsyncRateLimiter"""
+
+    def test_concurrent_waits_are_spaced(self):
+        """Test esperas concurrentes salen espaciadas por el delay"""
+        limiter = AsyncRateLimiter(delay=0.05)
+
+        async def scenario():
+            async def timed_wait():
+                await limiter.wait()
+                return time.monotonic()
+
+            return await asyncio.gather(*(timed_wait() for _ in range(3)))
+
+        times = sorted(asyncio.run(scenario()))
+
+        assert limiter.request_count == 3
+        assert times[1] - times[0] >= 0.04
+        assert times[2] - times[1] >= 0.04
+
+    @patch('src.api.retry_policy.random.uniform', side_effect=lambda low, high: high)
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_with_retry_success_after_retries(self, mock_sleep, mock_uniform):
+        """Test with_retry asíncrono reintenta con backoff exponencial"""
+        limiter = AsyncRateLimiter(delay=0.0, max_retries=3, retry_delay=2)
+        attempts = [0]
+
+        @limiter.with_retry
+        async def flaky():
+            attempts[0] += 1
+            if attempts[0] < 3:
+                raise TimeoutError("Temporary error")
+            return "success"
+
+        assert asyncio.run(flaky()) == "success"
+        backoffs = [call[0][0] for call in mock_sleep.call_args_list]
+        assert backoffs == [2, 4]
+
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_with_retry_all_attempts_fail(self, mock_sleep):
+        """Test with_retry asíncrono propaga el último error"""
+        limiter = AsyncRateLimiter(delay=0.0, max_retries=2)
+
+        @limiter.with_retry
+        async def failing():
+            raise HTTPError(502, "Bad Gateway")
+
+        with pytest.raises(HTTPError):
+            asyncio.run(failing())
+
+        assert limiter.request_count == 2
+
+    @patch('src.api.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+    def test_with_retry_non_retryable_error(self, mock_sleep):
+        """Test with_retry asíncrono no reintenta un 400"""
+        limiter = AsyncRateLimiter(delay=0.0, max_retries=3)
+
+        @limiter.with_retry
+        async def failing():
+            raise HTTPError(400, "Bad Request")
+
+        with pytest.raises(HTTPError):
+            asyncio.run(failing())
+
+        assert limiter.request_count == 1
+        mock_sleep.assert_not_called()
+
 
 class TestRetryOnHttpError:
     """Tests para retry_on_http_error decorator"""
@@ -201,7 +490,7 @@ class TestRetryOnHttpError:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 3:
-                raise Exception("HTTP 429 Rate limit")
+                raise HTTPError(429, "Rate limit")
             return "success"
 
         result = test_func()
@@ -217,7 +506,7 @@ class TestRetryOnHttpError:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 2:
-                raise Exception("Connection timeout")
+                raise TimeoutError("Connection timeout")
             return "success"
 
         result = test_func()
@@ -241,7 +530,7 @@ class TestRetryOnHttpError:
         """Test decorator alcanza máximo de reintentos"""
         @retry_on_http_error(max_retries=3, retry_delay=1)
         def test_func():
-            raise Exception("429 rate limit")
+            raise HTTPError(429, "rate limit")
 
         with pytest.raises(Exception) as exc_info:
             test_func()
@@ -250,16 +539,17 @@ class TestRetryOnHttpError:
         # Debería haber dormido 2 veces (entre 3 intentos: intento1->sleep->intento2->sleep->intento3)
         assert mock_sleep.call_count == 2
 
+    @patch('src.api.retry_policy.random.uniform', side_effect=lambda low, high: high)
     @patch('time.sleep')
-    def test_retry_on_http_error_incremental_delay(self, mock_sleep):
-        """Test decorator usa delay incremental"""
+    def test_retry_on_http_error_incremental_delay(self, mock_sleep, mock_uniform):
+        """Test decorator usa delay exponencial (tope del jitter)"""
         attempt_count = [0]
 
         @retry_on_http_error(max_retries=3, retry_delay=2)
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 4:
-                raise Exception("Connection error")
+                raise ConnectionError("Connection error")
             return "success"
 
         with pytest.raises(Exception):
@@ -298,7 +588,7 @@ class TestRetryOnHttpError:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 2:
-                raise Exception("Connection refused")
+                raise ConnectionRefusedError("Connection refused")
             return "success"
 
         result = test_func()
@@ -313,7 +603,7 @@ class TestRetryOnHttpError:
         def test_func():
             attempt_count[0] += 1
             if attempt_count[0] < 2:
-                raise Exception("Temporary failure")
+                raise HTTPError(503, "Temporary failure")
             return "success"
 
         result = test_func()
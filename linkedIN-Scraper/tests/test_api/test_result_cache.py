@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_result_cache.py
+Descripción: Tests para ResultCache, NegativeCache y su uso en JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPError
+from src.api.result_cache import DEFAULT_TTLS, NegativeCache, ResultCache
+from src.models.search_params import SearchParameters
+
+JOBS = [{"job_id": "1"}]
+
+
+class TestResultCache:
+    """Tests para ResultCache"""
+
+    def test_hit_returns_copy(self):
+        """Test un acierto devuelve el resultado sin compartir el objeto guardado"""
+        cache = ResultCache()
+        jobs = [{"job_id": "1"}]
+        cache.put("k", jobs, ttl=60)
+
+        first = cache.get("k")
+        first[0]["job_id"] = "changed"
+
+        assert cache.get("k") == [{"job_id": "1"}]
+        assert cache.stats()['hits'] == 2
+
+    def test_miss(self):
+        """Test una clave desconocida cuenta como fallo"""
+        cache = ResultCache()
+
+        assert cache.get("k") is None
+        assert cache.stats()['misses'] == 1
+
+    def test_expired_entry_removed(self):
+        """Test una entrada caducada no se sirve y libera su espacio"""
+        cache = ResultCache()
+        with patch('src.api.result_cache.time.monotonic', return_value=100.0):
+            cache.put("k", [1, 2, 3], ttl=10)
+        with patch('src.api.result_cache.time.monotonic', return_value=110.0):
+            assert cache.get("k") is None
+
+        stats = cache.stats()
+        assert stats['expired'] == 1
+        assert stats['entries'] == 0
+        assert stats['bytes'] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        """Test al superar max_bytes se expulsa la entrada menos usada"""
+        cache = ResultCache(max_bytes=25)
+        cache.put("a", "x" * 8, ttl=60)   # 10 bytes serializado
+        cache.put("b", "y" * 8, ttl=60)
+        cache.get("a")
+        cache.put("c", "z" * 8, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 8
+        assert cache.get("c") == "z" * 8
+        assert cache.stats()['evicted'] == 1
+        assert cache.stats()['bytes'] == 20
+
+    def test_oversized_result_not_stored(self):
+        """Test un resultado mayor que la caché no expulsa al resto"""
+        cache = ResultCache(max_bytes=20)
+        cache.put("a", "x" * 8, ttl=60)
+        cache.put("big", "y" * 100, ttl=60)
+
+        assert cache.get("big") is None
+        assert cache.get("a") == "x" * 8
+        assert cache.stats()['oversized'] == 1
+
+    def test_replace_updates_size(self):
+        """Test guardar de nuevo una clave no duplica su tamaño"""
+        cache = ResultCache()
+        cache.put("k", "x" * 8, ttl=60)
+        cache.put("k", "x" * 18, ttl=60)
+
+        assert cache.stats()['bytes'] == 20
+        assert cache.stats()['entries'] == 1
+
+    def test_make_key_ignores_param_order(self):
+        """Test la clave no depende del orden de los parámetros"""
+        assert ResultCache.make_key("/s", {"a": 1, "b": 2}) == ResultCache.make_key("/s", {"b": 2, "a": 1})
+        assert ResultCache.make_key("/s", {"a": 1}) != ResultCache.make_key("/s", {"a": 2})
+
+    def test_ttl_by_date_posted(self):
+        """Test las búsquedas de hoy caducan antes que las del mes"""
+        cache = ResultCache(ttls={'today': 5.0})
+
+        assert cache.ttl_for("today") == 5.0
+        assert cache.ttl_for("month") == DEFAULT_TTLS['month']
+        assert cache.ttl_for("today") < cache.ttl_for("week") < cache.ttl_for("month")
+        assert cache.ttl_for("unknown") == DEFAULT_TTLS['all']
+
+    def test_invalidate_and_clear(self):
+        """Test invalidar una clave y vaciar la caché"""
+        cache = ResultCache()
+        cache.put("a", [1], ttl=60)
+        cache.put("b", [2], ttl=60)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.stats()['entries'] == 0
+        assert cache.stats()['bytes'] == 0
+
+    def test_concurrent_access(self):
+        """Test accesos concurrentes mantienen la contabilidad de bytes"""
+        cache = ResultCache(max_bytes=500)
+
+        def worker(n):
+            for i in range(200):
+                cache.put(f"k{(n * i) % 40}", [n, i], ttl=60)
+                cache.get(f"k{i % 40}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert 0 < stats['bytes'] <= 500
+        assert stats['bytes'] == sum(len(entry.data) for entry in cache._entries.values())
+
+
+class TestNegativeCache:
+    """Tests para NegativeCache"""
+
+    def test_remembers_key(self):
+        """Test una clave negativa se recuerda"""
+        cache = NegativeCache(ttl=60)
+        cache.add("k")
+
+        assert cache.contains("k") is True
+        assert cache.contains("other") is False
+        assert cache.stats()['hits'] == 1
+
+    def test_expires(self):
+        """Test una clave negativa se olvida tras el TTL"""
+        cache = NegativeCache(ttl=10)
+        with patch('src.api.result_cache.time.monotonic', return_value=100.0):
+            cache.add("k")
+        with patch('src.api.result_cache.time.monotonic', return_value=110.0):
+            assert cache.contains("k") is False
+
+        assert cache.stats()['expired'] == 1
+        assert cache.stats()['entries'] == 0
+
+    def test_lru_eviction(self):
+        """Test al superar max_entries se olvida la menos consultada"""
+        cache = NegativeCache(ttl=60, max_entries=2)
+        cache.add("a")
+        cache.add("b")
+        cache.contains("a")
+        cache.add("c")
+
+        assert cache.contains("b") is False
+        assert cache.contains("a") is True
+        assert cache.stats()['evicted'] == 1
+
+    def test_discard_and_clear(self):
+        """Test olvidar una clave y todas"""
+        cache = NegativeCache(ttl=60)
+        cache.add("a")
+        cache.add("b")
+
+        cache.discard("a")
+        assert cache.contains("a") is False
+        cache.clear()
+        assert cache.stats()['entries'] == 0
+
+
+class TestJSearchClientNegativeCache:
+    """Tests para la caché negativa de JSearchClient"""
+
+    def test_missing_job_not_requested_again(self, make_jsearch_client):
+        """Test un trabajo no encontrado se responde con 404 sin petición"""
+        client = make_jsearch_client([])
+
+        for _ in range(3):
+            with pytest.raises(HTTPError) as exc_info:
+                client.get_job_details("expired", country="US")
+            assert exc_info.value.status_code == 404
+
+        assert client.client.get.call_count == 1
+        assert client.get_stats()['negative_cache']['hits'] == 2
+
+    def test_api_404_remembered(self, make_jsearch_client):
+        """Test un 404 de la API también se recuerda"""
+        client = make_jsearch_client([])
+        client.client.get.side_effect = HTTPError(404, "Not found")
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get_job_details("expired")
+
+        assert client.client.get.call_count == 1
+
+    def test_other_errors_not_remembered(self, make_jsearch_client):
+        """Test los errores que no son 404 se vuelven a pedir"""
+        client = make_jsearch_client([])
+        client.client.get.side_effect = HTTPError(400, "Bad request")
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get_job_details("abc")
+
+        assert client.client.get.call_count == 2
+
+    def test_batch_skips_known_missing(self, make_jsearch_client):
+        """Test el lote no vuelve a pedir IDs no encontrados y mantiene el orden"""
+        client = make_jsearch_client([{"job_id": "a"}])
+
+        client.get_job_details_batch(["a", "dead"])
+        results = client.get_job_details_batch(["dead", "a"])
+
+        assert client.client.get.call_args[0][1]['job_id'] == "a"
+        assert list(results) == ["dead", "a"]
+        assert results["dead"].status_code == 404
+        assert client.get_job_details_batch(["dead"])["dead"].status_code == 404
+        assert client.client.get.call_count == 2
+
+    def test_single_and_batch_share_entries(self, make_jsearch_client):
+        """Test un ID no encontrado en el lote tampoco se pide por separado"""
+        client = make_jsearch_client([])
+        client.get_job_details_batch(["dead"])
+
+        with pytest.raises(HTTPError):
+            client.get_job_details("dead")
+
+        assert client.client.get.call_count == 1
+
+    def test_empty_search_not_repeated(self, make_jsearch_client):
+        """Test una búsqueda sin resultados no se repite durante el TTL"""
+        client = make_jsearch_client([])
+
+        assert client.search_jobs(SearchParameters(query="cobol")) == []
+        assert client.search_jobs(SearchParameters(query="cobol")) == []
+
+        assert client.client.get.call_count == 1
+
+    def test_disabled(self, make_jsearch_client):
+        """Test NEGATIVE_CACHE_TTL=0 desactiva la caché negativa"""
+        client = make_jsearch_client([], negative_cache_ttl=0)
+
+        client.search_jobs(SearchParameters(query="cobol"))
+        client.search_jobs(SearchParameters(query="cobol"))
+
+        assert client.negative_cache is None
+        assert client.get_stats()['negative_cache'] is None
+        assert client.client.get.call_count == 2
+
+
+class TestJSearchClientResultCache:
+    """Tests para la caché de búsquedas de JSearchClient"""
+
+    def test_repeated_search_served_from_cache(self, make_jsearch_client):
+        """Test una búsqueda repetida no vuelve a la API"""
+        client = make_jsearch_client(JOBS)
+
+        first = client.search_jobs(SearchParameters(query="python"))
+        second = client.search_jobs(SearchParameters(query="python"))
+
+        assert first == second == [{"job_id": "1"}]
+        assert client.client.get.call_count == 1
+        assert client.get_stats()['result_cache']['hits'] == 1
+
+    def test_different_params_not_shared(self, make_jsearch_client):
+        """Test parámetros distintos son entradas distintas"""
+        client = make_jsearch_client(JOBS)
+
+        client.search_jobs(SearchParameters(query="python"))
+        client.search_jobs(SearchParameters(query="python", country="es"))
+
+        assert client.client.get.call_count == 2
+
+    def test_ttl_from_config(self, make_jsearch_client):
+        """Test el TTL sale de la configuración según date_posted"""
+        client = make_jsearch_client(JOBS, result_cache_ttl_today=10.0, result_cache_ttl_month=600.0)
+
+        assert client.result_cache.ttl_for("today") == 10.0
+        assert client.result_cache.ttl_for("all") == 600.0
+
+    def test_empty_result_not_stored(self, make_jsearch_client):
+        """Test un resultado vacío no ocupa la caché de resultados"""
+        client = make_jsearch_client(JOBS, negative_cache_ttl=0)
+        client.client.get.return_value = {"data": []}
+
+        client.search_jobs(SearchParameters(query="python"))
+        client.search_jobs(SearchParameters(query="python"))
+
+        assert client.client.get.call_count == 2
+        assert client.get_stats()['result_cache']['entries'] == 0
+
+    def test_partial_fanout_not_cached(self, make_jsearch_client):
+        """Test una búsqueda con páginas fallidas no se guarda"""
+        client = make_jsearch_client(JOBS, page_fanout=True, circuit_breaker_enabled=False, max_retries=1)
+
+        def fake_get(endpoint, params):
+            if params['page'] == "2":
+                raise ConnectionError("reset")
+            return {"data": [{"job_id": params['page']}]}
+
+        client.client.get = Mock(side_effect=fake_get)
+        client.rate_limiter.retry_policy.max_attempts = 1
+
+        client.search_jobs(SearchParameters(query="python", num_pages=2))
+
+        assert client.get_stats()['result_cache']['entries'] == 0
+
+    def test_iter_search_pages_uses_cache(self, make_jsearch_client):
+        """Test las páginas ya vistas se sirven desde la caché"""
+        client = make_jsearch_client(JOBS)
+        client.client.get = Mock(side_effect=lambda endpoint, params: {
+            "data": [{"job_id": params['page']}] if params['page'] == "1" else []
+        })
+
+        list(client.iter_search_pages(SearchParameters(query="python")))
+        list(client.iter_search_pages(SearchParameters(query="python")))
+
+        pages = [call.args[1]['page'] for call in client.client.get.call_args_list]
+        assert pages.count("1") == 1
+
+    def test_disabled(self, make_jsearch_client):
+        """Test RESULT_CACHE_BYTES=0 desactiva la caché"""
+        client = make_jsearch_client(JOBS, result_cache_bytes=0)
+
+        client.search_jobs(SearchParameters(query="python"))
+        client.search_jobs(SearchParameters(query="python"))
+
+        assert client.result_cache is None
+        assert client.get_stats()['result_cache'] is None
+        assert client.client.get.call_count == 2
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_retry_policy.py
+Descripción: Tests para RetryPolicy, RetryBudget y la clasificación de errores
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import http.client
+import json
+import socket
+import ssl
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.api.circuit_breaker import CircuitOpenError
+from src.api.client import HTTPError
+from src.api.retry_policy import RetryBudget, RetryPolicy, build_retry_policy, is_retryable
+from src.utils.config import Config
+
+
+class TestIsRetryable:
+    """Tests para la clasificación de errores"""
+
+    @pytest.mark.parametrize("status", [408, 429, 500, 502, 503, 504])
+    def test_transient_status_codes(self, status):
+        """Test los status transitorios se reintentan"""
+        assert is_retryable(HTTPError(status, "error")) is True
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422])
+    def test_client_errors_not_retried(self, status):
+        """Test los 4xx deterministas no se reintentan"""
+        assert is_retryable(HTTPError(status, "error")) is False
+
+    def test_network_errors(self):
+        """Test errores de red y timeouts se reintentan"""
+        assert is_retryable(ConnectionResetError()) is True
+        assert is_retryable(TimeoutError()) is True
+        assert is_retryable(asyncio.TimeoutError()) is True
+        assert is_retryable(http.client.RemoteDisconnected()) is True
+        assert is_retryable(http.client.IncompleteRead(b"")) is True
+        assert is_retryable(socket.gaierror(-3, "Temporary failure in name resolution")) is True
+        assert is_retryable(asyncio.IncompleteReadError(b"", None)) is True
+
+    def test_permanent_os_errors_not_retried(self):
+        """Test los OSError que no son de red no se reintentan"""
+        assert is_retryable(ssl.SSLCertVerificationError("certificate verify failed")) is False
+        assert is_retryable(PermissionError()) is False
+        assert is_retryable(FileNotFoundError()) is False
+
+    def test_other_errors_not_retried(self):
+        """Test errores de parseo o de programación no se reintentan"""
+        assert is_retryable(json.JSONDecodeError("bad", "", 0)) is False
+        assert is_retryable(KeyError("data")) is False
+        assert is_retryable(CircuitOpenError("/jsearch/search", 30)) is False
+
+    def test_custom_statuses(self):
+        """Test conjunto de status configurable"""
+        assert is_retryable(HTTPError(409, "conflict"), frozenset({409})) is True
+
+
+class TestRetryBudget:
+    """Tests para RetryBudget"""
+
+    def test_min_retries_without_traffic(self):
+        """Test se permiten min_retries aunque no haya peticiones"""
+        budget = RetryBudget(ratio=0.1, min_retries=2)
+
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+    def test_ratio_of_requests(self):
+        """Test el presupuesto crece con las peticiones"""
+        budget = RetryBudget(ratio=0.1, min_retries=0)
+        for _ in range(30):
+            budget.record_request()
+
+        allowed = sum(budget.try_acquire() for _ in range(10))
+
+        assert allowed == 3
+        assert budget.stats() == {'requests': 30, 'retries': 3, 'allowed': pytest.approx(3.0)}
+
+    @patch('src.api.retry_policy.time.monotonic')
+    def test_window_expires(self, mock_monotonic):
+        """Test los reintentos antiguos salen de la ventana"""
+        mock_monotonic.return_value = 100.0
+        budget = RetryBudget(ratio=0.0, min_retries=1, window=60.0)
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+        mock_monotonic.return_value = 161.0
+
+        assert budget.try_acquire() is True
+
+
+class TestRetryPolicy:
+    """Tests para RetryPolicy"""
+
+    @patch('src.api.retry_policy.random.uniform', side_effect=lambda low, high: high)
+    def test_backoff_exponential_and_capped(self, mock_uniform):
+        """Test el tope del backoff se dobla y se acota a max_delay"""
+        policy = RetryPolicy(base_delay=2, max_delay=10)
+
+        assert [policy.backoff(attempt) for attempt in range(4)] == [2, 4, 8, 10]
+
+    def test_backoff_full_jitter_range(self):
+        """Test el backoff es aleatorio entre 0 y el tope"""
+        policy = RetryPolicy(base_delay=1, max_delay=30)
+
+        delays = [policy.backoff(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 8 for delay in delays)
+        assert len(set(delays)) > 1
+
+    @patch('time.sleep')
+    def test_retries_transient_error(self, mock_sleep):
+        """Test un error transitorio se reintenta hasta tener éxito"""
+        policy = RetryPolicy(max_attempts=3)
+        func = Mock(side_effect=[HTTPError(503, "down"), "ok"])
+        before = Mock()
+
+        assert policy.call(func, before_attempt=before) == "ok"
+        assert func.call_count == 2
+        assert before.call_count == 2
+        assert policy.stats()['retries'] == 1
+
+    @patch('time.sleep')
+    def test_non_retryable_raises_immediately(self, mock_sleep):
+        """Test un 404 se propaga sin reintentos ni esperas"""
+        policy = RetryPolicy(max_attempts=3)
+        func = Mock(side_effect=HTTPError(404, "Trabajo no encontrado"))
+
+        with pytest.raises(HTTPError):
+            policy.call(func)
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert policy.stats()['non_retryable'] == 1
+
+    @patch('time.sleep')
+    def test_certificate_error_not_retried(self, mock_sleep):
+        """Test un certificado inválido falla sin reintentos ni esperas"""
+        policy = RetryPolicy(max_attempts=3, budget=RetryBudget())
+        func = Mock(side_effect=ssl.SSLCertVerificationError("certificate verify failed"))
+
+        with pytest.raises(ssl.SSLCertVerificationError):
+            policy.call(func)
+
+        func.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert policy.budget.stats()['retries'] == 0
+
+    @patch('time.sleep')
+    def test_budget_stops_retry_storm(self, mock_sleep):
+        """Test con la API caída los reintentos se limitan al presupuesto"""
+        policy = RetryPolicy(max_attempts=3, budget=RetryBudget(ratio=0.1, min_retries=0))
+        func = Mock(side_effect=HTTPError(503, "down"))
+
+        for _ in range(50):
+            with pytest.raises(HTTPError):
+                policy.call(func)
+
+        # 50 peticiones originales y como mucho ~10% de reintentos
+        assert func.call_count <= 55
+        stats = policy.stats()
+        assert stats['retries'] <= 5
+        assert stats['budget_exhausted'] > 0
+
+    def test_zero_attempts(self):
+        """Test sin intentos la política no se puede construir"""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+
+    @patch('src.api.retry_policy.asyncio.sleep', new_callable=AsyncMock)
+    def test_call_async(self, mock_sleep):
+        """Test versión asíncrona"""
+        policy = RetryPolicy(max_attempts=3)
+        attempts = [0]
+
+        async def flaky():
+            attempts[0] += 1
+            if attempts[0] == 1:
+                raise ConnectionResetError()
+            return "ok"
+
+        assert asyncio.run(policy.call_async(flaky)) == "ok"
+        assert attempts[0] == 2
+        mock_sleep.assert_awaited_once()
+
+    def test_build_from_config(self):
+        """Test la política se construye desde Config"""
+        config = Config(api_key="test_key", max_retries=4, retry_delay=1, retry_max_delay=5, retry_budget_ratio=0.2)
+
+        policy = build_retry_policy(config)
+
+        assert policy.max_attempts == 4
+        assert policy.base_delay == 1
+        assert policy.max_delay == 5
+        assert policy.budget.ratio == 0.2
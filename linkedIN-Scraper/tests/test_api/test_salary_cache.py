@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_salary_cache.py
+Descripción: Tests para SalaryCache y la caché de salarios de JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+from unittest.mock import patch
+from src.api.salary_cache import DAY, SalaryCache, normalize_value
+
+ENDPOINT = "/jsearch/estimated-salary"
+SALARIES = [{"median_salary": 50000}]
+
+
+class TestSalaryCache:
+    """Tests para SalaryCache"""
+
+    def test_roundtrip(self, tmp_path):
+        """Test un resultado guardado se recupera"""
+        cache = SalaryCache(tmp_path / "salary.sqlite3")
+        cache.put("k", [{"median_salary": 50000}])
+
+        assert cache.get("k") == [{"median_salary": 50000}]
+        assert cache.stats()['hits'] == 1
+
+    def test_miss(self, tmp_path):
+        """Test una clave desconocida cuenta como fallo"""
+        cache = SalaryCache(tmp_path / "salary.sqlite3")
+
+        assert cache.get("k") is None
+        assert cache.stats()['misses'] == 1
+
+    def test_survives_restart(self, tmp_path):
+        """Test otra instancia sobre el mismo fichero ve los resultados"""
+        path = tmp_path / "salary.sqlite3"
+        SalaryCache(path).put("k", [1, 2])
+
+        assert SalaryCache(path).get("k") == [1, 2]
+
+    def test_expired_entry_removed(self, tmp_path):
+        """Test un resultado caducado no se sirve y se borra"""
+        cache = SalaryCache(tmp_path / "salary.sqlite3", ttl=DAY)
+        with patch('src.api.salary_cache.time.time', return_value=1000.0):
+            cache.put("k", [1])
+        with patch('src.api.salary_cache.time.time', return_value=1000.0 + DAY):
+            assert cache.get("k") is None
+
+        stats = cache.stats()
+        assert stats['expired'] == 1
+        assert stats['entries'] == 0
+
+    def test_purge_expired(self, tmp_path):
+        """Test purge_expired borra solo los caducados"""
+        cache = SalaryCache(tmp_path / "salary.sqlite3")
+        cache.put("old", [1], ttl=-1)
+        cache.put("new", [2])
+
+        assert cache.purge_expired() == 1
+        assert cache.get("new") == [2]
+
+    def test_key_normalized(self):
+        """Test mayúsculas, espacios y orden no cambian la clave"""
+        first = SalaryCache.make_key(ENDPOINT, {'job_title': "Data  Engineer", 'location': "Madrid, Spain"})
+        second = SalaryCache.make_key(ENDPOINT, {'location': " madrid, spain", 'job_title': "data engineer"})
+
+        assert first == second
+        assert first != SalaryCache.make_key("/jsearch/company-job-salary", {'job_title': "data engineer"})
+
+    def test_key_ignores_none(self):
+        """Test los parámetros sin valor no forman parte de la clave"""
+        assert SalaryCache.make_key(ENDPOINT, {'a': "x", 'b': None}) == SalaryCache.make_key(ENDPOINT, {'a': "x"})
+
+    def test_normalize_value(self):
+        """Test normalización de valores"""
+        assert normalize_value("  Madrid,   Spain ") == "madrid, spain"
+        assert normalize_value(5) == "5"
+
+    def test_clear(self, tmp_path):
+        """Test clear borra todo"""
+        cache = SalaryCache(tmp_path / "salary.sqlite3")
+        cache.put("k", [1])
+
+        cache.clear()
+
+        assert cache.stats()['entries'] == 0
+
+    def test_unwritable_path_behaves_as_empty(self, tmp_path):
+        """Test un fichero inaccesible no rompe las consultas"""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        cache = SalaryCache(blocker / "salary.sqlite3")
+
+        cache.put("k", [1])
+        assert cache.get("k") is None
+        assert cache.purge_expired() == 0
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats['entries'] is None
+        assert stats['errors'] == 2
+
+    def test_corrupt_file_behaves_as_empty(self, tmp_path):
+        """Test un fichero corrupto se trata como caché vacía"""
+        path = tmp_path / "salary.sqlite3"
+        path.write_bytes(b"esto no es una base de datos" * 100)
+        cache = SalaryCache(path)
+
+        assert cache.get("k") is None
+        cache.put("k", [1])
+        assert cache.stats()['entries'] is None
+
+
+class TestJSearchClientSalaryCache:
+    """Tests para la caché de salarios de JSearchClient"""
+
+    def test_repeated_lookup_served_from_disk(self, make_jsearch_client):
+        """Test una consulta repetida, aunque cambien mayúsculas, no vuelve a la API"""
+        client = make_jsearch_client(SALARIES)
+
+        client.get_estimated_salary("Developer", "Madrid")
+        result = client.get_estimated_salary("developer", " MADRID ")
+
+        assert result == [{"median_salary": 50000}]
+        assert client.client.get.call_count == 1
+        assert client.get_stats()['salary_cache']['hits'] == 1
+
+    def test_shared_between_clients(self, make_jsearch_client):
+        """Test otro proceso con el mismo fichero aprovecha la consulta"""
+        make_jsearch_client(SALARIES).get_company_salary("Acme", "Developer", "Madrid")
+        other = make_jsearch_client(SALARIES)
+
+        other.get_company_salary("Acme", "Developer", "Madrid")
+
+        other.client.get.assert_not_called()
+
+    def test_company_is_part_of_key(self, make_jsearch_client):
+        """Test empresas distintas no comparten resultado"""
+        client = make_jsearch_client(SALARIES)
+
+        client.get_company_salary("Acme", "Developer")
+        client.get_company_salary("Globex", "Developer")
+
+        assert client.client.get.call_count == 2
+
+    def test_ttl_from_config(self, make_jsearch_client):
+        """Test el TTL se configura en días"""
+        client = make_jsearch_client(SALARIES, salary_cache_ttl_days=30)
+
+        assert client.salary_cache.ttl == 30 * DAY
+
+    def test_empty_result_not_cached(self, make_jsearch_client):
+        """Test un resultado vacío no se guarda"""
+        client = make_jsearch_client(SALARIES)
+        client.client.get.return_value = {"data": []}
+
+        client.get_estimated_salary("Developer", "Madrid")
+        client.get_estimated_salary("Developer", "Madrid")
+
+        assert client.client.get.call_count == 2
+
+    def test_broken_cache_keeps_upstream_result(self, make_jsearch_client, tmp_path):
+        """Test si la caché falla se devuelve el resultado de la API"""
+        client = make_jsearch_client(SALARIES)
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        client.salary_cache.path = blocker / "salary.sqlite3"
+
+        assert client.get_estimated_salary("Developer", "Madrid") == [{"median_salary": 50000}]
+        assert client.get_stats()['salary_cache']['entries'] is None
+
+    def test_disabled(self, make_jsearch_client):
+        """Test SALARY_CACHE_ENABLED=false consulta siempre la API"""
+        client = make_jsearch_client(SALARIES, salary_cache_enabled=False)
+
+        client.get_estimated_salary("Developer", "Madrid")
+        client.get_estimated_salary("Developer", "Madrid")
+
+        assert client.salary_cache is None
+        assert client.get_stats()['salary_cache'] is None
+        assert client.client.get.call_count == 2
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_scheduler.py
+Descripción: Tests para RequestScheduler y su uso desde RateLimiter y JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from src.api.jsearch_client import JSearchClient
+from src.api.rate_limiter import RateLimiter
+from src.api.scheduler import DEFAULT_WEIGHTS, RequestScheduler
+from src.api.usage_budget import BATCH, ENRICHMENT, INTERACTIVE, usage_scope
+from src.utils.config import Config
+
+
+def _backlog(scheduler, requests):
+    """
+    Encola `requests` [(nombre, prioridad)] mientras otra petición ocupa el
+    turno y devuelve el orden en que se atienden
+    """
+    order = []
+    release = threading.Event()
+    holding = threading.Event()
+
+    def hold():
+        holding.set()
+        release.wait(5)
+
+    holder = threading.Thread(target=scheduler.run, args=(hold, BATCH))
+    holder.start()
+    holding.wait(5)
+
+    threads = []
+    for name, priority in requests:
+        thread = threading.Thread(target=scheduler.run, args=(lambda name=name: order.append(name), priority))
+        thread.start()
+        threads.append(thread)
+        # Espera a que la petición esté en cola para fijar el orden de llegada
+        deadline = time.monotonic() + 5
+        while sum(s['queued'] for s in scheduler.stats().values()) < len(threads) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    release.set()
+    holder.join(5)
+    for thread in threads:
+        thread.join(5)
+    return order
+
+
+class TestRequestScheduler:
+    """Tests para RequestScheduler"""
+
+    def test_runs_gate_and_returns_result(self):
+        """Test sin cola la petición se atiende al momento"""
+        scheduler = RequestScheduler()
+
+        assert scheduler.run(lambda: 42) == 42
+        assert scheduler.stats()[INTERACTIVE]['dispatched'] == 1
+
+    def test_interactive_goes_before_queued_batch(self):
+        """Test una búsqueda interactiva no espera detrás del lote"""
+        scheduler = RequestScheduler()
+
+        order = _backlog(scheduler, [("b1", BATCH), ("b2", BATCH), ("b3", BATCH), ("i1", INTERACTIVE)])
+
+        assert order[0] == "i1"
+        assert order[1:] == ["b1", "b2", "b3"]
+
+    def test_weighted_share_when_backlogged(self):
+        """Test con todas las clases en cola los turnos siguen los pesos"""
+        scheduler = RequestScheduler(weights={INTERACTIVE: 3, BATCH: 1})
+        requests = [(f"b{i}", BATCH) for i in range(4)] + [(f"i{i}", INTERACTIVE) for i in range(6)]
+
+        order = _backlog(scheduler, requests)
+
+        # Contando el turno del lote que ya estaba en curso, 3 interactivos por cada uno del lote
+        assert [name[0] for name in order[:8]].count("b") == 2
+        assert len(order) == 10
+
+    def test_aging_prevents_starvation(self):
+        """Test una petición que supera max_wait pasa delante"""
+        scheduler = RequestScheduler(max_wait=10.0)
+        clock = [100.0]
+
+        with patch('src.api.scheduler.time.monotonic', side_effect=lambda: clock[0]):
+            scheduler._queues[BATCH].append(Mock(priority=BATCH, seq=0, enqueued_at=80.0))
+            scheduler._queues[INTERACTIVE].append(Mock(priority=INTERACTIVE, seq=1, enqueued_at=99.0))
+
+            ticket = scheduler._select(clock[0])
+
+        assert ticket.priority == BATCH
+
+    def test_aged_requests_counted(self):
+        """Test las estadísticas cuentan las peticiones envejecidas"""
+        scheduler = RequestScheduler(max_wait=1.0)
+        clock = iter([0.0])
+
+        with patch('src.api.scheduler.time.monotonic', side_effect=lambda: next(clock, 5.0)):
+            scheduler.run(lambda: None, BATCH)
+
+        stats = scheduler.stats()[BATCH]
+        assert stats['aged'] == 1
+        assert stats['max_wait'] == 5.0
+
+    def test_priority_from_usage_scope(self):
+        """Test sin prioridad explícita se usa la del usage_scope"""
+        scheduler = RequestScheduler()
+
+        with usage_scope("enricher", ENRICHMENT):
+            scheduler.run(lambda: None)
+
+        assert scheduler.stats()[ENRICHMENT]['dispatched'] == 1
+
+    def test_unknown_priority_uses_default(self):
+        """Test una prioridad desconocida cae en la clase por defecto"""
+        scheduler = RequestScheduler(default_priority=BATCH)
+
+        scheduler.run(lambda: None, "crawl")
+
+        assert scheduler.stats()[BATCH]['dispatched'] == 1
+
+    def test_gate_error_releases_turn(self):
+        """Test un error en la espera no bloquea a las siguientes peticiones"""
+        scheduler = RequestScheduler()
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(Mock(side_effect=RuntimeError("fallo")))
+
+        assert scheduler.run(lambda: "ok") == "ok"
+
+    def test_invalid_weights(self):
+        """Test pesos no válidos"""
+        with pytest.raises(ValueError):
+            RequestScheduler(weights={INTERACTIVE: 0, BATCH: 1})
+        with pytest.raises(ValueError):
+            RequestScheduler(weights={"crawl": 1})
+
+    def test_invalid_default_priority(self):
+        """Test prioridad por defecto sin peso"""
+        with pytest.raises(ValueError):
+            RequestScheduler(weights={INTERACTIVE: 1}, default_priority=BATCH)
+
+    def test_stats(self):
+        """Test estadísticas por clase"""
+        stats = RequestScheduler().stats()
+
+        assert set(stats) == set(DEFAULT_WEIGHTS)
+        assert stats[INTERACTIVE] == {
+            'weight': 8, 'queued': 0, 'dispatched': 0, 'aged': 0, 'avg_wait': 0.0, 'max_wait': 0.0
+        }
+
+
+class TestRateLimiterWithScheduler:
+    """Tests para RateLimiter con planificador"""
+
+    def test_wait_goes_through_scheduler(self):
+        """Test la espera del rate limiter se hace en el turno del planificador"""
+        scheduler = Mock()
+        limiter = RateLimiter(delay=0.0, scheduler=scheduler)
+
+        limiter.wait()
+
+        scheduler.run.assert_called_once_with(limiter._acquire)
+
+    @patch('time.sleep')
+    def test_wait_without_scheduler(self, mock_sleep):
+        """Test sin planificador se mantiene el orden de llegada"""
+        limiter = RateLimiter(delay=1.0, burst=1)
+
+        limiter.wait()
+        limiter.wait()
+
+        assert limiter.scheduler is None
+        mock_sleep.assert_called_once()
+
+
+class TestJSearchClientScheduler:
+    """Tests para la configuración del planificador en JSearchClient"""
+
+    def test_enabled_from_config(self):
+        """Test el planificador usa la prioridad y max_wait de la configuración"""
+        config = Config(api_key="test_key", usage_priority=BATCH, scheduler_max_wait=5.0)
+
+        client = JSearchClient(api_key="test_key", config=config)
+
+        assert client.rate_limiter.scheduler.default_priority == BATCH
+        assert client.rate_limiter.scheduler.max_wait == 5.0
+        assert set(client.get_stats()['scheduler']) == set(DEFAULT_WEIGHTS)
+
+    def test_disabled(self):
+        """Test SCHEDULER_ENABLED=false deja el orden de llegada"""
+        config = Config(api_key="test_key", scheduler_enabled=False)
+
+        client = JSearchClient(api_key="test_key", config=config)
+
+        assert client.rate_limiter.scheduler is None
+        assert client.get_stats()['scheduler'] is None
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_shared_rate_limit.py
+Descripción: Tests para los almacenes compartidos del rate limiter y su uso en
+             RateLimiter y JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import sqlite3
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from src.api.jsearch_client import JSearchClient
+from src.api.rate_limiter import RateLimiter
+from src.api.shared_rate_limit import (
+    RedisBucketStore, SQLiteBucketStore, SharedStoreError, create_bucket_store, take_token
+)
+from src.utils.config import Config
+
+
+class TestTakeToken:
+    """Tests para el cálculo del token bucket"""
+
+    def test_full_bucket_no_wait(self):
+        """Test con tokens disponibles no hay espera"""
+        tokens, wait = take_token(3.0, 100.0, 0.0, delay=1.0, burst=3, now=100.0)
+
+        assert tokens == 2.0
+        assert wait == 0.0
+
+    def test_empty_bucket_waits(self):
+        """Test sin tokens se espera el tiempo de la deuda"""
+        tokens, wait = take_token(0.0, 100.0, 0.0, delay=2.0, burst=3, now=100.0)
+
+        assert tokens == -1.0
+        assert wait == 2.0
+
+    def test_refill_capped_by_burst(self):
+        """Test el relleno no supera la capacidad"""
+        tokens, _ = take_token(0.0, 0.0, 0.0, delay=1.0, burst=3, now=1000.0)
+
+        assert tokens == 2.0
+
+    def test_blocked_until_dominates(self):
+        """Test el bloqueo del servidor prevalece sobre los tokens"""
+        _, wait = take_token(3.0, 100.0, 105.0, delay=1.0, burst=3, now=100.0)
+
+        assert wait == 5.0
+
+
+class TestSQLiteBucketStore:
+    """Tests para SQLiteBucketStore"""
+
+    def test_budget_shared_between_instances(self, tmp_path):
+        """Test dos instancias (procesos) consumen el mismo bucket"""
+        path = tmp_path / "rate.sqlite3"
+        first = SQLiteBucketStore(path)
+        second = SQLiteBucketStore(path)
+
+        waits = [first.reserve("key", 1.0, 2)[0], second.reserve("key", 1.0, 2)[0], first.reserve("key", 1.0, 2)[0]]
+
+        assert waits[0] == 0.0
+        assert waits[1] == 0.0
+        assert waits[2] == pytest.approx(1.0, abs=0.05)
+        first.close()
+        second.close()
+
+    def test_keys_are_independent(self, tmp_path):
+        """Test cada API key tiene su propio bucket"""
+        store = SQLiteBucketStore(tmp_path / "rate.sqlite3")
+
+        store.reserve("a", 1.0, 1)
+
+        assert store.reserve("b", 1.0, 1) == (0.0, 0.0)
+
+    def test_concurrent_reservations_are_serialized(self, tmp_path):
+        """Test reservas concurrentes no toman el mismo token"""
+        path = tmp_path / "rate.sqlite3"
+        stores = [SQLiteBucketStore(path) for _ in range(4)]
+        waits = []
+        lock = threading.Lock()
+
+        def worker(store):
+            for _ in range(5):
+                wait, _ = store.reserve("key", 0.5, 1)
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker, args=(store,)) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 20 reservas con un token y 0.5s por token: la última espera ~9.5s
+        assert len(waits) == 20
+        assert max(waits) == pytest.approx(9.5, abs=0.2)
+
+    def test_block_applies_to_every_instance(self, tmp_path):
+        """Test un bloqueo se ve desde otras instancias"""
+        path = tmp_path / "rate.sqlite3"
+        SQLiteBucketStore(path).block("key", 5.0)
+        other = SQLiteBucketStore(path)
+
+        assert other.reserve("key", 1.0, 3)[0] == pytest.approx(5.0, abs=0.1)
+        assert other.state("key")['blocked_for'] == pytest.approx(5.0, abs=0.1)
+
+    def test_state_unknown_key(self, tmp_path):
+        """Test estado de un bucket sin uso"""
+        store = SQLiteBucketStore(tmp_path / "rate.sqlite3")
+
+        assert store.state("key") == {
+            'tokens': None, 'blocked_for': 0.0, 'delay': 0.0, 'quota_remaining': None, 'quota_reset_in': None
+        }
+
+    def test_published_delay_applies_to_every_instance(self, tmp_path):
+        """Test un delay publicado frena las reservas de otras instancias"""
+        path = tmp_path / "rate.sqlite3"
+        SQLiteBucketStore(path).publish("key", 4.0, remaining=10, reset_in=30.0)
+        other = SQLiteBucketStore(path)
+
+        assert other.reserve("key", 1.0, 1) == (0.0, 4.0)
+        assert other.reserve("key", 1.0, 1)[0] == pytest.approx(4.0, abs=0.05)
+        state = other.state("key")
+        assert state['delay'] == 4.0
+        assert state['quota_remaining'] == 10
+        assert state['quota_reset_in'] == pytest.approx(30.0, abs=0.5)
+
+    def test_publish_keeps_known_quota(self, tmp_path):
+        """Test publicar solo el delay no borra la cuota ya vista"""
+        store = SQLiteBucketStore(tmp_path / "rate.sqlite3")
+        store.publish("key", 2.0, remaining=10, reset_in=30.0)
+
+        store.publish("key", 1.0)
+
+        state = store.state("key")
+        assert state['delay'] == 1.0
+        assert state['quota_remaining'] == 10
+
+    def test_upgrades_existing_database(self, tmp_path):
+        """Test un fichero de la versión anterior gana las columnas nuevas"""
+        path = tmp_path / "rate.sqlite3"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL, "
+            "blocked_until REAL NOT NULL DEFAULT 0)"
+        )
+        conn.close()
+        store = SQLiteBucketStore(path)
+
+        store.publish("key", 3.0)
+
+        assert store.reserve("key", 1.0, 1) == (0.0, 3.0)
+
+    def test_unavailable_database_raises(self, tmp_path):
+        """Test un fichero inaccesible lanza SharedStoreError"""
+        store = SQLiteBucketStore(tmp_path)  # un directorio no es una base de datos
+
+        with pytest.raises(SharedStoreError):
+            store.reserve("key", 1.0, 1)
+
+
+class TestRedisBucketStore:
+    """Tests para RedisBucketStore con un cliente simulado"""
+
+    def _store(self):
+        client = Mock()
+        reserve, block, publish = Mock(return_value=[b"0.75", b"2.0"]), Mock(return_value=1), Mock(return_value=1)
+        client.register_script.side_effect = [reserve, block, publish]
+        return RedisBucketStore(client=client, prefix="rl:"), client, reserve, block, publish
+
+    def test_reserve_runs_script(self):
+        """Test reserve ejecuta el script atómico con la clave prefijada"""
+        store, _, reserve, _, _ = self._store()
+
+        assert store.reserve("key", 1.0, 3) == (0.75, 2.0)
+        reserve.assert_called_once_with(keys=["rl:key"], args=[1.0, 3, 86400])
+
+    def test_block_runs_script(self):
+        """Test block ejecuta el script de bloqueo"""
+        store, _, _, block, _ = self._store()
+
+        store.block("key", 4.0)
+
+        block.assert_called_once_with(keys=["rl:key"], args=[4.0, 86400])
+
+    def test_publish_runs_script(self):
+        """Test publish envía el delay y la cuota (vacía si no se conoce)"""
+        store, _, _, _, publish = self._store()
+
+        store.publish("key", 2.0, remaining=5)
+
+        publish.assert_called_once_with(keys=["rl:key"], args=[2.0, 5, '', 86400])
+
+    def test_errors_wrapped(self):
+        """Test los errores de Redis se convierten en SharedStoreError"""
+        store, _, reserve, _, _ = self._store()
+        reserve.side_effect = ConnectionError("refused")
+
+        with pytest.raises(SharedStoreError):
+            store.reserve("key", 1.0, 3)
+
+    def test_state(self):
+        """Test estado del bucket"""
+        store, client, _, _, _ = self._store()
+        client.hmget.return_value = [b"1.5", None, b"2.0", None, None]
+
+        assert store.state("key") == {
+            'tokens': 1.5, 'blocked_for': 0.0, 'delay': 2.0, 'quota_remaining': None, 'quota_reset_in': None
+        }
+
+    @patch('src.api.shared_rate_limit.redis', None)
+    def test_missing_package(self):
+        """Test sin el paquete redis se indica cómo instalarlo"""
+        with pytest.raises(ImportError, match="redis"):
+            RedisBucketStore()
+
+
+class TestCreateBucketStore:
+    """Tests para create_bucket_store"""
+
+    def test_local_has_no_store(self):
+        """Test el backend local no usa almacén"""
+        assert create_bucket_store("local") is None
+
+    def test_sqlite(self, tmp_path):
+        """Test backend sqlite"""
+        store = create_bucket_store("sqlite", path=tmp_path / "rate.sqlite3")
+
+        assert isinstance(store, SQLiteBucketStore)
+
+    def test_invalid_backend(self):
+        """Test backend inválido"""
+        with pytest.raises(ValueError):
+            create_bucket_store("memcached")
+
+
+class TestRateLimiterWithStore:
+    """Tests para RateLimiter con almacén compartido"""
+
+    @patch('time.sleep')
+    def test_wait_uses_shared_bucket(self, mock_sleep):
+        """Test la espera la decide el bucket compartido"""
+        store = Mock()
+        store.reserve.return_value = (2.5, 0.0)
+        limiter = RateLimiter(delay=1.0, burst=3, store=store, store_key="k")
+
+        limiter.wait()
+
+        store.reserve.assert_called_once_with("k", 1.0, 3)
+        mock_sleep.assert_called_once_with(2.5)
+
+    @patch('time.sleep')
+    def test_falls_back_to_local_bucket(self, mock_sleep):
+        """Test si el almacén falla se usa el bucket local"""
+        store = Mock()
+        store.reserve.side_effect = SharedStoreError("caído")
+        limiter = RateLimiter(delay=1.0, burst=1, store=store)
+
+        limiter.wait()
+        limiter.wait()
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
+
+    def test_retry_after_propagated(self):
+        """Test Retry-After bloquea también a los demás procesos"""
+        store = Mock()
+        limiter = RateLimiter(delay=1.0, store=store, store_key="k")
+
+        limiter.observe_response(429, {'retry-after': '3'})
+        limiter.observe_response(200, {})
+
+        store.block.assert_called_once()
+        assert store.block.call_args[0][0] == "k"
+        assert store.block.call_args[0][1] == pytest.approx(3.0, abs=0.1)
+
+    def test_stats_include_shared_state(self, tmp_path):
+        """Test las estadísticas muestran el backend y el bucket compartido"""
+        store = SQLiteBucketStore(tmp_path / "rate.sqlite3")
+        limiter = RateLimiter(delay=0.5, store=store, store_key="k")
+
+        with patch('time.sleep'):
+            limiter.wait()
+        stats = limiter.stats()
+
+        assert stats['backend'] == "sqlite"
+        assert stats['shared']['tokens'] == pytest.approx(0.0, abs=0.1)
+
+    def test_two_limiters_share_budget(self, tmp_path):
+        """Test dos limitadores (procesos) con la misma key comparten presupuesto"""
+        path = tmp_path / "rate.sqlite3"
+        first = RateLimiter(delay=1.0, burst=1, store=SQLiteBucketStore(path), store_key="k")
+        second = RateLimiter(delay=1.0, burst=1, store=SQLiteBucketStore(path), store_key="k")
+
+        with patch('time.sleep') as mock_sleep:
+            first.wait()
+            second.wait()
+
+        # Cada limitador tiene su primer token local, pero el compartido obliga a esperar
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.05)
+
+    def test_throttling_shared_between_limiters(self, tmp_path):
+        """Test un 429 recibido por un limitador frena también al otro"""
+        path = tmp_path / "rate.sqlite3"
+        first = RateLimiter(delay=1.0, burst=1, adaptive=True, store=SQLiteBucketStore(path), store_key="k")
+        second = RateLimiter(delay=1.0, burst=1, adaptive=True, store=SQLiteBucketStore(path), store_key="k")
+
+        first.observe_response(429, {})
+        with patch('time.sleep') as mock_sleep:
+            second.wait()
+            second.wait()
+
+        # El segundo no vio el 429 pero reserva al ritmo publicado (2s)
+        assert second.delay == 1.0
+        assert mock_sleep.call_args[0][0] == pytest.approx(2.0, abs=0.05)
+
+    def test_adjustments_start_from_shared_delay(self, tmp_path):
+        """Test un 429 en otro proceso frena desde el delay compartido, no desde el propio"""
+        path = tmp_path / "rate.sqlite3"
+        first = RateLimiter(delay=1.0, burst=1, adaptive=True, store=SQLiteBucketStore(path), store_key="k")
+        second = RateLimiter(delay=1.0, burst=1, adaptive=True, store=SQLiteBucketStore(path), store_key="k")
+        first.observe_response(429, {})
+        with patch('time.sleep'):
+            second.wait()
+
+        second.observe_response(429, {})
+
+        assert second.delay == 4.0
+        assert first.store.state("k")['delay'] == 4.0
+
+    def test_quota_published(self, tmp_path):
+        """Test la cuota vista por un limitador queda en el almacén compartido"""
+        store = SQLiteBucketStore(tmp_path / "rate.sqlite3")
+        limiter = RateLimiter(delay=0.1, adaptive=True, store=store, store_key="k")
+
+        limiter.observe_response(200, {'x-ratelimit-remaining': '20', 'x-ratelimit-reset': '10'})
+
+        shared = limiter.stats()['shared']
+        assert shared['quota_remaining'] == 20
+        assert shared['quota_reset_in'] == pytest.approx(10.0, abs=0.5)
+        assert shared['delay'] == pytest.approx(0.5)
+
+
+class TestJSearchClientSharedLimiter:
+    """Tests para la configuración del rate limiter compartido en JSearchClient"""
+
+    def test_sqlite_backend_from_config(self, tmp_path):
+        """Test RATE_LIMIT_BACKEND=sqlite crea un bucket por API key"""
+        config = Config(
+            api_key="key-a",
+            rate_limit_backend="sqlite",
+            rate_limit_store_path=tmp_path / "rate.sqlite3"
+        )
+
+        first = JSearchClient(api_key="key-a", config=config)
+        second = JSearchClient(api_key="key-b", config=config)
+
+        assert isinstance(first.rate_limiter.store, SQLiteBucketStore)
+        assert first.rate_limiter.store_key.startswith("jsearch:")
+        assert "key-a" not in first.rate_limiter.store_key
+        assert first.rate_limiter.store_key != second.rate_limiter.store_key
+
+    def test_local_backend_by_default(self):
+        """Test por defecto el rate limiter es local"""
+        client = JSearchClient(api_key="test_key", config=Config(api_key="test_key"))
+
+        assert client.rate_limiter.store is None
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_sqlite_file.py
+Descripción: Tests para la base común de los almacenes en SQLite
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+from unittest.mock import patch
+from src.api.salary_cache import SalaryCache
+from src.api.shared_rate_limit import SQLiteBucketStore
+from src.api.sqlite_file import SQLiteFile
+from src.api.usage_budget import UsageLedger
+
+
+class _Store(SQLiteFile):
+    schema = ("CREATE TABLE IF NOT EXISTS items (key TEXT PRIMARY KEY)",)
+
+
+class TestSQLiteFile:
+    """Tests para SQLiteFile"""
+
+    def test_creates_directory_schema_and_wal(self, tmp_path):
+        """Test al abrir se crea el directorio, el esquema y se activa WAL"""
+        store = _Store(tmp_path / "nested" / "store.sqlite3")
+
+        conn = store._connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall() == [("items",)]
+
+    def test_connection_reused_in_same_process(self, tmp_path):
+        """Test la conexión se reutiliza dentro del proceso"""
+        store = _Store(tmp_path / "store.sqlite3")
+
+        assert store._connection() is store._connection()
+
+    def test_reopened_after_fork(self, tmp_path):
+        """Test un proceso hijo abre su propia conexión"""
+        store = _Store(tmp_path / "store.sqlite3")
+        parent = store._connection()
+
+        with patch('src.api.sqlite_file.os.getpid', return_value=-1):
+            child = store._connection()
+
+        assert child is not parent
+
+    def test_close(self, tmp_path):
+        """Test close descarta la conexión y la siguiente llamada abre otra"""
+        store = _Store(tmp_path / "store.sqlite3")
+        first = store._connection()
+
+        store.close()
+
+        assert store._connection() is not first
+
+    def test_stores_share_the_base(self):
+        """Test los tres almacenes usan la misma base"""
+        for store in (UsageLedger, SalaryCache, SQLiteBucketStore):
+            assert issubclass(store, SQLiteFile)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_transport.py
+Descripción: Tests para los transportes de grabación y reproducción (cassettes)
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import gzip
+import json
+import pytest
+from unittest.mock import Mock, patch
+from src.api.client import HTTPClient, HTTPError
+from src.api.connection_pool import ConnectionPool
+from src.api.jsearch_client import JSearchClient
+from src.utils.config import Config
+from src.api.transport import (
+    Cassette, CassetteMissError, RecordingPool, ReplayPool, create_pool, request_key
+)
+
+
+def _record_json(cassette, url, payload, status=200, compress=False, latency=0.05):
+    """Graba una respuesta JSON en el cassette"""
+    body = json.dumps(payload).encode('utf-8')
+    headers = [('Content-Type', 'application/json')]
+    if compress:
+        body = gzip.compress(body)
+        headers.append(('Content-Encoding', 'gzip'))
+    cassette.record(request_key("GET", url), status, headers, body, latency)
+
+
+class TestRequestKey:
+    """Tests para request_key"""
+
+    def test_query_order_does_not_matter(self):
+        """Test el orden de los parámetros no cambia la clave"""
+        assert request_key("GET", "/s?b=2&a=1") == request_key("get", "/s?a=1&b=2")
+
+    def test_body_changes_key(self):
+        """Test peticiones con distinto body tienen distinta clave"""
+        assert request_key("POST", "/s", b'{"a": 1}') != request_key("POST", "/s", b'{"a": 2}')
+        assert request_key("POST", "/s") == "POST /s"
+
+
+class TestCassette:
+    """Tests para Cassette"""
+
+    def test_record_and_load(self, tmp_path):
+        """Test grabar y volver a cargar desde disco"""
+        path = tmp_path / "cassettes" / "test.jsonl.gz"
+        cassette = Cassette(path)
+        _record_json(cassette, "/a?x=1", {"data": [1]})
+        _record_json(cassette, "/b", {"data": [2]})
+
+        loaded = Cassette.load(path)
+
+        assert len(loaded) == 2
+        assert loaded.next_response("GET /a?x=1")['status'] == 200
+
+    def test_file_is_gzip_compressed(self, tmp_path):
+        """Test el cassette se guarda comprimido"""
+        path = tmp_path / "test.jsonl.gz"
+        _record_json(Cassette(path), "/a", {"data": []})
+
+        with open(path, 'rb') as f:
+            assert f.read(2) == b'\x1f\x8b'
+
+    def test_responses_replayed_in_order(self, tmp_path):
+        """Test respuestas repetidas se reproducen en orden y luego se repite la última"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/a", {"n": 1})
+        _record_json(cassette, "/a", {"n": 2})
+
+        statuses = [cassette.next_response("GET /a")['body'] for _ in range(3)]
+
+        assert statuses[0] != statuses[1]
+        assert statuses[1] == statuses[2]
+
+        cassette.rewind()
+        assert cassette.next_response("GET /a")['body'] == statuses[0]
+
+    def test_skips_sensitive_headers(self, tmp_path):
+        """Test no se guardan cookies ni headers de conexión"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        cassette.record("GET /a", 200, [('Set-Cookie', 's=1'), ('ETag', '"v1"')], b'{}', 0.0)
+
+        assert cassette.next_response("GET /a")['headers'] == [['ETag', '"v1"']]
+
+    def test_missing_key(self, tmp_path):
+        """Test petición no grabada"""
+        assert Cassette(tmp_path / "x.jsonl.gz").next_response("GET /a") is None
+
+
+class TestReplay:
+    """Tests para la reproducción con HTTPClient"""
+
+    def test_get_from_cassette(self, tmp_path):
+        """Test GET servido desde el cassette sin red"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/search?query=python", {"data": [{"id": 1}]}, compress=True)
+
+        with patch('http.client.HTTPSConnection') as mock_https:
+            client = HTTPClient("api.test.com", pool=ReplayPool(cassette))
+            result = client.get("/search", {"query": "python"})
+
+        assert result == {"data": [{"id": 1}]}
+        mock_https.assert_not_called()
+
+    def test_stream_from_cassette(self, tmp_path):
+        """Test streaming desde el cassette"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/search", {"status": "OK", "data": [1, 2, 3]})
+        client = HTTPClient("api.test.com", pool=ReplayPool(cassette))
+
+        assert list(client.stream_get("/search")) == [1, 2, 3]
+
+    def test_recorded_error_status(self, tmp_path):
+        """Test los errores grabados se reproducen como HTTPError"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/search", {"message": "quota"}, status=429)
+        client = HTTPClient("api.test.com", pool=ReplayPool(cassette))
+
+        with pytest.raises(HTTPError) as exc_info:
+            client.get("/search")
+
+        assert exc_info.value.status_code == 429
+
+    def test_cassette_miss(self, tmp_path):
+        """Test petición no grabada lanza CassetteMissError"""
+        client = HTTPClient("api.test.com", pool=ReplayPool(Cassette(tmp_path / "x.jsonl.gz")))
+
+        with pytest.raises(CassetteMissError) as exc_info:
+            client.get("/missing")
+
+        assert not isinstance(exc_info.value, HTTPError)
+
+    def test_simulated_latency(self, tmp_path):
+        """Test latencia simulada proporcional a la grabada"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/search", {"data": []}, latency=0.2)
+        client = HTTPClient("api.test.com", pool=ReplayPool(cassette, latency_scale=0.5))
+
+        with patch('src.api.transport.time.sleep') as mock_sleep:
+            client.get("/search")
+
+        mock_sleep.assert_called_once_with(pytest.approx(0.1))
+
+    def test_pool_stats(self, tmp_path):
+        """Test estadísticas del pool de replay"""
+        cassette = Cassette(tmp_path / "test.jsonl.gz")
+        _record_json(cassette, "/search", {"data": []})
+        pool = ReplayPool(cassette)
+
+        HTTPClient("api.test.com", pool=pool).get("/search")
+
+        stats = pool.stats()
+        assert stats['mode'] == 'replay'
+        assert stats['reused'] == 1
+        assert stats['interactions'] == 1
+
+
+class TestRecording:
+    """Tests para la grabación de respuestas reales"""
+
+    @patch('http.client.HTTPSConnection')
+    def test_record_then_replay(self, mock_https, tmp_path):
+        """Test una respuesta grabada se reproduce igual"""
+        body = gzip.compress(b'{"data": [{"id": 7}]}')
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.will_close = False
+        mock_response.getheader.side_effect = lambda name, default=None: (
+            'gzip' if name == 'Content-Encoding' else default
+        )
+        mock_response.getheaders.return_value = [('Content-Encoding', 'gzip')]
+        mock_response.read.side_effect = [body, b'']
+        mock_conn = Mock()
+        mock_conn.getresponse.return_value = mock_response
+        mock_https.return_value = mock_conn
+
+        path = tmp_path / "test.jsonl.gz"
+        client = HTTPClient("api.test.com", pool=RecordingPool(Cassette(path)))
+        assert client.get("/search", {"query": "go"}) == {"data": [{"id": 7}]}
+
+        replay = HTTPClient("api.test.com", pool=ReplayPool(Cassette.load(path)))
+        assert replay.get("/search", {"query": "go"}) == {"data": [{"id": 7}]}
+
+    @patch('http.client.HTTPSConnection')
+    def test_api_key_not_recorded(self, mock_https, tmp_path):
+        """Test los headers de la petición (API key) no se guardan"""
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.getheader.return_value = None
+        mock_response.getheaders.return_value = []
+        mock_response.read.return_value = b'{}'
+        mock_https.return_value.getresponse.return_value = mock_response
+
+        path = tmp_path / "test.jsonl.gz"
+        HTTPClient("api.test.com", headers={'x-api-key': 'secret'}, pool=RecordingPool(Cassette(path))).get("/a")
+
+        with gzip.open(path, 'rt') as f:
+            assert 'secret' not in f.read()
+
+
+class TestCreatePool:
+    """Tests para create_pool"""
+
+    def test_live(self):
+        """Test modo live crea un ConnectionPool normal"""
+        pool = create_pool("live")
+
+        assert type(pool) is ConnectionPool
+
+    def test_record(self, tmp_path):
+        """Test modo record"""
+        assert isinstance(create_pool("record", tmp_path / "c.jsonl.gz"), RecordingPool)
+
+    def test_replay_requires_cassette(self, tmp_path):
+        """Test modo replay sin cassette"""
+        with pytest.raises(FileNotFoundError):
+            create_pool("replay", tmp_path / "missing.jsonl.gz")
+
+    def test_invalid_mode(self):
+        """Test modo no válido"""
+        with pytest.raises(ValueError):
+            create_pool("offline")
+
+
+class TestJSearchClientReplay:
+    """Tests para JSearchClient en modo replay"""
+
+    def test_search_jobs_offline(self, tmp_path, sample_search_params):
+        """Test búsqueda servida desde el cassette sin rate limiting"""
+        path = tmp_path / "jsearch.jsonl.gz"
+        url = HTTPClient._build_endpoint("/jsearch/search", sample_search_params.to_api_params())
+        _record_json(Cassette(path), url, {"status": "OK", "data": [{"job_id": "1"}]})
+
+        config = Config(api_key="unused", transport_mode="replay", cassette_path=path)
+
+        client = JSearchClient("unused", config=config)
+
+        assert client.search_jobs(sample_search_params) == [{"job_id": "1"}]
+        assert client.rate_limiter.delay == 0.0
+
+    def test_cassette_miss_not_cached_as_missing_job(self, tmp_path):
+        """Test un trabajo sin grabar no se recuerda como no encontrado"""
+        path = tmp_path / "jsearch.jsonl.gz"
+        _record_json(Cassette(path), "/jsearch/search?query=python", {"status": "OK", "data": []})
+        config = Config(api_key="unused", transport_mode="replay", cassette_path=path)
+        client = JSearchClient("unused", config=config)
+
+        for _ in range(2):
+            with pytest.raises(CassetteMissError):
+                client.get_job_details("abc")
+
+        assert client.negative_cache.stats()['stored'] == 0
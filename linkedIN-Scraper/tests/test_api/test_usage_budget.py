@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_usage_budget.py
+Descripción: Tests para UsageLedger, CreditBudget y el control de presupuesto
+             en JSearchClient
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import sqlite3
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+from src.api.client import HTTPError
+from src.api.jsearch_client import JSearchClient
+from src.api.usage_budget import (
+    BATCH, EXHAUSTED, INTERACTIVE, OK, SOFT_LIMIT, BudgetExceededError, CreditBudget,
+    UsageLedger, month_key, month_progress, usage_scope
+)
+from src.models.search_params import SearchParameters
+from src.utils.config import Config
+
+JOBS = [{"job_id": "1"}]
+
+
+def _fill(ledger, credits, endpoint="/jsearch/search", caller="cli"):
+    for _ in range(credits):
+        ledger.record(endpoint, caller)
+
+
+class TestUsageLedger:
+    """Tests para UsageLedger"""
+
+    def test_record_and_breakdown(self, tmp_path):
+        """Test el consumo se agrupa por endpoint y llamador"""
+        ledger = UsageLedger(tmp_path / "usage.sqlite3")
+        now = datetime(2025, 12, 10, tzinfo=timezone.utc)
+
+        ledger.record("/jsearch/search", "web", credits=3, now=now)
+        ledger.record("/jsearch/search", "cli", now=now)
+        ledger.record("/jsearch/job-details", "web", now=now)
+
+        usage = ledger.usage("2025-12")
+        assert usage['requests'] == 3
+        assert usage['credits'] == 5
+        assert usage['by_endpoint']['/jsearch/search'] == {'requests': 2, 'credits': 4}
+        assert usage['by_caller']['web'] == {'requests': 2, 'credits': 4}
+        assert ledger.month_credits("2025-12") == 5
+
+    def test_months_are_separate(self, tmp_path):
+        """Test cada mes tiene su propio contador"""
+        ledger = UsageLedger(tmp_path / "usage.sqlite3")
+
+        ledger.record("/jsearch/search", "cli", now=datetime(2025, 11, 30, tzinfo=timezone.utc))
+
+        assert ledger.month_credits("2025-12") == 0
+        assert ledger.month_credits("2025-11") == 1
+
+    def test_persisted_between_instances(self, tmp_path):
+        """Test el registro sobrevive al proceso (otra instancia lo lee)"""
+        path = tmp_path / "usage.sqlite3"
+        now = datetime(2025, 12, 10, tzinfo=timezone.utc)
+        UsageLedger(path).record("/jsearch/search", "cron", credits=2, now=now)
+
+        assert UsageLedger(path).month_credits("2025-12") == 2
+
+
+class TestMonthHelpers:
+    """Tests para las utilidades de fechas"""
+
+    def test_month_key(self):
+        """Test formato del mes"""
+        assert month_key(datetime(2025, 2, 3, tzinfo=timezone.utc)) == "2025-02"
+
+    def test_month_progress(self):
+        """Test fracción transcurrida del mes"""
+        assert month_progress(datetime(2025, 12, 1, tzinfo=timezone.utc)) == 0.0
+        assert month_progress(datetime(2025, 2, 15, tzinfo=timezone.utc)) == pytest.approx(0.5)
+
+
+class TestCreditBudget:
+    """Tests para el control de admisión de CreditBudget"""
+
+    def _budget(self, tmp_path, used=0, **kwargs):
+        ledger = UsageLedger(tmp_path / "usage.sqlite3")
+        _fill(ledger, used)
+        return CreditBudget(ledger, **kwargs)
+
+    def test_no_limit_tracks_only(self, tmp_path):
+        """Test sin límite todo se admite"""
+        budget = self._budget(tmp_path, used=5)
+
+        assert budget.admit("/jsearch/search", pages=5) == (5, False, OK)
+
+    def test_under_soft_limit(self, tmp_path):
+        """Test por debajo del límite blando se admite tal cual"""
+        budget = self._budget(tmp_path, used=10, monthly_limit=100)
+
+        assert budget.admit("/jsearch/search", pages=3) == (3, False, OK)
+
+    def test_pages_capped_by_remaining(self, tmp_path):
+        """Test no se piden más páginas de las que quedan en la cuota"""
+        budget = self._budget(tmp_path, used=8, monthly_limit=10, soft_limit=1.0)
+
+        assert budget.admit("/jsearch/search", pages=5).pages == 2
+
+    def test_soft_limit_degrades_interactive(self, tmp_path):
+        """Test bajo presión el trabajo interactivo usa caché y una página"""
+        budget = self._budget(tmp_path, used=85, monthly_limit=100, soft_limit=0.8)
+
+        assert budget.admit("/jsearch/search", pages=5) == (1, True, SOFT_LIMIT)
+
+    def test_soft_limit_rejects_batch(self, tmp_path):
+        """Test bajo presión el trabajo por lotes se rechaza"""
+        budget = self._budget(tmp_path, used=85, monthly_limit=100, default_priority=BATCH)
+
+        with pytest.raises(BudgetExceededError) as exc_info:
+            budget.admit("/jsearch/search")
+
+        assert exc_info.value.status_code == 402
+        assert exc_info.value.priority == BATCH
+
+    def test_hard_limit_rejects_everything(self, tmp_path):
+        """Test con la cuota agotada se rechaza también lo interactivo"""
+        budget = self._budget(tmp_path, used=100, monthly_limit=100)
+
+        with pytest.raises(BudgetExceededError, match="agotada"):
+            budget.admit("/jsearch/job-details")
+
+    def test_usage_scope_overrides_caller_and_priority(self, tmp_path):
+        """Test usage_scope atribuye las peticiones y cambia la prioridad"""
+        budget = self._budget(tmp_path, used=85, monthly_limit=100)
+
+        with usage_scope("cron", BATCH):
+            assert budget.current_caller() == "cron"
+            with pytest.raises(BudgetExceededError):
+                budget.admit("/jsearch/search")
+            budget.record("/jsearch/search")
+
+        assert budget.current_priority() == INTERACTIVE
+        assert budget.ledger.usage(month_key(datetime.now(timezone.utc)))['by_caller']['cron']['requests'] == 1
+
+    def test_ledger_errors_fail_open(self, tmp_path):
+        """Test si el registro falla las peticiones siguen pasando"""
+        ledger = Mock()
+        ledger.month_credits.side_effect = sqlite3.OperationalError("locked")
+        ledger.record.side_effect = sqlite3.OperationalError("locked")
+        budget = CreditBudget(ledger, monthly_limit=10)
+
+        assert budget.admit("/jsearch/search", pages=2) == (2, False, OK)
+        budget.record("/jsearch/search")
+
+    def test_unwritable_ledger_fails_open(self, tmp_path):
+        """Test un directorio del registro sin permisos no bloquea las peticiones"""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        budget = CreditBudget(UsageLedger(blocker / "usage.sqlite3"), monthly_limit=10)
+
+        assert budget.admit("/jsearch/search", pages=2) == (2, False, OK)
+        budget.record("/jsearch/search")
+
+    def test_report_unreadable_ledger(self, tmp_path):
+        """Test si el registro no se puede leer el informe es None"""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        budget = CreditBudget(UsageLedger(blocker / "usage.sqlite3"), monthly_limit=10)
+
+        assert budget.report() is None
+
+    def test_report(self, tmp_path):
+        """Test informe con proyección a fin de mes"""
+        ledger = UsageLedger(tmp_path / "usage.sqlite3")
+        now = datetime(2025, 2, 15, tzinfo=timezone.utc)  # mitad de febrero
+        for _ in range(30):
+            ledger.record("/jsearch/search", "web", now=now)
+        budget = CreditBudget(ledger, monthly_limit=50, soft_limit=0.5)
+
+        report = budget.report(now)
+
+        assert report['month'] == "2025-02"
+        assert report['used'] == 30
+        assert report['remaining'] == 20
+        assert report['projected'] == 60
+        assert report['projected_over'] is True
+        assert report['state'] == SOFT_LIMIT
+        assert report['by_caller'] == {'web': {'requests': 30, 'credits': 30}}
+
+    def test_report_exhausted(self, tmp_path):
+        """Test estado agotado"""
+        budget = self._budget(tmp_path, used=3, monthly_limit=3)
+
+        assert budget.report()['state'] == EXHAUSTED
+
+
+class TestJSearchClientBudget:
+    """Tests para el presupuesto en JSearchClient"""
+
+    def test_requests_are_recorded(self, make_jsearch_client):
+        """Test cada petición se anota con sus créditos y el llamador"""
+        client = make_jsearch_client(JOBS, caller="web", usage_tracking=True)
+
+        client.search_jobs(SearchParameters(query="python", num_pages=3))
+        client.get_job_details("1")
+
+        report = client.get_usage_report()
+        assert report['used'] == 4
+        assert report['by_endpoint']['/jsearch/search'] == {'requests': 1, 'credits': 3}
+        assert report['by_caller']['web']['requests'] == 2
+
+    def test_unwritable_ledger_does_not_resend(self, make_jsearch_client, tmp_path):
+        """Test si el registro no se puede escribir la petición no se repite"""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("x")
+        client = make_jsearch_client(JOBS, usage_tracking=True, usage_db_path=blocker / "usage.sqlite3")
+
+        assert client.search_jobs(SearchParameters(query="python")) == JOBS
+        client.client.get.assert_called_once()
+        assert client.get_usage_report() is None
+
+    def test_client_errors_recorded_server_errors_not(self, make_jsearch_client):
+        """Test los 4xx consumen cuota y los 5xx no"""
+        client = make_jsearch_client(usage_tracking=True, circuit_breaker_enabled=False, max_retries=1)
+        client.client.get.side_effect = [HTTPError(404, "no"), HTTPError(503, "down")]
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get_estimated_salary("dev", "madrid")
+
+        assert client.get_usage_report()['used'] == 1
+
+    def test_soft_limit_shrinks_pages_and_prefers_cache(self, make_jsearch_client):
+        """Test bajo presión la búsqueda usa una página y la caché"""
+        client = make_jsearch_client(JOBS, usage_tracking=True, monthly_request_budget=10, budget_soft_limit=0.5)
+        _fill(client.budget.ledger, 9)
+        client.client.cached_result = Mock(return_value=None)
+
+        client.search_jobs(SearchParameters(query="python", num_pages=5))
+
+        sent_params = client.client.get.call_args[0][1]
+        assert sent_params['num_pages'] == "1"
+        client.client.cached_result.assert_called_once()
+
+    def test_cached_result_served_without_charge(self, make_jsearch_client):
+        """Test una respuesta cacheada servida bajo presión no consume cuota"""
+        client = make_jsearch_client(JOBS, usage_tracking=True, monthly_request_budget=10, budget_soft_limit=0.5)
+        _fill(client.budget.ledger, 9)
+        client.client.cached_result = Mock(return_value={"data": [{"job_id": "cached"}]})
+
+        jobs = client.search_jobs(SearchParameters(query="python"))
+
+        assert jobs == [{"job_id": "cached"}]
+        client.client.get.assert_not_called()
+        assert client.get_usage_report()['used'] == 9
+
+    def test_exhausted_budget_rejects_without_request(self, make_jsearch_client):
+        """Test con la cuota agotada no se envía la petición"""
+        client = make_jsearch_client(JOBS, usage_tracking=True, monthly_request_budget=10)
+        _fill(client.budget.ledger, 10)
+
+        with pytest.raises(BudgetExceededError):
+            client.get_job_details("1")
+
+        client.client.get.assert_not_called()
+
+    def test_tracking_disabled(self, tmp_path):
+        """Test USAGE_TRACKING=false desactiva el registro"""
+        config = Config(api_key="test_key", usage_tracking=False)
+
+        client = JSearchClient(api_key="test_key", config=config)
+
+        assert client.budget is None
+        assert client.get_usage_report() is None
@@ -12,7 +12,7 @@ Fecha: 2025-12-08
 """
 import pytest
 from pydantic import ValidationError
-from src.models.job import Job
+from src.models.job import LISTING_FIELDS, Job, normalize_fields
 
 
 def test_job_creation_from_api_data(sample_job_data):
@@ -220,3 +220,20 @@ def test_job_salary_range_with_zero_values():
 
     # Con salarios en 0, debería retornar None (línea 110)
     assert job.get_salary_range() is None
+
+
+def test_listing_fields_cover_job_table():
+    """Test la proyección de listados incluye lo que muestra la tabla"""
+    fields = LISTING_FIELDS.split(",")
+
+    assert fields[0] == "job_id"
+    for name in ("job_title", "employer_name", "job_city", "job_min_salary", "job_employment_type"):
+        assert name in fields
+    assert "job_description" not in fields
+    assert "job_highlights" not in fields
+
+
+def test_normalize_fields():
+    """Test normalización de proyecciones"""
+    assert normalize_fields("job_title") == "job_id,job_title"
+    assert normalize_fields("job_title,job_id, job_title") == "job_id,job_title"
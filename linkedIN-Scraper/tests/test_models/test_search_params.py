@@ -181,3 +181,19 @@ def test_search_params_radius_zero():
     # radius=0 es válido y debería incluirse
     assert "radius" in api_params
     assert api_params["radius"] == "0"
+
+
+def test_search_params_fields_projection():
+    """Test la proyección de campos se normaliza y se envía a la API"""
+    params = SearchParameters(query="test", fields=" job_title, employer_name ,job_title")
+
+    assert params.fields == "job_id,job_title,employer_name"
+    assert params.to_api_params()["fields"] == "job_id,job_title,employer_name"
+
+
+def test_search_params_without_fields():
+    """Test sin proyección no se envía fields"""
+    params = SearchParameters(query="test", fields="  ")
+
+    assert params.fields is None
+    assert "fields" not in params.to_api_params()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_async_services.py
+Descripción: Tests para AsyncJobService y AsyncSalaryService
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from src.services.async_job_service import AsyncJobService
+from src.services.job_service import JobService
+from src.services.async_salary_service import AsyncSalaryService
+
+
+class TestAsyncJobService:
+    """Tests para AsyncJobService"""
+
+    def test_search_jobs(self, sample_job_data, sample_search_params):
+        """Test búsqueda asíncrona con datos válidos e inválidos"""
+        mock_client = Mock()
+        mock_client.search_jobs = AsyncMock(return_value=[sample_job_data, {"invalid": "data"}])
+        service = AsyncJobService(mock_client)
+
+        jobs = asyncio.run(service.search_jobs(sample_search_params))
+
+        assert len(jobs) == 1
+        assert jobs[0].job_id == "abc123xyz"
+
+    def test_search_jobs_error(self, sample_search_params):
+        """Test búsqueda asíncrona con error de API"""
+        mock_client = Mock()
+        mock_client.search_jobs = AsyncMock(side_effect=Exception("API Error"))
+        service = AsyncJobService(mock_client)
+
+        with pytest.raises(Exception, match="API Error"):
+            asyncio.run(service.search_jobs(sample_search_params))
+
+    def test_get_job_details(self, sample_job_data):
+        """Test detalles asíncronos"""
+        mock_client = Mock()
+        mock_client.get_job_details = AsyncMock(return_value=sample_job_data)
+        service = AsyncJobService(mock_client)
+
+        job = asyncio.run(service.get_job_details("abc123xyz", "es"))
+
+        assert job.title == "Python Developer"
+        mock_client.get_job_details.assert_awaited_once_with("abc123xyz", "es")
+
+    def test_get_job_details_invalid(self):
+        """Test detalles asíncronos con datos inválidos"""
+        mock_client = Mock()
+        mock_client.get_job_details = AsyncMock(return_value={"invalid": "data"})
+        service = AsyncJobService(mock_client)
+
+        with pytest.raises(ValueError):
+            asyncio.run(service.get_job_details("x"))
+
+    def test_get_job_details_api_error(self):
+        """Test detalles asíncronos con error de API"""
+        mock_client = Mock()
+        mock_client.get_job_details = AsyncMock(side_effect=Exception("API Error"))
+        service = AsyncJobService(mock_client)
+
+        with pytest.raises(Exception, match="API Error"):
+            asyncio.run(service.get_job_details("x"))
+
+    def test_inherits_filters(self, sample_job):
+        """Test los filtros síncronos siguen disponibles"""
+        service = AsyncJobService(Mock())
+
+        assert service.filter_remote_jobs([sample_job]) == []
+
+    def test_no_sync_only_methods(self):
+        """Test no expone métodos que necesitan el cliente síncrono"""
+        service = AsyncJobService(Mock())
+
+        assert not hasattr(service, "iter_jobs")
+        assert not hasattr(service, "get_job_details_batch")
+        assert not isinstance(service, JobService)
+
+
+class TestAsyncSalaryService:
+    """Tests para AsyncSalaryService"""
+
+    def test_get_estimated_salary(self, sample_salary_data):
+        """Test estimación salarial asíncrona"""
+        mock_client = Mock()
+        mock_client.get_estimated_salary = AsyncMock(return_value=[sample_salary_data, {}])
+        service = AsyncSalaryService(mock_client)
+
+        salaries = asyncio.run(service.get_estimated_salary("Software Engineer", "Madrid"))
+
+        assert len(salaries) == 1
+        assert salaries[0].median_salary == 50000
+
+    def test_get_estimated_salary_error(self):
+        """Test estimación salarial asíncrona con error"""
+        mock_client = Mock()
+        mock_client.get_estimated_salary = AsyncMock(side_effect=Exception("API Error"))
+        service = AsyncSalaryService(mock_client)
+
+        with pytest.raises(Exception, match="API Error"):
+            asyncio.run(service.get_estimated_salary("Engineer", "Madrid"))
+
+    def test_get_company_salary(self, sample_salary_data):
+        """Test salarios de empresa asíncronos"""
+        mock_client = Mock()
+        mock_client.get_company_salary = AsyncMock(return_value=[sample_salary_data])
+        service = AsyncSalaryService(mock_client)
+
+        salaries = asyncio.run(service.get_company_salary("Google", "Engineer", "NYC"))
+
+        assert len(salaries) == 1
+        mock_client.get_company_salary.assert_awaited_once_with(
+            company="Google", job_title="Engineer", location="NYC", years_of_experience="ALL"
+        )
+
+    def test_get_company_salary_error(self):
+        """Test salarios de empresa asíncronos con error"""
+        mock_client = Mock()
+        mock_client.get_company_salary = AsyncMock(side_effect=Exception("API Error"))
+        service = AsyncSalaryService(mock_client)
+
+        with pytest.raises(Exception, match="API Error"):
+            asyncio.run(service.get_company_salary("Google", "Engineer"))
+
+    def test_compare_locations_concurrently(self, sample_salary_data):
+        """Test comparación concurrente con una ubicación fallida"""
+        async def fake_salary(job_title, location, years_of_experience):
+            if location == "Nowhere":
+                raise Exception("Invalid location")
+            return [sample_salary_data]
+
+        mock_client = Mock()
+        mock_client.get_estimated_salary = AsyncMock(side_effect=fake_salary)
+        service = AsyncSalaryService(mock_client)
+
+        comparison = asyncio.run(service.compare_locations("Engineer", ["Madrid", "Nowhere", "Barcelona"]))
+
+        assert set(comparison) == {"Madrid", "Barcelona"}
+        assert comparison["Madrid"]["average_median"] == 50000
+        assert mock_client.get_estimated_salary.await_count == 3
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_batch_search.py
+Descripción: Tests para BatchSearchRunner
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import threading
+import time
+from unittest.mock import Mock
+from src.api.client import HTTPError
+from src.api.usage_budget import BATCH, scoped_priority
+from src.models.job import Job
+from src.models.search_params import SearchParameters
+from src.services.batch_search import BatchSearchResult, BatchSearchRunner
+
+
+def _jobs(*ids):
+    return [Job(job_id=job_id) for job_id in ids]
+
+
+class TestBatchSearchRunner:
+    """Tests para BatchSearchRunner"""
+
+    def test_merges_and_deduplicates_in_query_order(self):
+        """Test los trabajos repetidos entre queries se cuentan una vez"""
+        results = {"python": _jobs("a", "b"), "java": _jobs("b", "c"), "go": _jobs("a")}
+        service = Mock()
+        service.search_jobs.side_effect = lambda params: results[params.query]
+
+        result = BatchSearchRunner(service).run(
+            [SearchParameters(query=query) for query in ("python", "java", "go")]
+        )
+
+        assert [job.job_id for job in result.jobs] == ["a", "b", "c"]
+        assert [outcome.new_jobs for outcome in result.outcomes] == [2, 1, 0]
+        assert [len(outcome.jobs) for outcome in result.outcomes] == [2, 2, 1]
+
+    def test_failed_query_does_not_stop_batch(self):
+        """Test una query que falla se reporta y el resto continúa"""
+        def search(params):
+            if params.query == "bad":
+                raise HTTPError(500, "Server Error")
+            return _jobs(params.query)
+
+        service = Mock()
+        service.search_jobs.side_effect = search
+
+        result = BatchSearchRunner(service).run(
+            [SearchParameters(query=query) for query in ("ok1", "bad", "ok2")]
+        )
+
+        assert [job.job_id for job in result.jobs] == ["ok1", "ok2"]
+        assert len(result.failed) == 1
+        assert result.failed[0].params.query == "bad"
+        assert result.outcomes[1].error.status_code == 500
+
+    def test_runs_concurrently_with_bounded_workers(self):
+        """Test las queries se ejecutan en paralelo sin superar max_workers"""
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def search(params):
+            with lock:
+                active.append(params.query)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(params.query)
+            return []
+
+        service = Mock()
+        service.search_jobs.side_effect = search
+
+        result = BatchSearchRunner(service, max_workers=3).run(
+            [SearchParameters(query=f"q{i}") for i in range(9)]
+        )
+
+        assert peak[0] == 3
+        assert len(result.outcomes) == 9
+        assert all(outcome.duration >= 0.05 for outcome in result.outcomes)
+
+    def test_queries_run_as_batch_priority(self):
+        """Test las queries se atribuyen al llamador y prioridad del lote"""
+        priorities = []
+        service = Mock()
+        service.search_jobs.side_effect = lambda params: priorities.append(scoped_priority()) or []
+
+        BatchSearchRunner(service).run([SearchParameters(query="python")])
+
+        assert priorities == [BATCH]
+
+    def test_empty_batch(self):
+        """Test sin queries no se hace nada"""
+        service = Mock()
+
+        result = BatchSearchRunner(service).run([])
+
+        assert result == BatchSearchResult([], [], 0.0)
+        service.search_jobs.assert_not_called()
@@ -13,7 +13,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from pydantic import ValidationError
 from src.services.job_service import JobService
-from src.models.job import Job
+from src.models.job import LISTING_FIELDS, Job
 from src.models.search_params import SearchParameters
 
 
@@ -44,6 +44,20 @@ class TestJobService:
         assert all(isinstance(job, Job) for job in jobs)
         mock_client.search_jobs.assert_called_once_with(params)
 
+    def test_search_jobs_stream(self, sample_job_data):
+        """Test búsqueda en modo streaming valida los trabajos según llegan"""
+        mock_client = Mock()
+        mock_client.iter_search_jobs.return_value = iter([sample_job_data, {"invalid": "data"}])
+
+        service = JobService(mock_client, stream=True)
+        params = SearchParameters(query="python", country="us")
+
+        jobs = service.search_jobs(params)
+
+        assert len(jobs) == 1
+        mock_client.iter_search_jobs.assert_called_once_with(params)
+        mock_client.search_jobs.assert_not_called()
+
     def test_search_jobs_empty_results(self):
         """Test búsqueda sin resultados"""
         mock_client = Mock()
@@ -90,6 +104,59 @@ class TestJobService:
 
         assert "API Error" in str(exc_info.value)
 
+    def test_iter_jobs_lazy_with_limit(self, sample_job_data):
+        """Test iter_jobs deja de consumir páginas al llegar al límite"""
+        pages_read = []
+
+        def pages(params):
+            for page in range(1, 4):
+                pages_read.append(page)
+                yield [dict(sample_job_data, job_id=f"{page}-{i}") for i in range(2)] + [{"invalid": "data"}]
+
+        mock_client = Mock()
+        mock_client.iter_search_pages.side_effect = pages
+
+        service = JobService(mock_client)
+        jobs = list(service.iter_jobs(SearchParameters(query="python"), limit=3))
+
+        assert [job.job_id for job in jobs] == ["1-0", "1-1", "2-0"]
+        assert pages_read == [1, 2]
+
+    def test_iter_jobs_zero_limit(self):
+        """Test con límite 0 no se hace ninguna petición"""
+        mock_client = Mock()
+
+        jobs = list(JobService(mock_client).iter_jobs(SearchParameters(query="python"), limit=0))
+
+        assert jobs == []
+        mock_client.iter_search_pages.assert_not_called()
+
+    def test_search_jobs_with_projection(self, sample_job_data):
+        """Test con proyección solo se validan los campos pedidos"""
+        mock_client = Mock()
+        mock_client.search_jobs.return_value = [sample_job_data]
+
+        service = JobService(mock_client)
+        params = SearchParameters(query="python", fields=LISTING_FIELDS)
+
+        jobs = service.search_jobs(params)
+
+        assert jobs[0].title == sample_job_data["job_title"]
+        assert jobs[0].description is None
+        assert jobs[0].highlights is None
+
+    def test_get_job_details_with_projection(self, sample_job_data):
+        """Test proyección en los detalles de un trabajo"""
+        mock_client = Mock()
+        mock_client.get_job_details.return_value = sample_job_data
+
+        service = JobService(mock_client)
+        job = service.get_job_details("abc123", "us", fields="job_title")
+
+        mock_client.get_job_details.assert_called_once_with("abc123", "us", fields="job_id,job_title")
+        assert job.title == sample_job_data["job_title"]
+        assert job.employer_name is None
+
     def test_get_job_details_success(self, sample_job_data):
         """Test obtener detalles de trabajo exitoso"""
         mock_client = Mock()
@@ -100,7 +167,7 @@ class TestJobService:
 
         assert isinstance(job, Job)
         assert job.job_id == "abc123xyz"
-        mock_client.get_job_details.assert_called_once_with("abc123", "us")
+        mock_client.get_job_details.assert_called_once_with("abc123", "us", fields=None)
 
     def test_get_job_details_with_country(self, sample_job_data):
         """Test obtener detalles con país específico"""
@@ -110,7 +177,7 @@ class TestJobService:
         service = JobService(mock_client)
         job = service.get_job_details("abc123", "es")
 
-        mock_client.get_job_details.assert_called_once_with("abc123", "es")
+        mock_client.get_job_details.assert_called_once_with("abc123", "es", fields=None)
 
     def test_get_job_details_validation_error(self):
         """Test obtener detalles con datos inválidos"""
@@ -136,6 +203,24 @@ class TestJobService:
 
         assert "Not found" in str(exc_info.value)
 
+    def test_get_job_details_batch(self, sample_job_data):
+        """Test detalles de varios trabajos con errores por ID"""
+        mock_client = Mock()
+        not_found = Exception("Trabajo no encontrado")
+        mock_client.get_job_details_batch.return_value = {
+            "abc123": sample_job_data,
+            "bad": {"invalid": "data"},
+            "missing": not_found
+        }
+
+        service = JobService(mock_client)
+        results = service.get_job_details_batch(["abc123", "bad", "missing"], "es")
+
+        assert isinstance(results["abc123"], Job)
+        assert isinstance(results["bad"], ValueError)
+        assert results["missing"] is not_found
+        mock_client.get_job_details_batch.assert_called_once_with(["abc123", "bad", "missing"], "es", fields=None)
+
     def test_filter_remote_jobs(self, sample_job_data):
         """Test filtrar trabajos remotos"""
         # Crear trabajos remotos y no remotos
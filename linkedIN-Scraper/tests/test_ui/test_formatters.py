@@ -13,9 +13,11 @@ import pytest
 from unittest.mock import Mock
 from rich.table import Table
 from rich.panel import Panel
-from src.ui.formatters import JobFormatter, SalaryFormatter
+from src.ui.formatters import JobFormatter, SalaryFormatter, StatsFormatter
 from src.models.job import Job
 from src.models.salary import SalaryInfo
+from src.models.search_params import SearchParameters
+from src.services.batch_search import BatchSearchResult, SearchOutcome
 
 
 class TestJobFormatter:
@@ -208,3 +210,89 @@ class TestSalaryFormatter:
 
         # No debería causar errores
         assert isinstance(details, str)
+
+
+class TestStatsFormatter:
+    """Tests para StatsFormatter"""
+
+    def _latency(self):
+        summary = {
+            'count': 2, 'mean_ms': 12.5, 'min_ms': 10.0, 'max_ms': 15.0,
+            'p50_ms': 10, 'p90_ms': 15.0, 'p99_ms': None, 'buckets': {}
+        }
+        return {'/jsearch/search': {'phases': {'ttfb': summary, 'total': summary}, 'connections': {}}}
+
+    def test_format_latency_table(self):
+        """Test tabla de latencias tiene una fila por fase"""
+        table = StatsFormatter.format_latency_table(self._latency())
+
+        assert isinstance(table, Table)
+        assert table.row_count == 2
+
+    def test_format_latency_table_empty(self):
+        """Test tabla de latencias vacía"""
+        table = StatsFormatter.format_latency_table({})
+
+        assert table.row_count == 0
+
+    def test_format_pool_summary(self):
+        """Test resumen de conexiones y caché"""
+        stats = {
+            'connection_pool': {'created': 1, 'reused': 3, 'reuse_rate': 0.75},
+            'conditional_cache': {'entries': 2, 'revalidated': 1},
+            'hedging': {'requests': 10, 'hedged': 1, 'hedge_wins': 1},
+            'retries': {'retries': 4, 'non_retryable': 2, 'budget_exhausted': 1},
+            'api_keys': {'total': 3, 'active': 2, 'failovers': 5, 'keys': []}
+        }
+
+        summary = StatsFormatter.format_pool_summary(stats)
+
+        assert "3 reused" in summary
+        assert "75%" in summary
+        assert "2 entries" in summary
+        assert "1 of 10" in summary
+        assert "Retries: 4 sent" in summary
+        assert "API keys: 2 of 3 active" in summary
+
+    def _usage_report(self, **overrides):
+        report = {
+            'month': '2025-12', 'limit': 1000, 'soft_limit': 800, 'used': 850, 'requests': 700,
+            'remaining': 150, 'used_ratio': 0.85, 'projected': 1200, 'projected_over': True,
+            'month_progress': 0.7, 'state': 'soft_limit',
+            'by_endpoint': {'/jsearch/search': {'requests': 600, 'credits': 750},
+                            '/jsearch/job-details': {'requests': 100, 'credits': 100}},
+            'by_caller': {'web': {'requests': 700, 'credits': 850}}
+        }
+        report.update(overrides)
+        return report
+
+    def test_format_batch_report(self):
+        """Test tabla de resultados de un lote de búsquedas"""
+        job = Job(job_id="a")
+        result = BatchSearchResult([job], [
+            SearchOutcome(SearchParameters(query="python"), [job], 1, 1.5, None),
+            SearchOutcome(SearchParameters(query="java"), [], 0, 0.2, Exception("Server Error"))
+        ], 1.7)
+
+        table = StatsFormatter.format_batch_report(result)
+
+        assert isinstance(table, Table)
+        assert table.row_count == 2
+        assert "1 unique jobs" in str(table.title)
+
+    def test_format_usage_report(self):
+        """Test tabla de consumo por endpoint y llamador"""
+        table = StatsFormatter.format_usage_report(self._usage_report())
+
+        assert isinstance(table, Table)
+        assert table.row_count == 3
+        assert "850 / 1000" in str(table.title)
+
+    def test_format_budget_summary(self):
+        """Test resumen del presupuesto según su estado"""
+        soft = StatsFormatter.format_budget_summary(self._usage_report())
+        unlimited = StatsFormatter.format_budget_summary(self._usage_report(limit=None))
+
+        assert "Projected month-end usage: 1200" in soft
+        assert "Soft limit reached" in soft
+        assert "Remaining" not in unlimited
@@ -43,7 +43,7 @@ class TestMenuSystem:
         console = Console()
         menu = MenuSystem(console)
 
-        for choice in ["0", "1", "5", "10", "13"]:
+        for choice in ["0", "1", "5", "10", "13", "14", "15", "16"]:
             mock_prompt_ask.return_value = choice
             result = menu.show_main_menu()
             assert result == choice
@@ -137,6 +137,33 @@ class TestConfig:
         with pytest.raises(ValueError):
             config.validate_and_setup()
 
+    @patch.dict('os.environ', {'API_KEY': 'YOUR_API_KEY_HERE', 'TRANSPORT_MODE': 'replay'})
+    def test_validate_and_setup_replay_without_api_key(self):
+        """Test modo replay no requiere API key real"""
+        config = Config()
+
+        config.validate_and_setup()
+
+        assert config.transport_mode == 'replay'
+
+    @patch.dict('os.environ', {'API_KEY': 'key_a', 'EXTRA_API_KEYS': ' key_b, key_a,,key_c, key_b '})
+    def test_additional_api_keys(self):
+        """Test keys adicionales sin huecos ni repetidas"""
+        config = Config()
+
+        assert config.additional_api_keys() == ['key_b', 'key_c']
+
+    @patch.dict('os.environ', {'API_KEY': 'key_a'})
+    def test_additional_api_keys_default(self):
+        """Test sin EXTRA_API_KEYS no hay keys adicionales"""
+        assert Config().additional_api_keys() == []
+
+    @patch.dict('os.environ', {'API_KEY': 'test_key', 'TRANSPORT_MODE': 'offline'})
+    def test_invalid_transport_mode(self):
+        """Test modo de transporte no válido"""
+        with pytest.raises(ValidationError):
+            Config()
+
     @patch.dict('os.environ', {'API_KEY': 'valid_key'})
     def test_config_load_method(self, tmp_path):
         """Test método load de Config"""
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Nombre del archivo: test_json_codec.py
+Descripción: Tests para el codec JSON con backends orjson/msgspec/stdlib
+
+Autor: Hex686f6c61
+Repositorio: https://github.com/Hex686f6c61/linkedIN-Scraper
+Versión: 3.0.0
+Fecha: 2025-12-08
+"""
+import json
+import pytest
+from datetime import date
+from src.utils import json_codec
+from src.utils.json_codec import BACKENDS, JSONCodec
+
+
+def _codec(backend):
+    """Codec del backend o skip si no está instalado"""
+    try:
+        return JSONCodec(backend)
+    except ValueError:
+        pytest.skip(f"{backend} no instalado")
+
+
+@pytest.fixture(params=BACKENDS)
+def codec(request):
+    return _codec(request.param)
+
+
+class TestJSONCodec:
+    """Tests comunes a todos los backends"""
+
+    def test_roundtrip(self, codec):
+        """Test codificar y decodificar"""
+        data = {"title": "Ingeniero de Datos – Málaga", "salary": 45000.5, "remote": True, "tags": [1, None]}
+
+        assert codec.loads(codec.dumps(data)) == data
+
+    def test_dumps_returns_utf8_without_escaping(self, codec):
+        """Test la salida es UTF-8 sin escapar caracteres no ASCII"""
+        encoded = codec.dumps({"city": "Málaga"})
+
+        assert isinstance(encoded, bytes)
+        assert "Málaga".encode('utf-8') in encoded
+
+    def test_loads_accepts_bytes_and_str(self, codec):
+        """Test decodificar desde bytes, bytearray y str"""
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+        assert codec.loads(bytearray(b'[1, 2]')) == [1, 2]
+        assert codec.loads('"x"') == "x"
+
+    def test_indent_matches_stdlib(self, codec):
+        """Test la salida indentada coincide con json.dumps(indent=2)"""
+        data = [{"a": 1, "b": ["x", "y"]}]
+
+        assert codec.dumps_str(data, indent=True) == json.dumps(data, indent=2)
+
+    def test_sort_keys(self, codec):
+        """Test ordenar claves"""
+        assert codec.dumps_str({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+    def test_default_hook(self, codec):
+        """Test hook para tipos no serializables"""
+        encoded = codec.dumps({"day": date(2025, 12, 8)}, default=lambda o: o.isoformat())
+
+        assert codec.loads(encoded) == {"day": "2025-12-08"}
+
+    def test_unsupported_type_raises(self, codec):
+        """Test tipo no serializable sin hook"""
+        with pytest.raises(TypeError):
+            codec.dumps({"value": object()})
+
+    def test_invalid_json_raises_json_decode_error(self, codec):
+        """Test JSON inválido lanza json.JSONDecodeError en todos los backends"""
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b'{"a": ')
+
+
+class TestBackendSelection:
+    """Tests para la selección de backend"""
+
+    def test_default_backend_is_fastest_installed(self):
+        """Test el codec compartido usa el primer backend disponible"""
+        assert json_codec.codec.backend in BACKENDS
+        assert JSONCodec().backend == json_codec.codec.backend
+
+    def test_stdlib_always_available(self):
+        """Test el backend stdlib siempre está disponible"""
+        assert JSONCodec("json").backend == "json"
+
+    def test_unknown_backend(self):
+        """Test backend desconocido"""
+        with pytest.raises(ValueError):
+            JSONCodec("simplejson")
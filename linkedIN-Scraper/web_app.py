@@ -6,8 +6,8 @@ Provides a Flask-based web interface for the LinkedIn scraper
 """
 
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import json
 import os
 import sys
 from datetime import datetime
@@ -18,6 +18,23 @@ from src.services.job_service import JobService
 from src.services.salary_service import SalaryService
 from src.services.export_service import ExportService
 from src.models.search_params import SearchParameters
+from src.utils import json_codec
+
+
+class CodecJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the shared fast JSON codec"""
+
+    def dumps(self, obj, **kwargs):
+        return json_codec.dumps_str(
+            obj,
+            indent=bool(kwargs.get('indent')),
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            default=self.default
+        )
+
+    def loads(self, s, **kwargs):
+        return json_codec.loads(s)
+
 
 app = Flask(__name__)
 CORS(app)
@@ -25,12 +42,15 @@ CORS(app)
 # Configure app
 app.config['JSON_SORT_KEYS'] = False
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+app.json = CodecJSONProvider(app)
+app.json.sort_keys = app.config['JSON_SORT_KEYS']
+app.json.compact = not app.config['JSONIFY_PRETTYPRINT_REGULAR']
 
 # Initialize services
 config = Config()
 logger = setup_logger()
-jsearch_client = JSearchClient(api_key=config.api_key, api_host=config.api_host)
-job_service = JobService(jsearch_client)
+jsearch_client = JSearchClient(api_key=config.api_key, api_host=config.api_host, config=config, caller="web")
+job_service = JobService(jsearch_client, stream=config.stream_responses)
 salary_service = SalaryService(jsearch_client)
 export_service = ExportService()
 
@@ -202,11 +222,33 @@ def export_jobs():
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (degraded while any API circuit breaker is open)"""
+    circuits = jsearch_client.get_circuit_state()
+    degraded = any(circuit['state'] == 'open' for circuit in circuits.values())
     return jsonify({
-        'status': 'healthy',
+        'status': 'degraded' if degraded else 'healthy',
         'service': 'LinkedIn Job Scraper Web Dashboard',
         'version': '3.0.0',
+        'circuit_breakers': circuits,
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/stats', methods=['GET'])
+def api_stats():
+    """API client statistics (connection reuse, cache, latency per endpoint/phase)"""
+    return jsonify({
+        'success': True,
+        'stats': jsearch_client.get_stats(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/usage', methods=['GET'])
+def api_usage():
+    """API usage for the current month against the monthly budget"""
+    report = jsearch_client.get_usage_report()
+    return jsonify({
+        'success': report is not None,
+        'usage': report,
         'timestamp': datetime.now().isoformat()
     })
 